@@ -1,12 +1,24 @@
-"""Investment-X backend package. See ARCHITECTURE.md for module placement guide."""
+"""Investment-X backend package. See ARCHITECTURE.md for module placement guide.
 
-from . import core
-from . import common
-from .core import backtesting as bt
-from .db.query import *
-from .db.client import *
-from .core.indicators import *
-from .collectors import crawler
-from .common.viz.theme import apply_research_style, NBER_RECESSIONS
-from .core import indicators, regimes
-from . import collectors
\ No newline at end of file
+Top-level re-exports (``ix.Series``, ``ix.bt``, indicator functions, …)
+are resolved on first access, so importing a submodule such as
+``ix.api.main`` does not load the whole indicator and backtesting stack.
+"""
+
+from ix.common.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    attrs={
+        "core": "ix.core",
+        "common": "ix.common",
+        "bt": "ix.core.backtesting",
+        "crawler": "ix.collectors.crawler",
+        "apply_research_style": "ix.common.viz.theme:apply_research_style",
+        "NBER_RECESSIONS": "ix.common.viz.theme:NBER_RECESSIONS",
+        "indicators": "ix.core.indicators",
+        "regimes": "ix.core.regimes",
+        "collectors": "ix.collectors",
+    },
+    star=("ix.db.query", "ix.db.client", "ix.core.indicators"),
+)
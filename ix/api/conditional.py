@@ -0,0 +1,115 @@
+"""Conditional GET: strong ETags, ``304 Not Modified`` and ``Cache-Control``.
+
+Endpoints derive an ETag from the versions of the rows they read (e.g.
+``TimeseriesData.updated``, ``RegimeSnapshot.computed_at``) plus every
+request parameter that shapes the body, and call :func:`not_modified`
+*before* doing the expensive work::
+
+    etag = make_etag("regime-current", fp, computed_at)
+    cached = not_modified(request, etag, computed_at)
+    if cached is not None:
+        return cached
+    ...
+    set_validators(response, etag, computed_at)
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+DEFAULT_CACHE_CONTROL = "private, max-age=60"
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag over *parts* (anything JSON-serialisable via ``str``)."""
+    raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return '"' + hashlib.sha256(raw.encode()).hexdigest()[:32] + '"'
+
+
+def http_date(dt: datetime) -> str:
+    """RFC 9110 HTTP-date; naive datetimes are taken as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return format_datetime(dt.astimezone(timezone.utc), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison, as ``If-None-Match`` requires."""
+    if header.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in header.split(","))
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since is None:
+        return False
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP-dates have one-second resolution
+    return int(last_modified.timestamp()) <= int(since.timestamp())
+
+
+def _validator_headers(
+    etag: str, last_modified: Optional[datetime], cache_control: str
+) -> dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified(
+    request: Request,
+    etag: Optional[str],
+    last_modified: Optional[datetime] = None,
+    cache_control: str = DEFAULT_CACHE_CONTROL,
+) -> Optional[Response]:
+    """A ``304`` response if the client's copy is current, else ``None``.
+
+    ``If-None-Match`` takes precedence; ``If-Modified-Since`` is only
+    consulted when it is absent. Only ``GET`` / ``HEAD`` are eligible, and
+    a ``None`` *etag* (response not versionable) never matches.
+    """
+    if etag is None or request.method not in ("GET", "HEAD"):
+        return None
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, etag)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        fresh = bool(
+            if_modified_since
+            and last_modified is not None
+            and _not_modified_since(if_modified_since, last_modified)
+        )
+    if not fresh:
+        return None
+    return Response(
+        status_code=304, headers=_validator_headers(etag, last_modified, cache_control)
+    )
+
+
+def set_validators(
+    response: Response,
+    etag: Optional[str],
+    last_modified: Optional[datetime] = None,
+    cache_control: str = DEFAULT_CACHE_CONTROL,
+) -> Response:
+    """Attach ``ETag`` / ``Last-Modified`` / ``Cache-Control`` to *response*.
+
+    No-op when *etag* is ``None``.
+    """
+    if etag is None:
+        return response
+    response.headers.update(_validator_headers(etag, last_modified, cache_control))
+    return response
@@ -2,19 +2,25 @@
 Main FastAPI application.
 """
 import os
-import time
 from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse, FileResponse, ORJSONResponse, Response
+from fastapi.responses import JSONResponse, FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from sqlalchemy import text
 from slowapi.errors import RateLimitExceeded
 
 from ix.db.conn import ensure_connection, conn
+from ix.api.middleware import (
+    DBSessionCleanupMiddleware,
+    NormalizePathMiddleware,
+    RequestLoggingMiddleware,
+    SecurityHeadersMiddleware,
+)
 from ix.common.logger import setup_logging
 
 logger = setup_logging(service_name="backend")
@@ -28,6 +34,8 @@ def _run_startup_migrations() -> None:
         logger.warning("Skipping startup migrations — DB connection unavailable.")
         return
 
+    from ix.db.models.timeseries import SEARCH_PREFIX_COLUMNS, SEARCH_VECTOR_SQL
+
     try:
         from ix.db.conn import Base as ModelBase
 
@@ -70,10 +78,44 @@ def _run_startup_migrations() -> None:
                 "ALTER TABLE chart_packs ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP"
             ))
 
+            # Last built regime frame, resumed by incremental refresh
+            db.execute(text(
+                "ALTER TABLE regime_snapshot ADD COLUMN IF NOT EXISTS frame BYTEA"
+            ))
+
+            # Keyset index for the research library listing
+            db.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_research_files_listing "
+                "ON research_files (filename DESC, id DESC) WHERE is_deleted = false"
+            ))
+
+            # Stored search document + GIN index for timeseries search
+            db.execute(text(
+                "ALTER TABLE timeseries ADD COLUMN IF NOT EXISTS search_vector tsvector "
+                f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+            ))
+            db.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_timeseries_search_vector "
+                "ON timeseries USING gin (search_vector)"
+            ))
+
         logger.info("Startup migrations completed.")
     except Exception as exc:
         logger.warning(f"Startup migrations failed: {exc}")
 
+    # Trigram indexes for type-ahead prefix matches; pg_trgm may need a
+    # privileged role, so failure here only costs search speed.
+    try:
+        with conn.engine.begin() as db:
+            db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            for column in SEARCH_PREFIX_COLUMNS:
+                db.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_timeseries_{column}_trgm "
+                    f"ON timeseries USING gin (lower({column}) gin_trgm_ops)"
+                ))
+    except Exception as exc:
+        logger.warning(f"Trigram search indexes unavailable: {exc}")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -86,36 +128,65 @@ async def lifespan(app: FastAPI):
 
     _run_startup_migrations()
 
+    # Nightly jobs run in ix.common.task.jobs' worker processes, not in the API
+    from ix.common.task.jobs import STALE_AFTER, resume_interrupted, run_job
+
     # Schedule macro research pipeline daily at 06:00 UTC
-    from ix.common.task import run_macro_research
     scheduler.add_job(
-        run_macro_research,
+        run_job,
         "cron", hour=6, minute=0,
+        args=["macro_research"],
         id="macro_research",
         replace_existing=True,
         misfire_grace_time=3600,
     )
 
     # Send data reports daily at 07:00 KST (22:00 UTC)
-    from ix.common.task import send_data_reports
     scheduler.add_job(
-        send_data_reports,
+        run_job,
         "cron", hour=22, minute=0,
+        args=["send_data_reports"],
         id="send_data_reports",
         replace_existing=True,
         misfire_grace_time=3600,
     )
 
     # Compute VOMO screener daily at 23:00 UTC
-    from ix.api.routers.analytics.screener import compute_screener
     scheduler.add_job(
-        compute_screener,
+        run_job,
         "cron", hour=23, minute=0,
+        args=["vomo_screener"],
         id="vomo_screener",
         replace_existing=True,
         misfire_grace_time=3600,
     )
 
+    # Resume runs cut off by the last shutdown once their heartbeat is stale
+    scheduler.add_job(
+        resume_interrupted,
+        "date",
+        run_date=datetime.now(timezone.utc) + timedelta(seconds=STALE_AFTER),
+        id="resume_interrupted_jobs",
+        replace_existing=True,
+    )
+
+    # Warm the compose / ensemble result store once, right after startup
+    from ix.core.regimes.result_store import warm_up as warm_regime_results
+    scheduler.add_job(
+        warm_regime_results,
+        "date",
+        id="regime_result_warmup",
+        replace_existing=True,
+    )
+
+    # Build the favourites panel once, right after startup
+    from ix.core.ts.favorites import refresh_favorites_panel
+    scheduler.add_job(
+        refresh_favorites_panel,
+        "date",
+        id="favorites_panel_warmup",
+        replace_existing=True,
+    )
 
     scheduler.start()
     logger.info(f"Scheduler started with {len(scheduler.get_jobs())} job(s)")
@@ -126,6 +197,13 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down scheduler...")
     if scheduler.running:
         scheduler.shutdown()
+    from ix.collectors import fred, yahoo
+    from ix.common.task import jobs
+
+    fred.shutdown()
+    yahoo.shutdown()
+    jobs.shutdown()
+    await conn.dispose_async()
 
 
 # Create FastAPI app
@@ -209,69 +287,12 @@ app.add_middleware(
 )
 
 
-@app.middleware("http")
-async def normalize_path_middleware(request: Request, call_next):
-    """Collapse double slashes in URL path (e.g. //api/... → /api/...).
-    Cloudflare tunnel can introduce these depending on service URL config."""
-    import re
-    raw = request.scope.get("path", "")
-    if "//" in raw:
-        request.scope["path"] = re.sub(r"/{2,}", "/", raw)
-    return await call_next(request)
-
-
-@app.middleware("http")
-async def security_headers_middleware(request: Request, call_next):
-    """Add security headers to all responses."""
-    response = await call_next(request)
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    if not request.url.path.startswith("/api/research/library/view/"):
-        response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-    return response
-
-
-@app.middleware("http")
-async def request_logging_middleware(request: Request, call_next):
-    """Log method, path, status code, and duration for each request."""
-    start = time.time()
-    response = None
-    try:
-        response = await call_next(request)
-        return response
-    except RuntimeError as e:
-        if str(e) == "No response returned.":
-            response = Response(status_code=499)
-            return response
-        raise
-    finally:
-        duration_ms = (time.time() - start) * 1000
-        status = response.status_code if response else 500
-        path = request.url.path
-        method = request.method
-        # Skip noisy health check logs
-        if path != "/api/health":
-            logger.info(
-                f"{method} {path} {status} {duration_ms:.0f}ms"
-            )
-
-
-@app.middleware("http")
-async def db_session_middleware(request, call_next):
-    """Ensure scoped session is removed after each request."""
-    try:
-        response = await call_next(request)
-        return response
-    except RuntimeError as e:
-        if str(e) == "No response returned.":
-            # Client disconnected mid-request, causing Starlette's BaseHTTPMiddleware to crash.
-            # We return a dummy 499 Client Closed Request to gracefully exit the middleware chain.
-            return Response(status_code=499)
-        raise
-    finally:
-        if conn.Session:
-            conn.Session.remove()
+# Pure ASGI middleware; the last added is outermost, so requests pass
+# session cleanup → logging → security headers → path normalisation → CORS.
+app.add_middleware(NormalizePathMiddleware)
+app.add_middleware(SecurityHeadersMiddleware)
+app.add_middleware(RequestLoggingMiddleware)
+app.add_middleware(DBSessionCleanupMiddleware)
 
 
 # Root endpoint removed as Dash handles "/"
@@ -302,7 +323,11 @@ if _DEBUG_MODE:
 
 @app.get("/api/jobs")
 async def get_jobs(_=Depends(_get_admin_user)):
-    """List currently scheduled jobs — admin only."""
+    """List currently scheduled jobs and recent worker-pool runs — admin only."""
+    import asyncio
+
+    from ix.common.task.jobs import job_status
+
     jobs = []
     for job in scheduler.get_jobs():
         jobs.append(
@@ -312,7 +337,7 @@ async def get_jobs(_=Depends(_get_admin_user)):
                 "func": job.func.__name__,
             }
         )
-    return {"jobs": jobs}
+    return {"jobs": jobs, "runs": await asyncio.to_thread(job_status)}
 
 
 from starlette.exceptions import HTTPException as StarletteHTTPException
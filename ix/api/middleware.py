@@ -0,0 +1,134 @@
+"""Pure ASGI middleware for the API.
+
+These replace ``@app.middleware("http")`` (``BaseHTTPMiddleware``) layers,
+which run every request through an extra task and an in-memory stream
+pair and interact badly with ``StreamingResponse`` bodies (TTS audio,
+Excel exports, NDJSON frames). Each class here wraps ``send`` instead, so
+the response body flows straight through.
+
+All of them pass non-HTTP scopes (``lifespan``, ``websocket``) through
+untouched.
+"""
+
+import re
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ix.common import get_logger
+from ix.db.conn import conn
+
+logger = get_logger(__name__)
+
+_DOUBLE_SLASH = re.compile(r"/{2,}")
+
+_SECURITY_HEADERS = (
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-XSS-Protection", "1; mode=block"),
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+)
+
+# Research library documents are rendered inside an <iframe> by the UI
+_FRAMEABLE_PREFIX = "/api/research/library/view/"
+
+# Status logged when the client went away before any response started
+CLIENT_CLOSED_REQUEST = 499
+
+
+class NormalizePathMiddleware:
+    """Collapse double slashes in the URL path (``//api/...`` → ``/api/...``).
+
+    Cloudflare tunnel can introduce these depending on service URL config.
+    The scope is updated in place so outer layers log the routed path.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            path = scope.get("path", "")
+            if "//" in path:
+                scope["path"] = _DOUBLE_SLASH.sub("/", path)
+        await self.app(scope, receive, send)
+
+
+class SecurityHeadersMiddleware:
+    """Add security headers to every HTTP response."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in _SECURITY_HEADERS:
+                    headers[name] = value
+                if not scope["path"].startswith(_FRAMEABLE_PREFIX):
+                    headers["X-Frame-Options"] = "DENY"
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+class RequestLoggingMiddleware:
+    """Log method, path, status code and duration for each request.
+
+    Duration covers the full response, including streamed bodies. Requests
+    that raise are logged as ``500``; requests whose client disconnected
+    before a response started are logged as ``499``.
+    """
+
+    skip_paths = frozenset({"/api/health"})
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = CLIENT_CLOSED_REQUEST
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception:
+            status = 500
+            raise
+        finally:
+            path = scope["path"]
+            # Skip noisy health check logs
+            if path not in self.skip_paths:
+                duration_ms = (time.perf_counter() - start) * 1000
+                logger.info(f"{scope['method']} {path} {status} {duration_ms:.0f}ms")
+
+
+class DBSessionCleanupMiddleware:
+    """Remove the thread-local scoped session once the response is sent."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if conn.Session:
+                conn.Session.remove()
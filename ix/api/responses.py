@@ -0,0 +1,59 @@
+"""Response helpers shared by the data routers."""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.orm import Session as SessionType
+
+from ix.api.conditional import make_etag
+from ix.common.date import today
+from ix.core.ts import data_versions
+from ix.core.ts.encoding import NDJSON, encode_frame, negotiate_format
+
+
+def frame_response(
+    df: pd.DataFrame,
+    request: Request,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Encode a ``Date``-indexed frame in the format the client ``Accept``s.
+
+    JSON by default; ``application/x-ndjson`` is streamed in row chunks,
+    and Arrow IPC / Parquet are returned as binary bodies.
+    """
+    media_type = negotiate_format(request.headers.get("accept"))
+    headers = {**(headers or {}), "Vary": "Accept"}
+    body = encode_frame(df, media_type)
+    if media_type == NDJSON:
+        return StreamingResponse(body, media_type=media_type, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def data_validators(
+    db: SessionType,
+    request: Request,
+    codes: List[str],
+    *params: Any,
+) -> Tuple[Optional[str], Optional[datetime]]:
+    """``(etag, last_modified)`` for a frame built from *codes*.
+
+    The ETag covers the stored-data versions behind every code or
+    expression, the negotiated format, today's date (series are sliced
+    to today) and *params*. ``(None, None)`` when an expression's inputs
+    cannot be determined without evaluating it.
+    """
+    versions = data_versions(db, codes)
+    if versions is None:
+        return None, None
+    etag = make_etag(
+        list(codes),
+        sorted(versions.items()),
+        negotiate_format(request.headers.get("accept")),
+        today().date(),
+        *params,
+    )
+    stamps = [v for v in versions.values() if v is not None]
+    return etag, max(stamps, default=None)
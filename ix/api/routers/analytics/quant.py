@@ -18,23 +18,13 @@ from starlette.requests import Request
 from ix.api.dependencies import get_current_user
 from ix.api.rate_limit import limiter as _limiter
 from plotly.subplots import make_subplots
-from scipy.cluster.hierarchy import dendrogram
 
 from ix.db.query import Series
-from ix.common.quantitative import (
-    correlation_matrix,
-    rolling_correlation,
-    hierarchical_cluster,
-    rolling_beta,
-    multi_factor_regression,
-    pca_decomposition,
-    historical_var,
-    parametric_var,
-    expected_shortfall,
-    rolling_var,
-)
 from ix.common import get_logger
 
+# ix.common.quantitative (scipy, sklearn) is imported inside the handlers so
+# it loads on the first quant request rather than at API startup.
+
 router = APIRouter()
 logger = get_logger(__name__)
 
@@ -73,6 +63,9 @@ def quant_correlation_matrix(
     _user=Depends(get_current_user),
 ):
     """Heatmap correlation matrix with hierarchical clustering dendrogram."""
+    from ix.common.quantitative import correlation_matrix, hierarchical_cluster
+    from scipy.cluster.hierarchy import dendrogram
+
     try:
         df = _codes_to_df(codes)
         df.columns = [_short_name(c) for c in df.columns]
@@ -151,6 +144,8 @@ def quant_rolling_correlation(
     _user=Depends(get_current_user),
 ):
     """Rolling correlation line chart between two series."""
+    from ix.common.quantitative import rolling_correlation
+
     try:
         s1 = Series(code1)
         s2 = Series(code2)
@@ -199,6 +194,8 @@ def quant_ols_regression(
     _user=Depends(get_current_user),
 ):
     """4-panel OLS regression: scatter/fitted, residuals, histogram, stats."""
+    from ix.common.quantitative import multi_factor_regression
+
     try:
         x_codes = [c.strip() for c in x.split(",") if c.strip()]
         if not x_codes:
@@ -296,6 +293,8 @@ def quant_rolling_beta(
     _user=Depends(get_current_user),
 ):
     """Rolling beta line chart with beta=1 reference."""
+    from ix.common.quantitative import rolling_beta
+
     try:
         s_y = Series(y)
         s_x = Series(x)
@@ -346,6 +345,8 @@ def quant_pca(
     _user=Depends(get_current_user),
 ):
     """3-panel PCA: scree bar, loadings heatmap, component time series."""
+    from ix.common.quantitative import pca_decomposition
+
     try:
         df = _codes_to_df(codes)
         df.columns = [_short_name(c) for c in df.columns]
@@ -432,6 +433,12 @@ def quant_var(
     _user=Depends(get_current_user),
 ):
     """Return distribution histogram with VaR and CVaR lines."""
+    from ix.common.quantitative import (
+        historical_var,
+        parametric_var,
+        expected_shortfall,
+    )
+
     try:
         s = Series(code)
         if s.empty:
@@ -494,6 +501,8 @@ def quant_rolling_var(
     _user=Depends(get_current_user),
 ):
     """Rolling VaR line + price on secondary axis."""
+    from ix.common.quantitative import rolling_var
+
     try:
         s = Series(code)
         if s.empty:
@@ -12,10 +12,13 @@ from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.orm import Session as SessionType
+from datetime import datetime
 
-from ix.api.dependencies import get_current_admin_user, get_db, get_optional_user
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
+
+from ix.api.conditional import make_etag, not_modified, set_validators
+from ix.api.dependencies import get_current_admin_user, get_optional_user
 from ix.api.rate_limit import limiter as _limiter
 from ix.common import get_logger
 from ix.core.regimes import (
@@ -23,7 +26,13 @@ from ix.core.regimes import (
     get_regime,
     list_regimes,
 )
-from ix.core.regimes.compose import compose_regimes
+from ix.core.regimes.result_store import (
+    get_composition,
+    get_ensemble,
+    invalidate_versions,
+    store_stats,
+)
+from ix.db.conn import fetch_first
 from ix.db.models import RegimeSnapshot, regime_fingerprint
 
 router = APIRouter()
@@ -40,8 +49,8 @@ _refresh_executor = ThreadPoolExecutor(
 # ─────────────────────────────────────────────────────────────────────
 
 
-def _lookup_snapshot(db: SessionType, key: str) -> RegimeSnapshot:
-    """Load the snapshot row for a regime key using its default params."""
+def _snapshot_fingerprint(key: str) -> str:
+    """Fingerprint of a regime's default-params snapshot (404 if unknown)."""
     try:
         reg = get_regime(key)
     except KeyError:
@@ -49,20 +58,43 @@ def _lookup_snapshot(db: SessionType, key: str) -> RegimeSnapshot:
             status_code=404,
             detail=f"Regime '{key}' is not registered.",
         )
-
-    fp = regime_fingerprint(key, reg.default_params)
-    row = db.get(RegimeSnapshot, fp)
+    return regime_fingerprint(key, reg.default_params)
+
+
+def _not_computed(key: str) -> HTTPException:
+    return HTTPException(
+        status_code=404,
+        detail=(
+            f"Regime '{key}' not computed yet. "
+            f"Admin must trigger POST /api/regimes/{key}/refresh."
+        ),
+    )
+
+
+async def _lookup_snapshot(key: str, *columns):
+    """``regime_type``, ``computed_at`` and *columns* of a regime's
+    default-params snapshot; other JSONB payloads are not loaded."""
+    row = await fetch_first(
+        select(RegimeSnapshot.regime_type, RegimeSnapshot.computed_at, *columns)
+        .where(RegimeSnapshot.fingerprint == _snapshot_fingerprint(key)),
+        scalars=False,
+    )
     if row is None:
-        raise HTTPException(
-            status_code=404,
-            detail=(
-                f"Regime '{key}' not computed yet. "
-                f"Admin must trigger POST /api/regimes/{key}/refresh."
-            ),
-        )
+        raise _not_computed(key)
     return row
 
 
+async def _snapshot_version(key: str, view: str) -> tuple[str, datetime]:
+    """``(etag, computed_at)`` of a snapshot view, without loading its JSONB."""
+    fp = _snapshot_fingerprint(key)
+    computed_at = await fetch_first(
+        select(RegimeSnapshot.computed_at).where(RegimeSnapshot.fingerprint == fp)
+    )
+    if computed_at is None:
+        raise _not_computed(key)
+    return make_etag("regime", view, fp, computed_at), computed_at
+
+
 # ─────────────────────────────────────────────────────────────────────
 # List models
 # ─────────────────────────────────────────────────────────────────────
@@ -98,11 +130,6 @@ def list_models(request: Request, _user=Depends(get_optional_user)):
 # ─────────────────────────────────────────────────────────────────────
 
 
-# In-process cache for compose results — same params + same key set
-# always produces the same composite, so cache by canonical key.
-_COMPOSE_CACHE: dict[str, dict] = {}
-
-
 @router.get("/regimes/compose")
 @_limiter.limit("30/minute")
 def compose_regimes_endpoint(
@@ -129,12 +156,8 @@ def compose_regimes_endpoint(
             detail="Need at least 2 regime keys to compose (comma-separated).",
         )
 
-    cache_key = "+".join(sorted(set(key_list)))
-    if cache_key in _COMPOSE_CACHE:
-        return _COMPOSE_CACHE[cache_key]
-
     try:
-        result = compose_regimes(key_list)
+        return get_composition(key_list)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -144,12 +167,8 @@ def compose_regimes_endpoint(
             detail=f"Compose computation failed: {type(e).__name__}: {e}",
         )
 
-    _COMPOSE_CACHE[cache_key] = result
-    return result
-
 
 # ── Ensemble endpoint ──────────────────────────────────────────────
-_ENSEMBLE_CACHE: dict[str, dict] = {}
 
 
 @router.get("/regimes/ensemble")
@@ -163,7 +182,7 @@ def ensemble_endpoint(
 
     Combines ALL registered regimes optimally per asset using walk-forward
     IC-weighted signal combination.  Expensive on first call (~15-45s);
-    cached in-process after.
+    served from the result store after, until an input regime refreshes.
 
     Query params:
         universe: ``"broad"`` (11 ETFs, default) or ``"equity"``
@@ -180,12 +199,8 @@ def ensemble_endpoint(
             detail=f"Unknown universe '{universe}'. Choose from: {list(UNIVERSE_PRESETS.keys())}",
         )
 
-    if universe in _ENSEMBLE_CACHE:
-        return _ENSEMBLE_CACHE[universe]
-
     try:
-        from ix.core.regimes.ensemble import compute_ensemble_strategy
-        result = compute_ensemble_strategy(tickers=UNIVERSE_PRESETS[universe])
+        result = get_ensemble(universe)
     except Exception as e:
         logger.exception("Ensemble computation failed for universe=%s", universe)
         raise HTTPException(
@@ -196,10 +211,15 @@ def ensemble_endpoint(
     if result is None:
         raise HTTPException(status_code=500, detail="Ensemble returned no data")
 
-    _ENSEMBLE_CACHE[universe] = result
     return result
 
 
+@router.get("/regimes/store/stats")
+def result_store_stats(_user=Depends(get_current_admin_user)):
+    """Compose / ensemble result-store hit, miss and eviction counters (admin only)."""
+    return store_stats()
+
+
 # ─────────────────────────────────────────────────────────────────────
 # Per-model data endpoints
 # ─────────────────────────────────────────────────────────────────────
@@ -207,11 +227,11 @@ def ensemble_endpoint(
 
 @router.get("/regimes/{key}/current")
 @_limiter.limit("30/minute")
-def get_current_state(
+async def get_current_state(
     request: Request,
     key: str,
+    response: Response,
     _user=Depends(get_optional_user),
-    db: SessionType = Depends(get_db),
 ):
     """Return the current state snapshot for a regime model.
 
@@ -221,7 +241,13 @@ def get_current_state(
     Also mirrors those values onto a top-level ``input_states[key]`` block
     for tiles that operate in single-axis mode.
     """
-    row = _lookup_snapshot(db, key)
+    etag, computed_at = await _snapshot_version(key, "current")
+    cached = not_modified(request, etag, computed_at)
+    if cached is not None:
+        return cached
+    set_validators(response, etag, computed_at)
+
+    row = await _lookup_snapshot(key, RegimeSnapshot.parameters, RegimeSnapshot.current_state, RegimeSnapshot.timeseries)
     cs = dict(row.current_state or {})  # shallow copy — don't mutate JSONB
     ts = row.timeseries or {}
     composites = ts.get("composites") or {}
@@ -258,14 +284,20 @@ def get_current_state(
 
 @router.get("/regimes/{key}/timeseries")
 @_limiter.limit("30/minute")
-def get_timeseries(
+async def get_timeseries(
     request: Request,
     key: str,
+    response: Response,
     _user=Depends(get_optional_user),
-    db: SessionType = Depends(get_db),
 ):
     """Return the full historical timeseries for a regime model."""
-    row = _lookup_snapshot(db, key)
+    etag, computed_at = await _snapshot_version(key, "timeseries")
+    cached = not_modified(request, etag, computed_at)
+    if cached is not None:
+        return cached
+    set_validators(response, etag, computed_at)
+
+    row = await _lookup_snapshot(key, RegimeSnapshot.timeseries)
     return {
         "regime_type": row.regime_type,
         "computed_at": row.computed_at.isoformat(),
@@ -275,14 +307,20 @@ def get_timeseries(
 
 @router.get("/regimes/{key}/strategy")
 @_limiter.limit("30/minute")
-def get_strategy(
+async def get_strategy(
     request: Request,
     key: str,
+    response: Response,
     _user=Depends(get_optional_user),
-    db: SessionType = Depends(get_db),
 ):
     """Return strategy backtest results (only models with allocations)."""
-    row = _lookup_snapshot(db, key)
+    etag, computed_at = await _snapshot_version(key, "strategy")
+    cached = not_modified(request, etag, computed_at)
+    if cached is not None:
+        return cached
+    set_validators(response, etag, computed_at)
+
+    row = await _lookup_snapshot(key, RegimeSnapshot.strategy)
     if row.strategy is None:
         raise HTTPException(
             status_code=404,
@@ -297,14 +335,20 @@ def get_strategy(
 
 @router.get("/regimes/{key}/assets")
 @_limiter.limit("30/minute")
-def get_asset_analytics(
+async def get_asset_analytics(
     request: Request,
     key: str,
+    response: Response,
     _user=Depends(get_optional_user),
-    db: SessionType = Depends(get_db),
 ):
     """Return per-regime asset analytics."""
-    row = _lookup_snapshot(db, key)
+    etag, computed_at = await _snapshot_version(key, "assets")
+    cached = not_modified(request, etag, computed_at)
+    if cached is not None:
+        return cached
+    set_validators(response, etag, computed_at)
+
+    row = await _lookup_snapshot(key, RegimeSnapshot.asset_analytics)
     if row.asset_analytics is None:
         raise HTTPException(
             status_code=404,
@@ -319,14 +363,20 @@ def get_asset_analytics(
 
 @router.get("/regimes/{key}/meta")
 @_limiter.limit("60/minute")
-def get_meta(
+async def get_meta(
     request: Request,
     key: str,
+    response: Response,
     _user=Depends(get_optional_user),
-    db: SessionType = Depends(get_db),
 ):
     """Return model methodology documentation."""
-    row = _lookup_snapshot(db, key)
+    etag, computed_at = await _snapshot_version(key, "meta")
+    cached = not_modified(request, etag, computed_at)
+    if cached is not None:
+        return cached
+    set_validators(response, etag, computed_at)
+
+    row = await _lookup_snapshot(key, RegimeSnapshot.meta)
     return {
         "regime_type": row.regime_type,
         "computed_at": row.computed_at.isoformat(),
@@ -339,10 +389,11 @@ def get_meta(
 # ─────────────────────────────────────────────────────────────────────
 
 
-def _run_refresh(key: str) -> None:
-    """Background task runner."""
+def _run_refresh(key: str, full: bool = False) -> None:
+    """Background task runner (incremental unless *full*)."""
     try:
-        fp = compute_regime(key)
+        fp = compute_regime(key, incremental=not full)
+        invalidate_versions()
         logger.info("Regime refresh complete: %s", fp)
     except Exception as exc:
         logger.exception("Regime refresh failed for %s: %s", key, exc)
@@ -353,9 +404,16 @@ def _run_refresh(key: str) -> None:
 def refresh_regime(
     request: Request,
     key: str,
+    full: bool = Query(False, description="Force a full rebuild and rewrite"),
     _user=Depends(get_current_admin_user),
 ):
-    """Trigger a background recompute of a regime model (admin only)."""
+    """Trigger a background recompute of a regime model (admin only).
+
+    By default only months whose inputs changed since the last build are
+    patched into the stored timeseries (current state, asset analytics and
+    strategy are always recomputed); ``full=true`` forces a complete
+    rebuild and rewrite.
+    """
     try:
         get_regime(key)
     except KeyError:
@@ -364,5 +422,5 @@ def refresh_regime(
             detail=f"Regime '{key}' is not registered.",
         )
 
-    _refresh_executor.submit(_run_refresh, key)
+    _refresh_executor.submit(_run_refresh, key, full)
     return {"status": "computing", "regime": key}
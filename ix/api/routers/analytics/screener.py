@@ -13,7 +13,6 @@ from typing import Any
 import numpy as np
 import pandas as pd
 import requests
-import yfinance as yf
 from cachetools import TTLCache
 from fastapi import APIRouter, Depends, Query
 from starlette.requests import Request
@@ -42,6 +41,14 @@ _cusip_ticker_cache: dict[str, str | None] = {}
 # Persistent ticker info cache (sector, market_cap, industry) — survives recomputes
 _ticker_info_cache: dict[str, dict[str, Any]] = {}
 
+
+def _yf():
+    """yfinance, imported on first request rather than at API startup."""
+    import yfinance as yf
+
+    return yf
+
+
 SEC_HEADERS = {
     "User-Agent": "Investment-X Research Platform admin@investment-x.com",
     "Accept-Encoding": "gzip, deflate",
@@ -97,7 +104,7 @@ def _resolve_ticker_from_name(security_name: str) -> str | None:
 
     # 4. Fallback: yfinance search
     try:
-        search_result = yf.Search(clean, max_results=3)
+        search_result = _yf().Search(clean, max_results=3)
         if hasattr(search_result, "quotes") and search_result.quotes:
             for q in search_result.quotes:
                 sym = q.get("symbol", "")
@@ -301,13 +308,17 @@ def compute_screener() -> dict[str, Any]:
 
     logger.info(f"Resolved {len(symbols)} unique tickers from {len(distinct_cusips)} CUSIPs")
 
-    # Step 3: Download price data in batch
-    try:
-        data = yf.download(symbols, period="2y", progress=False, threads=True)
-    except Exception as e:
-        logger.error(f"yfinance download failed: {e}")
+    # Step 3: Download price data in batches (isolated worker processes)
+    from ix.collectors.yahoo import fetch_yahoo
+
+    start = (pd.Timestamp.now() - pd.DateOffset(years=2)).strftime("%Y-%m-%d")
+    frames = fetch_yahoo(symbols, start=start, actions=False)
+    if not frames:
+        logger.error("yfinance download returned no data")
         empty_result["universe_size"] = len(symbols)
         return empty_result
+    # (field, symbol) columns, as yf.download returns for many symbols
+    data = pd.concat(frames, axis=1).swaplevel(axis=1)
 
     if data.empty:
         empty_result["universe_size"] = len(symbols)
@@ -414,10 +425,18 @@ def compute_screener() -> dict[str, Any]:
             continue
 
     # Step 6: Forward earnings + market cap + sector (rate-limited)
+    # Checkpointed per symbol, so a resumed job run skips symbols already looked up
+    from ix.common.task.jobs import current as current_job
+
+    job = current_job()
     for stock in stocks[:100]:  # Cap at 100 to avoid excessive API calls
         sym = stock["symbol"]
+        if job.done(sym):
+            stock.update(job.value(sym) or {})
+            continue
+        fundamentals: dict[str, Any] = {}
         try:
-            t = yf.Ticker(sym)
+            t = _yf().Ticker(sym)
 
             # Forward EPS growth
             ge = t.growth_estimates
@@ -425,13 +444,13 @@ def compute_screener() -> dict[str, Any]:
                 if "+1y" in ge.index and "stock" in ge.columns:
                     val = ge.loc["+1y", "stock"]
                     if val is not None and not pd.isna(val):
-                        stock["fwd_eps_growth"] = round(float(val), 3)
+                        fundamentals["fwd_eps_growth"] = round(float(val), 3)
 
             # Market cap + sector (use persistent cache)
             if sym in _ticker_info_cache:
                 cached = _ticker_info_cache[sym]
-                stock["market_cap"] = cached.get("market_cap")
-                stock["sector"] = cached.get("sector")
+                fundamentals["market_cap"] = cached.get("market_cap")
+                fundamentals["sector"] = cached.get("sector")
             else:
                 try:
                     info = t.info
@@ -442,14 +461,16 @@ def compute_screener() -> dict[str, Any]:
                         "sector": sec,
                         "industry": info.get("industry"),
                     }
-                    stock["market_cap"] = mc
-                    stock["sector"] = sec
+                    fundamentals["market_cap"] = mc
+                    fundamentals["sector"] = sec
                 except Exception:
                     _ticker_info_cache[sym] = {"market_cap": None, "sector": None, "industry": None}
 
             time.sleep(0.12)
         except Exception:
             pass
+        stock.update(fundamentals)
+        job.complete(sym, fundamentals)
 
     # Step 6b: Relative strength percentile (post-pass)
     returns_6m = [(i, s.get("return_6m")) for i, s in enumerate(stocks)]
@@ -515,11 +536,15 @@ def compute_screener() -> dict[str, Any]:
         "universe_size": len(symbols),
     }
 
+    cache_result(result)
+    return result
+
+
+def cache_result(result: dict[str, Any]) -> None:
+    """Serve *result* from this process (the screener job runs in a worker process)."""
     with _lock:
         _cache["data"] = result
 
-    return result
-
 
 def _get_data() -> dict[str, Any]:
     """Get cached screener data, computing on first access."""
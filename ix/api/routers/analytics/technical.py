@@ -11,17 +11,11 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.io as pio
-import yfinance as yf
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
 
 from ix.api.dependencies import get_current_user
 from fastapi.responses import StreamingResponse
 from plotly.subplots import make_subplots
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from reportlab.lib import utils
-from pptx import Presentation
-from pptx.util import Inches, Pt
 
 from ix.common import get_logger
 from ix.core.technical.ohlcv_indicators import (
@@ -50,6 +44,12 @@ router = APIRouter()
 logger = get_logger(__name__)
 
 
+def _yf():
+    """yfinance, imported on first request rather than at API startup."""
+    import yfinance as yf
+
+    return yf
+
 
 @router.get("/technical/elliott")
 def technical_elliott(
@@ -72,7 +72,7 @@ def technical_elliott(
 ):
     try:
         tk = ticker.strip().upper()
-        raw = yf.download(tk, period=period, interval=interval, auto_adjust=False, progress=False)
+        raw = _yf().download(tk, period=period, interval=interval, auto_adjust=False, progress=False)
         if raw is None or raw.empty:
             raise HTTPException(status_code=404, detail=f"No data for ticker '{ticker}'.")
         df = _normalize_yf(raw, tk)
@@ -141,7 +141,7 @@ def technical_overlays(
         tk = ticker.strip().upper()
         period_map = {"1d": "2y", "1wk": "5y", "1mo": "10y"}
         yf_period = period_map.get(interval, "2y")
-        raw = yf.download(tk, period=yf_period, interval=interval, auto_adjust=False, progress=False)
+        raw = _yf().download(tk, period=yf_period, interval=interval, auto_adjust=False, progress=False)
         if raw is None or raw.empty:
             raise HTTPException(status_code=404, detail=f"No data for ticker '{tk}'.")
         df = _normalize_yf(raw, tk)
@@ -229,7 +229,7 @@ def export_technical_report(
     try:
         tk = ticker.strip().upper()
         # 1. Generate the chart image
-        raw = yf.download(tk, period="2y", interval=interval, auto_adjust=False, progress=False)
+        raw = _yf().download(tk, period="2y", interval=interval, auto_adjust=False, progress=False)
         if raw is None or raw.empty:
             raise HTTPException(status_code=404, detail=f"No data for ticker '{ticker}'.")
         df = _normalize_yf(raw, tk)
@@ -251,6 +251,9 @@ def export_technical_report(
         filename = f"InvestmentX_{tk}_Analysis_{datetime.now().strftime('%Y%m%d')}.{format}"
 
         if format.lower() == "pptx":
+            from pptx import Presentation
+            from pptx.util import Inches, Pt
+
             prs = Presentation()
             
             # Slide 1: Title
@@ -297,6 +300,10 @@ def export_technical_report(
             )
 
         else: # Default to PDF
+            from reportlab.lib import utils
+            from reportlab.lib.pagesizes import letter
+            from reportlab.pdfgen import canvas
+
             buffer = BytesIO()
             c = canvas.Canvas(buffer, pagesize=letter)
             width, height = letter
@@ -385,7 +392,7 @@ def get_research_chart(
         fetch_years = min(view_years * 3, 10)
         fetch_period = f"{fetch_years}y"
 
-        df = yf.download(tk, period=fetch_period, interval=interval, progress=False)
+        df = _yf().download(tk, period=fetch_period, interval=interval, progress=False)
         if df.empty:
             raise HTTPException(status_code=404, detail=f"No data for {tk}")
 
@@ -17,7 +17,7 @@ from starlette.requests import Request
 from ix.api.dependencies import get_optional_user
 from ix.api.rate_limit import limiter as _limiter
 
-from ix import Series
+from ix.db.query import Series
 
 router = APIRouter()
 
@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 from ix.db.conn import get_session
 from ix.db.models.chart_pack import ChartPack
 from ix.db.models import User
+from ix.api.conditional import make_etag, not_modified, set_validators
 from ix.api.dependencies import get_current_user, get_optional_user
 from ix.api.rate_limit import limiter as _limiter
 from ix.api.routers.charts.pack_reports import (
@@ -24,6 +25,9 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Packs are edited interactively — always revalidate (cheap 304 when unchanged)
+_PACK_CACHE_CONTROL = "private, no-cache"
+
 
 # ── Pydantic schemas ──
 
@@ -210,17 +214,36 @@ def create_pack(
 @router.get("/chart-packs/{pack_id}", response_model=PackDetail)
 def get_pack(
     request: Request,
+    response: Response,
     pack_id: str,
     user: Optional[User] = Depends(get_optional_user),
     db: Session = Depends(get_session),
 ):
-    pack = db.query(ChartPack).filter(ChartPack.id == pack_id).first()
-    if not pack or pack.is_deleted:
+    # Access check and validators from metadata only — the charts JSONB
+    # (embedded figures) is loaded only when the client's copy is stale.
+    head = (
+        db.query(
+            ChartPack.user_id,
+            ChartPack.is_published,
+            ChartPack.is_deleted,
+            ChartPack.updated_at,
+        )
+        .filter(ChartPack.id == pack_id)
+        .first()
+    )
+    if not head or head.is_deleted:
         raise HTTPException(status_code=404, detail="Chart pack not found")
     # Allow access if user owns the pack or it's published
-    is_owner = user and str(user.id) == str(pack.user_id)
-    if not is_owner and not pack.is_published:
+    is_owner = bool(user and str(user.id) == str(head.user_id))
+    if not is_owner and not head.is_published:
         raise HTTPException(status_code=404, detail="Chart pack not found")
+    etag = make_etag("chart-pack", pack_id, head.updated_at, is_owner)
+    cached = not_modified(request, etag, head.updated_at, cache_control=_PACK_CACHE_CONTROL)
+    if cached is not None:
+        return cached
+    set_validators(response, etag, head.updated_at, cache_control=_PACK_CACHE_CONTROL)
+
+    pack = db.query(ChartPack).filter(ChartPack.id == pack_id).first()
     creator = pack.creator
     creator_name = None
     if creator:
@@ -11,11 +11,6 @@ from fastapi import HTTPException
 
 from ix.common import get_logger
 
-try:
-    from xhtml2pdf import pisa
-except ImportError:
-    pisa = None
-
 logger = get_logger(__name__)
 
 _DEFAULT_DISCLAIMER = (
@@ -33,12 +28,19 @@ _DEFAULT_DISCLAIMER = (
 )
 
 
-def _require_pdf_dep() -> None:
-    if pisa is None:
+def _require_pdf_dep():
+    """The ``xhtml2pdf.pisa`` module, imported on first use (it is slow to load).
+
+    Raises a 503 when the optional dependency is not installed.
+    """
+    try:
+        from xhtml2pdf import pisa
+    except ImportError:
         raise HTTPException(
             status_code=503,
             detail="PDF export dependency is unavailable. Install `xhtml2pdf`.",
         )
+    return pisa
 
 
 def _resolve_chart_figure(
@@ -80,7 +82,7 @@ def generate_pack_report_pdf(
     """
     from ix.api.routers.charts.code_execution import render_chart_image
 
-    _require_pdf_dep()
+    pisa = _require_pdf_dep()
     buffer = BytesIO()
 
     # Flatten all figures for parallel rendering
@@ -515,7 +517,7 @@ def _generate_slides_pdf(
     """Generate a WYSIWYG PDF matching the report editor's light theme appearance."""
     from ix.api.routers.charts.code_execution import render_chart_image
 
-    _require_pdf_dep()
+    pisa = _require_pdf_dep()
     buffer = BytesIO()
 
     # Always render charts in light theme for the PDF
@@ -19,8 +19,8 @@ from ix.api.dependencies import get_current_user
 from ix.api.rate_limit import limiter as _limiter
 from ix.common import get_logger
 from ix.common.security.safe_expression import (
-    EVALUATION_EXPRESSION_CONTEXT,
     UnsafeExpressionError,
+    evaluation_context,
     safe_eval_expression,
     safe_exec_code,
 )
@@ -72,9 +72,9 @@ def _run_evaluation(code: str, fmt: str) -> Response:
         is_expression = False
 
     if is_expression:
-        result = safe_eval_expression(code, EVALUATION_EXPRESSION_CONTEXT)
+        result = safe_eval_expression(code, evaluation_context())
     else:
-        result = safe_exec_code(code, EVALUATION_EXPRESSION_CONTEXT)
+        result = safe_exec_code(code, evaluation_context())
 
     if isinstance(result, pd.Series):
         df = result.to_frame()
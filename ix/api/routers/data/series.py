@@ -5,15 +5,15 @@ Series router for advanced time series data retrieval.
 from fastapi import APIRouter, Depends, Query, HTTPException
 from fastapi.responses import Response
 from typing import List, Optional
-from collections import OrderedDict
-import json
-import math
 import pandas as pd
-from datetime import datetime
+from sqlalchemy.orm import Session as SessionType
 
 from ix.db.conn import ensure_connection
 from ix.db.query import Series
-from ix.api.dependencies import get_current_user
+from ix.api.conditional import not_modified, set_validators
+from ix.api.dependencies import get_current_user, get_db
+from ix.api.responses import data_validators, frame_response
+from ix.core.ts import empty_frame
 from ix.db.models.user import User
 from ix.common import get_logger
 from ix.common.security.safe_expression import (
@@ -29,6 +29,18 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
+def _split_series_alias(series_code: str) -> tuple[Optional[str], str]:
+    """Split ``NAME=Series(...)`` into ``(NAME, expression)``."""
+    if (
+        "=" in series_code
+        and not series_code.startswith("Series")
+        and not series_code.startswith("MultiSeries")
+    ):
+        alias_name, expression = series_code.split("=", maxsplit=1)
+        return alias_name.strip(), expression
+    return None, series_code
+
+
 @router.get("/series")
 @_limiter.limit("60/minute")
 def get_series(
@@ -40,6 +52,7 @@ def get_series(
     sort: str = Query("asc", description="Sort order ('asc' or 'desc')"),
     limit: Optional[int] = Query(None, ge=1, le=10000, description="Maximum number of rows"),
     offset: Optional[int] = Query(None, ge=0, description="Number of rows to skip"),
+    db: SessionType = Depends(get_db),
     _current_user: User = Depends(get_current_user),
 ):
     """
@@ -49,7 +62,8 @@ def get_series(
     - series: Series expressions (can be repeated multiple times)
     - start: Start date (YYYY-MM-DD format, optional)
     - end: End date (YYYY-MM-DD format, optional)
-    - format: Response format ('json', 'csv') (default: 'json')
+    - format: Response format ('json', 'csv') (default: 'json'). JSON
+      responses honour ``Accept`` for NDJSON / Arrow IPC / Parquet.
     - sort: Sort order ('asc', 'desc') (default: 'asc')
     - limit: Maximum number of rows to return (optional)
     - offset: Number of rows to skip (optional)
@@ -68,31 +82,26 @@ def get_series(
             status_code=400, detail="Invalid format. Must be 'json' or 'csv'"
         )
 
+    etag, last_modified = data_validators(
+        db,
+        request,
+        [_split_series_alias(c)[1] for c in series],
+        series, start, end, format, sort, limit, offset,
+    )
+    cached = not_modified(request, etag, last_modified)
+    if cached is not None:
+        return cached
+
     # Process series expressions
     series_data_list = []
 
     for series_code in series:
         try:
-            # Check for alias syntax: NAME=Series(...) or NAME=MultiSeries(...)
-            if (
-                "=" in series_code
-                and not series_code.startswith("Series")
-                and not series_code.startswith("MultiSeries")
-            ):
-                # Split into alias name and series expression
-                alias_name, expression = series_code.split("=", maxsplit=1)
-                series_data = safe_eval_expression(
-                    expression, SERIES_EXPRESSION_CONTEXT
-                )
-
-                # For Series: set the name attribute
-                if isinstance(series_data, pd.Series):
-                    series_data.name = alias_name.strip()
-            else:
-                # No alias, evaluate expression as-is
-                series_data = safe_eval_expression(
-                    series_code, SERIES_EXPRESSION_CONTEXT
-                )
+            alias_name, expression = _split_series_alias(series_code)
+            series_data = safe_eval_expression(expression, SERIES_EXPRESSION_CONTEXT)
+            # For Series: set the name attribute
+            if alias_name is not None and isinstance(series_data, pd.Series):
+                series_data.name = alias_name
 
             if series_data.empty:
                 continue
@@ -140,42 +149,21 @@ def get_series(
 
         if format == "csv":
             csv_data = df.to_csv()
-            return Response(
+            response = Response(
                 content=csv_data,
                 media_type="text/csv",
                 headers={"Content-Disposition": "attachment; filename=series_data.csv"},
             )
         else:
-            # Return as column-oriented dict
-            df_indexed = df.reset_index()
-            column_dict = OrderedDict()
-
-            for col in df_indexed.columns:
-                values = df_indexed[col].tolist()
-                cleaned_values = []
-                for v in values:
-                    if v is None or (isinstance(v, float) and math.isnan(v)):
-                        cleaned_values.append(None)
-                    elif isinstance(v, (pd.Timestamp, datetime)):
-                        cleaned_values.append(v.isoformat())
-                    else:
-                        cleaned_values.append(v)
-                column_dict[col] = cleaned_values
-
-            return Response(
-                content=json.dumps(column_dict, ensure_ascii=False),
-                media_type="application/json",
-            )
+            response = frame_response(df, request)
     else:
         # No data available
         if format == "csv":
-            return Response(
+            response = Response(
                 content="date,value\n",
                 media_type="text/csv",
                 headers={"Content-Disposition": "attachment; filename=series_data.csv"},
             )
         else:
-            return Response(
-                content=json.dumps({"Date": []}, ensure_ascii=False),
-                media_type="application/json",
-            )
+            response = frame_response(empty_frame(), request)
+    return set_validators(response, etag, last_modified)
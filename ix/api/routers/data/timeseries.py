@@ -18,6 +18,7 @@ from fastapi import (
 from fastapi.responses import Response, StreamingResponse, FileResponse
 from typing import Optional, List, Dict
 from pydantic import BaseModel
+import asyncio
 import json
 import pandas as pd
 from datetime import datetime, date, timezone
@@ -27,14 +28,15 @@ from ix.api.schemas import (
     TimeseriesCreate,
     TimeseriesBulkUpdate,
     TimeseriesDataUpload,
-    TimeseriesColumnarUpload,
     TimeseriesUpdate,
 )
 from ix.api.dependencies import get_db, get_current_admin_user, get_current_user, get_optional_user
 from ix.db.models import Timeseries
-from ix.db.conn import ensure_connection, Session
+from ix.db.conn import ensure_connection, fetch_all, fetch_first, Session
+from ix.db.pagination import count_rows, decode_cursor, encode_cursor, keyset_after, order_by
 from ix.db.models.user import User
-from sqlalchemy.orm import joinedload, Session as SessionType
+from sqlalchemy import select
+from sqlalchemy.orm import Session as SessionType
 from ix.common import get_logger
 from ix.api.rate_limit import limiter as _limiter
 from ix.common.security.safe_expression import UnsafeExpressionError
@@ -50,12 +52,18 @@ from ix.core.timeseries_processing import (
     process_bulk_create,
     process_template_upload,
     merge_columnar_to_db,
-    process_database_timeseries,
-    evaluate_expression,
+    merge_response,
+    ingest_columnar,
+    evaluate_codes,
     execute_code_block,
-    format_dataframe_to_column_dict,
-    format_favorites_dataframe,
+    empty_frame,
+    prepare_custom_frame,
+    favorite_versions,
+    favorites_panel,
+    slice_dates,
 )
+from ix.api.conditional import not_modified, set_validators
+from ix.api.responses import data_validators, frame_response
 
 logger = get_logger(__name__)
 
@@ -67,10 +75,70 @@ router = APIRouter()
 # ────────────────────────────────────────────────────────────────────
 
 
+# Columns of TimeseriesResponse; the listing never loads full rows
+_LISTING_COLUMNS = (
+    Timeseries.id,
+    Timeseries.code,
+    Timeseries.name,
+    Timeseries.provider,
+    Timeseries.asset_class,
+    Timeseries.category,
+    Timeseries.start,
+    Timeseries.end,
+    Timeseries.num_data,
+    Timeseries.source,
+    Timeseries.source_code,
+    Timeseries.frequency,
+    Timeseries.unit,
+    Timeseries.scale,
+    Timeseries.currency,
+    Timeseries.country,
+    Timeseries.remark,
+    Timeseries.favorite,
+)
+
+# ``code`` is unique, so it alone is a complete keyset
+_LISTING_ORDER = [(Timeseries.code, False)]
+
+
+def _listing_item(row) -> dict:
+    return {
+        "id": str(row.id),
+        "code": str(row.code) if row.code else None,
+        "name": str(row.name) if row.name else None,
+        "provider": row.provider,
+        "asset_class": str(row.asset_class) if row.asset_class else None,
+        "category": row.category,
+        "start": row.start,
+        "end": row.end,
+        "num_data": int(row.num_data) if row.num_data is not None else None,
+        "source": row.source,
+        "source_code": row.source_code,
+        "frequency": str(row.frequency) if row.frequency else None,
+        "unit": row.unit,
+        "scale": row.scale,
+        "currency": row.currency,
+        "country": row.country,
+        "remark": str(row.remark) if row.remark else None,
+        "favorite": bool(row.favorite) if row.favorite is not None else False,
+    }
+
+
 @router.get("/timeseries", response_model=List[TimeseriesResponse])
-def get_timeseries(
+async def get_timeseries(
+    response: Response,
     limit: Optional[int] = Query(None, ge=1, le=1000, description="Limit number of results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(
+        None,
+        max_length=1000,
+        description="Resume after this cursor (from X-Next-Cursor); replaces offset",
+    ),
+    count: str = Query(
+        "none",
+        pattern="^(exact|estimate|none)$",
+        description="Total in X-Total-Count: exact, estimate (cheap for large sets) or none",
+    ),
     search: Optional[str] = Query(
         None,
         max_length=200,
@@ -79,20 +147,30 @@ def get_timeseries(
     category: Optional[str] = Query(None, max_length=100, description="Filter by category"),
     asset_class: Optional[str] = Query(None, max_length=100, description="Filter by asset class"),
     provider: Optional[str] = Query(None, max_length=100, description="Filter by provider"),
-    db: SessionType = Depends(get_db),
     _user: User = Depends(get_current_user),
 ):
     """
     GET /api/timeseries - List all timeseries with optional filtering and pagination.
+
+    Selects only the response columns and reads on the async engine when
+    available (see ``ix.db.conn.fetch_all``). Without a search the list
+    is ordered by code and, when a page is full, ``X-Next-Cursor`` holds
+    the cursor for the next one. Search results are ranked by relevance
+    and page with ``offset`` only.
     """
-    ensure_connection()
+    if cursor and (search or offset):
+        raise HTTPException(
+            status_code=400, detail="cursor cannot be combined with search or offset"
+        )
 
-    timeseries_query = db.query(Timeseries).filter(Timeseries.is_deleted == False)
+    timeseries_query = select(*_LISTING_COLUMNS).filter(Timeseries.is_deleted == False)
 
     if search:
         timeseries_query = build_search_filter_and_order(
-            timeseries_query, search, Timeseries
+            timeseries_query, search, Timeseries, dialect_name="postgresql"
         )
+    else:
+        timeseries_query = timeseries_query.order_by(*order_by(_LISTING_ORDER))
 
     # Apply filters
     if category:
@@ -104,40 +182,33 @@ def get_timeseries(
     if provider:
         timeseries_query = timeseries_query.filter(Timeseries.provider == provider)
 
+    count_query = timeseries_query
+
     # Apply pagination
+    if cursor:
+        try:
+            after = decode_cursor(cursor, len(_LISTING_ORDER))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        timeseries_query = timeseries_query.filter(keyset_after(_LISTING_ORDER, after))
     if offset:
         timeseries_query = timeseries_query.offset(offset)
     if limit:
         timeseries_query = timeseries_query.limit(limit)
 
-    timeseries_list = timeseries_query.all()
+    rows, (total, exact) = await asyncio.gather(
+        fetch_all(timeseries_query), count_rows(count_query, count)
+    )
+    items = [_listing_item(row) for row in rows]
 
-    formatted_timeseries = []
-    for ts in timeseries_list:
-        formatted_ts = TimeseriesResponse(
-            id=str(ts.id),
-            code=str(ts.code) if ts.code else None,
-            name=str(ts.name) if ts.name else None,
-            provider=ts.provider,
-            asset_class=str(ts.asset_class) if ts.asset_class else None,
-            category=ts.category,
-            start=ts.start,
-            end=ts.end,
-            num_data=int(ts.num_data) if ts.num_data is not None else None,
-            source=ts.source,
-            source_code=getattr(ts, "source_code", None),
-            frequency=str(ts.frequency) if ts.frequency else None,
-            unit=getattr(ts, "unit", None),
-            scale=getattr(ts, "scale", None),
-            currency=getattr(ts, "currency", None),
-            country=getattr(ts, "country", None),
-            remark=str(ts.remark) if ts.remark else None,
-            favorite=bool(ts.favorite) if ts.favorite is not None else False,
-        )
-        formatted_timeseries.append(formatted_ts)
+    if limit and len(rows) == limit and not search:
+        response.headers["X-Next-Cursor"] = encode_cursor([rows[-1].code])
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
+        response.headers["X-Total-Count-Exact"] = "true" if exact else "false"
 
-    logger.info("Retrieved %d timeseries records", len(formatted_timeseries))
-    return formatted_timeseries
+    logger.info("Retrieved %d timeseries records", len(items))
+    return items
 
 
 @router.get("/timeseries/sources")
@@ -353,6 +424,7 @@ def upload_data_json(
         "message": f"Merged {result['points']} points for {len(result['updated'])} codes.",
         "db_updated": result["updated"],
         "db_points_merged": result["points"],
+        "db_changed": result["changed"],
         "warning": f"Codes not found: {result['not_found']}" if result["not_found"] else None,
     }
 
@@ -697,17 +769,14 @@ def get_timeseries_by_id(
 
 
 @router.get("/timeseries/code/{code}", response_model=TimeseriesResponse)
-def get_timeseries_by_code(
+async def get_timeseries_by_code(
     code: str,
-    db: SessionType = Depends(get_db),
     _user: User = Depends(get_current_user),
 ):
     """
     GET /api/timeseries/code/{code} - Get timeseries by its code.
     """
-    ensure_connection()
-
-    ts = db.query(Timeseries).filter(Timeseries.code == code).first()
+    ts = await fetch_first(select(Timeseries).filter(Timeseries.code == code))
 
     if not ts:
         raise HTTPException(
@@ -743,6 +812,7 @@ def get_timeseries_by_code(
 
 @router.get("/timeseries/favorites")
 def get_favorite_timeseries_data(
+    request: Request,
     start_date: Optional[str] = Query(None, description="Start date (ISO-8601)"),
     end_date: Optional[str] = Query(None, description="End date (ISO-8601)"),
     db: SessionType = Depends(get_db),
@@ -751,39 +821,26 @@ def get_favorite_timeseries_data(
     """
     GET /api/timeseries/favorites - Get all favorite timeseries data as a concatenated DataFrame.
 
-    Returns column-oriented JSON format with dates sorted descending.
+    Returns column-oriented JSON format with dates sorted descending, or
+    NDJSON / Arrow IPC / Parquet when requested via ``Accept``.
     """
     ensure_connection()
 
     try:
-        favorite_timeseries = (
-            db.query(Timeseries)
-            .filter(Timeseries.favorite == True)
-            .all()
+        versions = favorite_versions(db)
+        # ETag only: un-favouriting a series does not move the newest
+        # version of the remaining ones, so Last-Modified would go stale
+        etag, _ = data_validators(
+            db, request, sorted(versions), start_date, end_date
         )
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
 
-        if not favorite_timeseries:
-            return Response(
-                content=json.dumps({"Date": []}, ensure_ascii=False),
-                media_type="application/json",
-            )
-
-        # Collect all series data
-        series_list = []
-        for ts in favorite_timeseries:
-            try:
-                ts_data = process_database_timeseries(ts, db)
-                if ts_data is not None:
-                    series_list.append(ts_data)
-            except Exception as e:
-                logger.warning("Error processing favorite timeseries %s: %s", ts.code, e)
-                continue
-
-        column_dict = format_favorites_dataframe(series_list, start_date, end_date)
-        return Response(
-            content=json.dumps(column_dict, ensure_ascii=False),
-            media_type="application/json",
-        )
+        # Materialised panel; only series changed since it was built are reloaded
+        panel = favorites_panel(db, versions)
+        df = slice_dates(panel, start_date, end_date)
+        return set_validators(frame_response(df, request), etag)
 
     except Exception as e:
         logger.exception("Error retrieving favorite timeseries: %s", e)
@@ -934,9 +991,10 @@ async def get_custom_timeseries_data(
     - Comma-separated (legacy, breaks if codes contain commas): X-Codes: CODE1, CODE2, CODE3
 
     Behavior:
-    - Queries each code one by one from the Timeseries table
+    - Loads all requested codes, and every series referenced by an expression, in one query
     - If code is found in database, uses stored data
-    - If code is NOT found, attempts to evaluate it as a Python expression (e.g., Series('CODE'))
+    - If code is NOT found, evaluates it as a Python expression (e.g., Series('CODE')),
+      expressions running concurrently against the preloaded series
     - Supports mixing database timeseries with dynamically computed series
 
     Examples:
@@ -946,7 +1004,10 @@ async def get_custom_timeseries_data(
 
     Note: For codes containing commas or special characters, use JSON body or JSON in X-Codes header.
 
-    Returns column-oriented format with dates sorted descending.
+    Returns column-oriented format with dates sorted descending. Send
+    ``Accept: application/x-ndjson`` for chunked streaming, or
+    ``application/vnd.apache.arrow.stream`` / ``application/vnd.apache.parquet``
+    for binary columnar output.
     """
     ensure_connection()
 
@@ -955,48 +1016,27 @@ async def get_custom_timeseries_data(
         logger.debug("Processing %d codes: %s", len(codes), codes)
 
         def _process_all_codes_sync():
-            series_list = []
-
-            # Batch-fetch all codes in one query instead of N sequential queries
-            all_ts = (
-                db.query(Timeseries)
-                .options(joinedload(Timeseries.data_record))
-                .filter(Timeseries.code.in_(codes))
-                .all()
-            )
-            found = {ts.code: ts for ts in all_ts}
-
-            for code in codes:
-                try:
-                    ts = found.get(code)
-                    if ts:
-                        ts_data = process_database_timeseries(ts, db)
-                        if ts_data is not None:
-                            series_list.append(ts_data)
-                    else:
-                        evaluated_series = evaluate_expression(
-                            code, start_date, end_date
-                        )
-                        series_list.extend(evaluated_series)
-                except Exception as e:
-                    logger.warning("Error processing custom timeseries %s: %s", code, e)
-                    continue
+            etag = last_modified = None
+            if request.method == "GET":
+                etag, last_modified = data_validators(
+                    db, request, codes, start_date, end_date
+                )
+                cached = not_modified(request, etag, last_modified)
+                if cached is not None:
+                    return cached
+
+            series_list = evaluate_codes(db, codes, start_date, end_date)
 
             if series_list:
-                df = pd.concat(series_list, axis=1)
-                column_dict = format_dataframe_to_column_dict(
-                    df, series_list, start_date, end_date
+                df = prepare_custom_frame(
+                    pd.concat(series_list, axis=1), series_list, start_date, end_date
                 )
-                return Response(
-                    content=json.dumps(column_dict, ensure_ascii=False),
-                    media_type="application/json",
-                    headers={"Cache-Control": "private, max-age=60"},
+                response = frame_response(
+                    df, request, headers={"Cache-Control": "private, max-age=60"}
                 )
             else:
-                return Response(
-                    content=json.dumps({"Date": []}, ensure_ascii=False),
-                    media_type="application/json",
-                )
+                response = frame_response(empty_frame(), request)
+            return set_validators(response, etag, last_modified)
 
         import asyncio
 
@@ -1123,35 +1163,30 @@ def upload_data(
     pivoted.index = pd.to_datetime(pivoted.index)
 
     result = merge_columnar_to_db(pivoted, db)
-    response = {"message": f"Merged {result['points']} points for {len(result['updated'])} codes.", "db_updated": result["updated"], "db_points_merged": result["points"]}
-    if result["not_found"]:
-        response["warning"] = f"Codes not found in database: {result['not_found']}"
-
-    return response
+    return merge_response(result)
 
 
 @router.post("/upload_data_columnar")
 @_limiter.limit("10/minute")
-def upload_data_columnar(
+async def upload_data_columnar(
     request: Request,
-    payload: TimeseriesColumnarUpload,
-    db: SessionType = Depends(get_db),
     _current_user: User = Depends(get_current_admin_user),
 ):
-    """POST /api/upload_data_columnar - Upload columnar timeseries data and merge into local DB."""
-    if not payload.dates or not payload.columns:
-        raise HTTPException(status_code=400, detail="No data provided")
-
-    ensure_connection()
-    dates_index = pd.to_datetime(payload.dates, errors="coerce")
-    df = pd.DataFrame(payload.columns, index=dates_index)
-    df = df.dropna(how="all", axis=0).dropna(how="all", axis=1)
-    if df.empty:
-        raise HTTPException(status_code=400, detail="No valid records after cleaning.")
+    """POST /api/upload_data_columnar - Upload columnar timeseries data and merge into local DB.
 
-    result = merge_columnar_to_db(df, db)
-    response = {"message": f"Merged {result['points']} points for {len(result['updated'])} codes.", "db_updated": result["updated"], "db_points_merged": result["points"]}
-    if result["not_found"]:
-        response["warning"] = f"Codes not found in database: {result['not_found']}"
+    The body is JSON (``TimeseriesColumnarUpload``), CSV (``text/csv``) or
+    an Arrow IPC stream (``application/vnd.apache.arrow.stream``), chosen
+    by ``Content-Type``. The merge runs off the event loop.
+    """
+    body = await request.body()
+    if not body:
+        raise HTTPException(status_code=400, detail="No data provided")
+    if len(body) > 200 * 1024 * 1024:
+        raise HTTPException(status_code=400, detail="Payload exceeds 200MB size limit")
 
-    return response
+    try:
+        return await asyncio.to_thread(
+            ingest_columnar, body, request.headers.get("content-type", "application/json")
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
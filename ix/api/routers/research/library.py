@@ -1,5 +1,6 @@
 """Research library — upload / list / serve / delete institutional research PDFs (DB-backed)."""
 
+import asyncio
 import hashlib
 from datetime import datetime, timezone
 from typing import List, Optional
@@ -9,12 +10,14 @@ from fastapi.responses import Response
 from pydantic import BaseModel
 from slowapi import Limiter
 from slowapi.util import get_remote_address
-from sqlalchemy.orm import Session, defer
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from ix.api.dependencies import get_current_admin_user, get_current_user, get_optional_user
-from ix.db.conn import get_session as get_db
+from ix.db.conn import fetch_all, get_session as get_db
 from ix.db.models import ResearchFile
 from ix.db.models.user import User
+from ix.db.pagination import count_rows, decode_cursor, encode_cursor, keyset_after, order_by
 from ix.common import get_logger
 
 logger = get_logger(__name__)
@@ -38,7 +41,23 @@ class LibraryItem(BaseModel):
 
 class PaginatedLibrary(BaseModel):
     items: List[LibraryItem]
-    total: int
+    total: Optional[int] = None
+    total_exact: bool = True
+    next_cursor: Optional[str] = None
+
+
+# Everything LibraryItem needs; never the PDF bytes
+_LISTING_COLUMNS = (
+    ResearchFile.id,
+    ResearchFile.filename,
+    ResearchFile.size_bytes,
+    ResearchFile.uploaded_by,
+    ResearchFile.created_at,
+    ResearchFile.summary,
+)
+
+# Matches ix_research_files_listing; ``id`` breaks filename ties
+_LISTING_ORDER = [(ResearchFile.filename, True), (ResearchFile.id, True)]
 
 
 def _to_item(row: ResearchFile) -> dict:
@@ -61,21 +80,52 @@ def _to_item(row: ResearchFile) -> dict:
 
 @router.get("", response_model=PaginatedLibrary)
 @_limiter.limit("60/minute")
-def list_research(
+async def list_research(
     request: Request,
     q: Optional[str] = None,
     limit: int = Query(25, ge=1, le=500),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, max_length=2000),
+    count: str = Query("exact", pattern="^(exact|estimate|none)$"),
     current_user: User = Depends(get_current_user),
 ):
-    base = db.query(ResearchFile).options(defer(ResearchFile.content)).filter(ResearchFile.is_deleted == False)
+    """List research files, newest-named first.
+
+    Pass ``next_cursor`` back as ``cursor`` for the next page instead of
+    growing ``offset``. ``count=estimate`` bounds the cost of ``total`` on
+    large result sets (``total_exact`` is then false past the bound);
+    ``count=none`` skips it.
+    """
+    if cursor and offset:
+        raise HTTPException(400, "cursor cannot be combined with offset")
+    stmt = select(*_LISTING_COLUMNS).where(ResearchFile.is_deleted == False)
     if q:
         pattern = f"%{q}%"
-        base = base.filter(ResearchFile.filename.ilike(pattern) | ResearchFile.summary.ilike(pattern))
-    total = base.count()
-    rows = base.order_by(ResearchFile.filename.desc()).offset(offset).limit(limit).all()
-    return {"items": [_to_item(r) for r in rows], "total": total}
+        stmt = stmt.where(ResearchFile.filename.ilike(pattern) | ResearchFile.summary.ilike(pattern))
+
+    page = stmt.order_by(*order_by(_LISTING_ORDER))
+    if cursor:
+        try:
+            after = decode_cursor(cursor, len(_LISTING_ORDER))
+        except ValueError:
+            raise HTTPException(400, "Invalid cursor")
+        page = page.where(keyset_after(_LISTING_ORDER, after))
+    elif offset:
+        page = page.offset(offset)
+
+    # Page and count are independent reads; run them side by side
+    rows, (total, exact) = await asyncio.gather(
+        fetch_all(page.limit(limit)), count_rows(stmt, count)
+    )
+    next_cursor = None
+    if len(rows) == limit:
+        next_cursor = encode_cursor([rows[-1].filename, rows[-1].id])
+    return {
+        "items": [_to_item(r) for r in rows],
+        "total": total,
+        "total_exact": exact,
+        "next_cursor": next_cursor,
+    }
 
 
 # ── Upload ────────────────────────────────────────────────────────────────────
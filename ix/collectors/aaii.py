@@ -19,6 +19,8 @@ class AAIISentimentCollector(BaseCollector):
     display_name = "AAII Sentiment Survey"
     schedule = "0 12 * * 4"  # Thursday noon
     category = "sentiment"
+    # The latest weekly reading is occasionally corrected
+    revision_days = 14
 
     SURVEY_URL = "https://www.aaii.com/sentimentsurvey/sent_results"
     HISTORICAL_URL = "https://www.aaii.com/files/surveys/sentiment.xls"
@@ -35,41 +37,47 @@ class AAIISentimentCollector(BaseCollector):
         errors = 0
 
         try:
-            df = self._fetch_sentiment_data()
+            tracker = self.change_tracker()
+            df = self._fetch_sentiment_data(tracker)
+            if tracker.nothing_changed:
+                return self._unchanged_result(tracker)
             if df is None or df.empty:
                 self.update_state(error="Failed to fetch AAII data")
                 return {"inserted": 0, "updated": 0, "errors": 1, "message": "No data"}
 
             total = len(self.SERIES)
+            items = []
+            for i, (code, suffix, label) in enumerate(self.SERIES):
+                if progress_cb:
+                    progress_cb(i + 1, total, f"Updating {code}")
+                try:
+                    if suffix == "Spread":
+                        series = df["Bullish"] - df["Bearish"]
+                    else:
+                        series = df[suffix]
+                    series = series.dropna()
+
+                    items.append((
+                        code,
+                        {
+                            "source": "AAII",
+                            "source_code": f"AAII:{suffix}",
+                            "name": f"AAII {label}",
+                            "category": "Sentiment",
+                            "frequency": "W",
+                            "unit": "percent",
+                        },
+                        series,
+                    ))
+                except Exception as e:
+                    self.logger.error(f"Error processing {code}: {e}")
+                    errors += 1
+
             with Session() as db:
-                for i, (code, suffix, label) in enumerate(self.SERIES):
-                    if progress_cb:
-                        progress_cb(i + 1, total, f"Updating {code}")
-                    try:
-                        if suffix == "Spread":
-                            series = df["Bullish"] - df["Bearish"]
-                        else:
-                            series = df[suffix]
-                        series = series.dropna()
-
-                        self._upsert_timeseries(
-                            db,
-                            source="AAII",
-                            code=code,
-                            source_code=f"AAII:{suffix}",
-                            name=f"AAII {label}",
-                            category="Sentiment",
-                            data=series,
-                            frequency="W",
-                            unit="percent",
-                        )
-                        inserted += 1
-                    except Exception as e:
-                        self.logger.error(f"Error processing {code}: {e}")
-                        errors += 1
+                inserted = self._upsert_changes(db, items)
 
             last_date = str(df.index.max().date()) if not df.empty else None
-            self.update_state(last_data_date=last_date)
+            self.update_state(last_data_date=last_date, extra_state={"sources": tracker.commit()})
 
         except Exception as e:
             self.logger.exception(f"AAII collector failed: {e}")
@@ -83,11 +91,16 @@ class AAIISentimentCollector(BaseCollector):
             "message": f"AAII: {inserted} series updated",
         }
 
-    def _fetch_sentiment_data(self) -> pd.DataFrame:
-        """Try historical Excel first, fall back to page scraping."""
+    def _fetch_sentiment_data(self, tracker) -> pd.DataFrame:
+        """Try historical Excel first, fall back to page scraping.
+
+        Returns ``None`` without parsing when the Excel file is unchanged.
+        """
         # Try Excel download
         try:
-            resp = requests.get(self.HISTORICAL_URL, timeout=30)
+            resp = tracker.get(self.HISTORICAL_URL, timeout=30)
+            if resp is None:
+                return None
             if resp.status_code == 200:
                 df = pd.read_excel(
                     resp.content,
@@ -120,6 +133,7 @@ class AAIISentimentCollector(BaseCollector):
                         df[col] = pd.to_numeric(df[col], errors="coerce") * 100
                 return df[["Bullish", "Bearish", "Neutral"]].dropna()
         except Exception as e:
+            tracker.discard(self.HISTORICAL_URL)
             self.logger.warning(f"Excel download failed, trying scrape: {e}")
 
         # Fallback: scrape current page
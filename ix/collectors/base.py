@@ -1,14 +1,58 @@
 """Base collector class for all data collectors."""
 
+import json
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional, Tuple
+import numpy as np
 import pandas as pd
+from sqlalchemy import text
 
+from ix.collectors.incremental import ChangeTracker
 from ix.db.conn import Session
 from ix.db.models.collector_state import CollectorState
 from ix.common import get_logger
 
+# Timeseries columns taken from upsert metadata when a code is new
+UPSERT_FIELDS = ("source", "source_code", "name", "category", "frequency", "unit")
+
+# start / end / num_data / latest_value from the merged payloads; keys
+# are ISO dates, so lexical min / max are the first / last observation.
+_REFRESH_STATS = text(
+    r"""
+    UPDATE timeseries AS t
+    SET start = CAST(s.first_key AS date),
+        "end" = CAST(s.last_key AS date),
+        num_data = s.n,
+        latest_value = CAST(d.data ->> s.last_key AS double precision),
+        updated = now()
+    FROM timeseries_data AS d
+    CROSS JOIN LATERAL (
+        SELECT min(k) AS first_key, max(k) AS last_key, count(*) AS n
+        FROM jsonb_object_keys(d.data) AS k
+        WHERE k ~ '^\d{4}-\d{2}-\d{2}$'
+    ) AS s
+    WHERE d.timeseries_id = t.id
+      AND t.id = ANY(CAST(:ids AS uuid[]))
+    """
+)
+
+# Stored points of each code from ``revision_days`` before its end onwards
+_STORED_TAIL = text(
+    """
+    SELECT t.code, t."end", p.key, p.value
+    FROM timeseries AS t
+    LEFT JOIN timeseries_data AS d ON d.timeseries_id = t.id
+    LEFT JOIN LATERAL (
+        SELECT key, value
+        FROM jsonb_each_text(d.data)
+        WHERE t."end" IS NOT NULL
+          AND key >= to_char(t."end" - CAST(:days AS integer), 'YYYY-MM-DD')
+    ) AS p ON true
+    WHERE t.code = ANY(:codes)
+    """
+)
+
 
 class BaseCollector(ABC):
     """Abstract base for all data collectors."""
@@ -17,6 +61,8 @@ class BaseCollector(ABC):
     display_name: str = ""
     schedule: str = ""  # Cron expression
     category: str = ""  # positioning, sentiment, filings, research, academic
+    # Days before a series' stored end that are compared again (upstream revisions)
+    revision_days: int = 0
 
     def __init__(self):
         self.logger = get_logger(f"collector.{self.name}")
@@ -78,6 +124,77 @@ class BaseCollector(ABC):
                 state.state = current
             state.fetch_count = (state.fetch_count or 0) + 1
 
+    # ─────────────────────────────────────────────────────────────────
+    # Incremental runs
+    # ─────────────────────────────────────────────────────────────────
+
+    def change_tracker(self) -> ChangeTracker:
+        """Tracker seeded with the source validators stored by earlier runs."""
+        state = self.get_state()
+        return ChangeTracker(((state.state or {}) if state else {}).get("sources"))
+
+    def _unchanged_result(self, tracker: ChangeTracker) -> dict:
+        """Record and report a run whose sources were all unchanged."""
+        self.update_state(
+            extra_state={
+                "sources": tracker.commit(),
+                "last_unchanged_at": datetime.utcnow().isoformat(timespec="seconds"),
+            }
+        )
+        self.logger.info(f"{self.display_name}: sources unchanged, nothing to write")
+        return {
+            "inserted": 0,
+            "updated": 0,
+            "errors": 0,
+            "message": f"{self.display_name}: sources unchanged",
+        }
+
+    def _changed_points(
+        self, db, items: Iterable[Tuple[str, dict, pd.Series]]
+    ) -> list:
+        """*items* cut to the observations not stored yet, or stored with another value.
+
+        A series' stored ``end`` is its high-water mark: observations
+        before ``end - revision_days`` are dropped unread, later ones are
+        compared with the stored points of that window, fetched for all
+        codes in one query. Items left with nothing to write are dropped;
+        codes not stored yet keep all their observations.
+        """
+        from ix.db.models import Timeseries
+
+        items = [(code, meta, Timeseries._clean_data(data.copy())) for code, meta, data in items]
+        if not items:
+            return []
+        rows = db.execute(
+            _STORED_TAIL,
+            {"codes": [code for code, _, _ in items], "days": self.revision_days},
+        )
+        ends: dict[str, object] = {}
+        stored: dict[str, dict] = {}
+        for code, end, key, value in rows:
+            ends[code] = end
+            if key is not None:
+                stored.setdefault(code, {})[key] = value
+
+        changed = []
+        for code, meta, data in items:
+            end = ends.get(code)
+            if end is not None and not data.empty:
+                data = data[data.index >= pd.Timestamp(end) - pd.Timedelta(days=self.revision_days)]
+                known = stored.get(code, {})
+                previous = pd.to_numeric(
+                    pd.Series([known.get(k) for k in data.index.strftime("%Y-%m-%d")], dtype=object),
+                    errors="coerce",
+                ).to_numpy(dtype=float)
+                data = data[~np.isclose(data.to_numpy(dtype=float), previous, rtol=1e-12, atol=0.0)]
+            if not data.empty:
+                changed.append((code, meta, data))
+        return changed
+
+    def _upsert_changes(self, db, items: Iterable[Tuple[str, dict, pd.Series]]) -> int:
+        """:meth:`_bulk_upsert_timeseries` of the :meth:`_changed_points` of *items*."""
+        return self._bulk_upsert_timeseries(db, self._changed_points(db, items))
+
     def _upsert_timeseries(
         self,
         db,
@@ -91,22 +208,107 @@ class BaseCollector(ABC):
         frequency: str = None,
         unit: str = None,
     ):
-        """Upsert a timeseries entry following existing patterns."""
-        from ix.db.models import Timeseries
+        """Upsert a single timeseries (see :meth:`_bulk_upsert_timeseries`)."""
+        metadata = {
+            "source": source,
+            "source_code": source_code,
+            "name": name,
+            "category": category,
+            "frequency": frequency,
+            "unit": unit,
+        }
+        self._bulk_upsert_timeseries(db, [(code, metadata, data)])
+
+    def _bulk_upsert_timeseries(
+        self, db, items: Iterable[Tuple[str, dict, pd.Series]]
+    ) -> int:
+        """Write many ``(code, metadata, data)`` series in one transaction.
+
+        Existing rows are resolved in one query; missing codes are inserted
+        with a single multi-row ``INSERT`` using *metadata* (keys from
+        :data:`UPSERT_FIELDS`; existing rows keep theirs). Payloads are
+        merged into ``timeseries_data`` server-side (``jsonb ||``), so
+        stored history is never read back, and start / end / count /
+        latest value are recomputed in the same statement batch. Parents
+        receive their children's points, as with the ``data`` setter.
+
+        Commits *db*, then invalidates the caches of every written series.
+
+        Returns:
+            Number of series written.
+        """
+        from sqlalchemy import String, Text, cast, column, func, select, update, values
+        from sqlalchemy.dialects.postgresql import JSONB, UUID, insert
+
+        from ix.db.models import Timeseries, TimeseriesData
+        from ix.db.models.cache import _cache_invalidate
+        from ix.db.query import clear_series_cache
+
+        payloads: dict[str, dict] = {}
+        metadata: dict[str, dict] = {}
+        for code, meta, data in items:
+            data = Timeseries._clean_data(data.copy())
+            if data.empty:
+                continue
+            payloads.setdefault(code, {}).update(
+                {str(k.date()): float(v) for k, v in data.items()}
+            )
+            metadata.setdefault(code, meta)
+        if not payloads:
+            return 0
+
+        def resolve(codes):
+            stmt = select(Timeseries.code, Timeseries.id, Timeseries.parent_id).where(
+                Timeseries.code.in_(codes)
+            )
+            return {code: (ts_id, parent_id) for code, ts_id, parent_id in db.execute(stmt)}
+
+        rows = resolve(list(payloads))
+        missing = [code for code in payloads if code not in rows]
+        if missing:
+            db.execute(
+                insert(Timeseries)
+                .values(
+                    [
+                        {"code": code, **{f: metadata[code].get(f) for f in UPSERT_FIELDS}}
+                        for code in missing
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=["code"])
+            )
+            rows.update(resolve(missing))
+
+        # {timeseries id: points}; a parent gets its children's points too
+        merged: dict[str, dict] = {}
+        for code, points in payloads.items():
+            ts_id, parent_id = rows[code]
+            merged.setdefault(ts_id, {}).update(points)
+            if parent_id and parent_id != ts_id:
+                merged.setdefault(parent_id, {}).update(points)
+        ids = list(merged)
 
-        ts = db.query(Timeseries).filter(Timeseries.code == code).first()
-        if ts is None:
-            ts = Timeseries(
-                code=code,
-                name=name,
-                source=source,
-                source_code=source_code,
-                category=category,
-                frequency=frequency,
-                unit=unit,
+        db.execute(
+            insert(TimeseriesData)
+            .values([{"timeseries_id": ts_id, "data": {}} for ts_id in ids])
+            .on_conflict_do_nothing(index_elements=["timeseries_id"])
+        )
+        incoming = values(
+            column("id", String), column("points", Text), name="incoming"
+        ).data([(ts_id, json.dumps(points)) for ts_id, points in merged.items()])
+        db.execute(
+            update(TimeseriesData)
+            .where(TimeseriesData.timeseries_id == cast(incoming.c.id, UUID(as_uuid=False)))
+            .values(
+                data=TimeseriesData.data.op("||")(cast(incoming.c.points, JSONB)),
+                updated=func.now(),
             )
-            db.add(ts)
-            db.flush()
-        # Use the data setter which handles merge + cache invalidation
-        ts.data = data
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(_REFRESH_STATS, {"ids": ids})
+        db.commit()
 
+        for ts_id in ids:
+            _cache_invalidate(ts_id)
+        for code in payloads:
+            clear_series_cache(code)
+        return len(payloads)
@@ -5,7 +5,7 @@ browser-like headers for put/call CSVs. If CBOE blocks the request, skips
 gracefully — the VIX term structure metrics still work from existing VIX data.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pandas as pd
 import requests
@@ -19,6 +19,8 @@ class CBOECollector(BaseCollector):
     display_name = "CBOE Put/Call & VIX"
     schedule = "0 20 * * 1-5"  # Weekdays 8 PM
     category = "sentiment"
+    # Recent closes and ratios are compared again, in case of late corrections
+    revision_days = 7
 
     HEADERS = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
@@ -49,13 +51,14 @@ class CBOECollector(BaseCollector):
         errors = 0
         steps = 4  # PC ratios + VIX3M fetch + VIX term structure
         current = 0
+        tracker = self.change_tracker()
 
         with Session() as db:
             # 1) Try CBOE put/call CSVs (may be blocked)
             current += 1
             if progress_cb:
                 progress_cb(current, steps, "Fetching put/call ratios")
-            pc_count = self._fetch_put_call_ratios(db)
+            pc_count = self._fetch_put_call_ratios(db, tracker)
             inserted += pc_count
 
             # 2) Fetch VIX3M via yfinance and store
@@ -84,7 +87,9 @@ class CBOECollector(BaseCollector):
             if progress_cb:
                 progress_cb(current, steps, "Done")
 
-        self.update_state(last_data_date=str(datetime.now().date()))
+        self.update_state(
+            last_data_date=str(datetime.now().date()), extra_state={"sources": tracker.commit()}
+        )
         return {
             "inserted": inserted,
             "updated": 0,
@@ -92,37 +97,47 @@ class CBOECollector(BaseCollector):
             "message": f"CBOE: {inserted} series updated",
         }
 
-    def _fetch_put_call_ratios(self, db) -> int:
-        """Try to fetch CBOE put/call ratio CSVs."""
-        count = 0
+    def _fetch_put_call_ratios(self, db, tracker) -> int:
+        """Try to fetch CBOE put/call ratio CSVs; unchanged files are skipped."""
+        items = []
         for code, info in self.PC_URLS.items():
             try:
-                series = self._fetch_pc_csv(info["url"])
+                resp = tracker.get(info["url"], key=code, timeout=30, headers=self.HEADERS)
+                if resp is None:
+                    continue
+                series = self._parse_pc_csv(resp) if resp.status_code == 200 else None
                 if series is not None and not series.empty:
-                    self._upsert_timeseries(
-                        db,
-                        source="CBOE",
-                        code=code,
-                        source_code=info["source_code"],
-                        name=info["name"],
-                        category="Sentiment",
-                        data=series,
-                        unit="ratio",
-                    )
-                    count += 1
+                    items.append((
+                        code,
+                        {
+                            "source": "CBOE",
+                            "source_code": info["source_code"],
+                            "name": info["name"],
+                            "category": "Sentiment",
+                            "unit": "ratio",
+                        },
+                        series,
+                    ))
                 else:
+                    tracker.discard(code)
                     self.logger.warning(f"No data for {code} (CBOE may be blocking)")
             except Exception as e:
+                tracker.discard(code)
                 self.logger.error(f"Error fetching {code}: {e}")
-        return count
-
-    def _fetch_pc_csv(self, url: str) -> pd.Series:
-        """Download and parse a CBOE put/call ratio CSV."""
+        if not items:
+            return 0
         try:
-            resp = requests.get(url, timeout=30, headers=self.HEADERS)
-            if resp.status_code != 200:
-                return None
+            return self._upsert_changes(db, items)
+        except Exception as e:
+            self.logger.error(f"Error writing put/call ratios: {e}")
+            db.rollback()
+            for code, _, _ in items:
+                tracker.discard(code)
+            return 0
 
+    def _parse_pc_csv(self, resp: requests.Response) -> pd.Series:
+        """Parse a CBOE put/call ratio CSV response."""
+        try:
             from io import StringIO
             df = pd.read_csv(StringIO(resp.text))
 
@@ -145,15 +160,24 @@ class CBOECollector(BaseCollector):
             df = df.set_index("date").sort_index()
             return pd.to_numeric(df[ratio_col], errors="coerce").dropna()
         except Exception as e:
-            self.logger.warning(f"Failed to parse PC ratio from {url}: {e}")
+            self.logger.warning(f"Failed to parse PC ratio from {resp.url}: {e}")
             return None
 
     def _fetch_vix3m(self, db) -> int:
-        """Fetch VIX3M (3-month VIX) via yfinance and store as timeseries."""
+        """Fetch VIX3M (3-month VIX) via yfinance and store as timeseries.
+
+        Only the days from ``revision_days`` before the stored end are
+        requested once the series exists.
+        """
         import yfinance as yf
+        from ix.db.models import Timeseries
 
+        end = db.query(Timeseries.end).filter(Timeseries.code == "VIX3M INDEX:PX_LAST").scalar()
         ticker = yf.Ticker("^VIX3M")
-        hist = ticker.history(period="max")
+        if end is None:
+            hist = ticker.history(period="max")
+        else:
+            hist = ticker.history(start=str(end - timedelta(days=self.revision_days)))
         if hist.empty:
             self.logger.warning("No VIX3M data from yfinance")
             return 0
@@ -164,24 +188,25 @@ class CBOECollector(BaseCollector):
             idx = idx.tz_localize(None)
         series.index = idx.normalize()
 
-        self._upsert_timeseries(
+        return self._upsert_changes(
             db,
-            source="Yahoo",
-            code="VIX3M INDEX:PX_LAST",
-            source_code="^VIX3M:Adj Close",
-            name="CBOE 3-Month Volatility Index (VIX3M), Close",
-            category="Volatility",
-            data=series,
-            unit="index",
+            [(
+                "VIX3M INDEX:PX_LAST",
+                {
+                    "source": "Yahoo",
+                    "source_code": "^VIX3M:Adj Close",
+                    "name": "CBOE 3-Month Volatility Index (VIX3M), Close",
+                    "category": "Volatility",
+                    "unit": "index",
+                },
+                series,
+            )],
         )
-        return 1
 
     def _compute_vix_term_structure(self, db) -> int:
         """Compute VIX contango ratio and term slope from VIX & VIX3M data."""
         from ix.db.models import Timeseries
 
-        count = 0
-
         # Get VIX close
         vix_ts = (
             db.query(Timeseries)
@@ -217,30 +242,34 @@ class CBOECollector(BaseCollector):
         contango = combined["VIX3M"] / combined["VIX"]
         contango = contango.replace([float("inf"), float("-inf")], pd.NA).dropna()
 
-        self._upsert_timeseries(
-            db,
-            source="CBOE",
-            code="VIX_CONTANGO_RATIO",
-            source_code="CBOE:VIX_CONTANGO",
-            name="VIX Contango Ratio (VIX3M/VIX)",
-            category="Volatility",
-            data=contango,
-            unit="ratio",
-        )
-        count += 1
-
         # Term slope = VIX3M - VIX (positive = contango)
         slope = combined["VIX3M"] - combined["VIX"]
-        self._upsert_timeseries(
+
+        # Recomputed in full (cheap); only new or changed points are written
+        return self._upsert_changes(
             db,
-            source="CBOE",
-            code="VIX_TERM_SLOPE",
-            source_code="CBOE:VIX_SLOPE",
-            name="VIX Term Structure Slope (VIX3M - VIX)",
-            category="Volatility",
-            data=slope,
-            unit="points",
+            [
+                (
+                    "VIX_CONTANGO_RATIO",
+                    {
+                        "source": "CBOE",
+                        "source_code": "CBOE:VIX_CONTANGO",
+                        "name": "VIX Contango Ratio (VIX3M/VIX)",
+                        "category": "Volatility",
+                        "unit": "ratio",
+                    },
+                    contango,
+                ),
+                (
+                    "VIX_TERM_SLOPE",
+                    {
+                        "source": "CBOE",
+                        "source_code": "CBOE:VIX_SLOPE",
+                        "name": "VIX Term Structure Slope (VIX3M - VIX)",
+                        "category": "Volatility",
+                        "unit": "points",
+                    },
+                    slope,
+                ),
+            ],
         )
-        count += 1
-
-        return count
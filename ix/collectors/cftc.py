@@ -84,45 +84,49 @@ class CFTCCollector(BaseCollector):
             total = all_contracts * 3  # 3 series per contract
             current = 0
 
-            with Session() as db:
-                # Process financial contracts from TFF report
-                if tff_df is not None and not tff_df.empty:
-                    for prefix, info in self.FINANCIAL_CONTRACTS.items():
-                        count, err = self._process_contract(
-                            db, tff_df, prefix, info,
-                            long_col="Asset_Mgr_Positions_Long_All",
-                            short_col="Asset_Mgr_Positions_Short_All",
-                            fallback_long="Lev_Money_Positions_Long_All",
-                            fallback_short="Lev_Money_Positions_Short_All",
-                            progress_cb=progress_cb,
-                            current=current, total=total,
-                        )
-                        inserted += count
-                        errors += err
-                        current += 3
-                else:
-                    self.logger.warning("No TFF data available")
-                    errors += len(self.FINANCIAL_CONTRACTS)
-                    current += len(self.FINANCIAL_CONTRACTS) * 3
-
-                # Process commodity contracts from disaggregated report
-                if disagg_df is not None and not disagg_df.empty:
-                    for prefix, info in self.COMMODITY_CONTRACTS.items():
-                        count, err = self._process_contract(
-                            db, disagg_df, prefix, info,
-                            long_col="M_Money_Positions_Long_All",
-                            short_col="M_Money_Positions_Short_All",
-                            fallback_long="Asset_Mgr_Positions_Long_All",
-                            fallback_short="Asset_Mgr_Positions_Short_All",
-                            progress_cb=progress_cb,
-                            current=current, total=total,
-                        )
-                        inserted += count
-                        errors += err
-                        current += 3
-                else:
-                    self.logger.warning("No disaggregated data available")
-                    errors += len(self.COMMODITY_CONTRACTS)
+            # Series of every contract, written in one batch below
+            items = []
+
+            # Process financial contracts from TFF report
+            if tff_df is not None and not tff_df.empty:
+                for prefix, info in self.FINANCIAL_CONTRACTS.items():
+                    _, err = self._process_contract(
+                        items, tff_df, prefix, info,
+                        long_col="Asset_Mgr_Positions_Long_All",
+                        short_col="Asset_Mgr_Positions_Short_All",
+                        fallback_long="Lev_Money_Positions_Long_All",
+                        fallback_short="Lev_Money_Positions_Short_All",
+                        progress_cb=progress_cb,
+                        current=current, total=total,
+                    )
+                    errors += err
+                    current += 3
+            else:
+                self.logger.warning("No TFF data available")
+                errors += len(self.FINANCIAL_CONTRACTS)
+                current += len(self.FINANCIAL_CONTRACTS) * 3
+
+            # Process commodity contracts from disaggregated report
+            if disagg_df is not None and not disagg_df.empty:
+                for prefix, info in self.COMMODITY_CONTRACTS.items():
+                    _, err = self._process_contract(
+                        items, disagg_df, prefix, info,
+                        long_col="M_Money_Positions_Long_All",
+                        short_col="M_Money_Positions_Short_All",
+                        fallback_long="Asset_Mgr_Positions_Long_All",
+                        fallback_short="Asset_Mgr_Positions_Short_All",
+                        progress_cb=progress_cb,
+                        current=current, total=total,
+                    )
+                    errors += err
+                    current += 3
+            else:
+                self.logger.warning("No disaggregated data available")
+                errors += len(self.COMMODITY_CONTRACTS)
+
+            if items:
+                with Session() as db:
+                    inserted = self._bulk_upsert_timeseries(db, items)
 
             self.update_state(last_data_date=str(datetime.now().date()))
 
@@ -139,12 +143,12 @@ class CFTCCollector(BaseCollector):
         }
 
     def _process_contract(
-        self, db, df, prefix, info, *,
+        self, items, df, prefix, info, *,
         long_col, short_col,
         fallback_long, fallback_short,
         progress_cb, current, total,
     ):
-        """Process a single contract from the COT data."""
+        """Append a contract's LONG / SHORT / NET series to *items*."""
         inserted = 0
         errors = 0
 
@@ -184,17 +188,18 @@ class CFTCCollector(BaseCollector):
                 if progress_cb:
                     progress_cb(step, total, f"Updating {code}")
 
-                self._upsert_timeseries(
-                    db,
-                    source="CFTC",
-                    code=code,
-                    source_code=f"{prefix}:{suffix}",
-                    name=f"{info['name']} {suffix.title()} Positioning",
-                    category="Positioning",
-                    data=series,
-                    frequency="W",
-                    unit="contracts",
-                )
+                items.append((
+                    code,
+                    {
+                        "source": "CFTC",
+                        "source_code": f"{prefix}:{suffix}",
+                        "name": f"{info['name']} {suffix.title()} Positioning",
+                        "category": "Positioning",
+                        "frequency": "W",
+                        "unit": "contracts",
+                    },
+                    series,
+                ))
                 inserted += 1
 
         except Exception as e:
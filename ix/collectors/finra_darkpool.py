@@ -19,6 +19,8 @@ class FINRADarkPoolCollector(BaseCollector):
     display_name = "FINRA Dark Pool"
     schedule = "0 8 1,16 * *"  # 1st and 16th of each month
     category = "filings"
+    # Published settlements are sometimes restated in the next release
+    revision_days = 31
 
     # FINRA short interest is published twice monthly
     SHORT_INTEREST_URL = "https://api.finra.org/data/group/otcMarket/name/shortInterest"
@@ -32,39 +34,55 @@ class FINRADarkPoolCollector(BaseCollector):
         total = len(self.TRACKED_SYMBOLS) + 1
         current = 0
 
-        with Session() as db:
-            # Fetch short interest for tracked symbols
-            for symbol in self.TRACKED_SYMBOLS:
-                current += 1
-                if progress_cb:
-                    progress_cb(current, total, f"Fetching short interest: {symbol}")
-
-                try:
-                    series = self._fetch_short_interest(symbol)
-                    if series is not None and not series.empty:
-                        code = f"FINRA_SHORT_{symbol}"
-                        self._upsert_timeseries(
-                            db,
-                            source="FINRA",
-                            code=code,
-                            source_code=f"FINRA:{symbol}:SHORT",
-                            name=f"{symbol} Short Interest",
-                            category="Dark Pool",
-                            data=series,
-                            frequency=None,
-                            unit="shares",
-                        )
-                        inserted += 1
-                except Exception as e:
-                    self.logger.error(f"Error fetching short interest for {symbol}: {e}")
-                    errors += 1
-                time.sleep(0.5)
-
+        # Fetch short interest for tracked symbols, then write them together
+        tracker = self.change_tracker()
+        items = []
+        for symbol in self.TRACKED_SYMBOLS:
             current += 1
             if progress_cb:
-                progress_cb(current, total, "Done")
-
-        self.update_state(last_data_date=str(datetime.now().date()))
+                progress_cb(current, total, f"Fetching short interest: {symbol}")
+
+            try:
+                series = self._fetch_short_interest(symbol, tracker)
+                if series is not None and not series.empty:
+                    items.append((
+                        f"FINRA_SHORT_{symbol}",
+                        {
+                            "source": "FINRA",
+                            "source_code": f"FINRA:{symbol}:SHORT",
+                            "name": f"{symbol} Short Interest",
+                            "category": "Dark Pool",
+                            "frequency": None,
+                            "unit": "shares",
+                        },
+                        series,
+                    ))
+            except Exception as e:
+                self.logger.error(f"Error fetching short interest for {symbol}: {e}")
+                tracker.discard(f"FINRA:{symbol}")
+                errors += 1
+            time.sleep(0.5)
+
+        if not errors and tracker.nothing_changed:
+            return self._unchanged_result(tracker)
+
+        if items:
+            try:
+                with Session() as db:
+                    inserted = self._upsert_changes(db, items)
+            except Exception as e:
+                self.logger.error(f"Error writing short interest series: {e}")
+                errors += len(items)
+                for symbol in self.TRACKED_SYMBOLS:
+                    tracker.discard(f"FINRA:{symbol}")
+
+        current += 1
+        if progress_cb:
+            progress_cb(current, total, "Done")
+
+        self.update_state(
+            last_data_date=str(datetime.now().date()), extra_state={"sources": tracker.commit()}
+        )
         return {
             "inserted": inserted,
             "updated": 0,
@@ -72,8 +90,11 @@ class FINRADarkPoolCollector(BaseCollector):
             "message": f"FINRA: {inserted} short interest series updated",
         }
 
-    def _fetch_short_interest(self, symbol: str) -> pd.Series:
-        """Fetch short interest data for a symbol from FINRA API."""
+    def _fetch_short_interest(self, symbol: str, tracker) -> pd.Series:
+        """Fetch short interest data for a symbol from FINRA API.
+
+        Returns ``None`` when the API answers exactly as in the last run.
+        """
         try:
             # FINRA API requires specific format
             url = "https://api.finra.org/data/group/otcMarket/name/shortInterest"
@@ -94,7 +115,11 @@ class FINRADarkPoolCollector(BaseCollector):
                 "sortFields": ["-settlementDate"],
             }
 
-            resp = requests.post(url, json=payload, headers=headers, timeout=30)
+            resp = tracker.get(
+                url, key=f"FINRA:{symbol}", method="POST", json=payload, headers=headers, timeout=30
+            )
+            if resp is None:
+                return None
 
             if resp.status_code == 200:
                 data = resp.json()
@@ -112,10 +137,12 @@ class FINRADarkPoolCollector(BaseCollector):
                         return series.sort_index()
 
             # Fallback: try CSV download
+            tracker.discard(f"FINRA:{symbol}")
             return self._fetch_short_interest_csv(symbol)
 
         except Exception as e:
             self.logger.warning(f"FINRA API failed for {symbol}: {e}")
+            tracker.discard(f"FINRA:{symbol}")
             return self._fetch_short_interest_csv(symbol)
 
     def _fetch_short_interest_csv(self, symbol: str) -> pd.Series:
@@ -0,0 +1,425 @@
+"""Concurrent FRED downloads.
+
+``get_fred_data`` used to fetch one series at a time, retry with fixed
+``time.sleep`` back-off, and, without an API key, launch a fresh headless
+Chromium for every ticker. Fetches now go through shared machinery:
+
+* one token bucket keeps requests within :data:`REQUESTS_PER_MINUTE`
+  (FRED allows 120 per key) across every thread of the process;
+* an :class:`~ix.collectors.ratelimit.AdaptiveLimit` caps requests in
+  flight at :data:`WORKERS`, halves on ``429`` / ``503`` (waiting out
+  ``Retry-After``) and grows back as requests succeed;
+* API requests share one pooled HTTP session;
+* the browser fallback runs on up to :data:`BROWSERS` threads, each
+  keeping one Chromium context open between tickers and closing it after
+  :data:`BROWSER_IDLE` seconds without work;
+* the observations API takes one series per request, but
+  ``fredgraph.csv`` serves several, so the last fallback asks for
+  :data:`CSV_BATCH` series per request.
+
+Sources are tried in that order: API (with ``FRED_API_KEY``), browser,
+CSV; a ticker only moves on when the previous source failed for it.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib.util import find_spec
+from typing import Callable, Iterable, Optional
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from ix.collectors.ratelimit import AdaptiveLimit, RateBudget
+from ix.common.terminal import get_logger
+
+logger = get_logger(__name__)
+
+# Requests in flight at most (the adaptive limit may run fewer)
+WORKERS = 4
+# Requests started per minute, across all callers in this process
+REQUESTS_PER_MINUTE = 100
+# Attempts after a throttled response
+RETRIES = 2
+# Seconds per HTTP request
+TIMEOUT = 30
+# Browser threads for the fallback, each with one reused context
+BROWSERS = 2
+# Seconds a browser stays open without work
+BROWSER_IDLE = 120
+# Milliseconds to wait for a series in the browser
+BROWSER_TIMEOUT_MS = 20000
+# Series per fredgraph.csv request
+CSV_BATCH = 25
+
+API_URL = "https://api.stlouisfed.org/fred/series/observations"
+CHART_URL = "https://fred.stlouisfed.org/graph/api/series/"
+SERIES_URL = "https://fred.stlouisfed.org/series/{}"
+CSV_URL = "https://fred.stlouisfed.org/graph/fredgraph.csv"
+
+# Statuses FRED answers with when asked to slow down
+THROTTLED = {429, 503}
+
+_budget = RateBudget(REQUESTS_PER_MINUTE / 60.0, burst=5)
+_limit = AdaptiveLimit(WORKERS)
+
+_session: Optional[requests.Session] = None
+_pool: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+# (ticker, future) for the browser threads; None stops one thread
+_tasks: "queue.Queue[Optional[tuple[str, Future]]]" = queue.Queue()
+_browsers: list[threading.Thread] = []
+_browser_lock = threading.Lock()
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Frames
+# ─────────────────────────────────────────────────────────────────────
+
+
+def _frame(series: pd.Series) -> pd.DataFrame:
+    series = series.dropna().astype(float).sort_index()
+    series.name = "PX_LAST"
+    series.index.name = "DATE"
+    return series.to_frame()
+
+
+def api_frame(payload: dict) -> pd.DataFrame:
+    """``PX_LAST`` frame from an observations API response."""
+    observations = payload.get("observations") or []
+    records = {
+        pd.Timestamp(o["date"]): float(o["value"]) for o in observations if o.get("value") not in (".", "", None)
+    }
+    return _frame(pd.Series(records, dtype=float)) if records else pd.DataFrame()
+
+
+def chart_frame(body: bytes) -> pd.DataFrame:
+    """``PX_LAST`` frame from the chart API, whose observations are ``[ts_ms, value]`` pairs."""
+    obs = json.loads(body).get("observations") or []
+    if not obs or not obs[0]:
+        return pd.DataFrame()
+    records = {
+        pd.Timestamp(pair[0], unit="ms"): float(pair[1])
+        for pair in obs[0]
+        if len(pair) == 2 and pair[1] is not None
+    }
+    return _frame(pd.Series(records, dtype=float)) if records else pd.DataFrame()
+
+
+def csv_frames(text: str, start: str, end: str) -> dict[str, pd.DataFrame]:
+    """``{series id: frame}`` from a multi-series fredgraph.csv, cut to ``[start, end]``."""
+    # The first column holds the dates, whatever its header ("DATE", "observation_date")
+    table = pd.read_csv(io.StringIO(text), na_values=["."], index_col=0)
+    table.index = pd.to_datetime(table.index, errors="coerce")
+    table = table.loc[table.index.notna()].sort_index()
+    table = table.loc[pd.Timestamp(start) : pd.Timestamp(end)]
+    frames = {}
+    for ticker in table.columns:
+        values = pd.to_numeric(table[ticker], errors="coerce")
+        if values.notna().any():
+            frames[str(ticker)] = _frame(values)
+    return frames
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Requests
+# ─────────────────────────────────────────────────────────────────────
+
+
+def _retry_after(headers) -> Optional[float]:
+    value = (headers or {}).get("Retry-After") or (headers or {}).get("retry-after")
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        # Absent, or an HTTP date; fall back to the limit's cool-down
+        return None
+
+
+def _send(send: Callable, retries: int = RETRIES):
+    """Call *send* within the shared budget and limit; retry throttled responses.
+
+    Returns the last response, which is still throttled once retries are
+    spent. Exceptions from *send* propagate.
+    """
+    resp = None
+    for attempt in range(retries + 1):
+        _budget.acquire()
+        _limit.acquire()
+        ok = False
+        try:
+            resp = send()
+            status = getattr(resp, "status_code", None) or resp.status
+            ok = status not in THROTTLED
+        finally:
+            _limit.release(ok)
+        if ok:
+            return resp
+        _limit.throttled(_retry_after(resp.headers))
+        logger.info(
+            "FRED throttled (HTTP %s, attempt %d); limit now %d in flight", status, attempt + 1, _limit.limit
+        )
+    return resp
+
+
+def _http() -> requests.Session:
+    global _session
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=WORKERS)
+            _session.mount("https://", adapter)
+        return _session
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="fred")
+        return _pool
+
+
+def _fetch_api(ticker: str, start: str, end: str, api_key: str, timeout: int, retries: int) -> pd.DataFrame:
+    params = {
+        "series_id": ticker,
+        "api_key": api_key,
+        "file_type": "json",
+        "observation_start": start,
+        "observation_end": end,
+    }
+    resp = _send(lambda: _http().get(API_URL, params=params, timeout=timeout), retries)
+    resp.raise_for_status()
+    return api_frame(resp.json())
+
+
+def _fetch_csv(tickers: list[str], start: str, end: str, timeout: int, retries: int) -> dict[str, pd.DataFrame]:
+    frames: dict[str, pd.DataFrame] = {}
+    for i in range(0, len(tickers), CSV_BATCH):
+        batch = tickers[i : i + CSV_BATCH]
+        # One window for the whole batch: cut locally rather than per series in the query
+        params = {"id": ",".join(batch)}
+        try:
+            resp = _send(lambda: _http().get(CSV_URL, params=params, timeout=timeout), retries)
+            resp.raise_for_status()
+            frames.update(csv_frames(resp.text, start, end))
+        except requests.Timeout as exc:
+            # fredgraph.csv is blocked on some networks; later batches would time out too
+            logger.warning("FRED CSV timed out (%s); skipping %d series", exc, len(tickers) - i)
+            break
+        except Exception as exc:
+            logger.warning("FRED CSV failed for %d series (%s…): %s", len(batch), batch[0], exc)
+    return frames
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Browser pool
+# ─────────────────────────────────────────────────────────────────────
+
+
+def _capture(page, ticker: str, timeout_ms: int) -> Optional[bytes]:
+    """The chart API body the series page requests while loading."""
+    captured: dict[str, bytes] = {}
+
+    def on_response(response) -> None:
+        if CHART_URL in response.url and "obs=true" in response.url:
+            try:
+                captured["body"] = response.body()
+            except Exception:
+                pass
+
+    page.on("response", on_response)
+    try:
+        # commit (first byte), so CSV-redirect pages don't hang at domcontentloaded
+        page.goto(SERIES_URL.format(ticker), timeout=timeout_ms, wait_until="commit")
+    except Exception:
+        pass  # a redirect to CSV "fails" the page; the API call still fires
+    try:
+        deadline = time.monotonic() + timeout_ms / 1000
+        while "body" not in captured and time.monotonic() < deadline:
+            page.wait_for_timeout(200)
+    finally:
+        page.remove_listener("response", on_response)
+    return captured.get("body")
+
+
+def _browser_fetch(context, page, ticker: str, timeout_ms: int) -> pd.DataFrame:
+    """Ask the chart API directly with the context's cookies; load the series page if refused."""
+    resp = _send(
+        lambda: context.request.get(
+            CHART_URL,
+            params={"obs": "true", "sid": ticker},
+            headers={"Referer": SERIES_URL.format(ticker)},
+            timeout=timeout_ms,
+        )
+    )
+    if resp.ok:
+        try:
+            return chart_frame(resp.body())
+        except ValueError:
+            pass  # an HTML challenge page rather than JSON
+    body = _capture(page, ticker, timeout_ms)
+    if body is None:
+        raise RuntimeError("no chart API response captured")
+    return chart_frame(body)
+
+
+def _fail_queued(exc: BaseException) -> None:
+    while True:
+        try:
+            task = _tasks.get_nowait()
+        except queue.Empty:
+            return
+        if task is not None and task[1].set_running_or_notify_cancel():
+            task[1].set_exception(exc)
+
+
+def _browser_loop() -> None:
+    """One browser thread: a Chromium context reused for queued tickers until idle."""
+    me = threading.current_thread()
+    try:
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            try:
+                context = browser.new_context()
+                page = context.new_page()
+                while True:
+                    try:
+                        task = _tasks.get(timeout=BROWSER_IDLE)
+                    except queue.Empty:
+                        with _browser_lock:
+                            # Leave only while nothing was queued meanwhile
+                            if _tasks.empty():
+                                _browsers.remove(me)
+                                return
+                        continue
+                    if task is None:
+                        return
+                    ticker, fut = task
+                    if not fut.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        fut.set_result(_browser_fetch(context, page, ticker, BROWSER_TIMEOUT_MS))
+                    except Exception as exc:
+                        fut.set_exception(exc)
+            finally:
+                browser.close()
+    except Exception as exc:
+        logger.warning("FRED browser failed: %s", exc)
+        with _browser_lock:
+            alone = _browsers == [me]
+        if alone:
+            _fail_queued(exc)
+    finally:
+        with _browser_lock:
+            if me in _browsers:
+                _browsers.remove(me)
+
+
+def _browser_submit(ticker: str) -> Future:
+    fut: Future = Future()
+    with _browser_lock:
+        _tasks.put((ticker, fut))
+        # Another browser only while tickers are waiting for one
+        if len(_browsers) < min(BROWSERS, _tasks.qsize()):
+            thread = threading.Thread(target=_browser_loop, name="fred-browser", daemon=True)
+            _browsers.append(thread)
+            thread.start()
+    return fut
+
+
+def _fetch_browser(tickers: list[str], start: str, end: str) -> dict[str, pd.DataFrame]:
+    if find_spec("playwright") is None:
+        return {}
+    futures = [(ticker, _browser_submit(ticker)) for ticker in tickers]
+    # Each ticker waits for the ones queued before it
+    deadline = time.monotonic() + BROWSER_TIMEOUT_MS / 1000 * (2 + len(tickers) / BROWSERS) + 60
+    frames: dict[str, pd.DataFrame] = {}
+    for ticker, fut in futures:
+        try:
+            frame = fut.result(timeout=max(0.0, deadline - time.monotonic()))
+        except Exception as exc:
+            fut.cancel()
+            logger.warning("FRED browser fetch failed for %s: %s", ticker, exc)
+            continue
+        frames[ticker] = frame.loc[pd.Timestamp(start) : pd.Timestamp(end)] if not frame.empty else frame
+    return frames
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Entry points
+# ─────────────────────────────────────────────────────────────────────
+
+
+def fetch_fred(
+    tickers: Iterable[str],
+    start: str = "1900-1-1",
+    end: str = "",
+    timeout: int = TIMEOUT,
+    retries: int = RETRIES,
+) -> dict[str, pd.DataFrame]:
+    """``PX_LAST`` frames for FRED *tickers*, fetched concurrently.
+
+    Args:
+        tickers: FRED series ids; duplicates are fetched once.
+        start: First observation date.
+        end: Last observation date; defaults to tomorrow.
+        timeout: Seconds per HTTP request.
+        retries: Attempts after a throttled response.
+
+    Returns:
+        ``{ticker: frame}`` for the tickers that returned data. Failures
+        are logged and their tickers omitted.
+    """
+    from ix.common.date import tomorrow
+
+    tickers = list(dict.fromkeys(str(t) for t in tickers if t))
+    if not tickers:
+        return {}
+    if not end:
+        end = tomorrow().date().strftime("%Y-%m-%d")
+
+    frames: dict[str, pd.DataFrame] = {}
+    api_key = os.getenv("FRED_API_KEY", "").strip()
+    if api_key:
+        futures = [
+            (t, _executor().submit(_fetch_api, t, start, end, api_key, timeout, retries)) for t in tickers
+        ]
+        for ticker, fut in futures:
+            try:
+                # An empty frame is an answer: the series has no data in the window
+                frames[ticker] = fut.result()
+            except Exception as exc:
+                logger.warning("Download data from `fred` (API) fail for ticker %s: %s", ticker, exc)
+
+    missing = [t for t in tickers if t not in frames]
+    if missing:
+        frames.update(_fetch_browser(missing, start, end))
+    missing = [t for t in tickers if t not in frames]
+    if missing:
+        frames.update(_fetch_csv(missing, start, end, timeout, retries))
+    return {t: f for t, f in frames.items() if not f.empty}
+
+
+def shutdown() -> None:
+    """Close the browsers, HTTP session and threads (started again on the next fetch)."""
+    global _session, _pool
+    with _browser_lock:
+        for _ in _browsers:
+            _tasks.put(None)
+    with _lock:
+        session, _session = _session, None
+        pool, _pool = _pool, None
+    if session is not None:
+        session.close()
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
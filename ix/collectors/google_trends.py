@@ -9,6 +9,7 @@ from datetime import datetime
 import pandas as pd
 
 from ix.collectors.base import BaseCollector
+from ix.collectors.incremental import series_hash
 from ix.db.conn import Session
 
 
@@ -38,47 +39,66 @@ class GoogleTrendsCollector(BaseCollector):
             return {"inserted": 0, "updated": 0, "errors": 1, "message": "pytrends not installed"}
 
         pytrends = TrendReq(hl="en-US", tz=360, timeout=(10, 30))
+        tracker = self.change_tracker()
         total = len(self.TERMS)
         current = 0
 
-        with Session() as db:
-            for term, info in self.TERMS.items():
-                current += 1
-                if progress_cb:
-                    progress_cb(current, total, f"Fetching '{term}'")
-
-                try:
-                    pytrends.build_payload([term], timeframe="today 5-y", geo="US")
-                    df = pytrends.interest_over_time()
-
-                    if df is not None and not df.empty and term in df.columns:
-                        series = df[term].astype(float)
-                        series.index = pd.to_datetime(series.index)
-
-                        self._upsert_timeseries(
-                            db,
-                            source="GoogleTrends",
-                            code=info["code"],
-                            source_code=f"GT:{term}",
-                            name=info["name"],
-                            category="Sentiment",
-                            data=series,
-                            frequency="W",
-                            unit="index",
-                        )
-                        inserted += 1
-                    else:
-                        self.logger.warning(f"No data returned for '{term}'")
-
-                    # Respect rate limits
-                    time.sleep(3)
-
-                except Exception as e:
-                    self.logger.error(f"Error fetching '{term}': {e}")
-                    errors += 1
-                    time.sleep(5)  # Longer wait on error
-
-        self.update_state(last_data_date=str(datetime.now().date()))
+        items = []
+        for term, info in self.TERMS.items():
+            current += 1
+            if progress_cb:
+                progress_cb(current, total, f"Fetching '{term}'")
+
+            try:
+                pytrends.build_payload([term], timeframe="today 5-y", geo="US")
+                df = pytrends.interest_over_time()
+
+                if df is not None and not df.empty and term in df.columns:
+                    series = df[term].astype(float)
+                    series.index = pd.to_datetime(series.index)
+
+                    # Each fetch rescales the whole window (peak = 100), so
+                    # a term is written in full, and only when it changed
+                    if not tracker.unchanged(f"GT:{term}", series_hash(series)):
+                        items.append((
+                            info["code"],
+                            {
+                                "source": "GoogleTrends",
+                                "source_code": f"GT:{term}",
+                                "name": info["name"],
+                                "category": "Sentiment",
+                                "frequency": "W",
+                                "unit": "index",
+                            },
+                            series,
+                        ))
+                else:
+                    self.logger.warning(f"No data returned for '{term}'")
+
+                # Respect rate limits
+                time.sleep(3)
+
+            except Exception as e:
+                self.logger.error(f"Error fetching '{term}': {e}")
+                errors += 1
+                time.sleep(5)  # Longer wait on error
+
+        if not errors and tracker.nothing_changed:
+            return self._unchanged_result(tracker)
+
+        if items:
+            try:
+                with Session() as db:
+                    inserted = self._bulk_upsert_timeseries(db, items)
+            except Exception as e:
+                self.logger.error(f"Error writing Google Trends series: {e}")
+                errors += len(items)
+                for term in self.TERMS:
+                    tracker.discard(f"GT:{term}")
+
+        self.update_state(
+            last_data_date=str(datetime.now().date()), extra_state={"sources": tracker.commit()}
+        )
         return {
             "inserted": inserted,
             "updated": 0,
@@ -0,0 +1,116 @@
+"""Change detection for collectors: conditional requests and content hashes.
+
+Collectors run more often than most of their sources update, and used to
+re-download, re-parse and re-write full histories on every run. A
+:class:`ChangeTracker` keeps, per source (a URL or another key), the
+``ETag`` / ``Last-Modified`` validators and a SHA-256 of the last body
+that was written, in ``CollectorState.state["sources"]``:
+
+* :meth:`ChangeTracker.get` sends ``If-None-Match`` / ``If-Modified-Since``
+  and returns ``None`` on ``304``, or when the body hashes as before;
+* :meth:`ChangeTracker.unchanged` applies the hash check to payloads not
+  fetched through :meth:`~ChangeTracker.get` (pytrends frames);
+* :meth:`ChangeTracker.commit` returns the entries to store once the
+  run's writes went through, so a source whose write failed is fetched
+  in full again next run.
+
+Which observations of a changed source are new is decided by
+:meth:`ix.collectors.base.BaseCollector._changed_points`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from datetime import datetime
+from typing import Optional, Union
+
+import pandas as pd
+import requests
+
+
+def content_hash(payload: Union[bytes, str]) -> str:
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def series_hash(series: pd.Series) -> str:
+    """Hash of a series' index and values."""
+    return content_hash(pd.util.hash_pandas_object(series, index=True).values.tobytes())
+
+
+class ChangeTracker:
+    """Validators and body hashes of one collector run's sources."""
+
+    def __init__(self, stored: Optional[dict] = None) -> None:
+        self._stored: dict[str, dict] = dict(stored or {})
+        self._seen: dict[str, dict] = {}
+        # key -> whether the source changed since the stored entry
+        self._changed: dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def nothing_changed(self) -> bool:
+        """Every source checked this run was unchanged (and at least one was checked)."""
+        with self._lock:
+            return bool(self._changed) and not any(self._changed.values())
+
+    def _record(self, key: str, entry: Optional[dict], changed: bool) -> None:
+        with self._lock:
+            if entry is not None:
+                self._seen[key] = entry
+            self._changed[key] = changed
+
+    def get(
+        self, url: str, *, key: Optional[str] = None, method: str = "GET", session=None, **kwargs
+    ) -> Optional[requests.Response]:
+        """*url*'s response, or ``None`` when unchanged since the stored entry.
+
+        Non-200 responses are returned as they are and not recorded.
+        """
+        key = key or url
+        stored = self._stored.get(key) or {}
+        headers = dict(kwargs.pop("headers", None) or {})
+        if method.upper() == "GET":
+            if stored.get("etag"):
+                headers["If-None-Match"] = stored["etag"]
+            if stored.get("last_modified"):
+                headers["If-Modified-Since"] = stored["last_modified"]
+
+        resp = (session or requests).request(method, url, headers=headers, **kwargs)
+        if resp.status_code == 304:
+            self._record(key, None, changed=False)
+            return None
+        if resp.status_code != 200:
+            return resp
+
+        digest = content_hash(resp.content)
+        entry = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "sha256": digest,
+            "checked_at": datetime.utcnow().isoformat(timespec="seconds"),
+        }
+        changed = digest != stored.get("sha256")
+        self._record(key, entry, changed)
+        return resp if changed else None
+
+    def unchanged(self, key: str, digest: str) -> bool:
+        """Record *digest* for *key*; whether it matches the stored one."""
+        changed = digest != (self._stored.get(key) or {}).get("sha256")
+        self._record(
+            key, {"sha256": digest, "checked_at": datetime.utcnow().isoformat(timespec="seconds")}, changed
+        )
+        return not changed
+
+    def discard(self, key: str) -> None:
+        """Forget this run's entry for *key* (its data was not written)."""
+        with self._lock:
+            self._seen.pop(key, None)
+            self._changed.pop(key, None)
+
+    def commit(self) -> dict:
+        """Stored entries updated with this run's, for ``state["sources"]``."""
+        with self._lock:
+            return {**self._stored, **self._seen}
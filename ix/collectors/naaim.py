@@ -20,6 +20,8 @@ class NAAIMExposureCollector(BaseCollector):
     display_name = "NAAIM Exposure Index"
     schedule = "0 12 * * 4"  # Thursday noon
     category = "sentiment"
+    # The latest weekly reading is occasionally corrected
+    revision_days = 14
 
     INDEX_URL = "https://naaim.org/programs/naaim-exposure-index/"
 
@@ -28,7 +30,10 @@ class NAAIMExposureCollector(BaseCollector):
         errors = 0
 
         try:
-            data = self._fetch_exposure_data()
+            tracker = self.change_tracker()
+            data = self._fetch_exposure_data(tracker)
+            if tracker.nothing_changed:
+                return self._unchanged_result(tracker)
             if data is None or data.empty:
                 self.update_state(error="Failed to fetch NAAIM data")
                 return {"inserted": 0, "updated": 0, "errors": 1, "message": "No data"}
@@ -37,24 +42,28 @@ class NAAIMExposureCollector(BaseCollector):
                 if progress_cb:
                     progress_cb(1, 1, "Updating NAAIM_EXPOSURE")
                 try:
-                    self._upsert_timeseries(
+                    inserted += self._upsert_changes(
                         db,
-                        source="NAAIM",
-                        code="NAAIM_EXPOSURE:PX_LAST",
-                        source_code="NAAIM:Mean",
-                        name="NAAIM Exposure Index",
-                        category="Sentiment",
-                        data=data,
-                        frequency="W",
-                        unit="percent",
+                        [(
+                            "NAAIM_EXPOSURE:PX_LAST",
+                            {
+                                "source": "NAAIM",
+                                "source_code": "NAAIM:Mean",
+                                "name": "NAAIM Exposure Index",
+                                "category": "Sentiment",
+                                "frequency": "W",
+                                "unit": "percent",
+                            },
+                            data,
+                        )],
                     )
-                    inserted += 1
                 except Exception as e:
                     self.logger.error(f"Error upserting NAAIM_EXPOSURE: {e}")
                     errors += 1
 
             last_date = str(data.index.max().date()) if not data.empty else None
-            self.update_state(last_data_date=last_date)
+            extra_state = None if errors else {"sources": tracker.commit()}
+            self.update_state(last_data_date=last_date, extra_state=extra_state)
 
         except Exception as e:
             self.logger.exception(f"NAAIM collector failed: {e}")
@@ -68,16 +77,25 @@ class NAAIMExposureCollector(BaseCollector):
             "message": f"NAAIM: {inserted} series updated",
         }
 
-    def _fetch_exposure_data(self) -> pd.Series:
-        """Try Excel download first, fall back to page scraping."""
+    def _fetch_exposure_data(self, tracker) -> pd.Series:
+        """Try Excel download first, fall back to page scraping.
+
+        Returns ``None`` without parsing when the Excel file is unchanged.
+        """
         # Step 1: Find the Excel download link from the index page
         excel_url = self._find_excel_url()
         if excel_url:
             try:
-                data = self._parse_excel(excel_url)
+                # Keyed by name: the link may be re-dated without new content
+                resp = tracker.get(excel_url, key="naaim_excel", timeout=60)
+                if resp is None:
+                    return None
+                resp.raise_for_status()
+                data = self._parse_excel(resp.content)
                 if data is not None and not data.empty:
                     return data
             except Exception as e:
+                tracker.discard("naaim_excel")
                 self.logger.warning(f"Excel download failed: {e}")
 
         # Fallback: scrape current reading
@@ -110,14 +128,11 @@ class NAAIMExposureCollector(BaseCollector):
             self.logger.warning(f"Could not find Excel URL: {e}")
         return None
 
-    def _parse_excel(self, url: str) -> pd.Series:
-        """Download and parse NAAIM Excel file."""
-        resp = requests.get(url, timeout=60)
-        resp.raise_for_status()
-
+    def _parse_excel(self, content: bytes) -> pd.Series:
+        """Parse the downloaded NAAIM Excel file."""
         from io import BytesIO
 
-        df = pd.read_excel(BytesIO(resp.content), engine="openpyxl")
+        df = pd.read_excel(BytesIO(content), engine="openpyxl")
 
         # Find date column and mean/average column
         date_col = None
@@ -0,0 +1,87 @@
+"""Request-rate budgets shared by the HTTP collectors."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+
+class RateBudget:
+    """Token bucket: *rate* tokens per second, up to *burst* saved up."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+                self._stamp = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveLimit:
+    """Concurrency limit that backs off when the upstream throttles.
+
+    Starts at *ceiling* requests in flight. :meth:`throttled` halves the
+    limit (not below *floor*) and holds new requests until the cool-down
+    has passed; every *calm* successful requests after that raise it by
+    one again, up to *ceiling*.
+    """
+
+    def __init__(self, ceiling: int, floor: int = 1, calm: int = 10, cooldown: float = 5.0) -> None:
+        self.ceiling = ceiling
+        self.floor = floor
+        self.calm = calm
+        self.cooldown = cooldown
+        self.limit = ceiling
+        self._active = 0
+        self._streak = 0
+        self._resume = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        """Wait for a free slot and take it."""
+        with self._cond:
+            while True:
+                wait = self._resume - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                elif self._active < self.limit:
+                    self._active += 1
+                    return
+                else:
+                    self._cond.wait()
+
+    def release(self, ok: bool = True) -> None:
+        """Give the slot back; *ok* counts the request towards growing the limit."""
+        with self._cond:
+            self._active -= 1
+            if ok:
+                self._streak += 1
+                if self._streak >= self.calm and self.limit < self.ceiling:
+                    self.limit += 1
+                    self._streak = 0
+            else:
+                self._streak = 0
+            self._cond.notify_all()
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        """Halve the limit and pause new requests for *retry_after* seconds (or the cool-down)."""
+        with self._cond:
+            self.limit = max(self.floor, self.limit // 2)
+            self._streak = 0
+            pause = retry_after if retry_after is not None else self.cooldown
+            self._resume = max(self._resume, time.monotonic() + pause)
+            self._cond.notify_all()
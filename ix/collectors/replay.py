@@ -0,0 +1,322 @@
+"""Record / replay of HTTP traffic for offline crawler and collector runs.
+
+Crawlers and collectors talk to live services through ``requests``. This
+module captures that traffic once and serves it back from a local HTTP
+server, so ingestion can be benchmarked and regression-tested offline:
+
+* :func:`record` wraps ``requests.Session.send`` and appends every
+  exchange to a :class:`Cassette` (a JSON-lines file);
+* :class:`ReplayServer` serves a cassette on ``127.0.0.1`` with
+  configurable latency, error rate and rate limiting (:class:`Faults`);
+* :func:`replay` points every ``requests`` call at that server, so
+  requests still cross a real socket and the client's connection
+  handling, retries and back-off are exercised.
+
+Only traffic sent through ``requests`` is covered (collectors, the FRED
+API path, ``pandas_datareader``). yfinance (curl_cffi, in worker
+processes) and the Playwright FRED fallback bypass it.
+
+Query parameters in :data:`REDACTED_PARAMS` (API keys, moving end
+dates) are never written to a cassette and are ignored when matching.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, Optional
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urljoin, urlsplit, urlunsplit
+
+import requests
+
+REDACTED_PARAMS = frozenset(
+    {
+        # credentials
+        "api_key", "apikey", "token", "key",
+        # "until today" bounds that change daily (FRED, EDGAR full-text search)
+        "observation_end", "enddt",
+    }
+)
+
+# Hop-by-hop / encoding headers: the stored body is already decoded
+_DROPPED_HEADERS = frozenset({"content-encoding", "transfer-encoding", "content-length", "connection"})
+
+
+def normalize_url(url: str) -> str:
+    """*url* with redacted parameters removed and the query sorted."""
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k.lower() not in REDACTED_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path or "/", urlencode(query), ""))
+
+
+@dataclass
+class Exchange:
+    """One recorded request / response pair."""
+
+    method: str
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "method": self.method,
+                "url": self.url,
+                "status": self.status,
+                "headers": self.headers,
+                "body": base64.b64encode(self.body).decode("ascii"),
+            }
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> "Exchange":
+        raw = json.loads(line)
+        return cls(raw["method"], raw["url"], raw["status"], raw["headers"], base64.b64decode(raw["body"]))
+
+
+class Cassette:
+    """Recorded exchanges keyed by ``(method, normalised url)``.
+
+    Repeated requests for the same key are answered with the recorded
+    responses in order, the last one repeating.
+    """
+
+    def __init__(self, exchanges: Optional[list[Exchange]] = None) -> None:
+        self._by_key: dict[tuple[str, str], list[Exchange]] = {}
+        self._served: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        for exchange in exchanges or []:
+            self.add(exchange)
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._by_key.values())
+
+    def add(self, exchange: Exchange) -> None:
+        key = (exchange.method.upper(), normalize_url(exchange.url))
+        with self._lock:
+            self._by_key.setdefault(key, []).append(exchange)
+
+    def lookup(self, method: str, url: str) -> Optional[Exchange]:
+        key = (method.upper(), normalize_url(url))
+        with self._lock:
+            recorded = self._by_key.get(key)
+            if not recorded:
+                return None
+            n = self._served.get(key, 0)
+            self._served[key] = n + 1
+            return recorded[min(n, len(recorded) - 1)]
+
+    def rewind(self) -> None:
+        with self._lock:
+            self._served.clear()
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Cassette":
+        with open(path, encoding="utf-8") as f:
+            return cls([Exchange.from_json(line) for line in f if line.strip()])
+
+    def save(self, path: str | Path) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for recorded in self._by_key.values():
+                for exchange in recorded:
+                    f.write(exchange.to_json() + "\n")
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Recording
+# ─────────────────────────────────────────────────────────────────────
+
+
+@contextmanager
+def record(cassette: Cassette) -> Iterator[Cassette]:
+    """Send requests live and append each exchange to *cassette*."""
+    original_send = requests.Session.send
+
+    def send(session, request, **kwargs):
+        response = original_send(session, request, **kwargs)
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS}
+        cassette.add(
+            Exchange(request.method, normalize_url(request.url), response.status_code, headers, response.content)
+        )
+        return response
+
+    requests.Session.send = send
+    try:
+        yield cassette
+    finally:
+        requests.Session.send = original_send
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Replaying
+# ─────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class Faults:
+    """What the replay server does besides answering."""
+
+    latency: float = 0.0  # seconds added to every response
+    jitter: float = 0.0  # extra uniform [0, jitter) seconds
+    error_rate: float = 0.0  # share of requests answered 503
+    rate_limit: Optional[float] = None  # requests per second before 429s
+    seed: Optional[int] = None
+
+
+@dataclass
+class ReplayStats:
+    served: int = 0
+    misses: int = 0
+    errors: int = 0
+    throttled: int = 0
+    bytes: int = 0
+    missed_urls: list[str] = field(default_factory=list)
+
+
+class ReplayServer:
+    """Local HTTP server answering from a :class:`Cassette`.
+
+    Use as a context manager; :meth:`url_for` maps a live URL onto it.
+    """
+
+    def __init__(self, cassette: Cassette, faults: Optional[Faults] = None) -> None:
+        self.cassette = cassette
+        self.faults = faults or Faults()
+        self.stats = ReplayStats()
+        self._random = random.Random(self.faults.seed)
+        self._window: deque[float] = deque()
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_for(self, url: str) -> str:
+        """``https://host/path?q`` → ``http://127.0.0.1:port/https/host/path?q``."""
+        parts = urlsplit(url)
+        path = f"/{parts.scheme}/{parts.netloc}{quote(parts.path or '/')}"
+        return self.base_url + path + (f"?{parts.query}" if parts.query else "")
+
+    def __enter__(self) -> "ReplayServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._answer(self)
+
+            def do_HEAD(self):
+                server._answer(self, body=False)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                server._answer(self)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _original_url(self, path: str) -> str:
+        target, _, query = path.partition("?")
+        scheme, _, rest = target.lstrip("/").partition("/")
+        netloc, _, tail = rest.partition("/")
+        return urlunsplit((scheme, netloc, unquote("/" + tail), query, ""))
+
+    def _over_limit(self) -> bool:
+        if self.faults.rate_limit is None:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            while self._window and now - self._window[0] >= 1.0:
+                self._window.popleft()
+            if len(self._window) >= self.faults.rate_limit:
+                return True
+            self._window.append(now)
+            return False
+
+    def _answer(self, handler: BaseHTTPRequestHandler, body: bool = True) -> None:
+        faults = self.faults
+        with self._lock:
+            delay = faults.latency + (self._random.uniform(0, faults.jitter) if faults.jitter else 0.0)
+            fail = faults.error_rate > 0 and self._random.random() < faults.error_rate
+        if delay:
+            time.sleep(delay)
+
+        url = self._original_url(handler.path)
+        if self._over_limit():
+            status, headers, payload = 429, {"Retry-After": "1"}, b"rate limited"
+            with self._lock:
+                self.stats.throttled += 1
+        elif fail:
+            status, headers, payload = 503, {}, b"injected error"
+            with self._lock:
+                self.stats.errors += 1
+        else:
+            exchange = self.cassette.lookup(handler.command, url)
+            if exchange is None:
+                status, headers, payload = 404, {}, b"not recorded"
+                with self._lock:
+                    self.stats.misses += 1
+                    self.stats.missed_urls.append(url)
+            else:
+                status, headers, payload = exchange.status, exchange.headers, exchange.body
+                with self._lock:
+                    self.stats.served += 1
+                    self.stats.bytes += len(exchange.body)
+
+        handler.send_response(status)
+        for name, value in headers.items():
+            if name.lower() in _DROPPED_HEADERS:
+                continue
+            if name.lower() == "location":
+                # Absolute, so the redirected request is routed here again by replay()
+                value = urljoin(url, value)
+            handler.send_header(name, value)
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        if body:
+            handler.wfile.write(payload)
+
+
+@contextmanager
+def replay(server: ReplayServer) -> Iterator[ReplayServer]:
+    """Route every ``requests`` call to *server* instead of the network."""
+    original_send = requests.Session.send
+
+    def send(session, request, **kwargs):
+        original = request.url
+        request = request.copy()
+        request.url = server.url_for(original)
+        response = original_send(session, request, **kwargs)
+        if response.url == request.url:
+            # Not redirected (a redirect's final URL was restored by the nested send)
+            response.url = original
+        return response
+
+    requests.Session.send = send
+    try:
+        yield server
+    finally:
+        requests.Session.send = original_send
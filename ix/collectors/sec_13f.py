@@ -2,18 +2,128 @@
 
 Fetches quarterly 13-F filings from SEC EDGAR for tracked institutional investors.
 Parses XML holdings tables and stores in InstitutionalHolding model.
+
+A run works in three stages:
+
+1. the submissions JSON of every fund is fetched concurrently, and each
+   fund's 13F-HR filings newer than its stored cursor (and not already
+   ingested) are selected;
+2. the selected filings are downloaded concurrently: one ``index.json``
+   request locates the information table, which is stream-parsed with
+   ``iterparse``;
+3. each fund's holdings are bulk-inserted and its cursor advanced.
+
+All requests share a :class:`~ix.collectors.ratelimit.RateBudget` within
+SEC's fair-access limit.
 """
 
-import time
+import threading
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, date
+from typing import IO, Optional
 
 import requests
 
 from ix.collectors.base import BaseCollector
+from ix.collectors.ratelimit import RateBudget
 from ix.db.conn import Session
 from ix.db.models.institutional_holding import InstitutionalHolding
 
+# Concurrent requests to EDGAR
+WORKERS = 4
+# Requests per second across all workers (SEC allows 10)
+REQUESTS_PER_SECOND = 8
+# Filings taken per fund when it has no cursor yet (two years)
+INITIAL_FILINGS = 8
+# Holdings per INSERT statement
+INSERT_CHUNK = 1000
+
+FORMS_13F = ("13F-HR", "13-F-HR")
+
+
+@dataclass
+class Filing:
+    """One 13F-HR filing of a fund."""
+
+    cik: str
+    fund_name: str
+    accession: str  # as displayed, e.g. 0001067983-24-000006
+    filed: Optional[str] = None
+    report: Optional[str] = None
+    holdings: Optional[list] = field(default=None, repr=False)
+
+    @property
+    def folder(self) -> str:
+        return f"https://www.sec.gov/Archives/edgar/data/{self.cik.lstrip('0')}/{self.accession.replace('-', '')}/"
+
+
+def _tag(elem) -> str:
+    return elem.tag.rsplit("}", 1)[-1].lower()
+
+
+def parse_info_table(source: IO[bytes]) -> list:
+    """Stream-parse a 13-F information table into a list of holdings.
+
+    Each ``infoTable`` element is read with its descendants (shares and
+    their type sit inside ``shrsOrPrnAmt``) and cleared once parsed, so
+    memory stays flat for large tables.
+    """
+    holdings = []
+    for _, elem in ET.iterparse(source, events=("end",)):
+        if _tag(elem) != "infotable":
+            continue
+        holding = {}
+        for child in elem.iter():
+            tag = _tag(child)
+            text = (child.text or "").strip()
+            if tag == "nameofissuer":
+                holding["name"] = text
+            elif tag == "cusip":
+                holding["cusip"] = text
+            elif tag == "value":
+                try:
+                    holding["value"] = int(float(text))
+                except ValueError:
+                    pass
+            elif tag == "sshprnamt":
+                try:
+                    holding["shares"] = int(float(text))
+                except ValueError:
+                    pass
+            elif tag == "sshprnamttype":
+                holding["class"] = text
+            elif tag == "putcall":
+                holding["put_call"] = text
+        elem.clear()
+        if holding.get("name"):
+            holdings.append(holding)
+    return holdings
+
+
+def pick_info_table(names: list[str]) -> Optional[str]:
+    """The information-table XML among a filing's file names."""
+    xml = [n for n in names if n.lower().endswith(".xml") and n.lower() != "primary_doc.xml"]
+    for name in xml:
+        if "infotable" in name.lower():
+            return name
+    return xml[0] if xml else None
+
+
+def advance_cursor(cursor: Optional[str], attempted: list[Filing]) -> Optional[str]:
+    """New cursor after processing *attempted* (newest first).
+
+    The cursor moves to the newest filing of the unbroken run of
+    successes at the old end, so a failed filing is retried next run.
+    """
+    new = cursor
+    for filing in reversed(attempted):
+        if filing.holdings is None:
+            break
+        new = filing.accession
+    return new
+
 
 class SEC13FCollector(BaseCollector):
     name = "sec_13f"
@@ -44,31 +154,55 @@ class SEC13FCollector(BaseCollector):
         "Accept-Encoding": "gzip, deflate",
     }
 
-    EDGAR_SEARCH_URL = "https://efts.sec.gov/LATEST/search-index"
-    EDGAR_FILING_URL = "https://www.sec.gov/cgi-bin/browse-edgar"
+    def __init__(self):
+        super().__init__()
+        self._budget = RateBudget(REQUESTS_PER_SECOND, burst=1)
+        self._local = threading.local()
 
     def collect(self, progress_cb=None) -> dict:
         inserted = 0
         errors = 0
         total = len(self.TRACKED_FUNDS)
-        current = 0
-
-        with Session() as db:
-            for cik, fund_name in self.TRACKED_FUNDS.items():
-                current += 1
-                if progress_cb:
-                    progress_cb(current, total, f"Checking {fund_name}")
-
-                try:
-                    count = self._fetch_fund_filings(db, cik, fund_name)
-                    inserted += count
-                except Exception as e:
-                    self.logger.error(f"Error processing {fund_name} ({cik}): {e}")
-                    errors += 1
-
-                time.sleep(0.2)  # SEC rate limit: 10 req/sec
 
-        self.update_state(last_data_date=str(date.today()))
+        state = self.get_state()
+        cursors = dict(((state.state or {}) if state else {}).get("cursors", {}))
+
+        with ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="sec-13f") as pool:
+            # 1) New filings per fund
+            if progress_cb:
+                progress_cb(0, total, "Checking funds for new filings")
+            plans = dict(
+                zip(
+                    self.TRACKED_FUNDS,
+                    pool.map(
+                        lambda item: self._new_filings(*item, cursors.get(item[0])),
+                        self.TRACKED_FUNDS.items(),
+                    ),
+                )
+            )
+            errors += sum(1 for plan in plans.values() if plan is None)
+
+            # 2) Download and parse every new filing
+            filings = [f for plan in plans.values() if plan for f in plan]
+            for filing, holdings in zip(filings, pool.map(self._fetch_holdings, filings)):
+                filing.holdings = holdings
+
+        # 3) Store per fund, then move its cursor
+        for current, (cik, fund_name) in enumerate(self.TRACKED_FUNDS.items(), start=1):
+            plan = plans.get(cik)
+            if not plan:
+                continue
+            if progress_cb:
+                progress_cb(current, total, f"Storing {fund_name}")
+            try:
+                inserted += self._store(plan)
+                cursors[cik] = advance_cursor(cursors.get(cik), plan)
+            except Exception as e:
+                self.logger.error(f"Error storing {fund_name} ({cik}): {e}")
+                errors += 1
+            errors += sum(1 for f in plan if f.holdings is None)
+
+        self.update_state(last_data_date=str(date.today()), extra_state={"cursors": cursors})
         return {
             "inserted": inserted,
             "updated": 0,
@@ -76,167 +210,136 @@ class SEC13FCollector(BaseCollector):
             "message": f"13-F: {inserted} holdings from {total} funds, {errors} errors",
         }
 
-    def _fetch_fund_filings(self, db, cik: str, fund_name: str) -> int:
-        """Fetch recent 13-F filings for a specific fund."""
-        # Use EDGAR full-text search API
-        url = f"https://efts.sec.gov/LATEST/search-index?q=%2213-F%22&dateRange=custom&startdt=2024-01-01&forms=13-F-HR&entityName={cik}"
-
-        # Simpler approach: use the EDGAR submissions API
-        submissions_url = f"https://data.sec.gov/submissions/CIK{cik}.json"
-
+    # ─────────────────────────────────────────────────────────────────
+    # HTTP
+    # ─────────────────────────────────────────────────────────────────
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """Rate-limited GET on this thread's keep-alive session."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = requests.Session()
+            http.headers.update(self.HEADERS)
+        self._budget.acquire()
+        return http.get(url, timeout=30, **kwargs)
+
+    # ─────────────────────────────────────────────────────────────────
+    # Stages
+    # ─────────────────────────────────────────────────────────────────
+
+    def _new_filings(self, cik: str, fund_name: str, cursor: Optional[str]) -> Optional[list]:
+        """13F-HR filings after *cursor* not yet stored, newest first; ``None`` on failure."""
         try:
-            resp = requests.get(submissions_url, headers=self.HEADERS, timeout=30)
+            resp = self._get(f"https://data.sec.gov/submissions/CIK{cik}.json")
             if resp.status_code != 200:
                 self.logger.warning(f"EDGAR submissions fetch failed for {cik}: {resp.status_code}")
-                return 0
-
-            data = resp.json()
-            recent = data.get("filings", {}).get("recent", {})
-            forms = recent.get("form", [])
-            accessions = recent.get("accessionNumber", [])
-            filing_dates = recent.get("filingDate", [])
-            report_dates = recent.get("reportDate", [])
-
-            count = 0
-            for i, form in enumerate(forms):
-                if form not in ("13F-HR", "13-F-HR"):
-                    continue
-
-                accession = accessions[i].replace("-", "")
-                accession_display = accessions[i]
-                filed = filing_dates[i] if i < len(filing_dates) else None
-                report = report_dates[i] if i < len(report_dates) else None
-
-                # Check if we already have this filing
-                existing = db.query(InstitutionalHolding).filter(
-                    InstitutionalHolding.accession_number.like(f"{accession_display}%")
-                ).first()
-                if existing:
-                    continue
-
-                # Fetch and parse the filing
-                try:
-                    holdings = self._parse_13f_filing(cik, accession, accession_display)
-                    for holding in holdings:
-                        h = InstitutionalHolding(
-                            cik=cik,
-                            fund_name=fund_name,
-                            accession_number=f"{accession_display}_{holding.get('cusip', '')}",
-                            report_date=datetime.strptime(report, "%Y-%m-%d").date() if report else date.today(),
-                            filed_date=datetime.strptime(filed, "%Y-%m-%d").date() if filed else None,
-                            cusip=holding.get("cusip"),
-                            symbol=holding.get("symbol"),
-                            security_name=holding.get("name", "Unknown"),
-                            security_class=holding.get("class"),
-                            shares=holding.get("shares", 0),
-                            value_usd=holding.get("value", 0),
-                            put_call=holding.get("put_call"),
-                            meta={"accession": accession_display},
-                        )
-                        db.add(h)
-                        count += 1
-
-                    if count > 0 and count % 50 == 0:
-                        db.flush()
-
-                    time.sleep(0.2)
-                except Exception as e:
-                    self.logger.warning(f"Failed to parse filing {accession_display}: {e}")
-
-                # Only process recent filings (last 2 quarters)
-                if count > 2000:
-                    break
-
-            return count
-
+                return None
+            recent = resp.json().get("filings", {}).get("recent", {})
         except Exception as e:
             self.logger.error(f"Failed to fetch submissions for {cik}: {e}")
-            return 0
-
-    def _parse_13f_filing(self, cik: str, accession: str, accession_display: str) -> list:
-        """Parse a 13-F XML information table."""
-        # Try to find the XML info table
-        index_url = f"https://www.sec.gov/Archives/edgar/data/{cik.lstrip('0')}/{accession}/"
+            return None
+
+        forms = recent.get("form", [])
+        accessions = recent.get("accessionNumber", [])
+        filing_dates = recent.get("filingDate", [])
+        report_dates = recent.get("reportDate", [])
+
+        filings = []
+        for i, form in enumerate(forms):
+            if form not in FORMS_13F:
+                continue
+            if accessions[i] == cursor:
+                break
+            filings.append(
+                Filing(
+                    cik=cik,
+                    fund_name=fund_name,
+                    accession=accessions[i],
+                    filed=filing_dates[i] if i < len(filing_dates) else None,
+                    report=report_dates[i] if i < len(report_dates) else None,
+                )
+            )
+        if cursor is None:
+            filings = filings[:INITIAL_FILINGS]
+
+        stored = self._stored_accessions(cik)
+        return [f for f in filings if f.accession not in stored]
+
+    def _stored_accessions(self, cik: str) -> set:
+        from sqlalchemy import func, select
+
+        accession = func.split_part(InstitutionalHolding.accession_number, "_", 1)
+        with Session() as db:
+            rows = db.execute(
+                select(accession).where(InstitutionalHolding.cik == cik).distinct()
+            )
+            return {row[0] for row in rows}
 
+    def _fetch_holdings(self, filing: Filing) -> Optional[list]:
+        """Holdings of *filing*; ``None`` when it could not be read."""
         try:
-            resp = requests.get(index_url, headers=self.HEADERS, timeout=30)
+            resp = self._get(filing.folder + "index.json")
             if resp.status_code != 200:
+                return None
+            names = [item.get("name", "") for item in resp.json().get("directory", {}).get("item", [])]
+            table = pick_info_table(names)
+            if table is None:
+                # Filings without an information table hold nothing to store
                 return []
 
-            # Find the information table XML file
-            xml_url = None
-            for line in resp.text.split("\n"):
-                lower = line.lower()
-                if "infotable" in lower and ".xml" in lower:
-                    # Extract filename from the index page
-                    import re
-                    match = re.search(r'href="([^"]*infotable[^"]*\.xml)"', lower)
-                    if match:
-                        xml_url = index_url + match.group(1)
-                        break
-
-            if not xml_url:
-                # Try common naming patterns
-                for suffix in ["infotable.xml", "primary_doc.xml"]:
-                    test_url = f"{index_url}{suffix}"
-                    test_resp = requests.head(test_url, headers=self.HEADERS, timeout=10)
-                    if test_resp.status_code == 200:
-                        xml_url = test_url
-                        break
-                    time.sleep(0.1)
-
-            if not xml_url:
-                return []
-
-            time.sleep(0.1)
-            xml_resp = requests.get(xml_url, headers=self.HEADERS, timeout=30)
-            if xml_resp.status_code != 200:
-                return []
-
-            return self._parse_info_table_xml(xml_resp.text)
-
+            resp = self._get(filing.folder + table, stream=True)
+            if resp.status_code != 200:
+                return None
+            resp.raw.decode_content = True
+            with resp:
+                return parse_info_table(resp.raw)
         except Exception as e:
-            self.logger.warning(f"Failed to parse 13-F: {e}")
-            return []
+            self.logger.warning(f"Failed to parse filing {filing.accession}: {e}")
+            return None
+
+    def _store(self, filings: list) -> int:
+        """Bulk-insert the holdings of *filings*; returns rows written."""
+        from sqlalchemy.dialects.postgresql import insert
+
+        rows = []
+        for filing in filings:
+            for holding in filing.holdings or []:
+                rows.append(
+                    {
+                        "cik": filing.cik,
+                        "fund_name": filing.fund_name,
+                        "accession_number": f"{filing.accession}_{holding.get('cusip', '')}",
+                        "report_date": (
+                            datetime.strptime(filing.report, "%Y-%m-%d").date()
+                            if filing.report
+                            else date.today()
+                        ),
+                        "filed_date": (
+                            datetime.strptime(filing.filed, "%Y-%m-%d").date()
+                            if filing.filed
+                            else None
+                        ),
+                        "cusip": holding.get("cusip"),
+                        "symbol": holding.get("symbol"),
+                        "security_name": holding.get("name", "Unknown"),
+                        "security_class": holding.get("class"),
+                        "shares": holding.get("shares", 0),
+                        "value_usd": holding.get("value", 0),
+                        "put_call": holding.get("put_call"),
+                        "meta": {"accession": filing.accession},
+                    }
+                )
+        if not rows:
+            return 0
 
-    def _parse_info_table_xml(self, xml_text: str) -> list:
-        """Parse 13-F information table XML into a list of holdings."""
-        holdings = []
-        try:
-            # Handle namespace
-            xml_text = xml_text.replace('xmlns=', 'xmlns_orig=')
-            root = ET.fromstring(xml_text)
-
-            for entry in root.iter():
-                if "infotable" in entry.tag.lower():
-                    holding = {}
-                    for child in entry:
-                        tag = child.tag.split("}")[-1].lower() if "}" in child.tag else child.tag.lower()
-                        text = (child.text or "").strip()
-
-                        if "nameofissuer" in tag:
-                            holding["name"] = text
-                        elif "cusip" in tag:
-                            holding["cusip"] = text
-                        elif "value" in tag and "ssh" not in tag:
-                            try:
-                                holding["value"] = int(text)
-                            except ValueError:
-                                self.logger.debug("Non-numeric value field: %s", text)
-                        elif "sshprnamt" in tag:
-                            try:
-                                holding["shares"] = int(text)
-                            except ValueError:
-                                self.logger.debug("Non-numeric shares field: %s", text)
-                        elif "sshprnamttype" in tag:
-                            holding["class"] = text
-                        elif "putcall" in tag:
-                            holding["put_call"] = text
-
-                    if holding.get("name"):
-                        holdings.append(holding)
-
-        except ET.ParseError as e:
-            self.logger.warning(f"XML parse error: {e}")
-
-        return holdings
+        written = 0
+        with Session() as db:
+            for i in range(0, len(rows), INSERT_CHUNK):
+                result = db.execute(
+                    insert(InstitutionalHolding)
+                    .values(rows[i : i + INSERT_CHUNK])
+                    .on_conflict_do_nothing(index_elements=["accession_number"])
+                )
+                written += max(result.rowcount or 0, 0)
+            db.commit()
+        return written
@@ -0,0 +1,223 @@
+"""Process-isolated Yahoo Finance downloads.
+
+yfinance keeps process-wide state: one shared HTTP session with its
+cookie / crumb, and a module-level results dict that ``yf.download``
+fills from its own threads. Concurrent callers in one process can
+therefore corrupt each other's results, which is why fetches used to be
+serialised behind a lock, one symbol at a time via ``Ticker.history``.
+
+Here downloads run in a small pool of worker processes instead:
+
+* each worker runs one batch at a time, so the multi-symbol
+  ``yf.download`` is safe there, and batches from different callers
+  (screener, VAMS, ``Series`` live fetches, the nightly refresh) run in
+  parallel in separate workers;
+* a worker returns its batch as Arrow IPC bytes, split per symbol in the
+  calling process;
+* a token bucket in the calling process keeps batch starts within
+  :data:`REQUESTS_PER_MINUTE`.
+
+Callers on the event loop use :func:`fetch_yahoo_async`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Optional
+
+import pandas as pd
+
+from ix.collectors.ratelimit import RateBudget
+from ix.common.terminal import get_logger
+
+logger = get_logger(__name__)
+
+# Worker processes; each runs one download at a time
+WORKERS = 2
+# Symbols per yf.download call
+BATCH_SIZE = 50
+# Batch downloads started per minute, across all callers in this process
+REQUESTS_PER_MINUTE = 60
+# Seconds to wait for one batch
+TIMEOUT = 180
+
+_FIELD_ORDER = ["Open", "High", "Low", "Close", "Adj Close", "Volume", "Dividends", "Stock Splits"]
+
+_budget = RateBudget(REQUESTS_PER_MINUTE / 60.0, burst=max(1, REQUESTS_PER_MINUTE // 6))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Frames
+# ─────────────────────────────────────────────────────────────────────
+
+
+def normalize_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """Naive, midnight-normalised date index plus an ``Adj Close`` column.
+
+    Yahoo returns a tz-aware index in the exchange's local timezone. The
+    tz is dropped with ``tz_localize(None)``, keeping the exchange-local
+    calendar date; ``tz_convert(None)`` would shift to UTC and give
+    off-by-one dates for non-US exchanges.
+    """
+    if hasattr(data.index, "tz") and data.index.tz is not None:
+        data.index = data.index.tz_localize(None)
+    data.index = pd.to_datetime(data.index).normalize()
+    data.index.name = "Date"
+    # Equals Close when auto_adjust=False; some callers reference it
+    if "Adj Close" not in data.columns and "Close" in data.columns:
+        data["Adj Close"] = data["Close"]
+    return data
+
+
+def _to_long(data: pd.DataFrame, symbols: list[str]) -> pd.DataFrame:
+    """``(field, symbol)`` column frame to rows of ``Date, Symbol, <fields>``."""
+    if data is None or data.empty:
+        return pd.DataFrame(columns=["Date", "Symbol"])
+    if not isinstance(data.columns, pd.MultiIndex):
+        data = pd.concat({symbols[0]: data}, axis=1).swaplevel(axis=1)
+    long = data.stack(level=1, future_stack=True).dropna(how="all")
+    long.index.names = ["Date", "Symbol"]
+    return long.reset_index()
+
+
+def encode_frames(long: pd.DataFrame) -> bytes:
+    """Arrow IPC stream bytes of a long frame."""
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(long, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def decode_frames(payload: bytes) -> dict[str, pd.DataFrame]:
+    """Inverse of :func:`encode_frames`, split into one frame per symbol."""
+    import pyarrow as pa
+
+    long = pa.ipc.open_stream(payload).read_all().to_pandas()
+    frames = {}
+    for symbol, rows in long.groupby("Symbol", sort=False):
+        frame = rows.drop(columns="Symbol").set_index("Date").sort_index()
+        frame = frame.dropna(how="all")
+        if frame.empty:
+            continue
+        columns = [c for c in _FIELD_ORDER if c in frame.columns]
+        frames[str(symbol)] = normalize_frame(frame[columns + [c for c in frame.columns if c not in columns]])
+    return frames
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Worker side
+# ─────────────────────────────────────────────────────────────────────
+
+
+def _download(symbols: list[str], start: str, end: str, actions: bool) -> bytes:
+    """Runs in a worker process: one multi-symbol download, Arrow-encoded."""
+    import yfinance as yf
+
+    data = yf.download(
+        symbols,
+        start=start,
+        end=end,
+        actions=actions,
+        auto_adjust=False,
+        group_by="column",
+        progress=False,
+        threads=True,
+    )
+    if data is not None and hasattr(data.index, "tz") and data.index.tz is not None:
+        data.index = data.index.tz_localize(None)
+    return encode_frames(_to_long(data, symbols))
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Calling side
+# ─────────────────────────────────────────────────────────────────────
+
+
+def _executor() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: never fork a process that has threads (scheduler, API)
+            _pool = ProcessPoolExecutor(
+                max_workers=WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def _submit(batch: list[str], start: str, end: str, actions: bool) -> Future:
+    global _pool
+    _budget.acquire()
+    try:
+        return _executor().submit(_download, batch, start, end, actions)
+    except BrokenProcessPool:
+        # A worker died (e.g. killed for memory); start a fresh pool once
+        with _pool_lock:
+            _pool = None
+        return _executor().submit(_download, batch, start, end, actions)
+
+
+def fetch_yahoo(
+    symbols: Iterable[str],
+    start: str = "1950-1-1",
+    end: str = "",
+    actions: bool = True,
+) -> dict[str, pd.DataFrame]:
+    """Daily OHLCV frames for *symbols*, downloaded in isolated worker processes.
+
+    Args:
+        symbols: Yahoo tickers; duplicates are fetched once.
+        start: First date requested.
+        end: Exclusive last date; defaults to tomorrow.
+        actions: Include ``Dividends`` / ``Stock Splits``.
+
+    Returns:
+        ``{symbol: frame}`` for the symbols that returned data, with the
+        columns of :func:`~ix.collectors.crawler.get_yahoo_data`. Failed
+        batches are logged and their symbols omitted.
+    """
+    from ix.common.date import tomorrow
+
+    symbols = list(dict.fromkeys(str(s) for s in symbols if s))
+    if not symbols:
+        return {}
+    if not end:
+        end = tomorrow().date().strftime("%Y-%m-%d")
+
+    batches = [symbols[i : i + BATCH_SIZE] for i in range(0, len(symbols), BATCH_SIZE)]
+    futures = [(batch, _submit(batch, start, end, actions)) for batch in batches]
+    frames: dict[str, pd.DataFrame] = {}
+    for batch, fut in futures:
+        try:
+            frames.update(decode_frames(fut.result(timeout=TIMEOUT)))
+        except Exception as exc:
+            logger.warning("Yahoo download failed for %d symbol(s) (%s…): %s", len(batch), batch[0], exc)
+    return frames
+
+
+async def fetch_yahoo_async(
+    symbols: Iterable[str],
+    start: str = "1950-1-1",
+    end: str = "",
+    actions: bool = True,
+) -> dict[str, pd.DataFrame]:
+    """:func:`fetch_yahoo` without blocking the event loop."""
+    return await asyncio.to_thread(fetch_yahoo, list(symbols), start, end, actions)
+
+
+def shutdown() -> None:
+    """Stop the worker processes (started again on the next fetch)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
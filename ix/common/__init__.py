@@ -3,7 +3,6 @@ from .fmt import as_format, as_date
 from .date import today, tomorrow, periods, onemonthbefore, onemonthlater
 from .util import all_subclasses, ContributionToGrowth
 from .settings import Settings
-from ix.collectors.crawler import get_yahoo_data, get_fred_data, get_naver_data
 
 # Data transforms & helpers
 from .data.transforms import (  # noqa: F401
@@ -23,3 +22,15 @@ from .data.transforms import (  # noqa: F401
 )
 from .data.statistics import RollingZScore, Cycle, VAR, STDEV, ENTP, CV, Winsorize  # noqa: F401
 from .data.preprocessing import BaseScaler, StandardScaler, RobustScaler, MinMaxScaler  # noqa: F401
+
+from .lazy import lazy_exports
+
+# Crawlers pull in the collectors package; load them on first use
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    attrs={
+        "get_yahoo_data": "ix.collectors.crawler:get_yahoo_data",
+        "get_fred_data": "ix.collectors.crawler:get_fred_data",
+        "get_naver_data": "ix.collectors.crawler:get_naver_data",
+    },
+)
@@ -1,9 +1,14 @@
 """Statistical functions: cycle fitting, variance, entropy, scalers."""
 
+import sys
 from typing import Union, Optional
 import numpy as np
 import pandas as pd
-from scipy.optimize import curve_fit
+
+from ix.common.lazy import lazy_exports
+
+# scipy is slow to import; curve_fit is bound on first use
+__getattr__, __dir__ = lazy_exports(__name__, attrs={"curve_fit": "scipy.optimize:curve_fit"})
 
 
 def Offset(
@@ -94,7 +99,9 @@ def Cycle(series: pd.Series, max_points_per_cycle: Optional[int] = None) -> pd.S
 
     p0 = [A0, f0, phi0, C0]
 
-    # 6) Curve fitting
+    # 6) Curve fitting (module attribute, resolved lazily)
+    curve_fit = sys.modules[__name__].curve_fit
+
     try:
         if use_bounds:
             popt, _ = curve_fit(
@@ -6,7 +6,6 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 from pandas.tseries.offsets import MonthEnd
-from scipy.optimize import curve_fit
 
 logger = logging.getLogger(__name__)
 
@@ -208,6 +207,8 @@ def CycleForecast(
         phase = 2 * np.pi * np.cumsum(freq_trend)
         return A * np.sin(phase + phi) + C
 
+    from scipy.optimize import curve_fit  # deferred: scipy is slow to import
+
     popt, _ = curve_fit(
         sine_model_varfreq,
         t,
@@ -0,0 +1,80 @@
+"""Deferred package re-exports (PEP 562 module ``__getattr__``).
+
+Package ``__init__`` modules that re-export heavy subpackages (scipy,
+sklearn, plotly, every indicator module, …) make *any* ``import ix.x``
+pay for all of them. :func:`lazy_exports` keeps the same public names
+but imports their source module on first attribute access::
+
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        attrs={"bt": "ix.core.backtesting", "rebase": "ix.common.performance.metrics:rebase"},
+        star=("ix.db.query", "ix.core.indicators"),
+    )
+
+``attrs`` maps a name to ``"module"`` or ``"module:attribute"``. ``star``
+lists modules that used to be ``from module import *``-ed, in the same
+order; as with the original imports, later modules win when they export
+the same name.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+
+def _public_names(module: ModuleType) -> set[str]:
+    names = getattr(module, "__all__", None)
+    if names is not None:
+        return set(names)
+    return {n for n in vars(module) if not n.startswith("_")}
+
+
+def _resolve(target: str) -> Any:
+    path, _, attr = target.partition(":")
+    obj = importlib.import_module(path)
+    return getattr(obj, attr) if attr else obj
+
+
+def lazy_exports(
+    module_name: str,
+    attrs: Optional[Mapping[str, str]] = None,
+    star: Iterable[str] = (),
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """``(__getattr__, __dir__)`` for *module_name*.
+
+    Resolved values are cached on the module, so only the first access
+    goes through ``__getattr__``.
+    """
+    attrs = dict(attrs or {})
+    star = tuple(star)
+
+    def __getattr__(name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        target = attrs.get(name)
+        if target is not None:
+            value = _resolve(target)
+        else:
+            for path in reversed(star):
+                source = importlib.import_module(path)
+                if name in _public_names(source):
+                    value = getattr(source, name)
+                    break
+            else:
+                raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        names = set(vars(sys.modules[module_name])) | set(attrs)
+        for path in star:
+            # Only modules already loaded; listing names must not import them
+            source = sys.modules.get(path)
+            if source is not None:
+                names |= _public_names(source)
+        return sorted(names)
+
+    return __getattr__, __dir__
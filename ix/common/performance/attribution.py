@@ -4,7 +4,6 @@ from typing import Optional
 
 import numpy as np
 import pandas as pd
-from scipy import stats
 
 
 # ---------------------------------------------------------------------------
@@ -385,6 +384,8 @@ def _full_sample_regression(
 
     se = np.sqrt(np.diag(var_beta))
     t_stats = betas / se
+    from scipy import stats  # deferred: scipy is slow to import
+
     p_values = 2 * (1 - stats.t.cdf(np.abs(t_stats), dof))
 
     names = ["alpha"] + X.columns.tolist()
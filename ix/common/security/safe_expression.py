@@ -1,13 +1,15 @@
 import ast
+import threading
+from collections import OrderedDict
+from types import CodeType
 from typing import Any, Mapping
 
 import numpy as np
 import pandas as pd
 
-from ix.core import ContributionToGrowth
+from ix.common.util import ContributionToGrowth
 from ix.common.data import transforms as transforms_module
 from ix.db import query as query_module
-from ix.core import indicators as custom_module
 from ix.common.security.blocklists import BLOCKED_PANDAS_ATTRIBUTES
 
 
@@ -111,6 +113,10 @@ class UnsafeExpressionError(ValueError):
 
 
 def _build_query_context() -> dict[str, Any]:
+    # The indicator library is the heaviest import in the package; it is
+    # only loaded once a timeseries/evaluation context is first needed.
+    from ix.core import indicators as custom_module
+
     # Core query/transform names (from query_module & transforms_module)
     _core_names = {
         "Series",
@@ -165,43 +171,165 @@ SERIES_EXPRESSION_CONTEXT: dict[str, Any] = {
     "MultiSeries": query_module.MultiSeries,
 }
 
-TIMESERIES_EXPRESSION_CONTEXT: dict[str, Any] = {
-    **_build_query_context(),
-    "Series": _strict_query_series,
-    "pd": pd,
-    "np": np,
-    "abs": abs,
-    "round": round,
-    "min": min,
-    "max": max,
-    "len": len,
-    "int": int,
-    "float": float,
-    "str": str,
-    "range": range,
-    "enumerate": enumerate,
-    "zip": zip,
-    "list": list,
-    "dict": dict,
-    "tuple": tuple,
-    "set": set,
-    "True": True,
-    "False": False,
-    "None": None,
-}
+def _build_timeseries_context() -> dict[str, Any]:
+    return {
+        **_build_query_context(),
+        "Series": _strict_query_series,
+        "pd": pd,
+        "np": np,
+        "abs": abs,
+        "round": round,
+        "min": min,
+        "max": max,
+        "len": len,
+        "int": int,
+        "float": float,
+        "str": str,
+        "range": range,
+        "enumerate": enumerate,
+        "zip": zip,
+        "list": list,
+        "dict": dict,
+        "tuple": tuple,
+        "set": set,
+        "True": True,
+        "False": False,
+        "None": None,
+    }
+
+
+def _build_evaluation_context() -> dict[str, Any]:
+    return {
+        **timeseries_context(),
+        "ContributionToGrowth": ContributionToGrowth,
+    }
 
-EVALUATION_EXPRESSION_CONTEXT: dict[str, Any] = {
-    **TIMESERIES_EXPRESSION_CONTEXT,
-    "ContributionToGrowth": ContributionToGrowth,
+
+# TIMESERIES_/EVALUATION_EXPRESSION_CONTEXT are built on first use and
+# then stay the same dict objects (the compile cache keys on identity).
+_LAZY_CONTEXTS = {
+    "TIMESERIES_EXPRESSION_CONTEXT": _build_timeseries_context,
+    "EVALUATION_EXPRESSION_CONTEXT": _build_evaluation_context,
 }
+_context_lock = threading.RLock()
+
+
+def _lazy_context(name: str) -> dict[str, Any]:
+    context = globals().get(name)
+    if context is None:
+        with _context_lock:
+            context = globals().get(name)
+            if context is None:
+                context = _LAZY_CONTEXTS[name]()
+                globals()[name] = context
+    return context
+
+
+def timeseries_context() -> dict[str, Any]:
+    """Names available to ``/timeseries`` expressions and code blocks."""
+    return _lazy_context("TIMESERIES_EXPRESSION_CONTEXT")
+
+
+def evaluation_context() -> dict[str, Any]:
+    """:func:`timeseries_context` plus the evaluation-only helpers."""
+    return _lazy_context("EVALUATION_EXPRESSION_CONTEXT")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_CONTEXTS:
+        return _lazy_context(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Allowed-name profile per context mapping: {id: (context, names, callables)}.
+# The contexts are module-level constants, so this is computed once each.
+_CONTEXT_PROFILES: dict[int, tuple[Mapping[str, Any], frozenset, frozenset]] = {}
+
+# Validated, compiled code objects keyed by (mode, source, names, callables)
+_COMPILED_CACHE: OrderedDict[tuple, CodeType] = OrderedDict()
+_COMPILED_CACHE_MAX = 2048
+_compiled_lock = threading.Lock()
+
+
+def _context_profile(context: Mapping[str, Any]) -> tuple[frozenset, frozenset]:
+    """(allowed names, allowed callables) for *context*, computed once."""
+    cached = _CONTEXT_PROFILES.get(id(context))
+    if cached is not None and cached[0] is context:
+        return cached[1], cached[2]
+    names = frozenset(context.keys())
+    callables = frozenset(name for name, value in context.items() if callable(value))
+    if isinstance(context, dict) and len(_CONTEXT_PROFILES) < 64:
+        _CONTEXT_PROFILES[id(context)] = (context, names, callables)
+    return names, callables
+
+
+def _compile_validated(
+    source: str, mode: str, context: Mapping[str, Any]
+) -> CodeType:
+    """Parse, validate and compile *source*, memoised per context profile.
+
+    Only expressions that pass validation are cached; a rejected one is
+    re-validated (and rejected) on every call.
+    """
+    names, callables = _context_profile(context)
+    key = (mode, source, names, callables)
+    with _compiled_lock:
+        compiled = _COMPILED_CACHE.get(key)
+        if compiled is not None:
+            _COMPILED_CACHE.move_to_end(key)
+            return compiled
+
+    if mode == "eval":
+        try:
+            tree = ast.parse(source, mode="eval")
+        except SyntaxError as exc:
+            raise UnsafeExpressionError(f"Invalid expression syntax: {exc.msg}") from exc
+        _SafeExpressionValidator(context, names, callables).visit(tree)
+        compiled = compile(tree, "<safe-expression>", "eval")
+    else:
+        try:
+            tree = ast.parse(source, mode="exec")
+        except SyntaxError as exc:
+            raise UnsafeExpressionError(f"Invalid syntax: {exc.msg}") from exc
+
+        # Pre-collect all assignment/comprehension target names so forward references work
+        validator = _SafeExpressionValidator(context, names, callables)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        validator._assigned_names.add(target.id)
+            elif isinstance(node, ast.comprehension):
+                if isinstance(node.target, ast.Name):
+                    validator._assigned_names.add(node.target.id)
+        validator.visit(tree)
+        compiled = compile(tree, "<safe-code-block>", "exec")
+
+    with _compiled_lock:
+        _COMPILED_CACHE[key] = compiled
+        while len(_COMPILED_CACHE) > _COMPILED_CACHE_MAX:
+            _COMPILED_CACHE.popitem(last=False)
+    return compiled
+
+
+def clear_expression_cache() -> None:
+    """Drop all memoised compiled expressions and context profiles."""
+    with _compiled_lock:
+        _COMPILED_CACHE.clear()
+    _CONTEXT_PROFILES.clear()
 
 
 class _SafeExpressionValidator(ast.NodeVisitor):
-    def __init__(self, context: Mapping[str, Any]):
-        self.allowed_names = set(context.keys())
-        self.allowed_callables = {
-            name for name, value in context.items() if callable(value)
-        }
+    def __init__(
+        self,
+        context: Mapping[str, Any],
+        allowed_names: frozenset | None = None,
+        allowed_callables: frozenset | None = None,
+    ):
+        if allowed_names is None or allowed_callables is None:
+            allowed_names, allowed_callables = _context_profile(context)
+        self.allowed_names = allowed_names
+        self.allowed_callables = allowed_callables
         # Track names created by assignment so they can be used later
         self._assigned_names: set[str] = set()
 
@@ -288,13 +416,7 @@ def safe_eval_expression(expression: str, context: Mapping[str, Any]) -> Any:
             f"Expression exceeds {MAX_EXPRESSION_LENGTH} characters"
         )
 
-    try:
-        tree = ast.parse(expression_clean, mode="eval")
-    except SyntaxError as exc:
-        raise UnsafeExpressionError(f"Invalid expression syntax: {exc.msg}") from exc
-
-    _SafeExpressionValidator(context).visit(tree)
-    compiled = compile(tree, "<safe-expression>", "eval")
+    compiled = _compile_validated(expression_clean, "eval", context)
     return eval(compiled, {"__builtins__": {}}, dict(context))
 
 
@@ -313,24 +435,7 @@ def safe_exec_code(code: str, context: Mapping[str, Any]) -> Any:
             f"Code block exceeds {MAX_CODE_BLOCK_LENGTH} characters"
         )
 
-    try:
-        tree = ast.parse(code_clean, mode="exec")
-    except SyntaxError as exc:
-        raise UnsafeExpressionError(f"Invalid syntax: {exc.msg}") from exc
-
-    # Pre-collect all assignment/comprehension target names so forward references work
-    validator = _SafeExpressionValidator(context)
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name):
-                    validator._assigned_names.add(target.id)
-        elif isinstance(node, ast.comprehension):
-            if isinstance(node.target, ast.Name):
-                validator._assigned_names.add(node.target.id)
-    validator.visit(tree)
-
-    compiled = compile(tree, "<safe-code-block>", "exec")
+    compiled = _compile_validated(code_clean, "exec", context)
     # Context must be in globals so comprehension scopes can see it
     global_ns: dict[str, Any] = {"__builtins__": {}, **context}
     exec(compiled, global_ns)  # noqa: S102
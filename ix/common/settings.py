@@ -22,6 +22,12 @@ def _require_env(name: str) -> str:
 class Settings:
     db_url: str = _require_env("DB_URL")
     db_name: str = os.getenv("DB_NAME", "")
+    # Connection pools, sized per engine (sync psycopg2 / async asyncpg)
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_async: bool = os.getenv("DB_ASYNC", "0").strip().lower() in ("1", "true", "yes", "on")
+    db_async_pool_size: int = int(os.getenv("DB_ASYNC_POOL_SIZE", "10"))
+    db_async_max_overflow: int = int(os.getenv("DB_ASYNC_MAX_OVERFLOW", "10"))
     public_api_url: str = os.getenv("API_BASE_URL", "")
     secret_key: str = _require_env("SECRET_KEY")
     access_token_expire_minutes: int = int(
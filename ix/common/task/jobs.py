@@ -0,0 +1,524 @@
+"""Scheduled jobs in worker processes, with persistent state and checkpoints.
+
+The nightly jobs (macro research, data reports, the VOMO screener) used
+to run on the API's event-loop scheduler, competing with requests for
+CPU, the GIL and the DB pool, and losing their progress whenever the
+API restarted. :func:`run_job` instead:
+
+1. claims a run in the job's state row (a ``CollectorState`` named
+   ``job:<name>``), refusing it while ``max_concurrency`` runs with a
+   fresh heartbeat exist;
+2. executes the job function in a separate, low-priority process pool;
+   the job marks completed units on :func:`current`, which are saved
+   with the run's heartbeat;
+3. records status, duration and throughput in the run history and drops
+   the checkpoint once the run succeeds.
+
+A run that dies (worker crash, API restart) leaves its checkpoint behind
+and its heartbeat goes stale; :func:`resume_interrupted` starts it again
+under the same run key, and the job skips the units it already finished.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import importlib
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterable, Optional
+
+from ix.common.terminal import get_logger
+
+logger = get_logger(__name__)
+
+# Worker processes shared by all jobs
+JOB_WORKERS = 2
+# Added to the workers' nice value so the API keeps the CPU
+NICENESS = 10
+# Seconds between heartbeats (and checkpoint saves) of a running job
+HEARTBEAT = 30.0
+# A run without a heartbeat for this long is considered dead
+STALE_AFTER = 4 * HEARTBEAT
+# Minimum seconds between checkpoint saves triggered by completed units
+FLUSH_INTERVAL = 5.0
+# Interrupted runs older than this are not resumed
+RESUME_WITHIN = timedelta(hours=20)
+# Finished runs kept per job
+HISTORY = 20
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """A scheduled job and its limits."""
+
+    name: str
+    # "module:function" run in a worker process, without arguments
+    target: str
+    # Runs at once across all API processes
+    max_concurrency: int = 1
+    # Restart interrupted runs from their checkpoint
+    resume: bool = True
+    # "module:function" called in the API process with a successful result
+    on_result: Optional[str] = None
+
+
+JOBS: dict[str, JobSpec] = {
+    spec.name: spec
+    for spec in (
+        # One opaque subprocess with no checkpoint units: rerun, not resumed
+        JobSpec("macro_research", "ix.common.task:run_macro_research", resume=False),
+        JobSpec("send_data_reports", "ix.common.task:send_data_reports"),
+        JobSpec(
+            "vomo_screener",
+            "ix.api.routers.analytics.screener:compute_screener",
+            on_result="ix.api.routers.analytics.screener:cache_result",
+        ),
+    )
+}
+
+
+def _resolve(path: str) -> Callable:
+    module, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module), attr)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _stamp(moment: datetime) -> str:
+    return moment.isoformat(timespec="seconds")
+
+
+def _parse(stamp: str) -> datetime:
+    """A stored stamp as an aware UTC datetime (naive stamps are UTC)."""
+    moment = datetime.fromisoformat(stamp)
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+# ─────────────────────────────────────────────────────────────────────
+# State transitions (plain dicts, stored in CollectorState.state)
+# ─────────────────────────────────────────────────────────────────────
+#
+#   active:     {run_id: {run_key, started_at, heartbeat_at}}
+#   checkpoint: {run_key, units: {unit: value}}
+#   runs:       [finished run records, newest first]
+
+
+def _record(state: dict, run: dict) -> None:
+    state["runs"] = [run] + list(state.get("runs") or [])[: HISTORY - 1]
+
+
+def finish(
+    state: dict,
+    run_id: str,
+    status: str,
+    now: datetime,
+    *,
+    units: int = 0,
+    resumed: bool = False,
+    error: Optional[str] = None,
+    checkpoint: Optional[dict] = None,
+) -> dict:
+    """Move run *run_id* from the active runs to the history; returns its record.
+
+    A successful run drops the checkpoint; otherwise *checkpoint* (when
+    given) replaces it.
+    """
+    active = state.get("active") or {}
+    run = active.pop(run_id, None) or {"started_at": _stamp(now)}
+    state["active"] = active
+    duration = max((now - _parse(run["started_at"])).total_seconds(), 0.0)
+    record = {
+        "run_id": run_id,
+        "run_key": run.get("run_key"),
+        "status": status,
+        "started_at": run["started_at"],
+        "finished_at": _stamp(now),
+        "duration_s": round(duration, 1),
+        "units": units,
+        "units_per_s": round(units / duration, 2) if units and duration else None,
+        "resumed": resumed,
+        "error": error[:500] if error else None,
+    }
+    _record(state, record)
+    if status == "success":
+        state.pop("checkpoint", None)
+    elif checkpoint is not None:
+        state["checkpoint"] = checkpoint
+    return record
+
+
+def reap(state: dict, now: datetime) -> list[str]:
+    """Record active runs with a stale heartbeat as ``interrupted``; returns their ids."""
+    stale = [
+        run_id
+        for run_id, run in (state.get("active") or {}).items()
+        if now - _parse(run["heartbeat_at"]) > timedelta(seconds=STALE_AFTER)
+    ]
+    for run_id in stale:
+        finish(state, run_id, "interrupted", now, error="heartbeat lost")
+    return stale
+
+
+def claim(state: dict, spec: JobSpec, run_id: str, run_key: str, now: datetime) -> bool:
+    """Register run *run_id* unless *spec*'s concurrency limit is reached."""
+    reap(state, now)
+    active = state.setdefault("active", {})
+    if len(active) >= spec.max_concurrency:
+        return False
+    active[run_id] = {"run_key": run_key, "started_at": _stamp(now), "heartbeat_at": _stamp(now)}
+    return True
+
+
+def resumable(state: dict, now: datetime) -> Optional[str]:
+    """Run key of a recently interrupted run to start again, if any."""
+    reap(state, now)
+    if state.get("active"):
+        return None
+    runs = state.get("runs") or []
+    if not runs or runs[0]["status"] != "interrupted":
+        return None
+    last = runs[0]
+    if now - _parse(last["started_at"]) > RESUME_WITHIN:
+        return None
+    return last["run_key"]
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Persistence
+# ─────────────────────────────────────────────────────────────────────
+
+
+def _row_name(name: str) -> str:
+    return f"job:{name}"
+
+
+def _transact(name: str, update: Callable[[dict], Any], *, outcome: Optional[str] = None) -> Any:
+    """Apply *update* to job *name*'s state under a row lock; returns its result.
+
+    *outcome* (a finished run's status) also updates the row's counters.
+    """
+    from sqlalchemy.dialects.postgresql import insert
+
+    from ix.db.conn import Session
+    from ix.db.models.collector_state import CollectorState
+
+    with Session() as db:
+        # Every worker's scheduler fires the first run at once: create the
+        # row without racing, then lock it
+        db.execute(
+            insert(CollectorState)
+            .values(collector_name=_row_name(name), state={})
+            .on_conflict_do_nothing(index_elements=["collector_name"])
+        )
+        row = (
+            db.query(CollectorState)
+            .filter(CollectorState.collector_name == _row_name(name))
+            .with_for_update()
+            .one()
+        )
+        state = copy.deepcopy(row.state or {})
+        result = update(state)
+        row.state = state
+        if outcome is not None:
+            row.last_fetch_at = _utcnow().replace(tzinfo=None)  # naive UTC column
+            row.fetch_count = (row.fetch_count or 0) + 1
+            if outcome == "success":
+                row.last_success_at = row.last_fetch_at
+                row.last_error = None
+            else:
+                row.last_error = (result or {}).get("error") or outcome
+                row.error_count = (row.error_count or 0) + 1
+        return result
+
+
+def job_status() -> dict[str, dict]:
+    """Active runs, checkpoint size and recent history of every job."""
+    from ix.db.conn import Session
+    from ix.db.models.collector_state import CollectorState
+
+    with Session() as db:
+        rows = {
+            row.collector_name: row
+            for row in db.query(CollectorState).filter(
+                CollectorState.collector_name.in_([_row_name(n) for n in JOBS])
+            )
+        }
+        status = {}
+        for name, spec in JOBS.items():
+            row = rows.get(_row_name(name))
+            state = (row.state if row else None) or {}
+            checkpoint = state.get("checkpoint") or {}
+            status[name] = {
+                "max_concurrency": spec.max_concurrency,
+                "active": state.get("active") or {},
+                "checkpoint_units": len(checkpoint.get("units") or {}),
+                "runs": (state.get("runs") or [])[:5],
+                "run_count": row.fetch_count if row else 0,
+                "error_count": row.error_count if row else 0,
+                "last_success_at": str(row.last_success_at) if row and row.last_success_at else None,
+            }
+        return status
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Inside the worker
+# ─────────────────────────────────────────────────────────────────────
+
+
+class JobContext:
+    """Checkpoint and progress of the running job (see :func:`current`).
+
+    Units are short string keys (a symbol, a stage name); their values
+    must be JSON-serialisable and small, as they live in the state row.
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        run_id: Optional[str] = None,
+        run_key: Optional[str] = None,
+        units: Optional[dict] = None,
+    ) -> None:
+        self.name = name
+        self.run_id = run_id
+        self.run_key = run_key
+        self.resumed = bool(units)
+        self.processed = 0
+        self._units = dict(units or {})
+        self._dirty = False
+        self._flushed = time.monotonic()
+        self._lock = threading.Lock()
+
+    def done(self, unit: str) -> bool:
+        return unit in self._units
+
+    def value(self, unit: str, default: Any = None) -> Any:
+        return self._units.get(unit, default)
+
+    def pending(self, units: Iterable[str]) -> list[str]:
+        """The *units* not completed yet."""
+        return [u for u in units if u not in self._units]
+
+    def complete(self, unit: str, value: Any = None) -> None:
+        """Mark *unit* completed (with an optional result to reuse on resume)."""
+        with self._lock:
+            self._units[unit] = value
+            self.processed += 1
+            self._dirty = True
+        if time.monotonic() - self._flushed >= FLUSH_INTERVAL:
+            self.flush()
+
+    def progress(self, n: int = 1) -> None:
+        """Count *n* processed items that are not checkpointed."""
+        with self._lock:
+            self.processed += n
+
+    def checkpoint(self) -> dict:
+        with self._lock:
+            return {"run_key": self.run_key, "units": dict(self._units)}
+
+    def flush(self) -> None:
+        """Save the heartbeat, and the checkpoint when units were completed."""
+        if self.name is None:
+            return
+        with self._lock:
+            checkpoint = {"run_key": self.run_key, "units": dict(self._units)} if self._dirty else None
+            self._dirty = False
+            self._flushed = time.monotonic()
+        run_id = self.run_id
+
+        def beat(state: dict) -> None:
+            run = (state.get("active") or {}).get(run_id)
+            if run is not None:
+                run["heartbeat_at"] = _stamp(_utcnow())
+            if checkpoint is not None:
+                state["checkpoint"] = checkpoint
+
+        try:
+            _transact(self.name, beat)
+        except Exception as e:
+            logger.warning("Could not save checkpoint of %s: %s", self.name, e)
+            if checkpoint is not None:
+                with self._lock:
+                    self._dirty = True
+
+
+_context: Optional[JobContext] = None
+
+
+def current() -> JobContext:
+    """The running job's context; a throwaway one when called outside a job run."""
+    return _context if _context is not None else JobContext()
+
+
+def _init_worker() -> None:
+    try:
+        os.nice(NICENESS)
+    except (AttributeError, OSError):
+        pass
+
+
+def _heartbeat(ctx: JobContext, stop: threading.Event) -> None:
+    while not stop.wait(HEARTBEAT):
+        ctx.flush()
+
+
+def _execute(name: str, run_id: str, run_key: str) -> tuple[Any, dict]:
+    """Run job *name* in this process; returns ``(result, run record)``."""
+    global _context
+    spec = JOBS[name]
+    saved = _transact(name, lambda state: dict(state.get("checkpoint") or {}))
+    units = saved.get("units") if saved.get("run_key") == run_key else None
+    ctx = _context = JobContext(name, run_id, run_key, units)
+    if ctx.resumed:
+        logger.info("Job %s resuming run %s with %d completed unit(s)", name, run_key, len(units))
+
+    stop = threading.Event()
+    beat = threading.Thread(target=_heartbeat, args=(ctx, stop), name=f"job-{name}", daemon=True)
+    beat.start()
+    result, status, error = None, "success", None
+    try:
+        result = _resolve(spec.target)()
+    except Exception as e:
+        logger.exception("Job %s failed", name)
+        status, error = "failed", f"{type(e).__name__}: {e}"
+    finally:
+        stop.set()
+        beat.join()
+        _context = None
+
+    record = _transact(
+        name,
+        lambda state: finish(
+            state,
+            run_id,
+            status,
+            _utcnow(),
+            units=ctx.processed,
+            resumed=ctx.resumed,
+            error=error,
+            checkpoint=ctx.checkpoint(),
+        ),
+        outcome=status,
+    )
+    return result, record
+
+
+# ─────────────────────────────────────────────────────────────────────
+# In the API process
+# ─────────────────────────────────────────────────────────────────────
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _executor() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: never fork a process that has threads (scheduler, API)
+            _pool = ProcessPoolExecutor(
+                max_workers=JOB_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return _pool
+
+
+def _submit(name: str, run_id: str, run_key: str) -> Future:
+    global _pool
+    try:
+        return _executor().submit(_execute, name, run_id, run_key)
+    except BrokenProcessPool:
+        with _pool_lock:
+            _pool = None
+        return _executor().submit(_execute, name, run_id, run_key)
+
+
+async def run_job(name: str, run_key: Optional[str] = None) -> Optional[dict]:
+    """Run job *name* in the worker pool.
+
+    Args:
+        name: A key of :data:`JOBS`.
+        run_key: Identifies the run a checkpoint belongs to; defaults to
+            today's UTC date, so a daily job resumes only its own day.
+
+    Returns:
+        The finished run's record, or ``None`` when the job's concurrency
+        limit was reached.
+    """
+    global _pool
+    spec = JOBS[name]
+    run_key = run_key or _utcnow().date().isoformat()
+    run_id = uuid.uuid4().hex[:12]
+
+    claimed = await asyncio.to_thread(
+        _transact, name, lambda state: claim(state, spec, run_id, run_key, _utcnow())
+    )
+    if not claimed:
+        logger.info("Job %s skipped: %d run(s) already active", name, spec.max_concurrency)
+        return None
+
+    logger.info("Job %s started (run %s, key %s)", name, run_id, run_key)
+    try:
+        result, record = await asyncio.wrap_future(_submit(name, run_id, run_key))
+    except BrokenProcessPool:
+        # The worker died mid-run; its checkpoint stays for resume_interrupted()
+        with _pool_lock:
+            _pool = None
+        record = await asyncio.to_thread(
+            _transact,
+            name,
+            lambda state: finish(state, run_id, "interrupted", _utcnow(), error="worker process died"),
+            outcome="interrupted",
+        )
+        logger.error("Job %s interrupted: worker process died", name)
+        return record
+
+    if record["status"] == "success" and spec.on_result:
+        _resolve(spec.on_result)(result)
+    logger.info(
+        "Job %s %s in %.1fs (%d unit(s)%s)",
+        name,
+        record["status"],
+        record["duration_s"],
+        record["units"],
+        f", {record['units_per_s']}/s" if record["units_per_s"] else "",
+    )
+    return record
+
+
+async def resume_interrupted() -> None:
+    """Start again every resumable job whose last run was interrupted."""
+
+    async def resume(spec: JobSpec) -> None:
+        run_key = await asyncio.to_thread(_transact, spec.name, lambda state: resumable(state, _utcnow()))
+        if run_key:
+            logger.info("Resuming interrupted job %s (key %s)", spec.name, run_key)
+            await run_job(spec.name, run_key)
+
+    await asyncio.gather(*(resume(spec) for spec in JOBS.values() if spec.resume))
+
+
+def shutdown() -> None:
+    """Stop the worker processes; running jobs resume from their checkpoints."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is None:
+        return
+    # Running jobs would otherwise hold up interpreter exit until they finish
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,349 @@
+"""Ticker-grouped, concurrent refresh of source-backed timeseries.
+
+Several series usually share one source ticker and differ only by field
+(``SPY:PX_LAST``, ``SPY:PX_VOLUME``, …). The refresh therefore:
+
+1. groups a source's series by ticker, so each ticker is fetched once;
+2. asks only for the window after the oldest stored ``end`` in the group
+   (less a per-source look-back for revisions; full history when any
+   series in the group is still empty);
+3. fetches the tickers on a bounded thread pool, spacing request starts
+   per source and retrying failed requests with exponential back-off;
+   sources with a batch fetcher get up to ``batch_size`` tickers that
+   share a window per request;
+4. writes the fetched fields of :data:`WRITE_BATCH` tickers per
+   transaction from the calling thread while later fetches are still in
+   flight.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Callable, Iterable, Optional
+
+import pandas as pd
+
+from ix.common.terminal import get_logger
+
+logger = get_logger(__name__)
+
+# Tickers whose fields are written per transaction
+WRITE_BATCH = 25
+
+
+@dataclass(frozen=True)
+class SourcePolicy:
+    """How hard a refresh may hit one source."""
+
+    workers: int = 4
+    # Minimum seconds between request starts, across all workers
+    min_interval: float = 0.5
+    retries: int = 2
+    backoff: float = 2.0
+    # Days re-requested before the stored end; ``None`` always fetches full history
+    lookback_days: Optional[int] = 7
+    # Tickers per request when a batch fetcher is given
+    batch_size: int = 1
+
+
+POLICIES: dict[str, SourcePolicy] = {
+    # Batches run in ix.collectors.yahoo's worker processes, one per worker
+    "Yahoo": SourcePolicy(workers=2, min_interval=0.2, lookback_days=7, batch_size=50),
+    # FRED revises recent observations (monthly/quarterly releases); requests
+    # are paced and fanned out inside ix.collectors.fred, so no spacing here
+    "Fred": SourcePolicy(workers=2, min_interval=0.0, lookback_days=400, batch_size=25),
+    # The Naver reader ignores start/end
+    "Naver": SourcePolicy(workers=2, min_interval=1.0, lookback_days=None),
+}
+
+
+@dataclass
+class TickerGroup:
+    """The series of one source ticker and the window to request."""
+
+    ticker: str
+    # (timeseries id, code, field)
+    series: list[tuple[str, str, str]] = field(default_factory=list)
+    start: Optional[str] = None
+
+
+class Throttle:
+    """Spaces calls to :meth:`wait` at least *interval* seconds apart across threads."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Planning
+# ─────────────────────────────────────────────────────────────────────
+
+
+def plan_groups(
+    rows: Iterable[tuple[str, str, Optional[str], Optional[date]]],
+    policy: SourcePolicy,
+) -> tuple[list[TickerGroup], list[str]]:
+    """Group ``(id, code, source_code, end)`` rows by ticker.
+
+    Returns:
+        ``(groups, skipped codes)``: codes are skipped when they have no
+        ``TICKER:FIELD`` source_code. Groups keep first-seen ticker order.
+    """
+    groups: dict[str, TickerGroup] = {}
+    ends: dict[str, list[Optional[date]]] = {}
+    skipped = []
+    for ts_id, code, source_code, end in rows:
+        if source_code is None or ":" not in str(source_code):
+            skipped.append(code)
+            continue
+        ticker, field_name = str(source_code).split(":", maxsplit=1)
+        groups.setdefault(ticker, TickerGroup(ticker)).series.append((ts_id, code, field_name))
+        ends.setdefault(ticker, []).append(end)
+
+    for ticker, group in groups.items():
+        group_ends = ends[ticker]
+        if policy.lookback_days is None or any(e is None for e in group_ends):
+            continue
+        start = min(group_ends) - timedelta(days=policy.lookback_days)
+        group.start = start.strftime("%Y-%m-%d")
+    return list(groups.values()), skipped
+
+
+def plan_batches(groups: list[TickerGroup], batch_size: int) -> list[list[TickerGroup]]:
+    """Split *groups* into batches of at most *batch_size* sharing one ``start``."""
+    by_start: dict[Optional[str], list[TickerGroup]] = {}
+    for group in groups:
+        by_start.setdefault(group.start, []).append(group)
+    size = max(1, batch_size)
+    return [
+        same[i : i + size] for same in by_start.values() for i in range(0, len(same), size)
+    ]
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Fetching
+# ─────────────────────────────────────────────────────────────────────
+
+
+def _call_fetcher(fetcher: Callable, ticker: str, start: Optional[str]) -> pd.DataFrame:
+    kwargs = {"start": start} if start else {}
+    # Prefer positional ticker to support fetchers with different kwarg names
+    # (e.g. get_fred_data(ticker=...)).
+    try:
+        return fetcher(ticker, **kwargs)
+    except TypeError:
+        # Backward-compatible fallback for wrappers that still use `code=...`.
+        return fetcher(code=ticker, **kwargs)
+
+
+def fetch_group(
+    fetcher: Callable, group: TickerGroup, policy: SourcePolicy, throttle: Throttle
+) -> Optional[pd.DataFrame]:
+    """Fetch one ticker, retrying raised errors; ``None`` once retries are spent."""
+    for attempt in range(policy.retries + 1):
+        throttle.wait()
+        try:
+            return _call_fetcher(fetcher, group.ticker, group.start)
+        except Exception as e:
+            if attempt < policy.retries:
+                wait = policy.backoff * (2**attempt)
+                logger.info(
+                    "Fetching %s failed (attempt %d), retrying in %.1fs: %s",
+                    group.ticker, attempt + 1, wait, e,
+                )
+                time.sleep(wait)
+            else:
+                logger.warning("Error fetching data for %s: %s", group.ticker, e)
+    return None
+
+
+def fetch_batch(
+    batch_fetcher: Callable,
+    groups: list[TickerGroup],
+    policy: SourcePolicy,
+    throttle: Throttle,
+) -> dict[str, Optional[pd.DataFrame]]:
+    """Fetch groups sharing a window in one request.
+
+    *batch_fetcher* is called as ``batch_fetcher(tickers, start=...)`` and
+    returns ``{ticker: frame}``; tickers it leaves out come back empty.
+    All tickers map to ``None`` once retries are spent.
+    """
+    tickers = [g.ticker for g in groups]
+    start = groups[0].start
+    kwargs = {"start": start} if start else {}
+    for attempt in range(policy.retries + 1):
+        throttle.wait()
+        try:
+            frames = batch_fetcher(tickers, **kwargs)
+            return {t: frames.get(t, pd.DataFrame()) for t in tickers}
+        except Exception as e:
+            if attempt < policy.retries:
+                wait = policy.backoff * (2**attempt)
+                logger.info(
+                    "Fetching %d tickers (%s…) failed (attempt %d), retrying in %.1fs: %s",
+                    len(tickers), tickers[0], attempt + 1, wait, e,
+                )
+                time.sleep(wait)
+            else:
+                logger.warning("Error fetching data for %d tickers (%s…): %s", len(tickers), tickers[0], e)
+    return dict.fromkeys(tickers)
+
+
+def _fetch_single(
+    fetcher: Callable, groups: list[TickerGroup], policy: SourcePolicy, throttle: Throttle
+) -> dict[str, Optional[pd.DataFrame]]:
+    (group,) = groups
+    return {group.ticker: fetch_group(fetcher, group, policy, throttle)}
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Writing
+# ─────────────────────────────────────────────────────────────────────
+
+
+def _write_batch(updates: list[tuple[str, str, pd.Series]]) -> int:
+    """Merge ``(id, code, data)`` updates in one transaction; returns rows written."""
+    from ix.db.conn import Session
+    from ix.db.models import Timeseries
+
+    if not updates:
+        return 0
+    written = 0
+    try:
+        with Session() as session:
+            for ts_id, code, data in updates:
+                ts = session.get(Timeseries, ts_id)
+                if ts is None:
+                    continue
+                ts._save_data_logic(data, session)
+                written += 1
+    except Exception as e:
+        # The batch rolled back; later batches still go through
+        logger.warning("Writing %d series failed: %s", len(updates), e)
+        return 0
+    return written
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Entry point
+# ─────────────────────────────────────────────────────────────────────
+
+
+def refresh_source(
+    source_name: str,
+    fetcher: Callable,
+    progress_cb=None,
+    start_index: int = 0,
+    total_count: int | None = None,
+    policy: Optional[SourcePolicy] = None,
+    batch_fetcher: Optional[Callable] = None,
+) -> dict:
+    """Refresh every series of *source_name* from *fetcher*.
+
+    Args:
+        source_name: ``Timeseries.source`` value (``"Yahoo"``, ``"Fred"``, …).
+        fetcher: ``fetcher(ticker, start=...)`` returning a field-column frame.
+        progress_cb: Optional ``callable(current, total, code)``, called per series.
+        start_index: Offset added to ``current`` when several sources share a bar.
+        total_count: ``total`` reported to *progress_cb* (defaults to this source's count).
+        policy: Overrides the :data:`POLICIES` entry for *source_name*.
+        batch_fetcher: Optional ``batch_fetcher(tickers, start=...)`` returning
+            ``{ticker: frame}``; used instead of *fetcher* when the policy's
+            ``batch_size`` is above one.
+
+    Returns:
+        Counts: ``total``, ``updated``, ``skipped_no_ticker``,
+        ``skipped_empty_data``, ``failed_tickers``.
+    """
+    from ix.db.conn import Session
+    from ix.db.models import Timeseries
+
+    policy = policy or POLICIES.get(source_name, SourcePolicy())
+    logger.info("Starting %s data update process.", source_name)
+
+    with Session() as session:
+        rows = (
+            session.query(Timeseries.id, Timeseries.code, Timeseries.source_code, Timeseries.end)
+            .filter(Timeseries.source == source_name)
+            .all()
+        )
+    groups, no_ticker = plan_groups(rows, policy)
+    for code in no_ticker:
+        logger.debug("Skipping timeseries %s (no source_ticker).", code)
+
+    stats = {
+        "total": len(rows),
+        "updated": 0,
+        "skipped_no_ticker": len(no_ticker),
+        "skipped_empty_data": 0,
+        "failed_tickers": 0,
+    }
+    total = total_count if total_count is not None else len(rows)
+    done = len(no_ticker)
+    throttle = Throttle(policy.min_interval)
+    pending: list[tuple[str, str, pd.Series]] = []
+    pending_tickers = 0
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, policy.workers), thread_name_prefix=f"refresh-{source_name.lower()}"
+    ) as pool:
+        if batch_fetcher is not None and policy.batch_size > 1:
+            futures = {
+                pool.submit(fetch_batch, batch_fetcher, batch, policy, throttle): batch
+                for batch in plan_batches(groups, policy.batch_size)
+            }
+        else:
+            futures = {
+                pool.submit(_fetch_single, fetcher, [group], policy, throttle): [group]
+                for group in groups
+            }
+        for fut in as_completed(futures):
+            results = fut.result()
+            for group in futures[fut]:
+                fetched = results.get(group.ticker)
+                if fetched is None:
+                    stats["failed_tickers"] += 1
+                for ts_id, code, field_name in group.series:
+                    done += 1
+                    if progress_cb:
+                        progress_cb(start_index + done, total, code)
+                    if fetched is None:
+                        continue
+                    if fetched.empty or field_name not in fetched.columns:
+                        logger.debug("No data returned for %s:%s. Skipping.", group.ticker, field_name)
+                        stats["skipped_empty_data"] += 1
+                        continue
+                    data = Timeseries._clean_data(fetched[field_name].copy())
+                    if data.empty:
+                        stats["skipped_empty_data"] += 1
+                        continue
+                    pending.append((ts_id, code, data))
+
+                pending_tickers += 1
+                if pending_tickers >= WRITE_BATCH:
+                    stats["updated"] += _write_batch(pending)
+                    pending, pending_tickers = [], 0
+        stats["updated"] += _write_batch(pending)
+
+    logger.info(
+        "%s data update complete: %d total, %d updated, %d skipped (no ticker), "
+        "%d skipped (empty data), %d tickers failed (%d tickers fetched).",
+        source_name, stats["total"], stats["updated"], stats["skipped_no_ticker"],
+        stats["skipped_empty_data"], stats["failed_tickers"], len(groups),
+    )
+    return stats
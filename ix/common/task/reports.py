@@ -0,0 +1,153 @@
+"""Daily data report built from stored series.
+
+The report used to call ``Series(code)`` for every code, which could
+start live crawler fetches and DB rewrites, kept a 500-row copy of each
+series and stitched them together with ``MultiSeries``. It is now built
+from stored data only:
+
+1. one query returns, per series, its stored observations up to today
+   within the report window (at most :data:`WINDOW`) and its latest one;
+2. the long rows are pivoted into one panel per stored frequency,
+   resampled to that frequency and then, together, to business days;
+3. workbooks are written row by row in xlsxwriter's ``constant_memory``
+   mode, which flushes each row to disk once it is complete.
+"""
+
+from __future__ import annotations
+
+import io
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from ix.common.date import today
+from ix.common.terminal import get_logger
+
+logger = get_logger(__name__)
+
+# Business days in the Timeseries sheet
+WINDOW = 500
+# Extra business days loaded so the window is full when data ends before today
+SLACK = 10
+
+# Per series: up to :rows observations on or before :today, newest first;
+# rn = 1 marks the latest, which is kept even when it predates :cutoff
+_TAIL = text(
+    """
+    SELECT t.code, t.frequency, p.key, p.value, p.rn
+    FROM timeseries t
+    JOIN timeseries_data d ON d.timeseries_id = t.id
+    CROSS JOIN LATERAL (
+        SELECT key, value, row_number() OVER (ORDER BY key DESC) AS rn
+        FROM jsonb_each_text(d.data)
+        WHERE key <= :today
+        ORDER BY key DESC
+        LIMIT :rows
+    ) p
+    WHERE (t.source IS NULL OR t.source <> 'Fred')
+      AND (p.key >= :cutoff OR p.rn = 1)
+    """
+)
+
+Frame = Union[pd.DataFrame, pd.Series]
+
+
+def load_report_data(window: int = WINDOW) -> tuple[pd.Series, pd.DataFrame]:
+    """Latest value of every non-FRED series and its business-day panel.
+
+    Returns:
+        ``(latest, panel)``: the latest stored value per code, and the
+        last *window* business days of all codes (one column each).
+    """
+    from ix.db.conn import Session
+
+    end = pd.Timestamp(today())
+    cutoff = end - pd.offsets.BDay(window + SLACK)
+    with Session() as db:
+        rows = db.execute(
+            _TAIL,
+            {"today": end.strftime("%Y-%m-%d"), "cutoff": cutoff.strftime("%Y-%m-%d"), "rows": window},
+        ).all()
+    logger.info("Loaded %d stored observations for the data report", len(rows))
+    return build_report_frames(rows, cutoff, window)
+
+
+def build_report_frames(
+    rows: Iterable[tuple], cutoff: pd.Timestamp, window: int = WINDOW
+) -> tuple[pd.Series, pd.DataFrame]:
+    """``(latest, panel)`` from ``(code, frequency, date, value, rn)`` rows."""
+    long = pd.DataFrame(list(rows), columns=["code", "frequency", "date", "value", "rn"])
+    long["date"] = pd.to_datetime(long["date"], format="%Y-%m-%d", errors="coerce")
+    long["value"] = pd.to_numeric(long["value"], errors="coerce")
+    long = long.dropna(subset=["date", "value"])
+
+    latest = long.loc[long["rn"] == 1].set_index("code")["value"].sort_index()
+    latest.index.name = "Code"
+    latest.name = "Value"
+
+    tail = long.loc[long["date"] >= cutoff]
+    frames = []
+    for freq, group in tail.groupby(tail["frequency"].fillna(""), sort=False):
+        wide = group.pivot(index="date", columns="code", values="value").sort_index()
+        if freq:
+            # Same labels Series() gives a series resampled to its stored frequency
+            try:
+                wide = wide.resample(freq).last()
+            except ValueError as exc:
+                logger.debug("Resample to %r failed: %s", freq, exc)
+        frames.append(wide)
+
+    if not frames:
+        return latest, pd.DataFrame()
+    panel = pd.concat(frames, axis=1).sort_index()
+    panel = panel.resample("B").last().iloc[-window:]
+    panel = panel.reindex(columns=sorted(panel.columns))
+    panel.index.name = "Date"
+    panel.columns.name = None
+    return latest, panel
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Workbooks
+# ─────────────────────────────────────────────────────────────────────
+
+
+def _write_sheet(worksheet, frame: Frame, date_format) -> None:
+    if isinstance(frame, pd.Series):
+        frame = frame.to_frame()
+    worksheet.write_row(0, 0, [frame.index.name or ""] + [str(c) for c in frame.columns])
+
+    values = frame.to_numpy(dtype=float, na_value=np.nan)
+    cells = values.astype(object)
+    # Blank cells for NaN / inf (xlsxwriter rejects non-finite numbers)
+    cells[~np.isfinite(values)] = None
+
+    dates = isinstance(frame.index, pd.DatetimeIndex)
+    labels = frame.index.to_pydatetime() if dates else frame.index.astype(str)
+    for r, (label, row) in enumerate(zip(labels, cells.tolist()), start=1):
+        if dates:
+            if not pd.isna(label):
+                worksheet.write_datetime(r, 0, label, date_format)
+        else:
+            worksheet.write_string(r, 0, label)
+        worksheet.write_row(r, 1, row)
+
+
+def write_workbook(sheets: dict[str, Frame]) -> io.BytesIO:
+    """An ``.xlsx`` with one sheet per frame (index in the first column).
+
+    Rows are streamed through xlsxwriter's ``constant_memory`` mode, so
+    the writer holds one row at a time rather than every cell.
+    """
+    import xlsxwriter
+
+    buffer = io.BytesIO()
+    workbook = xlsxwriter.Workbook(buffer, {"constant_memory": True})
+    date_format = workbook.add_format({"num_format": "yyyy-mm-dd"})
+    for name, frame in sheets.items():
+        _write_sheet(workbook.add_worksheet(name), frame, date_format)
+    workbook.close()
+    buffer.seek(0)
+    return buffer
@@ -1,28 +1,39 @@
-"""Core computation engine. See ix/ARCHITECTURE.md for module placement guide."""
+"""Core computation engine. See ix/ARCHITECTURE.md for module placement guide.
 
-from .technical import *  # noqa: F401,F403
-from ix.common.data.statistics import *  # noqa: F401,F403
-from ix.common.data.preprocessing import *  # noqa: F401,F403
-from ix.common.quantitative import find_similar_patterns
-from .backtesting import *  # noqa: F401,F403
-from . import regimes
-from . import transforms  # noqa: F401
-from .stress_test import compute_stress_test  # noqa: F401
+Re-exports resolve on first access (see :mod:`ix.common.lazy`) so that
+importing e.g. ``ix.core.ts`` does not pull in scipy, sklearn and the
+technical/backtesting stacks.
+"""
 
+from ix.common.lazy import lazy_exports
 
-# Re-export for backward compat
-from ix.common.performance.utils import to_quantiles, sum_to_one, demeaned, performance_by_state  # noqa: F401
-from ix.common.performance.metrics import rebase  # noqa: F401
-
-from ix.common import ContributionToGrowth  # noqa: F401
-
-# Attribution
-from ix.common.performance.attribution import (  # noqa: F401
-    brinson_fachler,
-    brinson_fachler_summary,
-    multi_period_attribution,
-    factor_return_decomposition,
-    factor_decomposition_report,
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    attrs={
+        "regimes": "ix.core.regimes",
+        "transforms": "ix.core.transforms",
+        "compute_stress_test": "ix.core.stress_test:compute_stress_test",
+        "find_similar_patterns": "ix.common.quantitative:find_similar_patterns",
+        # Re-export for backward compat
+        "to_quantiles": "ix.common.performance.utils:to_quantiles",
+        "sum_to_one": "ix.common.performance.utils:sum_to_one",
+        "demeaned": "ix.common.performance.utils:demeaned",
+        "performance_by_state": "ix.common.performance.utils:performance_by_state",
+        "rebase": "ix.common.performance.metrics:rebase",
+        "ContributionToGrowth": "ix.common.util:ContributionToGrowth",
+        # Attribution
+        "brinson_fachler": "ix.common.performance.attribution:brinson_fachler",
+        "brinson_fachler_summary": "ix.common.performance.attribution:brinson_fachler_summary",
+        "multi_period_attribution": "ix.common.performance.attribution:multi_period_attribution",
+        "factor_return_decomposition": "ix.common.performance.attribution:factor_return_decomposition",
+        "factor_decomposition_report": "ix.common.performance.attribution:factor_decomposition_report",
+    },
+    star=(
+        "ix.core.technical",
+        "ix.common.data.statistics",
+        "ix.common.data.preprocessing",
+        "ix.core.backtesting",
+    ),
 )
 
 __all__ = [
@@ -36,7 +36,7 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
-from .compose import build_joint_states, compose_regimes
+from .compose import build_joint_states, build_regime_frames, compose_regimes
 from .registry import RegimeRegistration, get_regime
 
 
@@ -100,17 +100,7 @@ class MultiDimRegimeAnalyzer:
 
         params = self.params if self.params is not None else regs[0].default_params.copy()
 
-        built_dfs: dict[str, pd.DataFrame] = {}
-        for reg in regs:
-            regime = reg.regime_class()  # type: ignore[misc]
-            df = regime.build(
-                z_window=params.get("z_window", 96),
-                sensitivity=params.get("sensitivity", 2.0),
-                smooth_halflife=params.get("smooth_halflife", 3),
-            )
-            if df.empty:
-                raise ValueError(f"Regime '{reg.key}' built an empty DataFrame")
-            built_dfs[reg.key] = df
+        built_dfs = build_regime_frames(regs, params)
 
         joint = build_joint_states(built_dfs, regs, self.keys)
         self._built = _Built(
@@ -0,0 +1,340 @@
+"""Vectorised asset analytics for regime states.
+
+The per-regime asset tables (returns, vol, Sharpe, drawdown, separation,
+signal IC) are rebuilt for every snapshot and every composition, so they
+sit on the critical path of the regimes UI. This module computes them with
+grouped array operations instead of per-state / per-ticker Python loops:
+
+* :func:`load_asset_panel` — loads the whole ticker universe once (one
+  bulk query for the stored prices) into a month-end price panel, with a
+  short TTL cache so the analytics and strategy passes of one compute
+  share the same load.
+* :func:`state_return_stats` — one ``groupby`` over a state-coded index
+  yields every per-(state, asset) statistic at once.
+* :func:`state_separation` — Cohen's d, Welch p-value and η² derived from
+  the same grouped moments.
+* :func:`rank_ic` — Spearman IC for all tickers via ranked matrix
+  correlation on pairwise-complete observations.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Asset panel loading
+# ─────────────────────────────────────────────────────────────────────
+
+# TTL cache for monthly price panels: {sorted (display, code) items: (ts, df)}
+_panel_cache: dict[tuple, tuple[float, pd.DataFrame]] = {}
+_panel_lock = threading.Lock()
+_PANEL_CACHE_TTL = 300  # 5 minutes — matches the Series() result cache
+_PANEL_CACHE_MAX = 32
+_PANEL_MAX_WORKERS = 8
+
+
+def _load_monthly(display: str, code: str) -> pd.Series | None:
+    from ix.db.query import Series as DbSeries
+
+    try:
+        s = DbSeries(code)
+    except Exception as exc:
+        log.warning("Asset price load failed for %s (%s): %s", display, code, exc)
+        return None
+    if s.empty:
+        return None
+    return s.resample("ME").last()
+
+
+def _preload_stored(codes: list[str]) -> dict:
+    """``{canonical code: PreloadedSeries}`` for *codes*, in one query."""
+    from ix.core.ts.planner import preload
+    from ix.db.conn import Session
+    from ix.db.query import bulk_load_timeseries, canonical_code, split_alias
+
+    wanted = {canonical_code(split_alias(c)[1]) for c in codes}
+    try:
+        with Session() as db:
+            loaded = bulk_load_timeseries(db, sorted(wanted))
+            return {
+                code: preload(ts)
+                for code, ts in loaded.items()
+                if ts.data_record is not None
+            }
+    except Exception as exc:
+        log.warning("Asset price bulk load failed, loading per ticker: %s", exc)
+        return {}
+
+
+def load_asset_panel(tickers: dict[str, str]) -> pd.DataFrame:
+    """Load a month-end price panel for a ticker universe.
+
+    The stored series of the whole universe are read in one query and
+    served to ``Series()`` from memory, so each ticker keeps ``Series``
+    semantics (alias, start slicing) without a query of its own. Tickers
+    with a live source are still fetched from their crawler, as
+    ``Series`` does — concurrently. The aligned panel is cached for a few
+    minutes, so every consumer within one regime compute — asset
+    analytics, strategy backtest, composition — shares a single load.
+
+    Args:
+        tickers: ``{display_name: db_code}`` mapping.
+
+    Returns:
+        DataFrame indexed by month-end dates, columns = display names in
+        the order of *tickers*. Empty DataFrame if nothing loads.
+    """
+    if not tickers:
+        return pd.DataFrame()
+
+    key = tuple(sorted(tickers.items()))
+    with _panel_lock:
+        cached = _panel_cache.get(key)
+    if cached and (time.time() - cached[0]) < _PANEL_CACHE_TTL:
+        return cached[1].reindex(columns=[c for c in tickers if c in cached[1].columns]).copy()
+
+    from ix.db.query import preloaded_series
+
+    items = list(tickers.items())
+    workers = min(_PANEL_MAX_WORKERS, len(items))
+    with preloaded_series(_preload_stored([code for _, code in items])):
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="regime-px") as pool:
+            futures = [
+                pool.submit(contextvars.copy_context().run, _load_monthly, display, code)
+                for display, code in items
+            ]
+            loaded = [f.result() for f in futures]
+
+    out = {display: s for (display, _), s in zip(items, loaded) if s is not None}
+    panel = pd.DataFrame(out) if out else pd.DataFrame()
+
+    if not panel.empty:
+        with _panel_lock:
+            if len(_panel_cache) >= _PANEL_CACHE_MAX:
+                # Evict oldest 25%
+                for k in list(_panel_cache.keys())[: _PANEL_CACHE_MAX // 4]:
+                    _panel_cache.pop(k, None)
+            _panel_cache[key] = (time.time(), panel.copy())
+    return panel
+
+
+def clear_panel_cache() -> None:
+    """Drop all cached asset panels (e.g. after a bulk price refresh)."""
+    with _panel_lock:
+        _panel_cache.clear()
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Grouped per-state statistics
+# ─────────────────────────────────────────────────────────────────────
+
+
+def state_codes(regime: pd.Series, states: list[str]) -> np.ndarray:
+    """Integer-code a state label series against *states* (-1 = unknown)."""
+    return pd.Categorical(regime, categories=states).codes.astype(np.int64)
+
+
+def state_return_stats(
+    rets: pd.DataFrame,
+    regime: pd.Series,
+    states: list[str],
+    rf: pd.Series | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Per-(state, asset) return statistics from a single grouped pass.
+
+    NaN returns are ignored per asset, exactly like dropping them from each
+    state's slice before computing statistics.
+
+    Args:
+        rets: Monthly returns, one column per asset.
+        regime: State label per row of *rets* (same index).
+        states: Declared state order; rows with other labels are ignored.
+        rf: Optional risk-free monthly return (NaN treated as 0).
+
+    Returns:
+        Dict of ``states × assets`` DataFrames: ``count``, ``mean``,
+        ``std``, ``var``, ``min``, ``max``, ``win_rate``, ``excess_mean``
+        and ``max_dd``. States without observations appear as NaN rows
+        (``count`` = 0).
+    """
+    codes = state_codes(regime, states)
+    keep = codes >= 0
+    r = rets.loc[keep]
+    g_key = pd.Index(codes[keep], name="state")
+
+    grouped = r.groupby(g_key)
+    count = grouped.count()
+    mean = grouped.mean()
+    var = grouped.var(ddof=1)
+    r_min = grouped.min()
+    r_max = grouped.max()
+    win_rate = (r > 0).where(r.notna()).groupby(g_key).mean()
+
+    if rf is None:
+        excess = r
+    else:
+        excess = r.sub(rf.reindex(r.index).fillna(0.0), axis=0)
+    excess_mean = excess.groupby(g_key).mean()
+
+    # Max drawdown within each state's (non-contiguous) month sequence
+    cum = (1.0 + r).groupby(g_key).cumprod()
+    peak = cum.groupby(g_key).cummax()
+    max_dd = (cum / peak - 1.0).groupby(g_key).min()
+
+    positions = pd.RangeIndex(len(states))
+
+    def _label(frame: pd.DataFrame) -> pd.DataFrame:
+        frame = frame.reindex(index=positions, columns=rets.columns)
+        frame.index = pd.Index(states, name="state")
+        return frame
+
+    return {
+        "count": _label(count).fillna(0).astype(int),
+        "mean": _label(mean),
+        "std": _label(var).pow(0.5),
+        "var": _label(var),
+        "min": _label(r_min),
+        "max": _label(r_max),
+        "win_rate": _label(win_rate.astype(float)),
+        "excess_mean": _label(excess_mean),
+        "max_dd": _label(max_dd),
+    }
+
+
+def state_separation(
+    stats: dict[str, pd.DataFrame],
+    min_obs: int = 3,
+) -> pd.DataFrame:
+    """Best-vs-worst state separation per asset from grouped moments.
+
+    Only states with at least *min_obs* observations qualify. Ties for
+    best/worst resolve to the first state in declared order.
+
+    Returns:
+        DataFrame indexed by asset with ``cohens_d``, ``p_value`` (Welch
+        t-test, best vs worst), ``best_state``, ``worst_state``,
+        ``eta_sq`` (ANOVA across qualifying states), ``n`` and
+        ``n_states`` (number of qualifying states).
+    """
+    n = stats["count"].astype(float)
+    ok = n >= min_obs
+    mean = stats["mean"].where(ok)
+    var = stats["var"].where(ok)
+    n = n.where(ok)
+
+    cols = mean.columns
+    n_states = ok.sum(axis=0)
+    usable = n_states >= 2
+    out = pd.DataFrame(index=cols)
+    out["n_states"] = n_states.astype(int)
+
+    best_state = mean.loc[:, usable].idxmax(axis=0).reindex(cols)
+    worst_state = mean.loc[:, usable].idxmin(axis=0).reindex(cols)
+
+    def _pick(frame: pd.DataFrame, labels: pd.Series) -> np.ndarray:
+        vals = np.full(len(cols), np.nan)
+        for j, (c, lab) in enumerate(labels.items()):
+            if isinstance(lab, str):
+                vals[j] = frame.at[lab, c]
+        return vals
+
+    m1, m2 = _pick(mean, best_state), _pick(mean, worst_state)
+    v1, v2 = _pick(var, best_state), _pick(var, worst_state)
+    n1, n2 = _pick(n, best_state), _pick(n, worst_state)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pooled_var = ((n1 - 1) * v1 + (n2 - 1) * v2) / np.maximum(n1 + n2 - 2, 1)
+        pooled_std = np.sqrt(np.where(pooled_var > 0, pooled_var, 0.0))
+        cohens_d = np.where(pooled_std < 1e-12, np.nan, (m1 - m2) / pooled_std)
+
+        # Welch's t-test (unequal variance)
+        se1, se2 = v1 / n1, v2 / n2
+        se = np.sqrt(se1 + se2)
+        t_stat = (m1 - m2) / se
+        dof = (se1 + se2) ** 2 / (se1 ** 2 / (n1 - 1) + se2 ** 2 / (n2 - 1))
+        from scipy.stats import t as t_dist  # deferred: slow to import
+
+        p_value = 2.0 * t_dist.sf(np.abs(t_stat), dof)
+
+        # η² across all qualifying states
+        n_total = n.sum(axis=0)
+        grand = (mean * n).sum(axis=0) / n_total
+        ss_between = (n * (mean - grand) ** 2).sum(axis=0)
+        ss_within = ((n - 1) * var).sum(axis=0)
+        ss_total = ss_between + ss_within
+        eta_sq = (ss_between / ss_total).where(ss_total > 1e-12, 0.0)
+
+    out["cohens_d"] = np.where(usable, cohens_d, np.nan)
+    out["p_value"] = np.where(usable, p_value, np.nan)
+    out["best_state"] = best_state.where(usable, None)
+    out["worst_state"] = worst_state.where(usable, None)
+    out["eta_sq"] = eta_sq.where(usable)
+    out["n"] = n_total.where(usable, 0).fillna(0).astype(int)
+    return out
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Rank IC
+# ─────────────────────────────────────────────────────────────────────
+
+
+def rank_ic(
+    signal: pd.Series,
+    targets: pd.DataFrame,
+    min_obs: int = 30,
+) -> pd.DataFrame:
+    """Spearman rank IC between one signal and every target column.
+
+    Each column uses its own pairwise-complete observations (rows where
+    both the signal and that target are non-null), ranked with average
+    ties — identical to calling ``scipy.stats.spearmanr`` per column, but
+    computed as one ranked matrix correlation.
+
+    Returns:
+        DataFrame indexed by target column with ``ic``, ``ic_pvalue`` and
+        ``n``. ``ic``/``ic_pvalue`` are NaN where ``n < min_obs``.
+    """
+    sig = signal.reindex(targets.index)
+    mask = targets.notna().to_numpy() & sig.notna().to_numpy()[:, None]
+    n = mask.sum(axis=0)
+
+    sig_mat = pd.DataFrame(
+        np.where(mask, sig.to_numpy(dtype=float)[:, None], np.nan),
+        index=targets.index,
+        columns=targets.columns,
+    )
+    rx = sig_mat.rank().to_numpy()
+    ry = targets.where(mask).rank().to_numpy()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rx = rx - np.nanmean(rx, axis=0)
+        ry = ry - np.nanmean(ry, axis=0)
+        cov = np.nansum(rx * ry, axis=0)
+        denom = np.sqrt(np.nansum(rx ** 2, axis=0) * np.nansum(ry ** 2, axis=0))
+        rho = cov / denom
+        rho = np.clip(rho, -1.0, 1.0)
+        dof = n - 2
+        t_stat = rho * np.sqrt(dof / ((1.0 - rho) * (1.0 + rho)))
+        from scipy.stats import t as t_dist  # deferred: slow to import
+
+        pval = 2.0 * t_dist.sf(np.abs(t_stat), dof)
+
+    short = n < min_obs
+    return pd.DataFrame(
+        {
+            "ic": np.where(short, np.nan, rho),
+            "ic_pvalue": np.where(short, np.nan, pval),
+            "n": n.astype(int),
+        },
+        index=targets.columns,
+    )
@@ -22,9 +22,13 @@ Keys returned by ``_load_indicators`` determine which dimension they belong to:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Sequence
 
 import numpy as np
 import pandas as pd
+from scipy.special import expit
+
+from . import kernel
 
 
 def load_series(code: str, lag: int = 0) -> pd.Series:
@@ -103,7 +107,7 @@ def zscore_roc(
 
 def sigmoid(z: pd.Series | float, sensitivity: float = 1.0) -> pd.Series | float:
     """Map z-score → probability (0–1) via logistic function."""
-    return 1.0 / (1.0 + np.exp(-z * sensitivity))
+    return expit(z * sensitivity)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -234,9 +238,224 @@ class Regime(ABC):
         * ``Conviction`` score (0–100).
         * Score / Total counts per dimension.
         """
+        return self.build_batch(
+            [(sensitivity, smooth_halflife)], z_window=z_window, exclude=exclude
+        )[0]
+
+    def build_batch(
+        self,
+        param_sets: Sequence[tuple[float, int]],
+        z_window: int = 36,
+        exclude: set[str] | None = None,
+    ) -> list[pd.DataFrame]:
+        """Build the regime for many ``(sensitivity, smooth_halflife)`` pairs.
+
+        Indicators are loaded and composited once for *z_window*; the
+        post-composite stage (sigmoid → state probabilities → EMA smoothing
+        → dominant / conviction / streak) runs as one array kernel over the
+        whole stack of parameter sets. Grid audits and compositions should
+        prefer this over calling :meth:`build` in a loop.
+
+        Returns:
+            One DataFrame per entry of *param_sets*, each identical to
+            ``build(z_window, sensitivity, smooth_halflife, exclude)``.
+        """
+        if not param_sets:
+            return []
+        base, scores = self._composite_frame(z_window, exclude)
+        return self._post_composite(base, scores, param_sets)
+
+    def build_incremental(
+        self,
+        previous: pd.DataFrame | None,
+        z_window: int = 36,
+        sensitivity: float = 1.0,
+        smooth_halflife: int = 4,
+        exclude: set[str] | None = None,
+    ) -> tuple[pd.DataFrame, pd.Timestamp | None]:
+        """Rebuild only the months that changed since *previous*.
+
+        *previous* must be an earlier :meth:`build` output for the same
+        parameters. Indicators are reloaded and compared against the
+        indicator columns of *previous*; the first month whose values
+        differ (a new month, or a revision) is the restart point. Every
+        month before it is reused as-is and the pipeline runs over the
+        tail only, seeded with the carried state — last composite z for
+        the forward fill, the EWM numerator/denominator of the smoothed
+        probabilities and the regime streak — so the result is identical
+        to a full :meth:`build`.
+
+        Falls back to a full rebuild when there is no usable *previous*
+        (``None``, empty, or a different indicator/column layout).
+
+        Returns:
+            ``(df, since)`` — the rebuilt frame and the first recomputed
+            month. ``since`` is ``None`` when nothing changed, in which
+            case *previous* is returned unchanged.
+        """
+        indicators = pd.DataFrame(self._load_indicators(z_window)).dropna(how="all")
+        params = [(sensitivity, smooth_halflife)]
+
+        def _full() -> pd.DataFrame:
+            base, scores = self._composite_from_indicators(indicators, exclude)
+            return self._post_composite(base, scores, params)[0]
+
+        ind_cols = list(indicators.columns)
+        if (
+            previous is None
+            or previous.empty
+            or indicators.empty
+            or list(previous.columns[: len(ind_cols)]) != ind_cols
+        ):
+            df = _full()
+            return df, (df.index[0] if len(df) else None)
+
+        since = _first_changed_row(previous[ind_cols], indicators)
+        if since is None:
+            return previous, None
+
+        head = previous.loc[previous.index < since]
+        if head.empty:
+            return _full(), since
+
+        tail_ind = indicators.loc[indicators.index >= since]
+        last = head.iloc[-1]
+        z_seed = {
+            dim: last[f"{dim}_Z"]
+            for dim in self.dimensions
+            if f"{dim}_Z" in head.columns
+        }
+        base, scores = self._composite_from_indicators(tail_ind, exclude, z_seed=z_seed)
+
+        prob_cols = [f"P_{s}" for s in self.states]
+        seed = None
+        if all(c in head.columns for c in prob_cols):
+            raw = head[prob_cols].to_numpy(dtype=float)[None]  # (1, T, S)
+            dominant = head["Dominant"].ffill() if "Dominant" in head.columns else None
+            code = -1
+            if dominant is not None and pd.notna(dominant.iloc[-1]):
+                code = self.states.index(dominant.iloc[-1])
+            streak = last.get("Months_In_Regime", 1)
+            seed = {
+                "ewm": kernel.smoothing_state(raw, np.array([float(smooth_halflife)])),
+                "streak": (np.array([code]), np.array([1 if pd.isna(streak) else int(streak)])),
+            }
+
+        tail = self._post_composite(base, scores, params, seed=seed)[0]
+        if list(tail.columns) != list(head.columns):
+            return _full(), since
+        return pd.concat([head, tail]), since
+
+    def _post_composite(
+        self,
+        base: pd.DataFrame,
+        scores: dict[str, pd.Series | int],
+        param_sets: Sequence[tuple[float, int]],
+        seed: dict | None = None,
+    ) -> list[pd.DataFrame]:
+        """Sigmoid → state probabilities → smoothing → dominant / streak.
+
+        *seed* (used by :meth:`build_incremental`) carries the EWM and
+        streak state of the months preceding *base*: ``{"ewm": (num, den,
+        count), "streak": (code, streak)}``, each array shaped per
+        parameter set.
+        """
+        sens = np.array([float(p[0]) for p in param_sets])
+        halflives = np.array([float(p[1]) for p in param_sets])
+        n_sets = len(param_sets)
+
+        # 3. Sigmoid probabilities per dimension → (K, T) each
+        dim_p: dict[str, np.ndarray] = {}
+        for dim in self.dimensions:
+            z_col = f"{dim}_Z"
+            if z_col in base.columns:
+                dim_p[dim] = kernel.sigmoid_grid(
+                    base[z_col].ffill().to_numpy(dtype=float), sens
+                )
+
+        # 4. State probabilities — subclasses map dimension probabilities
+        #    element-wise, so a (T, K) frame per dimension batches for free.
+        state_p: dict[str, np.ndarray] = {}
+        if dim_p:
+            frames = {
+                dim: pd.DataFrame(p.T, index=base.index) for dim, p in dim_p.items()
+            }
+            for col_name, value in self._state_probabilities(frames).items():
+                arr = np.asarray(value, dtype=float)
+                if arr.ndim == 1:
+                    arr = np.repeat(arr[:, None], n_sets, axis=1)
+                state_p[col_name] = arr.T
+
+        def _frame(k: int) -> pd.DataFrame:
+            df = base.copy()
+            for dim, p in dim_p.items():
+                df[f"{dim}_P"] = p[k]
+            for col_name, p in state_p.items():
+                df[col_name] = p[k]
+            return df
+
+        prob_cols = [f"P_{s}" for s in self.states]
+        if not all(c in state_p for c in prob_cols):
+            return [_frame(k).sort_index() for k in range(n_sets)]
+
+        # 5–6. Smoothing, dominant state, conviction, streak (array kernel)
+        raw = np.stack([state_p[c] for c in prob_cols], axis=-1)  # (K, T, S)
+        seed = seed or {}
+        smoothed = kernel.smooth_state_probabilities(raw, halflives, init=seed.get("ewm"))
+        codes = kernel.dominant_codes(smoothed)
+        conviction = kernel.conviction(smoothed, len(self.states))
+        streaks = kernel.streak_lengths(codes, seed=seed.get("streak"))
+        labels = np.array(self.states + [np.nan], dtype=object)
+
+        out: list[pd.DataFrame] = []
+        for k in range(n_sets):
+            df = _frame(k)
+            for j, col in enumerate(prob_cols):
+                df[f"S_{col}"] = smoothed[k, :, j]
+            has_dominant = bool((codes[k] >= 0).any())
+            if has_dominant:
+                df["Dominant"] = labels[codes[k]]
+            df["Conviction"] = conviction[k]
+            if has_dominant:
+                df["Months_In_Regime"] = streaks[k]
+            for col, values in scores.items():
+                df[col] = values
+            out.append(df.sort_index())
+        return out
+
+    def _composite_frame(
+        self,
+        z_window: int,
+        exclude: set[str] | None = None,
+    ) -> tuple[pd.DataFrame, dict[str, pd.Series | int]]:
+        """Load indicators and build the per-dimension composite z-scores.
+
+        Returns the indicator + ``{Dim}_Z`` frame and the ``{Dim}_Score`` /
+        ``{Dim}_Total`` columns, which depend only on the indicators and so
+        are shared by every post-composite parameter set.
+        """
         # 1. Load indicators
         indicators = self._load_indicators(z_window)
-        df = pd.DataFrame(indicators).dropna(how="all")
+        return self._composite_from_indicators(
+            pd.DataFrame(indicators).dropna(how="all"), exclude
+        )
+
+    def _composite_from_indicators(
+        self,
+        df: pd.DataFrame,
+        exclude: set[str] | None = None,
+        z_seed: dict[str, float] | None = None,
+    ) -> tuple[pd.DataFrame, dict[str, pd.Series | int]]:
+        """Composite an already-loaded indicator frame (see ``_composite_frame``).
+
+        Composites are row-wise, so any contiguous slice of months can be
+        composited on its own; *z_seed* supplies the last composite z of
+        the preceding month per dimension so the forward fill carries
+        across the slice boundary.
+        """
+        df = df.copy()
+        ind_columns = list(df.columns)
+        z_seed = z_seed or {}
 
         # 2. Composite z per dimension (IC-weighted when weights provided)
         prefixes = self._dimension_prefixes()
@@ -255,85 +474,44 @@ class Regime(ABC):
                     w = np.array([ic_weights.get(c, 1.0) for c in parts_df.columns])
                     weighted = parts_df.mul(w).sum(axis=1)
                     w_sum = parts_df.notna().astype(float).mul(w).sum(axis=1).clip(lower=1e-9)
-                    df[f"{dim}_Z"] = (weighted / w_sum).ffill()
+                    z = weighted / w_sum
                 else:
-                    df[f"{dim}_Z"] = parts_df.mean(axis=1).ffill()
-
-        # 3. Sigmoid probabilities per dimension
-        dim_probs: dict[str, pd.Series] = {}
-        for dim in self.dimensions:
-            z_col = f"{dim}_Z"
-            if z_col in df.columns:
-                df[f"{dim}_P"] = sigmoid(df[z_col].ffill(), sensitivity)
-                dim_probs[dim] = df[f"{dim}_P"]
-
-        # 4. State probabilities
-        prob_cols = [f"P_{s}" for s in self.states]
-        if dim_probs:
-            state_probs = self._state_probabilities(dim_probs)
-            for col_name, series in state_probs.items():
-                df[col_name] = series
-
-        if not all(c in df.columns for c in prob_cols):
-            return df.sort_index()
-
-        # 5. EMA smoothing on state probabilities
-        if smooth_halflife > 1:
-            for col in prob_cols:
-                df[f"S_{col}"] = df[col].ewm(halflife=smooth_halflife).mean()
-            s_cols = [f"S_{c}" for c in prob_cols]
-            sums = df[s_cols].sum(axis=1).clip(lower=1e-9)
-            for c in s_cols:
-                df[c] = df[c] / sums
-        else:
-            for col in prob_cols:
-                df[f"S_{col}"] = df[col]
-
-        # 6. Dominant state = argmax of smoothed probabilities.
-        #    NA-safe: compute idxmax only on rows with a non-NA probability
-        #    so pandas ≥ 2.1 doesn't warn (and eventually raise) on all-NA rows.
-        s_cols = [f"S_P_{s}" for s in self.states]
-        s_prob_df = df[s_cols]
-        valid_s = s_prob_df.dropna(how="all")
-        if not valid_s.empty:
-            df["Dominant"] = (
-                valid_s.idxmax(axis=1)
-                .str.replace("S_P_", "", regex=False)
-                .reindex(df.index)
-            )
-
-        # Conviction: 0 at uniform baseline, 100 at full certainty
-        n_states = len(self.states)
-        baseline = 1.0 / n_states
-        df["Conviction"] = (
-            (df[s_cols].max(axis=1) - baseline) / (1.0 - baseline) * 100
-        ).clip(0, 100)
-
-        # Regime streak counter
-        if "Dominant" in df.columns:
-            dom = df["Dominant"].ffill()
-            streak, prev, streaks = 0, None, []
-            for v in dom:
-                streak = 1 if v != prev else streak + 1
-                prev = v
-                streaks.append(streak)
-            df["Months_In_Regime"] = streaks
+                    z = parts_df.mean(axis=1)
+                if dim in z_seed and len(z) and pd.isna(z.iloc[0]):
+                    z.iloc[0] = z_seed[dim]
+                df[f"{dim}_Z"] = z.ffill()
 
         # Score / Total per dimension (count of positive indicators)
+        scores: dict[str, pd.Series | int] = {}
         for dim in self.dimensions:
             prefix = prefixes[dim]
             ind_cols = [
-                c for c in df.columns
+                c for c in ind_columns
                 if c.startswith(prefix) and c not in exclude
             ]
             if ind_cols:
-                df[f"{dim}_Score"] = (df[ind_cols] > 0).sum(axis=1)
-                df[f"{dim}_Total"] = len(ind_cols)
+                scores[f"{dim}_Score"] = (df[ind_cols] > 0).sum(axis=1)
+                scores[f"{dim}_Total"] = len(ind_cols)
 
-        return df.sort_index()
+        return df, scores
 
     # ── Internal helpers ─────────────────────────────────────────────────
 
     def _dimension_prefixes(self) -> dict[str, str]:
         """Map dimension name → indicator prefix (default: first letter + _)."""
         return {dim: dim[0].lower() + "_" for dim in self.dimensions}
+
+
+def _first_changed_row(old: pd.DataFrame, new: pd.DataFrame) -> pd.Timestamp | None:
+    """Earliest index label where two indicator frames differ.
+
+    Rows present in only one frame count as changed; values compare with
+    a tight tolerance (NaN == NaN) so float round-trips are not revisions.
+    """
+    index = old.index.union(new.index)
+    a = old.reindex(index).to_numpy(dtype=float)
+    b = new.reindex(columns=old.columns).reindex(index).to_numpy(dtype=float)
+    same = np.isclose(a, b, rtol=1e-12, atol=0.0, equal_nan=True).all(axis=1)
+    same &= index.isin(old.index) & index.isin(new.index)
+    changed = np.flatnonzero(~same)
+    return index[changed[0]] if len(changed) else None
@@ -29,17 +29,26 @@ Composability rules
 * When state name collisions exist (e.g. credit and growth both have a
   state called "Expansion"), names are disambiguated with the regime key
   prefix (e.g. "credit:Expansion+growth:Expansion")
+
+Per-regime builds are cached independently of the composition key (see
+:func:`build_regime_frames`), so composing any subset of recently built
+regimes is assembly — joint probabilities are a broadcast outer product
+and the Markov projections run on integer-coded states (:mod:`.markov`).
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from itertools import product
 
 import numpy as np
 import pandas as pd
 
+from . import kernel, markov
 from .base import Regime
 from .compute import (
     DEFAULT_ASSET_TICKERS,
@@ -54,6 +63,98 @@ from .registry import get_regime, RegimeRegistration
 log = logging.getLogger(__name__)
 
 
+# ─────────────────────────────────────────────────────────────────────
+# Per-regime build cache
+# ─────────────────────────────────────────────────────────────────────
+
+# TTL cache of built regime frames: {(key, z_window, sensitivity,
+# smooth_halflife, exclude): (ts, df)}. Keyed per regime — not per
+# composition — so every composition sharing a regime reuses its build.
+_build_cache: dict[tuple, tuple[float, pd.DataFrame]] = {}
+_build_lock = threading.Lock()
+_BUILD_CACHE_TTL = 300  # 5 minutes — matches the asset panel cache
+_BUILD_CACHE_MAX = 128
+_BUILD_MAX_WORKERS = 4
+
+
+def _build_key(
+    reg: RegimeRegistration,
+    params: dict,
+    exclude: set[str] | None,
+) -> tuple:
+    return (
+        reg.key,
+        params.get("z_window", 96),
+        params.get("sensitivity", 2.0),
+        params.get("smooth_halflife", 3),
+        frozenset(exclude or ()),
+    )
+
+
+def cached_build(
+    reg: RegimeRegistration,
+    params: dict,
+    exclude: set[str] | None = None,
+) -> pd.DataFrame:
+    """``Regime.build()`` for one registration, cached for a few minutes.
+
+    The returned frame is shared between callers — treat it as read-only.
+
+    Raises:
+        ValueError: if the regime has no ``regime_class`` or builds empty.
+    """
+    if reg.regime_class is None:
+        raise ValueError(f"Regime '{reg.key}' has no regime_class — cannot build")
+    key = _build_key(reg, params, exclude)
+    with _build_lock:
+        cached = _build_cache.get(key)
+    if cached and (time.time() - cached[0]) < _BUILD_CACHE_TTL:
+        return cached[1]
+
+    regime: Regime = reg.regime_class()
+    df = regime.build(
+        z_window=key[1],
+        sensitivity=key[2],
+        smooth_halflife=key[3],
+        exclude=exclude,
+    )
+    if df.empty:
+        raise ValueError(f"Regime '{reg.key}' built an empty DataFrame")
+
+    with _build_lock:
+        if len(_build_cache) >= _BUILD_CACHE_MAX:
+            # Evict oldest 25%
+            for k in list(_build_cache.keys())[: _BUILD_CACHE_MAX // 4]:
+                _build_cache.pop(k, None)
+        _build_cache[key] = (time.time(), df)
+    return df
+
+
+def build_regime_frames(
+    regs: list[RegimeRegistration],
+    params: dict,
+    exclude: set[str] | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Build (or fetch from cache) every input regime, concurrently.
+
+    Returns:
+        ``{regime_key: built_df}`` in the order of *regs*.
+
+    Raises:
+        ValueError: from the first regime that fails to build.
+    """
+    workers = max(1, min(_BUILD_MAX_WORKERS, len(regs)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="regime-build") as pool:
+        futures = [pool.submit(cached_build, reg, params, exclude) for reg in regs]
+        return {reg.key: fut.result() for reg, fut in zip(regs, futures)}
+
+
+def clear_build_cache() -> None:
+    """Drop all cached regime builds (e.g. after an indicator refresh)."""
+    with _build_lock:
+        _build_cache.clear()
+
+
 # ─────────────────────────────────────────────────────────────────────
 # Joint state build (extracted for reuse by validator)
 # ─────────────────────────────────────────────────────────────────────
@@ -78,6 +179,9 @@ class JointStateBuild:
     qualified_dims: list[str]
     display_name: str
     disambiguate: bool
+    #: Integer code of ``Dominant`` per row of ``composite_df`` (index
+    #: into ``composite_states``).
+    dominant_codes: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
 
 
 def build_joint_states(
@@ -142,29 +246,36 @@ def build_joint_states(
             f"Composing {axis_order} produced no overlapping observations"
         )
 
-    composite_df = pd.DataFrame(index=union_index)
-
     # Joint hard + smoothed probability for each combo (independence assumed).
-    # Each axis's probability is reindexed to the union index with ffill so
-    # that axes with shorter data carry their last known probability forward.
-    for combo in joint_combos:
-        joint_name = state_map[combo]
-        s_prob: pd.Series | None = None
-        h_prob: pd.Series | None = None
-        for k, state in zip(axis_order, combo):
-            df = built_dfs[k]
-            s_col = f"S_P_{state}"
-            h_col = f"P_{state}"
-            if s_col not in df.columns or h_col not in df.columns:
-                s_prob = pd.Series(0.0, index=union_index)
-                h_prob = pd.Series(0.0, index=union_index)
-                break
-            s_series = df[s_col].reindex(union_index, method="ffill")
-            h_series = df[h_col].reindex(union_index, method="ffill")
-            s_prob = s_series if s_prob is None else s_prob * s_series
-            h_prob = h_series if h_prob is None else h_prob * h_series
-        composite_df[f"S_P_{joint_name}"] = s_prob
-        composite_df[f"P_{joint_name}"] = h_prob
+    # Each axis's probability matrix is reindexed to the union index with
+    # ffill so that axes with shorter data carry their last known
+    # probability forward; the joint matrix is the row-wise outer product
+    # across axes (C-order matches ``itertools.product``). A combo with any
+    # state missing its probability columns is 0 throughout.
+    s_joint: np.ndarray | None = None
+    h_joint: np.ndarray | None = None
+    available: np.ndarray | None = None
+    for k, reg in zip(axis_order, regs):
+        df = built_dfs[k]
+        s_cols = [f"S_P_{s}" for s in reg.states]
+        h_cols = [f"P_{s}" for s in reg.states]
+        has = np.array([
+            s_col in df.columns and h_col in df.columns
+            for s_col, h_col in zip(s_cols, h_cols)
+        ])
+        s_mat = df.reindex(columns=s_cols).reindex(union_index, method="ffill").to_numpy(dtype=float)
+        h_mat = df.reindex(columns=h_cols).reindex(union_index, method="ffill").to_numpy(dtype=float)
+        s_joint = s_mat if s_joint is None else _outer_rows(s_joint, s_mat)
+        h_joint = h_mat if h_joint is None else _outer_rows(h_joint, h_mat)
+        available = has if available is None else np.outer(available, has).ravel()
+    s_joint[:, ~available] = 0.0
+    h_joint[:, ~available] = 0.0
+
+    columns: dict[str, np.ndarray] = {}
+    for j, joint_name in enumerate(composite_states):
+        columns[f"S_P_{joint_name}"] = s_joint[:, j]
+        columns[f"P_{joint_name}"] = h_joint[:, j]
+    composite_df = pd.DataFrame(columns, index=union_index)
 
     # Drop rows where any joint probability is null
     s_prob_cols = [f"S_P_{s}" for s in composite_states]
@@ -175,25 +286,15 @@ def build_joint_states(
         )
 
     # Dominant = argmax of smoothed joint probabilities
-    prob_matrix = composite_df[s_prob_cols].copy()
-    prob_matrix.columns = composite_states
-    composite_df["Dominant"] = prob_matrix.idxmax(axis=1)
+    prob_matrix = composite_df[s_prob_cols].to_numpy(dtype=float)
+    codes = kernel.dominant_codes(prob_matrix)
+    composite_df["Dominant"] = np.array(composite_states, dtype=object)[codes]
 
     # Conviction = max smoothed joint probability * 100
     composite_df["Conviction"] = prob_matrix.max(axis=1) * 100.0
 
     # Months_In_Regime streak
-    streak: list[int] = []
-    prev = None
-    cnt = 0
-    for v in composite_df["Dominant"]:
-        if v == prev:
-            cnt += 1
-        else:
-            cnt = 1
-            prev = v
-        streak.append(cnt)
-    composite_df["Months_In_Regime"] = streak
+    composite_df["Months_In_Regime"] = kernel.streak_lengths(codes)
 
     return JointStateBuild(
         composite_df=composite_df,
@@ -205,9 +306,15 @@ def build_joint_states(
         qualified_dims=qualified_dims,
         display_name=display_name,
         disambiguate=disambiguate,
+        dominant_codes=codes,
     )
 
 
+def _outer_rows(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Row-wise outer product ``(T, A) × (T, B) → (T, A·B)``."""
+    return (left[:, :, None] * right[:, None, :]).reshape(left.shape[0], -1)
+
+
 # ─────────────────────────────────────────────────────────────────────
 # State name auto-generation
 # ─────────────────────────────────────────────────────────────────────
@@ -399,20 +506,9 @@ def compose_regimes(
     if params is None:
         params = regs[0].default_params.copy()
 
-    # ── Build each input regime's DataFrame ─────────────────────────
-    built_dfs: dict[str, pd.DataFrame] = {}
-    built_instances: dict[str, Regime] = {}
-    for reg in regs:
-        regime: Regime = reg.regime_class()
-        df = regime.build(
-            z_window=params.get("z_window", 96),
-            sensitivity=params.get("sensitivity", 2.0),
-            smooth_halflife=params.get("smooth_halflife", 3),
-        )
-        if df.empty:
-            raise ValueError(f"Regime '{reg.key}' built an empty DataFrame")
-        built_dfs[reg.key] = df
-        built_instances[reg.key] = regime
+    # ── Build (or reuse cached) input regime DataFrames ─────────────
+    built_dfs = build_regime_frames(regs, params)
+    built_instances: dict[str, Regime] = {reg.key: reg.regime_class() for reg in regs}
 
     # ── Joint state computation (extracted helper, reused by validator) ──
     # The composer is intentionally agnostic — it never assigns
@@ -434,46 +530,31 @@ def compose_regimes(
     # ── Multi-horizon Markov forward projections ──────────────────
     # Build a transition matrix from the historical Dominant sequence
     # (with Laplace smoothing), then project the latest smoothed joint
-    # probability vector forward at 1, 3, 6, and 12 month horizons by
-    # raising the transition matrix to the corresponding power.
+    # probability vector forward at 1, 3, 6, and 12 month horizons.
+    # Transitions are counted sparsely on integer state codes and all
+    # horizons come from one forward pass (see ``markov``).
     #
     # 1-step alone is uninformative for sticky regimes (the projection
     # is essentially the current distribution). Showing the full curve
     # 1M → 3M → 6M → 12M reveals the regime's natural drift toward its
     # steady-state distribution and lets the frontend show meaningful
     # delta arrows.
-    dom_seq = [
-        v for v in composite_df["Dominant"].dropna()
-        if v in composite_states
-    ]
+    dom_codes = joint.dominant_codes
     forward_probabilities: dict[str, float] | None = None
     forward_horizons: dict[int, dict[str, float]] | None = None
-    if len(dom_seq) > 20:
-        n = len(composite_states)
-        idx = {s: i for i, s in enumerate(composite_states)}
-        counts_np = np.ones((n, n), dtype=np.float64)  # Laplace +1
-        for a, b in zip(dom_seq[:-1], dom_seq[1:]):
-            counts_np[idx[a], idx[b]] += 1
-        tmat_np = counts_np / counts_np.sum(axis=1, keepdims=True)
-
-        last_row = composite_df.iloc[-1]
-        cur_p = np.array([
-            _safe_float(last_row.get(f"S_P_{s}"), 0.0) or 0.0
-            for s in composite_states
-        ])
+    if int((dom_codes >= 0).sum()) > 20:
+        counts = markov.transition_counts(dom_codes, len(composite_states))
+        cur_p = composite_df[s_prob_cols].iloc[-1].to_numpy(dtype=float)
+        cur_p = np.where(np.isfinite(cur_p), cur_p, 0.0)
         cur_total = cur_p.sum()
         if cur_total > 1e-9:
             cur_p = cur_p / cur_total
 
-        forward_horizons = {}
-        for h in (1, 3, 6, 12):
-            p_h = cur_p @ np.linalg.matrix_power(tmat_np, h)
-            t = p_h.sum()
-            if t > 1e-9:
-                p_h = p_h / t
-            forward_horizons[h] = {
-                s: float(p_h[i]) for i, s in enumerate(composite_states)
-            }
+        projected = markov.forward_distributions(counts, cur_p, (1, 3, 6, 12))
+        forward_horizons = {
+            h: {s: float(p_h[i]) for i, s in enumerate(composite_states)}
+            for h, p_h in projected.items()
+        }
         # Backwards compat — frontend still reads forward_probabilities
         # for the 1M projection, plus the new forward_horizons block.
         forward_probabilities = forward_horizons[1]
@@ -651,27 +732,21 @@ def compose_regimes(
             "components": components,
         }
 
-        # Walk back from last_date counting consecutive months where the
-        # smoothed argmax stays equal to the current `direction`. This
-        # gives a months-in-state count consistent with the value the
-        # dim card shows (P_max at last_date).
+        # Count consecutive months back from last_date where the smoothed
+        # argmax stays equal to the current `direction`. This gives a
+        # months-in-state count consistent with the value the dim card
+        # shows (P_max at last_date). Months with no positive probability
+        # end the run.
         months_in_state = 0
         try:
-            history_idx = src_df.loc[:last_date].index
-            for ts in reversed(history_idx):
-                row = src_df.loc[ts]
-                ts_pairs = [
-                    (s, _safe_float(row.get(f"S_P_{s}"), 0.0) or 0.0)
-                    for s in reg.states
-                ]
-                ts_valid = [(s, pv) for s, pv in ts_pairs if pv > 0]
-                if not ts_valid:
-                    break
-                top_state = max(ts_valid, key=lambda x: x[1])[0]
-                if top_state == direction:
-                    months_in_state += 1
-                else:
-                    break
+            history = src_df.loc[:last_date].reindex(
+                columns=[f"S_P_{s}" for s in reg.states]
+            ).to_numpy(dtype=float)
+            positive = np.where(np.isfinite(history) & (history > 0), history, -np.inf)
+            top = np.argmax(positive, axis=1)
+            valid = np.isfinite(positive).any(axis=1)
+            target = reg.states.index(direction) if direction in reg.states else -1
+            months_in_state = markov.trailing_run(valid & (top == target))
         except Exception:
             months_in_state = 0
 
@@ -717,23 +792,11 @@ def compose_regimes(
     cur_state_months = int((s_series == dom).sum())
     cur_state_pct = (cur_state_months / total_months * 100) if total_months > 0 else 0.0
 
-    # Average run length: walk through Dominant, collect run lengths
-    # for the current state, take the mean.
-    run_lengths: list[int] = []
-    cur_run = 0
-    cur_val: str | None = None
-    for v in s_series:
-        if v == cur_val:
-            cur_run += 1
-        else:
-            if cur_val == dom and cur_run > 0:
-                run_lengths.append(cur_run)
-            cur_val = v
-            cur_run = 1
-    if cur_val == dom and cur_run > 0:
-        run_lengths.append(cur_run)
-    avg_run_months = (sum(run_lengths) / len(run_lengths)) if run_lengths else 0.0
-    n_occurrences = len(run_lengths)
+    # Average run length of the current state across its occurrences.
+    run_states, run_lens = markov.run_lengths(s_series.to_numpy())
+    dom_runs = run_lens[run_states == dom]
+    avg_run_months = float(dom_runs.mean()) if len(dom_runs) else 0.0
+    n_occurrences = int(len(dom_runs))
 
     # Best/worst asset historically while in this state, and the
     # asset-level Cohen's d that gives the regime its statistical
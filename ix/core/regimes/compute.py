@@ -7,21 +7,35 @@ subclass and serializes the result into the shape expected by the
 All public regimes are 1D and use this generic pipeline. Multi-axis
 composites are generated on demand by ``ix.core.regimes.compose``,
 not by computer subclasses.
+
+Monthly refreshes go through :meth:`RegimeComputer.update`, which
+rebuilds only the months whose inputs changed (see
+:meth:`Regime.build_incremental`) and splices the new tail into the
+stored ``timeseries`` JSONB instead of rewriting the whole document.
 """
 
 from __future__ import annotations
 
+import io
+import json
 import logging
+import threading
 from datetime import datetime, timezone
 from typing import Any
 
 import numpy as np
 import pandas as pd
-from scipy.stats import spearmanr
+from sqlalchemy import select, text
 
 from ix.db.conn import Session
 from ix.db.models import RegimeSnapshot, regime_fingerprint
 
+from .asset_analytics import (
+    load_asset_panel,
+    rank_ic,
+    state_return_stats,
+    state_separation,
+)
 from .base import Regime
 from .registry import RegimeRegistration
 
@@ -66,6 +80,9 @@ UNIVERSE_PRESETS: dict[str, dict[str, str]] = {
 def _load_asset_prices(tickers: dict[str, str]) -> pd.DataFrame:
     """Load monthly price series for the given ticker universe.
 
+    Thin wrapper over :func:`~ix.core.regimes.asset_analytics.load_asset_panel`
+    (concurrent load + short TTL cache shared across one compute).
+
     Args:
         tickers: ``{display_name: db_code}`` mapping.
 
@@ -73,18 +90,7 @@ def _load_asset_prices(tickers: dict[str, str]) -> pd.DataFrame:
         DataFrame indexed by month-end dates, columns = display names.
         Empty DataFrame if no tickers load successfully.
     """
-    from ix.db.query import Series as DbSeries
-
-    out: dict[str, pd.Series] = {}
-    for display, code in tickers.items():
-        try:
-            s = DbSeries(code)
-            if not s.empty:
-                out[display] = s.resample("ME").last()
-        except Exception as exc:
-            log.warning("Asset price load failed for %s (%s): %s", display, code, exc)
-
-    return pd.DataFrame(out) if out else pd.DataFrame()
+    return load_asset_panel(tickers)
 
 
 def compute_signal_ic(
@@ -119,34 +125,31 @@ def compute_signal_ic(
     # Lag signal to respect publication delay
     sig = signal.shift(data_lag_months)
 
-    result: dict[str, dict] = {}
-    for ticker in asset_cols:
-        if ticker not in prices.columns:
-            continue
-        px = prices[ticker].dropna()
-        if px.empty:
-            continue
-
-        # Forward H-month return
-        fwd_ret = px.pct_change(horizon_months).shift(-horizon_months)
+    cols = [t for t in asset_cols if t in prices.columns and not prices[t].dropna().empty]
+    if not cols:
+        return {}
 
-        # Align, skip warmup, drop NAs
-        merged = pd.concat([sig.rename("signal"), fwd_ret.rename("fwd")], axis=1)
-        merged = merged.iloc[warmup_months:]
-        merged = merged.dropna()
+    # Forward H-month return per asset. The warmup skips the first N rows
+    # of the signal's index joined with *that asset's* own index, so each
+    # column is cut at its own date before going into one ranked matrix.
+    fwd = {}
+    for t in cols:
+        px = prices[t].dropna()
+        own = sig.index.union(px.index)
+        ret = px.pct_change(horizon_months).shift(-horizon_months)
+        fwd[t] = ret.loc[ret.index >= own[warmup_months]] if len(own) > warmup_months else ret.iloc[:0]
+    fwd = pd.DataFrame(fwd, columns=cols)
+    index = sig.index.union(fwd.index)
 
-        if len(merged) < 30:
-            result[ticker] = {
-                "ic": None, "ic_pvalue": None,
-                "n": len(merged), "horizon": horizon_months,
-            }
-            continue
+    ic = rank_ic(sig.reindex(index), fwd.reindex(index), min_obs=30)
 
-        rho, pval = spearmanr(merged["signal"], merged["fwd"])
+    result: dict[str, dict] = {}
+    for ticker in cols:
+        row = ic.loc[ticker]
         result[ticker] = {
-            "ic": _safe_float(rho),
-            "ic_pvalue": _safe_float(pval),
-            "n": len(merged),
+            "ic": _safe_float(row["ic"]),
+            "ic_pvalue": _safe_float(row["ic_pvalue"]),
+            "n": int(row["n"]),
             "horizon": horizon_months,
         }
 
@@ -211,20 +214,22 @@ def compute_asset_analytics(
         return None
 
     # Use BIL as risk-free proxy if present; else zero
-    bil_rf = aligned["BIL"] if "BIL" in aligned.columns else pd.Series(0.0, index=aligned.index)
+    bil_rf = aligned["BIL"] if "BIL" in aligned.columns else None
+
+    # ── Per-regime stats (one grouped pass over all states × assets) ─
+    stats = state_return_stats(aligned[asset_cols], aligned["regime"], states, rf=bil_rf)
+    count, mean = stats["count"], stats["mean"]
+    ann_ret = mean * 12
+    ann_vol = stats["std"] * float(np.sqrt(12))
+    exc_ret = stats["excess_mean"] * 12
+    sharpe = (exc_ret / ann_vol).where(ann_vol > 1e-9, 0.0)
+    state_months = aligned["regime"].value_counts()
 
-    # ── Per-regime stats ────────────────────────────────────────────
     per_regime_stats: dict[str, dict] = {}
     for regime in states:
-        mask = aligned["regime"] == regime
-        r_data = aligned.loc[mask]
         assets_list: list[dict] = []
-
         for t in asset_cols:
-            r = r_data[t].dropna()
-            rf = bil_rf.reindex(r.index).fillna(0.0)
-            n = len(r)
-
+            n = int(count.at[regime, t])
             if n < 3:
                 assets_list.append({
                     "ticker": t, "ann_ret": None, "ann_vol": None,
@@ -232,29 +237,20 @@ def compute_asset_analytics(
                     "worst_mo": None, "best_mo": None, "months": n,
                 })
                 continue
-
-            ann_ret = float(r.mean()) * 12
-            ann_vol = float(r.std()) * float(np.sqrt(12))
-            exc_ret = float((r - rf).mean()) * 12
-            sharpe = exc_ret / ann_vol if ann_vol > 1e-9 else 0.0
-            win_rt = float((r > 0).mean())
-            cum = (1 + r).cumprod()
-            max_dd = float((cum / cum.cummax() - 1).min())
-
             assets_list.append({
                 "ticker": t,
-                "ann_ret": _safe_float(ann_ret),
-                "ann_vol": _safe_float(ann_vol),
-                "sharpe": _safe_float(sharpe),
-                "win_rate": _safe_float(win_rt),
-                "max_dd": _safe_float(max_dd),
-                "worst_mo": _safe_float(r.min()),
-                "best_mo": _safe_float(r.max()),
+                "ann_ret": _safe_float(ann_ret.at[regime, t]),
+                "ann_vol": _safe_float(ann_vol.at[regime, t]),
+                "sharpe": _safe_float(sharpe.at[regime, t]),
+                "win_rate": _safe_float(stats["win_rate"].at[regime, t]),
+                "max_dd": _safe_float(stats["max_dd"].at[regime, t]),
+                "worst_mo": _safe_float(stats["min"].at[regime, t]),
+                "best_mo": _safe_float(stats["max"].at[regime, t]),
                 "months": n,
             })
 
         per_regime_stats[regime] = {
-            "months": int(mask.sum()),
+            "months": int(state_months.get(regime, 0)),
             "assets": assets_list,
         }
 
@@ -262,7 +258,7 @@ def compute_asset_analytics(
     total = len(aligned_all)
     regime_counts: dict[str, dict] = {}
     for regime in states:
-        n = int((aligned["regime"] == regime).sum())
+        n = int(state_months.get(regime, 0))
         regime_counts[regime] = {
             "months": n,
             "pct": (n / total * 100) if total > 0 else 0.0,
@@ -274,26 +270,22 @@ def compute_asset_analytics(
     last_valid = df.dropna(subset=prob_cols, how="all")
     if not last_valid.empty:
         last = last_valid.iloc[-1]
-        s_probs = {
+        s_probs = pd.Series({
             s: _safe_float(last.get(f"S_P_{s}", last.get(f"P_{s}")), 0.0) or 0.0
             for s in states
-        }
+        })
+        usable = count >= 3
+        weights = usable.mul(s_probs, axis=0)
+        total_p = weights.sum(axis=0)
+        exp_ret = (ann_ret.where(usable, 0.0) * weights).sum(axis=0)
         for t in asset_cols:
-            exp_ret = 0.0
-            total_p = 0.0
-            for regime in states:
-                r = aligned.loc[aligned["regime"] == regime, t].dropna()
-                if len(r) >= 3:
-                    p = s_probs[regime]
-                    exp_ret += p * (float(r.mean()) * 12)
-                    total_p += p
-            if total_p > 0:
-                expected_returns[t] = _safe_float(exp_ret / total_p) or 0.0
+            if total_p[t] > 0:
+                expected_returns[t] = _safe_float(exp_ret[t] / total_p[t]) or 0.0
 
     # ── Small sample regimes (< 12 months of data) ──────────────────
     small_sample = [
         r for r in states
-        if len(aligned[aligned["regime"] == r]) < 12
+        if int(state_months.get(r, 0)) < 12
     ]
 
     # ── Regime separation quality (Cohen's d + Welch t-test per asset) ──
@@ -306,7 +298,7 @@ def compute_asset_analytics(
     #   d 0.5-1.0 = strong
     #   d > 1.0  = exceptional
     # Welch's t-test provides the p-value for "is best ≠ worst significant".
-    regime_separation = _compute_regime_separation(aligned, asset_cols, states)
+    regime_separation = _separation_dict(state_separation(stats), asset_cols)
 
     # ── State-distribution balance ──────────────────────────────────
     # How evenly the regime spreads observations across declared states.
@@ -645,76 +637,30 @@ def _compute_regime_separation(
             n: int,               # total observations
         }}
     """
-    from scipy.stats import ttest_ind, f as f_dist
+    stats = state_return_stats(aligned[asset_cols], aligned["regime"], states)
+    return _separation_dict(state_separation(stats), asset_cols)
+
 
+def _separation_dict(sep: pd.DataFrame, asset_cols: list[str]) -> dict[str, dict]:
+    """Serialize a :func:`state_separation` frame into the JSONB shape."""
     result: dict[str, dict] = {}
     for t in asset_cols:
-        # Collect per-state return arrays
-        state_data: dict[str, np.ndarray] = {}
-        for state in states:
-            g = aligned.loc[aligned["regime"] == state, t].dropna().values
-            if len(g) >= 3:
-                state_data[state] = g
-
-        if len(state_data) < 2:
+        row = sep.loc[t]
+        if row["n_states"] < 2:
             result[t] = {
                 "cohens_d": None, "p_value": None,
                 "best_state": None, "worst_state": None,
                 "eta_sq": None, "n": 0,
             }
             continue
-
-        # Find best and worst states by mean
-        means = {s: float(g.mean()) for s, g in state_data.items()}
-        best_name = max(means, key=means.get)
-        worst_name = min(means, key=means.get)
-
-        best_values = state_data[best_name]
-        worst_values = state_data[worst_name]
-        n1, n2 = len(best_values), len(worst_values)
-
-        # Cohen's d with pooled standard deviation
-        s1_sq = float(best_values.var(ddof=1)) if n1 >= 2 else 0.0
-        s2_sq = float(worst_values.var(ddof=1)) if n2 >= 2 else 0.0
-        pooled_var = ((n1 - 1) * s1_sq + (n2 - 1) * s2_sq) / max(n1 + n2 - 2, 1)
-        pooled_std = float(np.sqrt(pooled_var)) if pooled_var > 0 else 0.0
-
-        if pooled_std < 1e-12:
-            cohens_d = None
-        else:
-            cohens_d = (means[best_name] - means[worst_name]) / pooled_std
-
-        # Welch's t-test for best vs worst (unequal variance, sample-size aware)
-        try:
-            _, p_welch = ttest_ind(best_values, worst_values, equal_var=False)
-        except Exception:
-            p_welch = None
-
-        # Also compute η² across ALL states as a backward-compat reference
-        all_obs = np.concatenate(list(state_data.values()))
-        n_total = len(all_obs)
-        k = len(state_data)
-        grand_mean = float(all_obs.mean())
-        ss_between = sum(
-            len(g) * (float(g.mean()) - grand_mean) ** 2
-            for g in state_data.values()
-        )
-        ss_within = sum(
-            float(((g - g.mean()) ** 2).sum())
-            for g in state_data.values()
-        )
-        ss_total = ss_between + ss_within
-        eta_sq = ss_between / ss_total if ss_total > 1e-12 else 0.0
-
         result[t] = {
-            "cohens_d": _safe_float(cohens_d),
-            "p_value": _safe_float(p_welch),
-            "best_state": best_name,
-            "worst_state": worst_name,
-            "eta_sq": _safe_float(eta_sq),
-            "n": int(n_total),
+            "cohens_d": _safe_float(row["cohens_d"]),
+            "p_value": _safe_float(row["p_value"]),
+            "best_state": row["best_state"],
+            "worst_state": row["worst_state"],
+            "eta_sq": _safe_float(row["eta_sq"]),
+            "n": int(row["n"]),
         }
-
     return result
 
 
@@ -778,22 +724,40 @@ class RegimeComputer:
         Returns a dict with keys matching RegimeSnapshot columns:
         ``current_state``, ``timeseries``, ``strategy``, ``asset_analytics``, ``meta``.
         """
+        return self.payload(self.build_frame(params))
+
+    def _regime(self) -> Regime:
         if self.reg.regime_class is None:
             raise ValueError(
                 f"Regime '{self.reg.key}' has no regime_class — "
                 f"it needs a custom computer_class."
             )
+        return self.reg.regime_class()
 
-        regime: Regime = self.reg.regime_class()
-        df = regime.build(
+    def build_frame(self, params: dict) -> pd.DataFrame:
+        """Run :meth:`Regime.build` with *params* (raises on an empty result)."""
+        df = self._regime().build(
             z_window=params.get("z_window", 36),
             sensitivity=params.get("sensitivity", 1.0),
             smooth_halflife=params.get("smooth_halflife", 4),
         )
-
         if df.empty:
             raise RuntimeError(f"Regime '{self.reg.key}' built an empty DataFrame")
+        return df
 
+    def payload(self, df: pd.DataFrame) -> dict:
+        """Serialize a built frame into the full JSONB payload."""
+        asset_analytics, strategy = self._analytics(df)
+        return {
+            "current_state": self.serialize_current_state(df),
+            "timeseries": self.serialize_timeseries(df),
+            "strategy": strategy,
+            "asset_analytics": asset_analytics,
+            "meta": self.serialize_meta(),
+        }
+
+    def _analytics(self, df: pd.DataFrame) -> tuple[dict | None, dict | None]:
+        """Asset analytics + strategy backtest for a built frame."""
         # Auto-compute asset analytics using the registration's declared
         # asset universe (or the default broad universe if none declared).
         # Determine signal column for IC computation — first dimension's Z
@@ -826,13 +790,7 @@ class RegimeComputer:
                         self.reg.key, exc)
             strategy = None
 
-        return {
-            "current_state": self.serialize_current_state(df),
-            "timeseries": self.serialize_timeseries(df),
-            "strategy": strategy,
-            "asset_analytics": asset_analytics,
-            "meta": self.serialize_meta(),
-        }
+        return asset_analytics, strategy
 
     # ── Serialization methods (overridable) ─────────────────────────
 
@@ -991,13 +949,17 @@ class RegimeComputer:
 
     # ── Persistence ──────────────────────────────────────────────────
 
-    def save(self, params: dict, payload: dict) -> str:
+    def save(self, params: dict, payload: dict, frame: pd.DataFrame | None = None) -> str:
         """Upsert the computed payload into the regime_snapshot table.
 
+        *frame* (the built DataFrame behind *payload*) is stored alongside
+        so a later :meth:`update` can resume from it.
+
         Returns the fingerprint of the saved row.
         """
         fp = regime_fingerprint(self.reg.key, params)
         now = datetime.now(timezone.utc)
+        state = None if frame is None else _frame_to_bytes(frame)
 
         with Session() as session:
             existing = session.get(RegimeSnapshot, fp)
@@ -1012,6 +974,7 @@ class RegimeComputer:
                     strategy=payload.get("strategy"),
                     asset_analytics=payload.get("asset_analytics"),
                     meta=payload.get("meta"),
+                    frame=state,
                 )
                 session.add(row)
             else:
@@ -1022,6 +985,7 @@ class RegimeComputer:
                 existing.strategy = payload.get("strategy")
                 existing.asset_analytics = payload.get("asset_analytics")
                 existing.meta = payload.get("meta")
+                existing.frame = state
             session.commit()
 
         log.info("Saved regime snapshot: %s", fp)
@@ -1030,8 +994,232 @@ class RegimeComputer:
     def compute_and_save(self, params: dict | None = None) -> str:
         """Run compute() + save() in one call. Returns the fingerprint."""
         params = params or self.reg.default_params
-        payload = self.compute(params)
-        return self.save(params, payload)
+        df = self.build_frame(params)
+        fp = self.save(params, self.payload(df), df)
+        _remember_frame(fp, df)
+        return fp
+
+    def update(self, params: dict | None = None) -> str:
+        """Incrementally refresh the stored snapshot. Returns the fingerprint.
+
+        Rebuilds only the months whose indicator inputs changed since the
+        last build (new month or revision). The previous build is read
+        from the stored row's ``frame``; the in-process cache only saves
+        that read. ``current_state`` / ``asset_analytics`` / ``strategy``
+        (which depend on the latest month and on fresh asset prices) are
+        always recomputed and replaced. When no indicator month changed the
+        ``timeseries`` arrays are left as they are; otherwise the rebuilt
+        tail is spliced into them server-side.
+
+        The saving is the JSONB rewrite, not the compute: indicators are
+        still reloaded over their full history, the smoothing state is
+        re-derived from the whole head, and the asset analytics and
+        strategy backtest run in full on every call.
+
+        Falls back to :meth:`compute_and_save` when there is no stored
+        previous build, the stored arrays do not line up with it, or the
+        column layout changed.
+        """
+        params = params or self.reg.default_params
+        fp = regime_fingerprint(self.reg.key, params)
+        previous = _recall_frame(fp)
+        if previous is None:
+            previous = _load_frame(fp)
+        if previous is None:
+            return self.compute_and_save(params)
+
+        df, since = self._regime().build_incremental(
+            previous,
+            z_window=params.get("z_window", 36),
+            sensitivity=params.get("sensitivity", 1.0),
+            smooth_halflife=params.get("smooth_halflife", 4),
+        )
+        if since is None:
+            if not self._refresh_analytics(fp, df):
+                return self.compute_and_save(params)
+            log.info("Regime timeseries unchanged, analytics refreshed: %s", fp)
+            return fp
+        if df.empty:
+            raise RuntimeError(f"Regime '{self.reg.key}' built an empty DataFrame")
+
+        if list(df.columns) != list(previous.columns) or not self._patch(fp, df, since):
+            fp = self.save(params, self.payload(df), df)
+        _remember_frame(fp, df)
+        return fp
+
+    def _refresh_analytics(self, fp: str, df: pd.DataFrame) -> bool:
+        """Replace the price-driven parts of the stored row for an unchanged *df*.
+
+        Returns ``False`` (nothing written) when the row is missing.
+        """
+        asset_analytics, strategy = self._analytics(df)
+        with Session() as session:
+            row = session.get(RegimeSnapshot, fp)
+            if row is None:
+                return False
+            row.current_state = self.serialize_current_state(df)
+            row.asset_analytics = asset_analytics
+            row.strategy = strategy
+            row.computed_at = datetime.now(timezone.utc)
+            session.commit()
+        return True
+
+    def _patch(self, fp: str, df: pd.DataFrame, since: pd.Timestamp) -> bool:
+        """Splice the rebuilt tail of *df* into the stored snapshot row.
+
+        Only arrays that run along the date axis are spliced: every list
+        leaf of the rebuilt tail, and the stored array at the same path,
+        must be exactly as long as its ``dates``.
+
+        Returns ``False`` (nothing written) when the row is missing, the
+        database is not PostgreSQL, the stored dates before *since* do
+        not match *df*, or any spliced array is not date-aligned — the
+        caller then rewrites the full payload.
+        """
+        tail = self.serialize_timeseries(df.loc[df.index >= since])
+        paths = list(_leaf_paths(tail))
+        if any(len(values) != len(tail["dates"]) for _, values in paths):
+            return False
+        clipped = df.loc["2000-01-01":].index  # serialize_timeseries clip
+        head_dates = _dates_to_list(clipped[clipped < since])
+        asset_analytics, strategy = self._analytics(df)
+
+        binds: dict[str, Any] = {"fp": fp}
+        for i, (path, values) in enumerate(paths):
+            binds[f"p{i}"] = list(path)
+            binds[f"v{i}"] = json.dumps(values)
+
+        with Session() as session:
+            if session.get_bind().dialect.name != "postgresql":
+                return False
+            lengths = ", ".join(_LENGTH_SQL.format(i=i) for i in range(len(paths)))
+            stored = session.execute(
+                text(
+                    f"SELECT timeseries->'dates', {lengths} "
+                    "FROM regime_snapshot WHERE fingerprint = :fp"
+                ),
+                binds,
+            ).first()
+            keep = len(head_dates)
+            if stored is None or stored[0] is None:
+                return False
+            dates = stored[0]
+            if len(dates) < keep or dates[:keep] != head_dates:
+                return False
+            if any(n != len(dates) for n in stored[1:]):
+                return False
+
+            binds.update(
+                keep=keep,
+                now=datetime.now(timezone.utc),
+                current_state=json.dumps(self.serialize_current_state(df)),
+                asset_analytics=_json_or_none(asset_analytics),
+                strategy=_json_or_none(strategy),
+                frame=_frame_to_bytes(df),
+            )
+            expr = "timeseries"
+            for i in range(len(paths)):
+                expr = _SPLICE_SQL.format(expr=expr, i=i)
+            session.execute(
+                text(
+                    "UPDATE regime_snapshot SET "
+                    f"timeseries = {expr}, "
+                    "current_state = CAST(:current_state AS jsonb), "
+                    "asset_analytics = CAST(:asset_analytics AS jsonb), "
+                    "strategy = CAST(:strategy AS jsonb), "
+                    "frame = :frame, "
+                    "computed_at = :now "
+                    "WHERE fingerprint = :fp"
+                ),
+                binds,
+            )
+            session.commit()
+
+        log.info(
+            "Patched regime snapshot %s from %s (%d arrays)",
+            fp, since.strftime("%Y-%m"), len(paths),
+        )
+        return True
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Incremental refresh state
+# ─────────────────────────────────────────────────────────────────────
+
+# Last built frame per snapshot fingerprint: {fingerprint: df}.
+# Accelerator only — the authoritative copy is regime_snapshot.frame.
+_frame_cache: dict[str, pd.DataFrame] = {}
+_frame_lock = threading.Lock()
+_FRAME_CACHE_MAX = 64
+
+# Keep the stored array's first :keep elements and append the new tail.
+_SPLICE_SQL = (
+    "jsonb_set({expr}, CAST(:p{i} AS text[]), "
+    "COALESCE((SELECT jsonb_agg(e ORDER BY n) "
+    "FROM jsonb_array_elements(timeseries #> CAST(:p{i} AS text[])) "
+    "WITH ORDINALITY AS a(e, n) WHERE n <= :keep), '[]'::jsonb) "
+    "|| CAST(:v{i} AS jsonb))"
+)
+
+# Stored array length at :p{i} (NULL when missing or not an array).
+_LENGTH_SQL = (
+    "CASE jsonb_typeof(timeseries #> CAST(:p{i} AS text[])) "
+    "WHEN 'array' THEN jsonb_array_length(timeseries #> CAST(:p{i} AS text[])) END"
+)
+
+
+def _remember_frame(fp: str, df: pd.DataFrame) -> None:
+    with _frame_lock:
+        if fp not in _frame_cache and len(_frame_cache) >= _FRAME_CACHE_MAX:
+            # Evict oldest 25%
+            for k in list(_frame_cache.keys())[: _FRAME_CACHE_MAX // 4]:
+                _frame_cache.pop(k, None)
+        _frame_cache[fp] = df
+
+
+def _recall_frame(fp: str) -> pd.DataFrame | None:
+    with _frame_lock:
+        return _frame_cache.get(fp)
+
+
+def _load_frame(fp: str) -> pd.DataFrame | None:
+    """Read the stored previous build for *fp* (``None`` if absent or unreadable)."""
+    with Session() as session:
+        blob = session.execute(
+            select(RegimeSnapshot.frame).where(RegimeSnapshot.fingerprint == fp)
+        ).scalar()
+    if blob is None:
+        return None
+    try:
+        df = _frame_from_bytes(blob)
+    except Exception as exc:
+        log.warning("Stored regime frame for %s is unreadable: %s", fp, exc)
+        return None
+    _remember_frame(fp, df)
+    return df
+
+
+def _frame_to_bytes(df: pd.DataFrame) -> bytes:
+    buf = io.BytesIO()
+    df.to_parquet(buf, compression="zstd")
+    return buf.getvalue()
+
+
+def _frame_from_bytes(blob: bytes) -> pd.DataFrame:
+    return pd.read_parquet(io.BytesIO(bytes(blob)))
+
+
+def _leaf_paths(tree: dict, prefix: tuple[str, ...] = ()):
+    """Yield ``(path, list)`` for every list leaf of a serialized payload."""
+    for key, value in tree.items():
+        if isinstance(value, dict):
+            yield from _leaf_paths(value, prefix + (key,))
+        elif isinstance(value, list):
+            yield prefix + (key,), value
+
+
+def _json_or_none(value: Any) -> str | None:
+    return None if value is None else json.dumps(value)
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -1039,9 +1227,17 @@ class RegimeComputer:
 # ─────────────────────────────────────────────────────────────────────
 
 
-def compute_regime(key: str, params: dict | None = None) -> str:
+def compute_regime(
+    key: str,
+    params: dict | None = None,
+    incremental: bool = False,
+) -> str:
     """Compute and save any registered regime by key.
 
+    Args:
+        incremental: Refresh via :meth:`RegimeComputer.update` — rebuild
+            and persist only the months whose inputs changed.
+
     Returns the fingerprint of the saved snapshot.
     """
     from .registry import get_regime
@@ -1049,4 +1245,6 @@ def compute_regime(key: str, params: dict | None = None) -> str:
     reg = get_regime(key)
     computer_cls = reg.computer_class or RegimeComputer
     computer = computer_cls(reg)
+    if incremental:
+        return computer.update(params)
     return computer.compute_and_save(params)
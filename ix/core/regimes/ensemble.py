@@ -19,8 +19,8 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
-from scipy.stats import spearmanr
 
+from .compose import cached_build
 from .compute import (
     DEFAULT_ASSET_TICKERS,
     _load_asset_prices,
@@ -61,8 +61,7 @@ def compute_ensemble_strategy(
         if not reg.regime_class or not reg.dimensions:
             continue
         try:
-            regime = reg.regime_class()
-            df = regime.build(**reg.default_params)
+            df = cached_build(reg, reg.default_params)
             z_col = f"{reg.dimensions[0]}_Z"
             if z_col in df.columns:
                 regime_z[reg.key] = df[z_col]
@@ -105,6 +104,8 @@ def compute_ensemble_strategy(
         return None
 
     # ── 4. Pre-compute expanding IC series ────────────────────────
+    from scipy.stats import spearmanr  # deferred: scipy.stats is slow to import
+
     # For each (regime, asset) pair, compute IC at every expanding window
     # point.  This vectorises the expensive spearmanr calls.
     log.info("Ensemble: computing expanding IC for %d regime-asset pairs...",
@@ -0,0 +1,205 @@
+"""Array kernel for the post-composite stage of the regime pipeline.
+
+Everything after the dimension composites — sigmoid mapping, EMA smoothing
+of state probabilities, dominant state, conviction and the regime streak
+counter — is pure array math. It is implemented here on stacked numpy
+arrays shaped ``(K, T, S)`` (parameter sets × months × states) so that
+:meth:`Regime.build_batch` can evaluate a whole ``(sensitivity,
+smooth_halflife)`` grid in one pass instead of rebuilding DataFrames per
+grid point.
+
+The EMA and streak kernels also accept the terminal state of a previous
+run (:func:`ewm_state`, ``seed=``) so an incremental rebuild can continue
+the recursion over just the appended months instead of replaying history.
+
+All kernels reproduce the pandas semantics used by :meth:`Regime.build`
+exactly (``ewm(halflife=h).mean()`` with ``adjust=True`` and
+``ignore_na=False``, NA-skipping ``idxmax``/``max``, forward-filled streaks).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from scipy.special import expit
+
+
+def sigmoid_grid(z: np.ndarray, sensitivities: np.ndarray) -> np.ndarray:
+    """Logistic map of a ``(T,)`` z-score for every sensitivity → ``(K, T)``."""
+    return expit(np.multiply.outer(np.asarray(sensitivities, dtype=float), z))
+
+
+def _ewm_decay(halflife: float) -> float:
+    return float(np.exp(np.log(0.5) / halflife))
+
+
+def _ewm_parts(
+    values: np.ndarray,
+    decay: float,
+    axis: int,
+    init: tuple[np.ndarray, np.ndarray, np.ndarray] | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Running EWM numerator, denominator and observation count."""
+    # scipy.signal takes ~1s to import; keep it off the API startup path
+    from scipy.signal import lfilter
+
+    obs = ~np.isnan(values)
+    x = np.where(obs, values, 0.0)
+    w = obs.astype(float)
+    b, a = [1.0], [1.0, -decay]
+    if init is None:
+        num = lfilter(b, a, x, axis=axis)
+        den = lfilter(b, a, w, axis=axis)
+        seen = np.cumsum(obs, axis=axis)
+    else:
+        num0, den0, seen0 = (np.asarray(v, dtype=float) for v in init)
+        # Direct-form II transposed: the single delay register holds
+        # ``decay * y[-1]``, which continues the recursion exactly.
+        num, _ = lfilter(b, a, x, axis=axis, zi=np.expand_dims(decay * num0, axis))
+        den, _ = lfilter(b, a, w, axis=axis, zi=np.expand_dims(decay * den0, axis))
+        seen = np.cumsum(obs, axis=axis) + np.expand_dims(seen0, axis)
+    return num, den, seen
+
+
+def ewm_mean(
+    values: np.ndarray,
+    halflife: float,
+    axis: int = 0,
+    init: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None,
+) -> np.ndarray:
+    """Adjusted exponentially-weighted mean along *axis*.
+
+    Matches ``DataFrame.ewm(halflife=halflife).mean()``: NaN observations
+    contribute nothing but the older weights still decay across them, and
+    the output carries the last mean through NaN rows (NaN only before the
+    first observation).
+
+    Args:
+        init: Optional terminal state from :func:`ewm_state` over the rows
+            preceding *values*; the result then equals the tail of the
+            EWM over the concatenated rows.
+    """
+    num, den, seen = _ewm_parts(values, _ewm_decay(halflife), axis, init)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = num / den
+    out[seen == 0] = np.nan
+    return out
+
+
+def ewm_state(
+    values: np.ndarray,
+    halflife: float,
+    axis: int = 0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Terminal ``(numerator, denominator, count)`` of :func:`ewm_mean`.
+
+    Arrays have *values*' shape with *axis* removed; pass the tuple as
+    ``init`` to continue the EWM over subsequent rows.
+    """
+    num, den, seen = _ewm_parts(values, _ewm_decay(halflife), axis, None)
+    return tuple(np.take(arr, -1, axis=axis).astype(float) for arr in (num, den, seen))
+
+
+def smooth_state_probabilities(
+    probs: np.ndarray,
+    halflives: np.ndarray,
+    init: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None,
+) -> np.ndarray:
+    """EMA-smooth and renormalise state probabilities per parameter set.
+
+    Args:
+        probs: ``(K, T, S)`` raw state probabilities.
+        halflives: ``(K,)`` smoothing halflife per parameter set. Values
+            ``<= 1`` pass the raw probabilities through unsmoothed (and
+            unnormalised), as :meth:`Regime.build` does.
+        init: Optional ``(K, S)`` EWM state from :func:`smoothing_state`
+            over the months preceding *probs*.
+
+    Returns:
+        ``(K, T, S)`` smoothed probabilities.
+    """
+    halflives = np.asarray(halflives, dtype=float)
+    out = probs.copy()
+    for h in np.unique(halflives[halflives > 1]):
+        sel = halflives == h
+        sel_init = None if init is None else tuple(v[sel] for v in init)
+        smoothed = ewm_mean(probs[sel], h, axis=1, init=sel_init)
+        sums = np.nansum(smoothed, axis=2, keepdims=True)
+        out[sel] = smoothed / np.clip(sums, 1e-9, None)
+    return out
+
+
+def smoothing_state(
+    probs: np.ndarray,
+    halflives: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """``(K, S)`` terminal EWM state of :func:`smooth_state_probabilities`.
+
+    Parameter sets with ``halflife <= 1`` carry no state (zeros).
+    """
+    halflives = np.asarray(halflives, dtype=float)
+    k, _, s = probs.shape
+    state = tuple(np.zeros((k, s)) for _ in range(3))
+    for h in np.unique(halflives[halflives > 1]):
+        sel = halflives == h
+        for dst, src in zip(state, ewm_state(probs[sel], h, axis=1)):
+            dst[sel] = src
+    return state
+
+
+def dominant_codes(smoothed: np.ndarray) -> np.ndarray:
+    """Argmax state index over the last axis, ``-1`` where all states are NaN.
+
+    NaN entries are skipped, and ties resolve to the first state.
+    """
+    valid = ~np.isnan(smoothed).all(axis=-1)
+    codes = np.argmax(np.where(np.isnan(smoothed), -np.inf, smoothed), axis=-1)
+    return np.where(valid, codes, -1)
+
+
+def conviction(smoothed: np.ndarray, n_states: int) -> np.ndarray:
+    """0 at the uniform baseline, 100 at full certainty (NaN where undefined)."""
+    valid = ~np.isnan(smoothed).all(axis=-1)
+    top = np.where(valid, np.where(np.isnan(smoothed), -np.inf, smoothed).max(axis=-1), np.nan)
+    baseline = 1.0 / n_states
+    return np.clip((top - baseline) / (1.0 - baseline) * 100, 0, 100)
+
+
+def ffill_codes(codes: np.ndarray) -> np.ndarray:
+    """Forward-fill ``-1`` (missing) state codes along the last axis."""
+    t = np.arange(codes.shape[-1])
+    last = np.maximum.accumulate(np.where(codes >= 0, t, -1), axis=-1)
+    filled = np.take_along_axis(codes, np.maximum(last, 0), axis=-1)
+    return np.where(last >= 0, filled, -1)
+
+
+def streak_lengths(
+    codes: np.ndarray,
+    seed: tuple[np.ndarray, np.ndarray] | None = None,
+) -> np.ndarray:
+    """Run-length streak counter over forward-filled state codes.
+
+    Each month gets the number of consecutive months (including itself)
+    spent in its state. Leading missing months each count as a fresh run
+    of 1.
+
+    Args:
+        seed: Optional ``(code, streak)`` of the month preceding *codes*
+            (forward-filled code, ``-1`` if none). The first run continues
+            that streak when it is in the same state.
+    """
+    if seed is not None:
+        prev_code = np.asarray(seed[0], dtype=codes.dtype)[..., None]
+        prev_streak = np.asarray(seed[1])[..., None]
+        ext = streak_lengths(np.concatenate([prev_code, codes], axis=-1))[..., 1:]
+        t = np.arange(codes.shape[-1])
+        continues = ext == t + 2  # run started at the seed month
+        return np.where(continues, ext + prev_streak - 1, ext)
+
+    filled = ffill_codes(codes)
+    t = np.arange(filled.shape[-1])
+    prev = np.concatenate(
+        [np.full(filled.shape[:-1] + (1,), -2), filled[..., :-1]], axis=-1
+    )
+    new_run = (filled != prev) | (filled < 0)
+    start = np.maximum.accumulate(np.where(new_run, t, 0), axis=-1)
+    return t - start + 1
@@ -0,0 +1,425 @@
+"""Bounded, persistent store for composition and ensemble results.
+
+``/regimes/compose`` and ``/regimes/ensemble`` results are expensive
+(seconds to tens of seconds) and identical for identical inputs. They are
+kept in two tiers:
+
+* a per-process LRU of :data:`_LRU_MAX` payloads, and
+* the ``regime_result`` table (:class:`~ix.db.models.RegimeResult`),
+  shared by every worker and surviving restarts.
+
+Both tiers are keyed by :func:`~ix.db.models.result_fingerprint` over the
+input regime keys, the parameters and the input data versions (see
+:func:`input_versions`: each input regime's snapshot ``computed_at``, the
+asset series' ``updated`` and the current date), so a result is
+recomputed when one of its inputs has been refreshed, and at least daily.
+Concurrent requests for the same fingerprint share a single computation.
+
+:func:`warm_up` preloads (or recomputes, if stale) the most-requested
+results at startup; :func:`store_stats` exposes hit / miss / eviction
+counters.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+
+from sqlalchemy import text
+
+from ix.core.ts.data_processing import timeseries_versions
+from ix.db.conn import Session
+from ix.db.models import RegimeResult, RegimeSnapshot, regime_fingerprint, result_fingerprint
+
+from .registry import get_regime, list_regimes
+
+log = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────────────────────────────
+# State
+# ─────────────────────────────────────────────────────────────────────
+
+# In-memory LRU front: {fingerprint: payload}, most recently used last
+_lru: OrderedDict[str, dict] = OrderedDict()
+_lru_lock = threading.Lock()
+_LRU_MAX = 32
+
+# Input data versions: {sorted keys: (ts, {key: computed_at iso})}
+_versions_cache: dict[tuple[str, ...], tuple[float, dict[str, str]]] = {}
+_versions_lock = threading.Lock()
+_VERSIONS_TTL = 30  # seconds — bounds staleness after a regime refresh
+
+# Single-flight: one computation per fingerprint at a time
+_inflight: dict[str, threading.Lock] = {}
+_inflight_lock = threading.Lock()
+
+# Hit counts are accumulated in memory and flushed to the table at most
+# once per interval, so memory hits never touch the database.
+_pending_hits: dict[str, int] = {}
+_hits_lock = threading.Lock()
+_last_hit_flush = time.monotonic()
+_HIT_FLUSH_INTERVAL = 60
+
+_stats = {
+    "memory_hits": 0,
+    "store_hits": 0,
+    "misses": 0,
+    "evictions": 0,
+    "store_errors": 0,
+}
+_stats_lock = threading.Lock()
+
+# PostgreSQL advisory lock held by the worker running warm_up()
+_WARM_UP_LOCK_ID = 0x72725F7761726D  # "rr_warm"
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        _stats[name] += 1
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Input versions
+# ─────────────────────────────────────────────────────────────────────
+
+
+def input_versions(keys: list[str], codes: Iterable[str] = ()) -> dict[str, str]:
+    """Data versions of everything a result is built from.
+
+    * ``{regime_key: snapshot computed_at}`` for the default-param
+      snapshots (``""`` when a regime has no snapshot);
+    * ``{"series:<code>": updated}`` for the asset series *codes*;
+    * ``{"as_of": today (UTC)}`` — indicators and live-fetched prices
+      carry no stored version, so results expire at least daily.
+
+    The stored versions are cached for a few seconds; call
+    :func:`invalidate_versions` after a refresh.
+    """
+    cache_key = tuple(sorted(set(keys))) + tuple(f"series:{c}" for c in sorted(set(codes)))
+    as_of = {"as_of": datetime.now(timezone.utc).date().isoformat()}
+    with _versions_lock:
+        cached = _versions_cache.get(cache_key)
+    if cached and (time.time() - cached[0]) < _VERSIONS_TTL:
+        return {**cached[1], **as_of}
+
+    regime_keys = sorted(set(keys))
+    fps = {regime_fingerprint(k, get_regime(k).default_params): k for k in regime_keys}
+    versions = {k: "" for k in regime_keys}
+    try:
+        with Session() as session:
+            rows = (
+                session.query(RegimeSnapshot.fingerprint, RegimeSnapshot.computed_at)
+                .filter(RegimeSnapshot.fingerprint.in_(list(fps)))
+                .all()
+            )
+            series = timeseries_versions(session, codes)
+    except Exception as exc:
+        log.warning("Result store: input version lookup failed: %s", exc)
+        return {**versions, **as_of}
+    for fp, computed_at in rows:
+        versions[fps[fp]] = computed_at.isoformat() if computed_at else ""
+    for code, updated in sorted(series.items()):
+        versions[f"series:{code}"] = updated.isoformat() if updated else ""
+
+    with _versions_lock:
+        _versions_cache[cache_key] = (time.time(), versions)
+    return {**versions, **as_of}
+
+
+def invalidate_versions() -> None:
+    """Forget cached input versions (call after recomputing a regime)."""
+    with _versions_lock:
+        _versions_cache.clear()
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Tiers
+# ─────────────────────────────────────────────────────────────────────
+
+
+def _lru_get(fp: str) -> dict | None:
+    with _lru_lock:
+        payload = _lru.get(fp)
+        if payload is not None:
+            _lru.move_to_end(fp)
+        return payload
+
+
+def _lru_put(fp: str, payload: dict) -> None:
+    with _lru_lock:
+        _lru[fp] = payload
+        _lru.move_to_end(fp)
+        while len(_lru) > _LRU_MAX:
+            _lru.popitem(last=False)
+            _count("evictions")
+
+
+def _store_load(fp: str) -> dict | None:
+    try:
+        with Session() as session:
+            row = session.get(RegimeResult, fp)
+            return None if row is None else row.payload
+    except Exception as exc:
+        _count("store_errors")
+        log.warning("Result store: load failed for %s: %s", fp, exc)
+        return None
+
+
+def _store_save(
+    fp: str,
+    kind: str,
+    cache_key: str,
+    keys: list[str],
+    params: dict,
+    versions: dict[str, str],
+    payload: dict,
+) -> None:
+    """Persist a payload, replacing stale rows for the same ``cache_key``.
+
+    The usage count of the replaced rows carries over so warm-up ranking
+    survives input refreshes.
+    """
+    try:
+        with Session() as session:
+            stale = (
+                session.query(RegimeResult)
+                .filter(
+                    RegimeResult.kind == kind,
+                    RegimeResult.cache_key == cache_key,
+                    RegimeResult.fingerprint != fp,
+                )
+                .all()
+            )
+            hits = max((r.hit_count or 0 for r in stale), default=0)
+            for r in stale:
+                session.delete(r)
+            now = datetime.now(timezone.utc)
+            row = session.get(RegimeResult, fp)
+            if row is None:
+                row = RegimeResult(fingerprint=fp, hit_count=hits)
+                session.add(row)
+            row.kind = kind
+            row.cache_key = cache_key
+            row.keys = keys
+            row.parameters = params
+            row.versions = versions
+            row.payload = payload
+            row.computed_at = now
+            row.last_accessed = now
+            session.commit()
+    except Exception as exc:
+        _count("store_errors")
+        log.warning("Result store: save failed for %s: %s", fp, exc)
+
+
+def _record_hit(fp: str) -> None:
+    global _last_hit_flush
+    with _hits_lock:
+        _pending_hits[fp] = _pending_hits.get(fp, 0) + 1
+        if time.monotonic() - _last_hit_flush < _HIT_FLUSH_INTERVAL:
+            return
+        pending = dict(_pending_hits)
+        _pending_hits.clear()
+        _last_hit_flush = time.monotonic()
+    _flush_hits(pending)
+
+
+def _flush_hits(pending: dict[str, int]) -> None:
+    if not pending:
+        return
+    try:
+        now = datetime.now(timezone.utc)
+        with Session() as session:
+            for fp, n in pending.items():
+                session.query(RegimeResult).filter(RegimeResult.fingerprint == fp).update(
+                    {
+                        RegimeResult.hit_count: RegimeResult.hit_count + n,
+                        RegimeResult.last_accessed: now,
+                    },
+                    synchronize_session=False,
+                )
+            session.commit()
+    except Exception as exc:
+        log.warning("Result store: hit flush failed: %s", exc)
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Public API
+# ─────────────────────────────────────────────────────────────────────
+
+
+def get_or_compute(
+    kind: str,
+    cache_key: str,
+    keys: list[str],
+    params: dict,
+    compute: Callable[[], dict | None],
+    codes: Iterable[str] = (),
+) -> dict | None:
+    """Return the stored result for these inputs, computing it on a miss.
+
+    Args:
+        kind: Result family (``"compose"`` / ``"ensemble"``).
+        cache_key: Human-readable identity within *kind* (e.g.
+            ``"growth+inflation"``); older versions under the same
+            ``cache_key`` are replaced on save.
+        keys: Input regime keys whose snapshot versions gate freshness.
+        params: Parameters that affect the result.
+        compute: Zero-argument callable producing the payload. ``None``
+            results are returned but not stored.
+        codes: Asset series codes the result reads prices from.
+
+    Results are not persisted while any input version is unknown (``""``):
+    they could never go stale.
+    """
+    versions = input_versions(keys, codes)
+    fp = result_fingerprint(kind, keys, params, versions)
+
+    payload = _lru_get(fp)
+    if payload is not None:
+        _count("memory_hits")
+        _record_hit(fp)
+        return payload
+
+    with _inflight_lock:
+        lock = _inflight.setdefault(fp, threading.Lock())
+    try:
+        with lock:
+            # Another request may have finished the same computation meanwhile
+            payload = _lru_get(fp)
+            if payload is not None:
+                _count("memory_hits")
+            else:
+                payload = _store_load(fp)
+                if payload is not None:
+                    _count("store_hits")
+                else:
+                    _count("misses")
+                    payload = compute()
+                    if payload is None:
+                        return None
+                    if all(versions.values()):
+                        _store_save(fp, kind, cache_key, sorted(keys), params, versions, payload)
+                _lru_put(fp, payload)
+            _record_hit(fp)
+            return payload
+    finally:
+        with _inflight_lock:
+            _inflight.pop(fp, None)
+
+
+def get_composition(keys: list[str]) -> dict:
+    """Composition of *keys* (see :func:`compose_regimes`), via the store.
+
+    Raises:
+        ValueError: for unknown or non-composable keys (from the composer).
+    """
+    from .compose import compose_regimes
+    from .compute import DEFAULT_ASSET_TICKERS
+
+    keys = sorted(set(keys))
+    for k in keys:
+        try:
+            get_regime(k)
+        except KeyError as e:
+            raise ValueError(f"Regime '{k}' not registered") from e
+    params = dict(get_regime(keys[0]).default_params)
+    # Same asset universe compose_regimes() prices against
+    tickers: dict[str, str] = {}
+    for k in keys:
+        tickers.update(get_regime(k).asset_tickers or {})
+    return get_or_compute(
+        "compose",
+        "+".join(keys),
+        keys,
+        params,
+        lambda: compose_regimes(keys, params),
+        codes=(tickers or DEFAULT_ASSET_TICKERS).values(),
+    )
+
+
+def get_ensemble(universe: str) -> dict | None:
+    """IC-weighted ensemble for a named universe preset, via the store."""
+    from .compute import UNIVERSE_PRESETS
+    from .ensemble import compute_ensemble_strategy
+
+    keys = sorted(r.key for r in list_regimes() if r.regime_class and r.dimensions)
+    return get_or_compute(
+        "ensemble",
+        universe,
+        keys,
+        {"universe": universe},
+        lambda: compute_ensemble_strategy(tickers=UNIVERSE_PRESETS[universe]),
+        codes=UNIVERSE_PRESETS[universe].values(),
+    )
+
+
+def warm_up(limit: int = 8) -> int:
+    """Load the *limit* most-requested results into memory.
+
+    Results whose inputs have been refreshed since they were stored are
+    recomputed, so the first request after a deploy or a data refresh is
+    served warm. Only one worker warms at a time: the others skip (they
+    read the recomputed rows from the table on first request). Returns
+    the number of results warmed.
+    """
+    try:
+        with Session() as session:
+            # Transaction-scoped, so it is released when the session ends
+            if session.get_bind().dialect.name == "postgresql" and not session.execute(
+                text("SELECT pg_try_advisory_xact_lock(:id)"), {"id": _WARM_UP_LOCK_ID}
+            ).scalar():
+                log.info("Result store warm-up running in another worker, skipped")
+                return 0
+            return _warm_up(session, limit)
+    except Exception as exc:
+        log.warning("Result store warm-up skipped: %s", exc)
+        return 0
+
+
+def _warm_up(session, limit: int) -> int:
+    rows = (
+        session.query(RegimeResult.kind, RegimeResult.cache_key, RegimeResult.keys)
+        .order_by(RegimeResult.hit_count.desc(), RegimeResult.computed_at.desc())
+        .limit(limit)
+        .all()
+    )
+    warmed = 0
+    for kind, cache_key, keys in rows:
+        try:
+            if kind == "compose":
+                get_composition(list(keys))
+            elif kind == "ensemble":
+                get_ensemble(cache_key)
+            else:
+                continue
+            warmed += 1
+        except Exception as exc:
+            log.warning("Result store warm-up failed for %s %s: %s", kind, cache_key, exc)
+    log.info("Result store warmed %d/%d results", warmed, len(rows))
+    return warmed
+
+
+def store_stats() -> dict:
+    """Hit / miss / eviction counters and current in-memory occupancy."""
+    with _stats_lock:
+        stats = dict(_stats)
+    with _lru_lock:
+        stats["size"] = len(_lru)
+    stats["max_size"] = _LRU_MAX
+    lookups = stats["memory_hits"] + stats["store_hits"] + stats["misses"]
+    stats["hit_rate"] = (
+        (stats["memory_hits"] + stats["store_hits"]) / lookups if lookups else None
+    )
+    return stats
+
+
+def clear_memory() -> None:
+    """Drop the in-memory tier (the table is untouched)."""
+    with _lru_lock:
+        _lru.clear()
@@ -270,6 +270,23 @@ def audit_regime_sensitivity(
     default_spread = default_result.spread if default_result else None
 
     # ── Grid sweep ───────────────────────────────────────────────────
+    # Indicators depend only on z_window, so each z_window is built once
+    # and every (sensitivity, smooth_halflife) cell comes out of a single
+    # batched post-composite pass.
+    post_params = [(float(s), int(h)) for _, s, h in combos]
+    batches: dict[int, dict[tuple[float, int], pd.DataFrame]] = {}
+    if reg.regime_class is not None:
+        for z in sorted({int(z) for z, _, _ in combos}):
+            cells = sorted({p for (zz, _, _), p in zip(combos, post_params) if int(zz) == z})
+            try:
+                frames = reg.regime_class().build_batch(
+                    cells, z_window=z, exclude=exclude_indicators
+                )
+                batches[z] = dict(zip(cells, frames))
+            except Exception as exc:
+                if not quiet:
+                    print(f"[{regime_key}] z_window={z} batch build failed: {exc}")
+
     rows: list[dict] = []
     for z, s, h in combos:
         params = dict(defaults)
@@ -288,6 +305,7 @@ def audit_regime_sensitivity(
             "best_state": None,
             "worst_state": None,
         }
+        prebuilt = batches.get(int(z), {}).get((float(s), int(h)))
         try:
             res = validate_composition(
                 [regime_key],
@@ -296,6 +314,7 @@ def audit_regime_sensitivity(
                 train_window=train_window,
                 params=params,
                 exclude_indicators=exclude_indicators,
+                built_dfs={regime_key: prebuilt} if prebuilt is not None else None,
             )
             row["spread"] = res.spread if res.spread is not None else np.nan
             row["cohens_d"] = res.cohens_d if res.cohens_d is not None else np.nan
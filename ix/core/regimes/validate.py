@@ -44,7 +44,7 @@ import numpy as np
 import pandas as pd
 
 from .balance import StateBalance, compute_state_balance
-from .compose import build_joint_states
+from .compose import build_joint_states, cached_build
 from .compute import _compute_regime_separation, _load_asset_prices
 from .registry import get_regime
 
@@ -116,6 +116,7 @@ def validate_composition(
     params: dict | None = None,
     exclude_indicators: set[str] | None = None,
     data_lag_months: int = 1,
+    built_dfs: dict[str, pd.DataFrame] | None = None,
 ) -> CompositionValidationResult:
     """Walk-forward validation of a multi-axis regime composition.
 
@@ -136,6 +137,10 @@ def validate_composition(
             against WTI). Same set is applied to all input regimes.
         data_lag_months: Publication lag — the regime decision at month-end
             *t* can only be acted on at *t + lag*. Default 1.
+        built_dfs: Optional pre-built ``{regime_key: Regime.build() output}``
+            frames (e.g. from :meth:`Regime.build_batch`). Keys present here
+            skip the build step; *params* and *exclude_indicators* are then
+            assumed to have been applied by the caller.
 
     Returns:
         :class:`CompositionValidationResult` with per-state stats, spread,
@@ -154,22 +159,20 @@ def validate_composition(
         params = regs[0].default_params.copy()
 
     # ── Build each regime once on full history (causal pipeline) ────
-    built_dfs: dict[str, pd.DataFrame] = {}
+    prebuilt = built_dfs or {}
+    built_dfs = {}
     for reg in regs:
+        if reg.key in prebuilt:
+            df = prebuilt[reg.key]
+            if df.empty:
+                raise ValueError(f"Regime '{reg.key}' built an empty DataFrame")
+            built_dfs[reg.key] = df
+            continue
         if reg.regime_class is None:
             raise ValueError(
                 f"Regime '{reg.key}' has no regime_class — cannot validate"
             )
-        regime = reg.regime_class()
-        df = regime.build(
-            z_window=params.get("z_window", 96),
-            sensitivity=params.get("sensitivity", 2.0),
-            smooth_halflife=params.get("smooth_halflife", 3),
-            exclude=exclude_indicators,
-        )
-        if df.empty:
-            raise ValueError(f"Regime '{reg.key}' built an empty DataFrame")
-        built_dfs[reg.key] = df
+        built_dfs[reg.key] = cached_build(reg, params, exclude=exclude_indicators)
 
     # ── Joint states (single regime → trivial passthrough) ─────────
     if len(keys) == 1:
@@ -1,7 +1,11 @@
 """VAMS technicals computation — dashboard index data.
 
-Per-index architecture: each index is fetched and computed independently.
+Per-index architecture: each index is computed independently.
 CACRI is computed separately from cross-asset proxies only.
+
+Prices come from :mod:`ix.collectors.yahoo`, which downloads in isolated
+worker processes, so fetches need no lock and related tickers (the
+cross-asset proxies, stale indices) are fetched in one batch.
 """
 
 from __future__ import annotations
@@ -22,9 +26,6 @@ from ix.common import get_logger
 
 logger = get_logger(__name__)
 
-# Lock for yfinance calls — yfinance is NOT thread-safe
-_yfinance_lock = threading.Lock()
-
 # Per-index cache
 _index_cache: dict[str, dict] = {}      # name → full index result dict
 _index_cache_ts: dict[str, float] = {}   # name → monotonic timestamp
@@ -241,12 +242,11 @@ def compute_single(index_name: str) -> dict | None:
     if yf_ticker is None:
         return None
 
-    with _yfinance_lock:
-        try:
-            df = get_yahoo_data(yf_ticker)
-        except Exception:
-            logger.warning(f"Failed to download {index_name} ({yf_ticker})")
-            return None
+    try:
+        df = get_yahoo_data(yf_ticker)
+    except Exception:
+        logger.warning(f"Failed to download {index_name} ({yf_ticker})")
+        return None
 
     return _compute_index(index_name, df)
 
@@ -262,18 +262,18 @@ def _compute_cacri_snapshot() -> dict:
     if _cacri_cache is not None and (time.monotonic() - _cacri_cache_ts) < _CACHE_TTL:
         return _cacri_cache
 
-    from ix.collectors.crawler import get_yahoo_data
+    from ix.collectors.yahoo import fetch_yahoo
 
+    frames = fetch_yahoo(CROSS_ASSET_YF.values())
     cross_asset_vams: dict[str, int] = {}
-    with _yfinance_lock:
-        for ca_name, yf_ticker in CROSS_ASSET_YF.items():
-            try:
-                df = get_yahoo_data(yf_ticker)
-                result = _compute_cross_asset(ca_name, df)
-                if result is not None:
-                    cross_asset_vams[result[0]] = result[1]
-            except Exception:
-                logger.warning(f"Failed to download cross-asset {ca_name}")
+    for ca_name, yf_ticker in CROSS_ASSET_YF.items():
+        df = frames.get(yf_ticker)
+        if df is None:
+            logger.warning(f"Failed to download cross-asset {ca_name}")
+            continue
+        result = _compute_cross_asset(ca_name, df)
+        if result is not None:
+            cross_asset_vams[result[0]] = result[1]
 
     snapshot = {
         "cacri": compute_cacri(cross_asset_vams),
@@ -345,10 +345,14 @@ def ensure_indices_background() -> None:
 
     def _worker() -> None:
         global _indices_computing
+        from ix.collectors.yahoo import fetch_yahoo
+
         try:
+            # One batched download for every stale index
+            frames = fetch_yahoo(INDEX_YF[name] for name in stale)
             for name in stale:
                 try:
-                    result = compute_single(name)
+                    result = _compute_index(name, frames.get(INDEX_YF[name], pd.DataFrame()))
                     if result is not None:
                         _index_cache[name] = result
                         _index_cache_ts[name] = time.monotonic()
@@ -429,26 +433,26 @@ def refresh_single(index_name: str) -> dict | None:
 
 def compute_cacri_history() -> dict:
     """Compute full CACRI history response via crawler, persist to DB cache."""
-    from ix.collectors.crawler import get_yahoo_data
+    from ix.collectors.yahoo import fetch_yahoo
     from ix.db.conn import Session as SessionCtx
     from ix.db.models.api_cache import ApiCache
 
+    frames = fetch_yahoo(CROSS_ASSET_YF.values())
     all_scores: dict[str, pd.Series] = {}
-    with _yfinance_lock:
-        for ca_name, yf_ticker in CROSS_ASSET_YF.items():
-            try:
-                df = get_yahoo_data(yf_ticker)
-                if df.empty:
-                    continue
-                close = df["Close"].squeeze().dropna()
-                weekly = _resample_weekly(close)
-                if weekly.empty or len(weekly) < SHORT_W + MEDIUM_W + 1:
-                    continue
-                scores = compute_vams_series(weekly, SHORT_W, MEDIUM_W).dropna()
-                if not scores.empty:
-                    all_scores[ca_name] = scores
-            except Exception:
-                logger.warning(f"CACRI history: failed for {ca_name}")
+    for ca_name, yf_ticker in CROSS_ASSET_YF.items():
+        try:
+            df = frames.get(yf_ticker)
+            if df is None or df.empty:
+                continue
+            close = df["Close"].squeeze().dropna()
+            weekly = _resample_weekly(close)
+            if weekly.empty or len(weekly) < SHORT_W + MEDIUM_W + 1:
+                continue
+            scores = compute_vams_series(weekly, SHORT_W, MEDIUM_W).dropna()
+            if not scores.empty:
+                all_scores[ca_name] = scores
+        except Exception:
+            logger.warning(f"CACRI history: failed for {ca_name}")
 
     if not all_scores:
         return {"dates": [], "cacri": [], "assets": {}}
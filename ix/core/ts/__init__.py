@@ -9,17 +9,31 @@ from .excel_templates import (
     generate_export_workbook,
 )
 from .bulk_upload import (
+    ingest_columnar,
     merge_columnar_to_db,
+    merge_response,
     process_bulk_create,
     process_template_upload,
+    read_columnar,
 )
-from .data_processing import process_database_timeseries
+from .data_processing import favorite_versions, process_database_timeseries, timeseries_versions
+from .favorites import favorites_panel, refresh_favorites_panel
 from .expression import evaluate_expression, execute_code_block
+from .planner import (
+    data_versions,
+    evaluate_codes,
+    referenced_series,
+    resolved_references,
+)
 from .formatting import (
+    empty_frame,
     format_dataframe_to_column_dict,
     format_favorites_dataframe,
     normalize_dataframe_tz,
     normalize_timezone,
+    prepare_custom_frame,
+    prepare_favorites_frame,
+    slice_dates,
 )
 
 __all__ = [
@@ -28,17 +42,32 @@ __all__ = [
     "DOWNLOAD_FORMULA_TEMPLATE",
     "apply_timeseries_updates",
     "build_search_filter_and_order",
+    "data_versions",
+    "empty_frame",
+    "evaluate_codes",
     "evaluate_expression",
     "execute_code_block",
+    "favorite_versions",
+    "favorites_panel",
     "format_dataframe_to_column_dict",
     "format_favorites_dataframe",
     "generate_create_template_workbook",
     "generate_download_template_workbook",
     "generate_export_workbook",
+    "ingest_columnar",
     "merge_columnar_to_db",
+    "merge_response",
     "normalize_dataframe_tz",
     "normalize_timezone",
+    "prepare_custom_frame",
+    "prepare_favorites_frame",
     "process_bulk_create",
     "process_database_timeseries",
     "process_template_upload",
+    "read_columnar",
+    "referenced_series",
+    "refresh_favorites_panel",
+    "resolved_references",
+    "slice_dates",
+    "timeseries_versions",
 ]
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import io
+import json
 import math
 import time as _time
 from datetime import date as _date
 from datetime import datetime, datetime as _dt
 from typing import Optional
 
+import numpy as np
 import pandas as pd
+from sqlalchemy import select, text
 from sqlalchemy.orm import Session as SessionType
 
 from ix.common import get_logger
@@ -288,13 +291,7 @@ def process_template_upload(contents: bytes) -> dict:
         _time.time() - _t1,
         len(result["updated"]),
     )
-    response = {
-        "message": f"Merged {result['points']} points for {len(result['updated'])} codes.",
-        "db_updated": result["updated"],
-        "db_points_merged": result["points"],
-    }
-    if result["not_found"]:
-        response["warning"] = f"Codes not found in database: {result['not_found']}"
+    response = merge_response(result)
 
     logger.info(
         "Template upload: returning response after %.1fs", _time.time() - _t0
@@ -302,100 +299,217 @@ def process_template_upload(contents: bytes) -> dict:
     return response
 
 
-def merge_columnar_to_db(df: pd.DataFrame, db: SessionType) -> dict:
-    """Merge a date-indexed DataFrame (columns=codes) into the database.
+# ─────────────────────────────────────────────────────────────────────
+# Columnar merge
+# ─────────────────────────────────────────────────────────────────────
 
-    Returns {"updated": [...], "not_found": [...], "points": int}.
-    Uses batch loading to minimise DB queries.
-    """
-    from ix.db.models import TimeseriesData
+# Staged rows merged per statement
+MERGE_BATCH = 50_000
 
-    codes_list = list(df.columns)
-    if not codes_list:
-        return {"updated": [], "not_found": [], "points": 0}
-
-    # Batch-load all matching Timeseries in one query
-    all_ts = db.query(Timeseries).filter(Timeseries.code.in_(codes_list)).all()
-    ts_by_code = {ts.code: ts for ts in all_ts}
-    found_codes = set(ts_by_code.keys())
-    not_found_codes = [c for c in codes_list if c not in found_codes]
-
-    if not ts_by_code:
-        return {"updated": [], "not_found": not_found_codes, "points": 0}
-
-    # Batch-load all data records in one query
-    ts_ids = [ts.id for ts in all_ts]
-    all_data = (
-        db.query(TimeseriesData)
-        .filter(TimeseriesData.timeseries_id.in_(ts_ids))
-        .all()
+CSV_TYPES = {"text/csv", "application/csv"}
+ARROW_TYPES = {
+    "application/vnd.apache.arrow.stream",
+    "application/vnd.apache.arrow.file",
+    "application/x-arrow",
+}
+
+# Dropped with the transaction that created it
+_STAGE = text(
+    """
+    CREATE TEMP TABLE IF NOT EXISTS ts_upload (
+        code text NOT NULL,
+        key text NOT NULL,
+        value double precision NOT NULL
+    ) ON COMMIT DROP
+    """
+)
+
+# Staged points that are new or differ from the stored value are merged
+# into each series' payload (jsonb ||); start / end / count / latest value
+# come from the merged payload. Returns (id, code, points written).
+_MERGE = text(
+    r"""
+    WITH changed AS (
+        SELECT t.id, s.key, s.value
+        FROM ts_upload AS s
+        JOIN timeseries AS t ON t.code = s.code
+        LEFT JOIN timeseries_data AS d ON d.timeseries_id = t.id
+        WHERE d.data -> s.key IS DISTINCT FROM to_jsonb(s.value)
+    ),
+    patches AS (
+        SELECT id, jsonb_object_agg(key, value) AS points, count(*) AS n
+        FROM changed
+        GROUP BY id
+    ),
+    merged AS (
+        INSERT INTO timeseries_data AS d (timeseries_id, data, created, updated)
+        SELECT id, points, now(), now() FROM patches
+        ON CONFLICT (timeseries_id) DO UPDATE
+        SET data = d.data || EXCLUDED.data, updated = EXCLUDED.updated
+        RETURNING d.timeseries_id, d.data
     )
-    data_by_ts_id = {dr.timeseries_id: dr for dr in all_data}
+    UPDATE timeseries AS t
+    SET start = CAST(s.first_key AS date),
+        "end" = CAST(s.last_key AS date),
+        num_data = s.n,
+        latest_value = CAST(m.data ->> s.last_key AS double precision),
+        updated = now()
+    FROM merged AS m
+    JOIN patches AS p ON p.id = m.timeseries_id
+    CROSS JOIN LATERAL (
+        SELECT min(k) AS first_key, max(k) AS last_key, count(*) AS n
+        FROM jsonb_object_keys(m.data) AS k
+        WHERE k ~ '^\d{4}-\d{2}-\d{2}$'
+    ) AS s
+    WHERE t.id = m.timeseries_id
+    RETURNING t.id, t.code, p.n
+    """
+)
 
-    updated_codes = []
-    total_points = 0
-    now = datetime.now()
 
-    for code in codes_list:
-        ts = ts_by_code.get(code)
-        if ts is None:
-            continue
+def read_columnar(body: bytes, content_type: str = "application/json") -> pd.DataFrame:
+    """Date-indexed frame (columns = codes) from a columnar upload body.
 
-        # Get or create data record (no extra query -- already loaded)
-        data_record = data_by_ts_id.get(ts.id)
-        if data_record is None:
-            data_record = TimeseriesData(timeseries_id=ts.id, data={})
-            db.add(data_record)
-            data_by_ts_id[ts.id] = data_record
-
-        column_data = data_record.data if data_record.data else {}
-
-        if column_data and isinstance(column_data, dict):
-            existing_data = pd.Series(column_data)
-            if not existing_data.empty:
-                existing_data.index = pd.to_datetime(
-                    existing_data.index, errors="coerce"
-                )
-                existing_data = existing_data.dropna()
-        else:
-            existing_data = pd.Series(dtype=float)
+    Accepts JSON ``{"dates": [...], "columns": {code: [...]}}``, CSV with
+    dates in the first column and one column per code, or an Arrow IPC
+    stream / file laid out like the CSV.
 
-        new_series = df[code].dropna()
+    Raises ValueError for bad input (caller should map to HTTP 400).
+    """
+    kind = (content_type or "").split(";")[0].strip().lower()
+    try:
+        if kind in ARROW_TYPES:
+            import pyarrow as pa
 
-        if not existing_data.empty:
-            combined = pd.concat([existing_data, new_series], axis=0)
-            combined = combined[~combined.index.duplicated(keep="last")].sort_index()
+            try:
+                table = pa.ipc.open_stream(body).read_all()
+            except pa.ArrowInvalid:
+                table = pa.ipc.open_file(body).read_all()
+            df = table.to_pandas()
+            df = df.set_index(df.columns[0])
+        elif kind in CSV_TYPES:
+            df = pd.read_csv(io.BytesIO(body), index_col=0)
         else:
-            combined = new_series.sort_index()
-
-        data_dict = {}
-        for k, v in combined.to_dict().items():
-            date_str = (
-                str(k.date())
-                if hasattr(k, "date")
-                else str(pd.to_datetime(k).date())
-                if not isinstance(k, str)
-                else k
-            )
-            data_dict[date_str] = (
-                float(v)
-                if v is not None and not (isinstance(v, float) and pd.isna(v))
-                else None
-            )
-
-        data_record.data = data_dict
-        data_record.updated = now
-        ts.start = combined.index.min().date() if len(combined) > 0 else None
-        ts.end = combined.index.max().date() if len(combined) > 0 else None
-        ts.num_data = len(combined)
-        ts.updated = now
-
-        total_points += len(new_series)
-        updated_codes.append(code)
+            payload = json.loads(body)
+            df = pd.DataFrame(payload["columns"], index=payload["dates"])
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(f"Invalid {kind or 'JSON'} payload: {e}")
+
+    df.index = pd.to_datetime(df.index, errors="coerce")
+    df = df.loc[df.index.notna()].apply(pd.to_numeric, errors="coerce")
+    df.columns = [str(c).strip() for c in df.columns]
+    return df.dropna(how="all", axis=0).dropna(how="all", axis=1)
+
+
+def long_points(df: pd.DataFrame) -> pd.DataFrame:
+    """``(code, key, value)`` rows of *df*'s finite values, keyed by ISO date.
+
+    A code's last value for a date wins.
+    """
+    frame = df.apply(pd.to_numeric, errors="coerce")
+    frame.index = pd.to_datetime(frame.index, errors="coerce")
+    frame = frame.loc[frame.index.notna()]
+    frame.index = frame.index.strftime("%Y-%m-%d")
+    frame.columns = [str(c) for c in frame.columns]
+    rows = frame.rename_axis("key").reset_index().melt(id_vars="key", var_name="code", value_name="value")
+    rows = rows.loc[np.isfinite(rows["value"].to_numpy(dtype=float))]
+    rows = rows.drop_duplicates(["code", "key"], keep="last")
+    return rows[["code", "key", "value"]].reset_index(drop=True)
+
+
+def _copy_rows(db: SessionType, rows: pd.DataFrame) -> None:
+    """``COPY`` *rows* into ``ts_upload`` on *db*'s connection (same transaction)."""
+    buffer = io.StringIO()
+    rows.to_csv(buffer, header=False, index=False)
+    buffer.seek(0)
+    raw = db.connection().connection
+    with raw.cursor() as cur:
+        cur.copy_expert("COPY ts_upload (code, key, value) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def merge_columnar_to_db(df: pd.DataFrame, db: SessionType) -> dict:
+    """Merge a date-indexed DataFrame (columns=codes) into the database.
 
+    Points are staged in a temporary table with ``COPY`` and merged
+    server-side with one statement per :data:`MERGE_BATCH` rows; only
+    points that are new or differ from the stored value are written, and
+    stored histories are never read back.
+
+    Returns {"updated": [...], "not_found": [...], "points": int,
+    "changed": {code: points written}}.
+    """
+    from ix.db.models.cache import _cache_invalidate
+    from ix.db.query import clear_series_cache
+
+    codes_list = [str(c) for c in df.columns]
+    if not codes_list:
+        return {"updated": [], "not_found": [], "points": 0, "changed": {}}
+
+    found = set(db.execute(select(Timeseries.code).where(Timeseries.code.in_(codes_list))).scalars())
+    updated_codes = [c for c in codes_list if c in found]
+    not_found_codes = [c for c in codes_list if c not in found]
+    if not updated_codes:
+        return {"updated": [], "not_found": not_found_codes, "points": 0, "changed": {}}
+
+    rows = long_points(df.set_axis(codes_list, axis=1)[updated_codes])
+    changed = {code: 0 for code in updated_codes}
+    written_ids = set()
+    if not rows.empty:
+        db.execute(_STAGE)
+        for i in range(0, len(rows), MERGE_BATCH):
+            _copy_rows(db, rows.iloc[i : i + MERGE_BATCH])
+            for ts_id, code, n in db.execute(_MERGE):
+                changed[code] += n
+                written_ids.add(ts_id)
+            db.execute(text("TRUNCATE ts_upload"))
     db.commit()
+
+    for ts_id in written_ids:
+        _cache_invalidate(ts_id)
+    for code, n in changed.items():
+        if n:
+            clear_series_cache(code)
     return {
         "updated": updated_codes,
         "not_found": not_found_codes,
-        "points": total_points,
+        "points": len(rows),
+        "changed": changed,
     }
+
+
+def merge_response(result: dict) -> dict:
+    """Upload endpoint response for a :func:`merge_columnar_to_db` result."""
+    response = {
+        "message": f"Merged {result['points']} points for {len(result['updated'])} codes.",
+        "db_updated": result["updated"],
+        "db_points_merged": result["points"],
+        "db_changed": result["changed"],
+    }
+    if result["not_found"]:
+        response["warning"] = f"Codes not found in database: {result['not_found']}"
+    return response
+
+
+def ingest_columnar(body: bytes, content_type: str = "application/json") -> dict:
+    """Parse a columnar upload (see :func:`read_columnar`) and merge it into the DB.
+
+    Raises ValueError for bad input (caller should map to HTTP 400).
+    """
+    _t0 = _time.time()
+    df = read_columnar(body, content_type)
+    if df.empty:
+        raise ValueError("No valid records after cleaning.")
+
+    ensure_connection()
+    with Session() as db:
+        result = merge_columnar_to_db(df, db)
+    logger.info(
+        "Columnar upload: %d points for %d codes (%d changed) in %.1fs",
+        result["points"],
+        len(result["updated"]),
+        sum(result["changed"].values()),
+        _time.time() - _t0,
+    )
+    return merge_response(result)
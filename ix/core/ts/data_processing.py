@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, Optional
 
 import pandas as pd
 from sqlalchemy.orm import Session as SessionType
 
 from ix.common import get_logger
-from ix.db.models import Timeseries
+from ix.db.models import Timeseries, TimeseriesData
 
 logger = get_logger(__name__)
 
@@ -63,3 +64,56 @@ def process_database_timeseries(
         return None
 
     return None
+
+
+def _versions_query(db: SessionType):
+    return db.query(Timeseries.code, Timeseries.updated, TimeseriesData.updated).outerjoin(
+        TimeseriesData, TimeseriesData.timeseries_id == Timeseries.id
+    )
+
+
+def _latest_versions(rows) -> dict[str, Optional[datetime]]:
+    return {
+        code: max((t for t in (meta, data) if t is not None), default=None)
+        for code, meta, data in rows
+    }
+
+
+def timeseries_versions(
+    db: SessionType, codes: Iterable[str]
+) -> dict[str, Optional[datetime]]:
+    """``{code: data updated timestamp}`` for the codes that exist.
+
+    Reads only the two timestamp columns — no JSONB — so it is cheap
+    enough to run before deciding whether a response needs rebuilding.
+    A series whose metadata changed more recently than its data reports
+    the metadata timestamp.
+    """
+    codes = list(set(codes))
+    if not codes:
+        return {}
+    return _latest_versions(_versions_query(db).filter(Timeseries.code.in_(codes)).all())
+
+
+def live_codes(db: SessionType, codes: Iterable[str]) -> set[str]:
+    """The *codes* ``Series()`` fetches from a crawler instead of stored data."""
+    from ix.db.query import LIVE_SOURCES
+
+    codes = list(set(codes))
+    if not codes:
+        return set()
+    rows = (
+        db.query(Timeseries.code)
+        .filter(
+            Timeseries.code.in_(codes),
+            Timeseries.source.in_(sorted(LIVE_SOURCES)),
+            Timeseries.source_code.isnot(None),
+        )
+        .all()
+    )
+    return {code for (code,) in rows}
+
+
+def favorite_versions(db: SessionType) -> dict[str, Optional[datetime]]:
+    """:func:`timeseries_versions` of every favourite series, in one query."""
+    return _latest_versions(_versions_query(db).filter(Timeseries.favorite == True).all())
@@ -0,0 +1,164 @@
+"""Content-negotiated wire encodings for column-oriented timeseries frames.
+
+All encoders take the ``Date``-indexed frame produced by
+:func:`~ix.core.ts.formatting.prepare_custom_frame` (or an equivalent) and
+write columns straight from their numpy buffers:
+
+* ``application/json`` — the classic ``{"Date": [...], "<code>": [...]}``
+  document, serialised by orjson (NaN → ``null``).
+* ``application/x-ndjson`` — the same column document split into row
+  chunks, one JSON object per line, streamed so neither side holds the
+  whole payload.
+* ``application/vnd.apache.arrow.stream`` — Arrow IPC stream.
+* ``application/vnd.apache.parquet`` — Parquet file.
+
+The binary formats need ``pyarrow``; without it they are simply not
+offered during negotiation.
+"""
+
+from __future__ import annotations
+
+import io
+from typing import Iterator, Optional
+
+import numpy as np
+import orjson
+import pandas as pd
+
+from .formatting import column_values
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+JSON = "application/json"
+NDJSON = "application/x-ndjson"
+ARROW = "application/vnd.apache.arrow.stream"
+PARQUET = "application/vnd.apache.parquet"
+
+NDJSON_CHUNK_ROWS = 5000
+
+
+def available_formats() -> list[str]:
+    """Media types this process can produce, JSON first."""
+    formats = [JSON, NDJSON]
+    if pa is not None:
+        formats += [ARROW, PARQUET]
+    return formats
+
+
+def negotiate_format(accept: Optional[str]) -> str:
+    """Pick the response media type for an ``Accept`` header.
+
+    Media ranges are tried in descending ``q`` order (ties keep header
+    order); wildcards, a missing header, or nothing supported fall back
+    to JSON so existing clients are unaffected.
+    """
+    if not accept:
+        return JSON
+    supported = available_formats()
+    ranges = []
+    for pos, part in enumerate(accept.split(",")):
+        media, *params = [p.strip() for p in part.split(";")]
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            ranges.append((-q, pos, media.lower()))
+    for _, _, media in sorted(ranges):
+        if media in supported:
+            return media
+        if media in ("*/*", "application/*"):
+            return JSON
+    return JSON
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Encoders
+# ─────────────────────────────────────────────────────────────────────
+
+
+def _columns(df: pd.DataFrame) -> dict[str, object]:
+    """``{name: array}`` with the index first as ``Date``.
+
+    Numeric and naive datetime columns stay numpy arrays (orjson reads
+    the buffer directly; it would write NaT as a 1677 timestamp, so
+    datetime columns holding NaT are converted); anything else is
+    converted value by value.
+    """
+    out: dict[str, object] = {}
+    frame = df.reset_index()
+    frame.columns = ["Date", *[str(c) for c in df.columns]]
+    for name in frame.columns:
+        values = frame[name].to_numpy()
+        kind = values.dtype.kind
+        if kind in "fiub" or (kind == "M" and not np.isnat(values).any()):
+            out[name] = np.ascontiguousarray(values)
+        else:
+            out[name] = column_values(frame[name])
+    return out
+
+
+def encode_json(df: pd.DataFrame) -> bytes:
+    """Single JSON column document."""
+    return orjson.dumps(_columns(df), option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def iter_ndjson(df: pd.DataFrame, chunk_rows: int = NDJSON_CHUNK_ROWS) -> Iterator[bytes]:
+    """Column documents of at most *chunk_rows* rows, newline-delimited.
+
+    An empty frame still yields one line so clients always learn the
+    column set.
+    """
+    cols = _columns(df)
+    n = len(df)
+    for start in range(0, max(n, 1), chunk_rows):
+        chunk = {name: values[start:start + chunk_rows] for name, values in cols.items()}
+        yield orjson.dumps(
+            chunk, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+        )
+
+
+def _arrow_table(df: pd.DataFrame):
+    frame = df.reset_index()
+    frame.columns = ["Date", *[str(c) for c in df.columns]]
+    return pa.Table.from_pandas(frame, preserve_index=False)
+
+
+def encode_arrow(df: pd.DataFrame) -> bytes:
+    """Arrow IPC stream (zero-copy from the float64 column buffers)."""
+    table = _arrow_table(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def encode_parquet(df: pd.DataFrame) -> bytes:
+    """Parquet file (zstd-compressed)."""
+    buf = io.BytesIO()
+    pq.write_table(_arrow_table(df), buf, compression="zstd")
+    return buf.getvalue()
+
+
+def encode_frame(df: pd.DataFrame, media_type: str) -> bytes | Iterator[bytes]:
+    """Encode *df* for a negotiated media type.
+
+    Returns bytes, or an iterator of byte chunks for :data:`NDJSON`.
+    """
+    if media_type == NDJSON:
+        return iter_ndjson(df)
+    if media_type == ARROW:
+        return encode_arrow(df)
+    if media_type == PARQUET:
+        return encode_parquet(df)
+    return encode_json(df)
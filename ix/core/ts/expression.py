@@ -9,10 +9,10 @@ import pandas as pd
 
 from ix.common import get_logger
 from ix.common.security.safe_expression import (
-    TIMESERIES_EXPRESSION_CONTEXT,
     UnsafeExpressionError,
     safe_eval_expression,
     safe_exec_code,
+    timeseries_context,
 )
 from .formatting import _apply_date_bounds
 
@@ -31,7 +31,7 @@ def evaluate_expression(
             "Code %s not found in database, attempting to evaluate as expression",
             code,
         )
-        evaluated_series = safe_eval_expression(code, TIMESERIES_EXPRESSION_CONTEXT)
+        evaluated_series = safe_eval_expression(code, timeseries_context())
         series_list: List[pd.Series] = []
 
         if isinstance(evaluated_series, pd.Series):
@@ -73,7 +73,7 @@ def execute_code_block(code: str) -> dict:
     The code must assign its output to ``result``.
     Raises UnsafeExpressionError for blocked code, or Exception on failure.
     """
-    evaluated = safe_exec_code(code, TIMESERIES_EXPRESSION_CONTEXT)
+    evaluated = safe_exec_code(code, timeseries_context())
     if isinstance(evaluated, pd.Series):
         df = evaluated.to_frame()
     else:
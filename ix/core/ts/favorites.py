@@ -0,0 +1,239 @@
+"""Materialised favourites panel behind ``/timeseries/favorites``.
+
+The favourites view is the landing page for most users. Building it from
+scratch loads every favourite series, resamples each to daily and
+concatenates them. The panel keeps that daily-aligned frame instead, in
+two tiers:
+
+* the current frame in process memory, and
+* the ``favorites_panel`` row (:class:`~ix.db.models.FavoritesPanel`),
+  shared by every worker and surviving restarts, holding the frame as a
+  compressed ``.npz`` blob (:func:`encode_panel`).
+
+Every column remembers the data version (see :func:`favorite_versions`)
+it was built from. A read compares those with the current versions and
+rebuilds only what differs: series written since, new favourites, and
+dropped ones. Requests are then served by slicing the frame by date.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session as SessionType, joinedload
+
+from ix.db.models import FavoritesPanel, Timeseries
+
+from .data_processing import favorite_versions, process_database_timeseries
+from .formatting import empty_frame, normalize_dataframe_tz
+
+log = logging.getLogger(__name__)
+
+_KEY = "default"
+
+# In-memory tier: (versions, frame); the frame is never mutated in place
+_panel: Optional[tuple[dict[str, str], pd.DataFrame]] = None
+_panel_lock = threading.Lock()
+
+# Single-flight: one rebuild at a time
+_build_lock = threading.Lock()
+
+
+def _stamps(versions: dict[str, Optional[datetime]]) -> dict[str, str]:
+    return {code: v.isoformat() if v else "" for code, v in versions.items()}
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Encoding
+# ─────────────────────────────────────────────────────────────────────
+
+
+def encode_panel(df: pd.DataFrame) -> bytes:
+    """Compressed ``.npz`` of a daily panel: start date, length, codes, values."""
+    buf = io.BytesIO()
+    start = df.index[0] if len(df) else pd.Timestamp(0)
+    np.savez_compressed(
+        buf,
+        start=np.array(start.to_datetime64(), dtype="datetime64[D]"),
+        codes=np.array([str(c) for c in df.columns], dtype=str),
+        values=df.to_numpy(dtype="float64").reshape(len(df), len(df.columns)),
+    )
+    return buf.getvalue()
+
+
+def decode_panel(payload: bytes) -> pd.DataFrame:
+    """Inverse of :func:`encode_panel`."""
+    with np.load(io.BytesIO(payload), allow_pickle=False) as npz:
+        values = npz["values"]
+        index = pd.date_range(pd.Timestamp(npz["start"][()]), periods=len(values), freq="D", name="Date")
+        return pd.DataFrame(values, index=index, columns=[str(c) for c in npz["codes"]])
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Building
+# ─────────────────────────────────────────────────────────────────────
+
+
+def _daily(series: pd.Series) -> pd.Series:
+    """One panel column: naive daily ``last`` values, NaN days dropped."""
+    frame = normalize_dataframe_tz(series.to_frame())
+    return frame.iloc[:, 0].resample("D").last().dropna()
+
+
+def _load_columns(db: SessionType, codes: list[str]) -> dict[str, pd.Series]:
+    """Daily columns for *codes*; series without usable data are omitted."""
+    if not codes:
+        return {}
+    # One query for metadata and payloads instead of one lazy load per series
+    rows = (
+        db.query(Timeseries)
+        .options(joinedload(Timeseries.data_record))
+        .filter(Timeseries.code.in_(codes))
+        .all()
+    )
+    columns = {}
+    for ts in rows:
+        series = process_database_timeseries(ts, db)
+        if series is not None:
+            columns[ts.code] = _daily(series)
+    return columns
+
+
+def assemble_panel(columns: dict[str, pd.Series]) -> pd.DataFrame:
+    """Align daily columns on one continuous ``Date`` index, codes sorted.
+
+    Matches :func:`~ix.core.ts.formatting.prepare_favorites_frame` over the
+    same series without date bounds.
+    """
+    columns = {code: s for code, s in columns.items() if not s.empty}
+    if not columns:
+        return empty_frame()
+    codes = sorted(columns)
+    df = pd.concat([columns[c].rename(c) for c in codes], axis=1)
+    index = pd.date_range(df.index.min(), df.index.max(), freq="D", name="Date")
+    return df.reindex(index)
+
+
+def _rebuild(
+    db: SessionType,
+    wanted: dict[str, str],
+    base: Optional[tuple[dict[str, str], pd.DataFrame]],
+) -> pd.DataFrame:
+    built, frame = base or ({}, empty_frame())
+    stale = sorted(code for code, version in wanted.items() if built.get(code) != version)
+    columns = {
+        code: frame[code].dropna()
+        for code in frame.columns
+        if code in wanted and code not in stale
+    }
+    columns.update(_load_columns(db, stale))
+    log.info("Favorites panel: rebuilt %d of %d series", len(stale), len(wanted))
+    return assemble_panel(columns)
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Tiers
+# ─────────────────────────────────────────────────────────────────────
+
+
+def _memory_get() -> Optional[tuple[dict[str, str], pd.DataFrame]]:
+    with _panel_lock:
+        return _panel
+
+
+def _memory_put(versions: dict[str, str], frame: pd.DataFrame) -> None:
+    global _panel
+    with _panel_lock:
+        _panel = (versions, frame)
+
+
+def _store_load(db: SessionType) -> Optional[tuple[dict[str, str], pd.DataFrame]]:
+    try:
+        row = db.get(FavoritesPanel, _KEY)
+        if row is None:
+            return None
+        return dict(row.versions or {}), decode_panel(row.payload)
+    except Exception as exc:
+        log.warning("Favorites panel: load failed: %s", exc)
+        db.rollback()
+        return None
+
+
+def _store_save(db: SessionType, versions: dict[str, str], frame: pd.DataFrame) -> None:
+    try:
+        row = db.get(FavoritesPanel, _KEY)
+        if row is None:
+            row = FavoritesPanel(key=_KEY)
+            db.add(row)
+        row.versions = versions
+        row.payload = encode_panel(frame)
+        row.computed_at = datetime.now(timezone.utc)
+        db.commit()
+    except Exception as exc:
+        log.warning("Favorites panel: save failed: %s", exc)
+        db.rollback()
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Public API
+# ─────────────────────────────────────────────────────────────────────
+
+
+def favorites_panel(
+    db: SessionType, versions: Optional[dict[str, Optional[datetime]]] = None
+) -> pd.DataFrame:
+    """Daily frame of every favourite series, up to date with *versions*.
+
+    Args:
+        db: Session used for version lookups, series loads and the store.
+        versions: ``{code: data version}`` of the favourites, as returned
+            by :func:`favorite_versions`; looked up when omitted.
+
+    Returns:
+        The shared panel; callers must not modify it (slice it with
+        :func:`~ix.core.ts.formatting.slice_dates`).
+    """
+    wanted = _stamps(favorite_versions(db) if versions is None else versions)
+
+    current = _memory_get()
+    if current is not None and current[0] == wanted:
+        return current[1]
+
+    with _build_lock:
+        # Another request, or another worker via the store, may have caught up
+        current = _memory_get()
+        if current is not None and current[0] == wanted:
+            return current[1]
+        stored = _store_load(db)
+        if stored is not None and stored[0] == wanted:
+            _memory_put(*stored)
+            return stored[1]
+
+        frame = _rebuild(db, wanted, stored or current)
+        _memory_put(wanted, frame)
+        _store_save(db, wanted, frame)
+        return frame
+
+
+def refresh_favorites_panel() -> None:
+    """Bring the panel up to date, e.g. after a data refresh or at startup."""
+    from ix.db.conn import Session
+
+    try:
+        with Session() as session:
+            favorites_panel(session)
+    except Exception as exc:
+        log.warning("Favorites panel refresh failed: %s", exc)
+
+
+def clear_memory() -> None:
+    """Drop the in-memory tier (the table is untouched)."""
+    global _panel
+    with _panel_lock:
+        _panel = None
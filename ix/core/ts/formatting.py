@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import math
 from collections import OrderedDict
 from datetime import datetime
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
 
@@ -48,16 +48,18 @@ def normalize_dataframe_tz(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def format_dataframe_to_column_dict(
+def empty_frame() -> pd.DataFrame:
+    """Frame with an empty ``Date`` index and no columns."""
+    return pd.DataFrame(index=pd.DatetimeIndex([], name="Date"))
+
+
+def prepare_custom_frame(
     df: pd.DataFrame,
     series_list: List[pd.Series],
     start_date: Optional[str],
     end_date: Optional[str],
-) -> OrderedDict:
-    """Convert a DataFrame into column-oriented OrderedDict for JSON response.
-
-    This is a pure-data function: the router wraps the result in a Response.
-    """
+) -> pd.DataFrame:
+    """Daily, date-bounded, input-ordered frame behind ``/timeseries.custom``."""
     df.index.name = "Date"
 
     # Optional date bounds
@@ -92,32 +94,54 @@ def format_dataframe_to_column_dict(
     df = df[present_in_order]
 
     # Sort dates ascending
-    df = df.sort_index(ascending=True)
-
-    return _dataframe_to_column_dict(df)
+    return df.sort_index(ascending=True)
 
 
-def format_favorites_dataframe(
+def format_dataframe_to_column_dict(
+    df: pd.DataFrame,
     series_list: List[pd.Series],
     start_date: Optional[str],
     end_date: Optional[str],
 ) -> OrderedDict:
-    """Concatenate favorite timeseries and return column-oriented OrderedDict."""
+    """Convert a DataFrame into column-oriented OrderedDict for JSON response.
+
+    This is a pure-data function: the router wraps the result in a Response.
+    """
+    return _dataframe_to_column_dict(
+        prepare_custom_frame(df, series_list, start_date, end_date)
+    )
+
+
+def prepare_favorites_frame(
+    series_list: List[pd.Series],
+    start_date: Optional[str],
+    end_date: Optional[str],
+) -> pd.DataFrame:
+    """Daily, date-bounded frame of the favourite series (``Date`` index)."""
     if not series_list:
-        return OrderedDict({"Date": []})
+        return empty_frame()
 
     df = pd.concat(series_list, axis=1)
     df.index.name = "Date"
 
-    # Optional date slicing
-    start_ts = pd.to_datetime(start_date, errors="coerce") if start_date else None
-    end_ts = pd.to_datetime(end_date, errors="coerce") if end_date else None
-
     # Normalize timezone info
     df = normalize_dataframe_tz(df)
 
     df = df.resample("D").last()
 
+    return slice_dates(df, start_date, end_date)
+
+
+def slice_dates(
+    df: pd.DataFrame, start_date: Optional[str], end_date: Optional[str]
+) -> pd.DataFrame:
+    """Rows of *df* within the optional ISO-8601 bounds, dates ascending.
+
+    Unparseable bounds are ignored. Always returns a new frame.
+    """
+    start_ts = pd.to_datetime(start_date, errors="coerce") if start_date else None
+    end_ts = pd.to_datetime(end_date, errors="coerce") if end_date else None
+
     if isinstance(start_ts, pd.Timestamp):
         start_ts = normalize_timezone(start_ts)
     if isinstance(end_ts, pd.Timestamp):
@@ -130,26 +154,64 @@ def format_favorites_dataframe(
         df = df[df.index <= end_ts]
 
     # Sort dates ascending
-    df = df.sort_index(ascending=True)
+    return df.sort_index(ascending=True)
 
-    return _dataframe_to_column_dict(df)
+
+def format_favorites_dataframe(
+    series_list: List[pd.Series],
+    start_date: Optional[str],
+    end_date: Optional[str],
+) -> OrderedDict:
+    """Concatenate favorite timeseries and return column-oriented OrderedDict."""
+    if not series_list:
+        return OrderedDict({"Date": []})
+    return _dataframe_to_column_dict(
+        prepare_favorites_frame(series_list, start_date, end_date)
+    )
 
 
 def _dataframe_to_column_dict(df: pd.DataFrame) -> OrderedDict:
     """Convert a DataFrame to an OrderedDict of columns (JSON-serialisable)."""
     df_indexed = df.reset_index()
     column_dict = OrderedDict()
-
     for col in df_indexed.columns:
-        values = df_indexed[col].tolist()
-        cleaned_values = []
-        for v in values:
-            if v is None or (isinstance(v, float) and math.isnan(v)):
-                cleaned_values.append(None)
-            elif isinstance(v, (pd.Timestamp, datetime)):
-                cleaned_values.append(v.isoformat())
-            else:
-                cleaned_values.append(v)
-        column_dict[col] = cleaned_values
-
+        column_dict[col] = column_values(df_indexed[col])
     return column_dict
+
+
+def column_values(col: pd.Series) -> list:
+    """JSON-ready values of one column: NaN/NaT → ``None``, dates → ISO-8601.
+
+    Numeric and naive datetime columns are converted from their numpy
+    buffer in bulk; only object / extension columns fall back to a
+    per-value loop.
+    """
+    values = col.to_numpy()
+    kind = values.dtype.kind
+    if kind == "f":
+        out = values.astype(object)
+        out[np.isnan(values)] = None
+        return out.tolist()
+    if kind in "iub":
+        return values.tolist()
+    if kind == "M":
+        # isoformat() omits the fraction on whole seconds
+        seconds = values.astype("datetime64[s]")
+        text = np.datetime_as_string(seconds, unit="s")
+        fractional = (seconds != values) & ~np.isnat(values)
+        if fractional.any():
+            text = np.where(
+                fractional, np.datetime_as_string(values, unit="us"), text
+            )
+        out = text.astype(object)
+        out[np.isnat(values)] = None
+        return out.tolist()
+    return [_clean_value(v) for v in values.tolist()]
+
+
+def _clean_value(v):
+    if v is None or (isinstance(v, float) and v != v):
+        return None
+    if isinstance(v, (pd.Timestamp, datetime)):
+        return v.isoformat()
+    return v
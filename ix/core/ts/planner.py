@@ -0,0 +1,195 @@
+"""Evaluation planner for batches of timeseries codes and expressions.
+
+``/timeseries.custom`` receives a mix of stored codes and expressions
+(``Series('A') / Series('B')``, spreads, ratios, …). Evaluated one at a
+time, every expression re-queries each series it references. The planner
+instead:
+
+1. parses every expression up front and collects the ``Series('…')``
+   codes it references,
+2. bulk-loads the requested codes and all referenced series in one query,
+3. evaluates the expressions concurrently against that preloaded set
+   (``Series()`` reads it via :func:`ix.db.query.preloaded_series`).
+
+Results come back in request order, exactly as the serial loop produced
+them.
+"""
+
+from __future__ import annotations
+
+import ast
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional
+
+import pandas as pd
+from sqlalchemy.orm import Session as SessionType
+
+from ix.common import get_logger
+from ix.db.query import (
+    PreloadedSeries,
+    bulk_load_timeseries,
+    canonical_code,
+    preloaded_series,
+)
+from .data_processing import live_codes, process_database_timeseries, timeseries_versions
+from .expression import evaluate_expression
+
+logger = get_logger(__name__)
+
+# Shared across requests so a burst of large requests cannot fan out
+# into an unbounded number of threads.
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ts-eval")
+
+
+# Context callables that only transform their arguments (no data access)
+_PURE_CALLABLES = frozenset({
+    "MultiSeries", "Resample", "PctChange", "Diff", "MovingAverage",
+    "MonthEndOffset", "MonthsOffset", "Offset", "StandardScalar", "Clip",
+    "Ffill", "Drawdown", "Rebase",
+    "abs", "round", "min", "max", "len", "int", "float", "str",
+    "range", "enumerate", "zip", "list", "dict", "tuple", "set",
+})
+
+
+def _series_references(expression: str) -> tuple[set[str], bool]:
+    """(canonical literal codes, whether those are *all* the data it reads)."""
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except (SyntaxError, ValueError):
+        return set(), False
+    codes: set[str] = set()
+    complete = True
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)):
+            continue
+        if node.func.id != "Series":
+            # Indicator functions may load series of their own
+            if node.func.id not in _PURE_CALLABLES:
+                complete = False
+            continue
+        # ccy= converts with FX series that are not literal references
+        ccy = node.args[3] if len(node.args) > 3 else next(
+            (kw.value for kw in node.keywords if kw.arg == "ccy"), None
+        )
+        if ccy is not None and not (isinstance(ccy, ast.Constant) and ccy.value is None):
+            complete = False
+        arg = node.args[0] if node.args else next(
+            (kw.value for kw in node.keywords if kw.arg == "code"), None
+        )
+        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+            codes.add(canonical_code(arg.value))
+        else:
+            complete = False
+    return codes, complete
+
+
+def referenced_series(expression: str) -> set[str]:
+    """Canonical codes of every literal ``Series('…')`` call in *expression*.
+
+    Unparseable expressions reference nothing; the evaluator reports the
+    syntax error itself.
+    """
+    return _series_references(expression)[0]
+
+
+def resolved_references(expression: str) -> Optional[set[str]]:
+    """Like :func:`referenced_series`, but ``None`` unless *every* series
+    the expression reads is a literal — i.e. its inputs are fully known
+    without evaluating it (required before caching on input versions).
+    """
+    codes, complete = _series_references(expression)
+    return codes if complete else None
+
+
+def data_versions(
+    db: SessionType, codes: List[str]
+) -> Optional[dict[str, Optional[datetime]]]:
+    """Data versions of every series behind *codes* (stored codes or expressions).
+
+    Returns ``{code: updated}`` (``None`` for codes that do not exist), or
+    ``None`` when some expression's inputs cannot be determined statically
+    or are fetched live (``Series()`` of a Yahoo / FRED / Naver series,
+    whose stored row lags the crawler) — then the result must not be
+    validated against versions at all.
+    """
+    refs: set[str] = set()
+    unresolved = []
+    for code in codes:
+        found = resolved_references(code)
+        if found is None:
+            unresolved.append(code)
+        else:
+            refs |= found
+    versions = timeseries_versions(db, set(codes) | refs)
+    if any(code not in versions for code in unresolved):
+        return None
+    if live_codes(db, refs):
+        return None
+    return {code: versions.get(code) for code in sorted(set(codes) | refs)}
+
+
+def preload(ts) -> PreloadedSeries:
+    """A loaded ``Timeseries`` (with its data record) as served to ``Series()``."""
+    data = process_database_timeseries(ts, None)
+    if data is None:
+        data = pd.Series(name=ts.code, dtype=float)
+    return PreloadedSeries(
+        start=ts.start,
+        currency=ts.currency or "",
+        scale=ts.scale,
+        source=str(ts.source or ""),
+        source_code=ts.source_code,
+        data=data,
+    )
+
+
+def evaluate_codes(
+    db: SessionType,
+    codes: List[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+) -> List[pd.Series]:
+    """Series for each stored code or expression in *codes*, in order.
+
+    Codes that fail to load or evaluate are skipped (logged), matching
+    the per-code behaviour of ``/timeseries.custom``.
+    """
+    expressions = {code: referenced_series(code) for code in codes}
+    referenced = set().union(*expressions.values()) if expressions else set()
+
+    # One round trip for the requested codes and everything they reference
+    loaded = bulk_load_timeseries(db, list(set(codes) | referenced))
+
+    preloaded = {}
+    for code in referenced:
+        ts = loaded.get(code)
+        if ts is not None and ts.data_record is not None:
+            preloaded[code] = preload(ts)
+
+    results: dict[int, List[pd.Series]] = {}
+    futures = {}
+    with preloaded_series(preloaded):
+        for i, code in enumerate(codes):
+            ts = loaded.get(code)
+            if ts is not None:
+                try:
+                    ts_data = process_database_timeseries(ts, db)
+                    if ts_data is not None:
+                        results[i] = [ts_data]
+                except Exception as e:
+                    logger.warning("Error processing custom timeseries %s: %s", code, e)
+                continue
+            ctx = contextvars.copy_context()
+            futures[i] = _executor.submit(
+                ctx.run, evaluate_expression, code, start_date, end_date
+            )
+
+    for i, future in futures.items():
+        try:
+            results[i] = future.result()
+        except Exception as e:
+            logger.warning("Error processing custom timeseries %s: %s", codes[i], e)
+
+    return [s for i in sorted(results) for s in results[i]]
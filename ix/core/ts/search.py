@@ -1,15 +1,25 @@
-"""Timeseries search filtering and ranking (PostgreSQL FTS + LIKE fallback)."""
+"""Timeseries search filtering and ranking (PostgreSQL FTS + LIKE fallback).
+
+On PostgreSQL the full-text match reads the stored ``search_vector``
+column (GIN) and prefix matches hit pg_trgm indexes on ``lower(col)``,
+so type-ahead queries are index scans rather than sequential scans.
+"""
 
 from __future__ import annotations
 
 import re
+from typing import Optional
 
 
-def build_search_filter_and_order(query, search: str, Timeseries_model):
+def build_search_filter_and_order(
+    query, search: str, Timeseries_model, dialect_name: Optional[str] = None
+):
     """Apply search filtering and ranking to a timeseries SQLAlchemy query.
 
     Returns the modified query with filters and ordering applied.
     Works with both PostgreSQL (weighted FTS) and other backends (LIKE fallback).
+    *query* may be a session ``Query`` or a 2.0-style ``select()``; the
+    latter has no bound session, so pass *dialect_name* for it.
     """
     from sqlalchemy import and_, case, func, or_
 
@@ -28,77 +38,22 @@ def build_search_filter_and_order(query, search: str, Timeseries_model):
     country_l = func.lower(func.coalesce(Timeseries_model.country, ""))
     source_code_l = func.lower(func.coalesce(Timeseries_model.source_code, ""))
 
-    dialect_name = (
-        getattr(getattr(query.session, "bind", None), "dialect", None).name
-        if getattr(getattr(query.session, "bind", None), "dialect", None) is not None
-        else ""
-    )
+    if dialect_name is None:
+        bind = getattr(getattr(query, "session", None), "bind", None)
+        dialect = getattr(bind, "dialect", None)
+        dialect_name = dialect.name if dialect is not None else ""
 
     if dialect_name == "postgresql":
-        # Weighted FTS vector:
+        # Stored, GIN-indexed weighted vector (Timeseries.search_vector):
         # code/name strongest; metadata moderate; source_code lower.
-        search_vector = (
-            func.setweight(
-                func.to_tsvector("simple", func.coalesce(Timeseries_model.code, "")),
-                "A",
-            )
-            .op("||")(
-                func.setweight(
-                    func.to_tsvector(
-                        "simple", func.coalesce(Timeseries_model.name, "")
-                    ),
-                    "A",
-                )
-            )
-            .op("||")(
-                func.setweight(
-                    func.to_tsvector(
-                        "simple", func.coalesce(Timeseries_model.source, "")
-                    ),
-                    "B",
-                )
-            )
-            .op("||")(
-                func.setweight(
-                    func.to_tsvector(
-                        "simple", func.coalesce(Timeseries_model.category, "")
-                    ),
-                    "B",
-                )
-            )
-            .op("||")(
-                func.setweight(
-                    func.to_tsvector(
-                        "simple", func.coalesce(Timeseries_model.provider, "")
-                    ),
-                    "C",
-                )
-            )
-            .op("||")(
-                func.setweight(
-                    func.to_tsvector(
-                        "simple", func.coalesce(Timeseries_model.asset_class, "")
-                    ),
-                    "C",
-                )
-            )
-            .op("||")(
-                func.setweight(
-                    func.to_tsvector(
-                        "simple", func.coalesce(Timeseries_model.country, "")
-                    ),
-                    "D",
-                )
-            )
-            .op("||")(
-                func.setweight(
-                    func.to_tsvector(
-                        "simple", func.coalesce(Timeseries_model.source_code, "")
-                    ),
-                    "D",
-                )
-            )
-        )
+        search_vector = Timeseries_model.search_vector
+        # Prefix and equality terms use bare lower(col) so they match the
+        # trigram expression indexes; NULL never matches a non-empty term.
+        code_l = func.lower(Timeseries_model.code)
+        name_l = func.lower(Timeseries_model.name)
+        source_l = func.lower(Timeseries_model.source)
+        category_l = func.lower(Timeseries_model.category)
+        source_code_l = func.lower(Timeseries_model.source_code)
         ts_query = func.plainto_tsquery("simple", term)
 
         # Keep prefix path so incremental typing ("sp", "usd") still feels responsive.
@@ -1,15 +1,23 @@
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, scoped_session, declarative_base
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import SQLAlchemyError, OperationalError
 from ix.common import Settings, get_logger
+import asyncio
 import time
 import os
 import threading
-from typing import Optional
+from typing import Any, List, Optional
 from contextlib import contextmanager
 from urllib.parse import urlparse, urlunparse
 
+try:
+    import asyncpg  # noqa: F401  (driver for the optional async engine)
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+except ImportError:
+    asyncpg = None
+
 logger = get_logger(__name__)
 
 Base = declarative_base()
@@ -22,6 +30,11 @@ class Connection:
         self.engine = None
         self.SessionLocal = None
         self.Session = None  # scoped_session
+        self.async_engine = None
+        self.AsyncSessionLocal = None
+        self._async_disabled = False
+        self._async_verified = False
+        self._dispose_task = None
         self._is_connected = False
         self._lock = threading.Lock()
 
@@ -76,8 +89,8 @@ class Connection:
                 self.engine = create_engine(
                     db_url,
                     poolclass=QueuePool,
-                    pool_size=10,
-                    max_overflow=10,
+                    pool_size=settings.db_pool_size,
+                    max_overflow=settings.db_max_overflow,
                     pool_pre_ping=True,  # Verify connections before using them
                     pool_recycle=3600,  # Recycle connections after 1 hour
                     echo=False,  # Set to True for SQL query logging
@@ -134,6 +147,69 @@ class Connection:
         logger.error(f"Failed to connect to PostgreSQL after {max_retries} attempts")
         return False
 
+    def connect_async(self) -> bool:
+        """Create the optional asyncpg engine for read-heavy endpoints.
+
+        Returns ``False`` (callers fall back to the sync engine) when
+        asyncpg is not installed, ``DB_ASYNC`` is off, or the async engine
+        failed on first use. Creating the engine does no I/O.
+        """
+        if self.AsyncSessionLocal is not None:
+            return True
+        settings = Settings()
+        if asyncpg is None or self._async_disabled or not settings.db_async:
+            return False
+
+        with self._lock:
+            if self.AsyncSessionLocal is not None:
+                return True
+            try:
+                self.async_engine = create_async_engine(
+                    async_url(settings.db_url),
+                    pool_size=settings.db_async_pool_size,
+                    max_overflow=settings.db_async_max_overflow,
+                    pool_pre_ping=True,
+                    pool_recycle=3600,
+                    connect_args={
+                        "timeout": 10,
+                        "server_settings": {"statement_timeout": "30000"},
+                    },
+                )
+                self.AsyncSessionLocal = async_sessionmaker(
+                    self.async_engine, autoflush=False, expire_on_commit=False
+                )
+            except Exception as e:
+                self.disable_async(e)
+                return False
+        return True
+
+    def disable_async(self, reason: Exception) -> None:
+        """Route all reads through the sync engine from now on.
+
+        The async engine's pooled connections are closed (on the running
+        loop, when there is one).
+        """
+        logger.warning(f"Async DB engine disabled, using sync engine: {reason}")
+        self._async_disabled = True
+        self.AsyncSessionLocal = None
+        engine, self.async_engine = self.async_engine, None
+        if engine is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop: the engine never opened an asyncpg connection
+            engine.sync_engine.dispose(close=False)
+            return
+        self._dispose_task = loop.create_task(engine.dispose())
+
+    async def dispose_async(self) -> None:
+        """Close the async engine's pooled connections (app shutdown)."""
+        if self.async_engine is not None:
+            await self.async_engine.dispose()
+            self.async_engine = None
+            self.AsyncSessionLocal = None
+
     def disconnect(self):
         """Safely closes the PostgreSQL connection."""
         if self.Session is not None:
@@ -254,6 +330,65 @@ def Session():
         session.close()
 
 
+# Query options asyncpg understands; the rest of a libpq DB_URL
+# (channel_binding, connect_timeout, gssencmode, ...) would be passed
+# through as unknown connect() keywords.
+_ASYNCPG_QUERY = {"ssl", "target_session_attrs", "prepared_statement_cache_size"}
+
+
+def async_url(db_url: str):
+    """Translate a libpq ``DB_URL`` into an asyncpg SQLAlchemy URL."""
+    url = make_url(db_url).set(drivername="postgresql+asyncpg")
+    query = dict(url.query)
+    if "sslmode" in query:  # libpq spelling → asyncpg's
+        query["ssl"] = query.pop("sslmode")
+    dropped = sorted(set(query) - _ASYNCPG_QUERY)
+    if dropped:
+        logger.debug(f"Async DB URL: ignoring libpq-only options {dropped}")
+    return url.set(query={k: v for k, v in query.items() if k in _ASYNCPG_QUERY})
+
+
+def _fetch_sync(stmt, scalars: bool) -> List[Any]:
+    with Session() as session:
+        result = session.execute(stmt)
+        return result.scalars().all() if scalars else result.all()
+
+
+async def fetch_all(stmt, *, scalars: bool = False) -> List[Any]:
+    """Run a read-only ``select`` without holding a threadpool slot.
+
+    Uses the async (asyncpg) engine when available; otherwise runs the
+    statement on the sync engine in a worker thread. ORM entities come
+    back detached with their column attributes loaded, so only select
+    what the caller reads (relationships are not lazy-loadable).
+
+    Args:
+        stmt: A SQLAlchemy ``select()``.
+        scalars: Return the first column of each row instead of rows.
+    """
+    if conn.connect_async():
+        try:
+            async with conn.AsyncSessionLocal() as session:
+                result = await session.execute(stmt)
+                rows = result.scalars().all() if scalars else result.all()
+            conn._async_verified = True
+            return rows
+        except Exception as e:
+            # A misconfigured async path (driver, URL options, network)
+            # must not take reads down with it; once it has worked,
+            # errors are real and propagate.
+            if conn._async_verified:
+                raise
+            conn.disable_async(e)
+    return await asyncio.to_thread(_fetch_sync, stmt, scalars)
+
+
+async def fetch_first(stmt, *, scalars: bool = True) -> Any:
+    """First result of :func:`fetch_all` on ``stmt.limit(1)``, or ``None``."""
+    rows = await fetch_all(stmt.limit(1), scalars=scalars)
+    return rows[0] if rows else None
+
+
 def ensure_connection():
     """Ensure database connection is established."""
     if not conn.is_connected():
@@ -21,6 +21,8 @@ from .timeseries import Timeseries, TimeseriesData
 from .universe import Universe
 from .research_file import ResearchFile
 from .regime_snapshot import RegimeSnapshot, regime_fingerprint
+from .regime_result import RegimeResult, result_fingerprint
+from .favorites_panel import FavoritesPanel
 from .cache import _cache_get, _cache_put, _cache_invalidate
 
 __all__ = [
@@ -45,6 +47,9 @@ __all__ = [
     "ResearchFile",
     "RegimeSnapshot",
     "regime_fingerprint",
+    "RegimeResult",
+    "result_fingerprint",
+    "FavoritesPanel",
     "all_models",
 ]
 
@@ -69,4 +74,6 @@ def all_models() -> list:
         CreditWatchlist,
         ResearchFile,
         RegimeSnapshot,
+        RegimeResult,
+        FavoritesPanel,
     ]
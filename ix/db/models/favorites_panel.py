@@ -0,0 +1,29 @@
+"""Materialised favourites panel (see ``ix.core.ts.favorites``)."""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, LargeBinary, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from ix.db.conn import Base
+
+
+class FavoritesPanel(Base):
+    """The daily-aligned frame of every favourite series, as one blob.
+
+    ``versions`` maps each column's code to the data version it was built
+    from, so readers can tell which columns are stale without loading any
+    series. ``payload`` is the frame encoded by
+    :func:`ix.core.ts.favorites.encode_panel`.
+    """
+
+    __tablename__ = "favorites_panel"
+
+    key = Column(String(64), primary_key=True)
+    versions = Column(JSONB, nullable=False, default=dict)
+    payload = Column(LargeBinary, nullable=False)
+    computed_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -0,0 +1,76 @@
+"""Durable store for on-demand regime results (compositions, ensembles).
+
+Unlike :class:`RegimeSnapshot`, these rows are produced on request by the
+``/regimes/compose`` and ``/regimes/ensemble`` endpoints. The
+*fingerprint* (primary key) covers the result kind, the input regime keys,
+the parameters and the versions of the input data (the ``computed_at`` of
+each input regime's snapshot), so a row is never served once any input
+has been refreshed. ``hit_count`` drives the startup warm-up.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from ix.db.conn import Base
+
+
+def result_fingerprint(
+    kind: str,
+    keys: list[str],
+    params: dict,
+    versions: dict[str, str],
+) -> str:
+    """Deterministic fingerprint from kind + keys + params + input versions.
+
+    >>> result_fingerprint("compose", ["growth", "inflation"], {}, {})
+    'compose:...'
+    """
+    canonical = json.dumps(
+        {"keys": sorted(keys), "params": params, "versions": versions},
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(canonical.encode()).hexdigest()[:16]
+    return f"{kind}:{digest}"
+
+
+class RegimeResult(Base):
+    """Stores computed composition / ensemble payloads.
+
+    One row per (kind, keys, params, input versions). Stale rows (an
+    input was refreshed) are simply never looked up again and are
+    replaced by the next computation for the same ``cache_key``.
+    """
+
+    __tablename__ = "regime_result"
+    __table_args__ = (
+        Index("ix_rr_kind_key", "kind", "cache_key"),
+        Index("ix_rr_hits", "hit_count"),
+    )
+
+    # ── Identity ────────────────────────────────────────────────────
+    fingerprint = Column(String(128), primary_key=True)
+    kind = Column(String(32), nullable=False)
+    cache_key = Column(Text, nullable=False)
+
+    # ── Reproducibility ─────────────────────────────────────────────
+    keys = Column(JSONB, nullable=False)
+    parameters = Column(JSONB, nullable=False)
+    versions = Column(JSONB, nullable=False)
+
+    # ── Result ──────────────────────────────────────────────────────
+    payload = Column(JSONB, nullable=False)
+    computed_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    # ── Usage (warm-up ranking) ─────────────────────────────────────
+    hit_count = Column(Integer, nullable=False, default=0)
+    last_accessed = Column(DateTime(timezone=True), nullable=True)
@@ -13,8 +13,9 @@ from __future__ import annotations
 import hashlib
 import json
 
-from sqlalchemy import Column, DateTime, Index, String, func
+from sqlalchemy import Column, DateTime, Index, LargeBinary, String, func
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred
 
 from ix.db.conn import Base
 
@@ -45,6 +46,9 @@ class RegimeSnapshot(Base):
     | asset_analytics |  Yes  | Asset Performance, Playbook               |
     | meta            |  Yes  | Model (methodology docs)                  |
     +-----------------+-------+-------------------------------------------+
+
+    *frame* is not served: it holds the last built DataFrame (Parquet) so
+    ``RegimeComputer.update`` can resume from it in any process.
     """
 
     __tablename__ = "regime_snapshot"
@@ -72,3 +76,6 @@ class RegimeSnapshot(Base):
     strategy = Column(JSONB, nullable=True)
     asset_analytics = Column(JSONB, nullable=True)
     meta = Column(JSONB, nullable=True)
+
+    # ── Incremental refresh state ───────────────────────────────────
+    frame = deferred(Column(LargeBinary, nullable=True))
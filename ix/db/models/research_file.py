@@ -1,6 +1,6 @@
 """ResearchFile ORM model."""
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, LargeBinary, String, Text, func, text
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, LargeBinary, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 
 from ix.db.conn import Base
@@ -22,3 +22,13 @@ class ResearchFile(Base):
     created_at = Column(DateTime, default=func.now(), nullable=False)
     is_deleted = Column(Boolean, nullable=False, default=False, index=True)
     deleted_at = Column(DateTime, nullable=True)
+
+    # Keyset order of the library listing (see ix.db.pagination)
+    __table_args__ = (
+        Index(
+            "ix_research_files_listing",
+            filename.desc(),
+            id.desc(),
+            postgresql_where=is_deleted == False,
+        ),
+    )
@@ -9,6 +9,7 @@ import pandas as pd
 from sqlalchemy import (
     Boolean,
     Column,
+    Computed,
     Date,
     DateTime,
     Float,
@@ -20,8 +21,8 @@ from sqlalchemy import (
     func,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
 from ix.common import get_logger
 from ix.db.conn import Base
@@ -29,6 +30,26 @@ from .cache import _cache_get, _cache_invalidate, _cache_put
 
 logger = get_logger(__name__)
 
+# Weighted full-text document used by ix.core.ts.search: code/name
+# strongest, metadata moderate, source_code lowest.
+SEARCH_VECTOR_SQL = " || ".join(
+    f"setweight(to_tsvector('simple', coalesce({column}, '')), '{weight}')"
+    for column, weight in (
+        ("code", "A"),
+        ("name", "A"),
+        ("source", "B"),
+        ("category", "B"),
+        ("provider", "C"),
+        ("asset_class", "C"),
+        ("country", "D"),
+        ("source_code", "D"),
+    )
+)
+
+# Columns type-ahead search matches by ``lower(col) LIKE 'term%'``; each
+# gets a pg_trgm index on that expression (see startup migrations).
+SEARCH_PREFIX_COLUMNS = ("code", "name", "source", "category", "source_code")
+
 
 class Timeseries(Base):
     """Timeseries model with metadata and associated data payload."""
@@ -37,6 +58,7 @@ class Timeseries(Base):
     __table_args__ = (
         Index("ix_timeseries_source_code", "source", "code"),
         Index("ix_timeseries_source_source_code", "source", "source_code"),
+        Index("ix_timeseries_search_vector", "search_vector", postgresql_using="gin"),
     )
 
     id = Column(
@@ -63,6 +85,8 @@ class Timeseries(Base):
     latest_value = Column(Float, nullable=True)
     is_deleted = Column(Boolean, nullable=False, default=False, index=True)
     deleted_at = Column(DateTime, nullable=True)
+    # Maintained by PostgreSQL on insert/update; only search reads it
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
 
     # Legacy JSONB column retained for migration/backward compatibility.
     created = Column(DateTime, default=func.now(), nullable=False)
@@ -213,19 +237,23 @@ class Timeseries(Base):
         """Set timeseries data from pandas Series or dict."""
         from ix.db.conn import Session
 
+        data = self._clean_data(data)
+        if data.empty:
+            return
+
+        with Session() as session:
+            self._save_data_logic(data, session)
+
+    @staticmethod
+    def _clean_data(data) -> pd.Series:
+        """Numeric, date-indexed, sorted Series with unparseable points dropped."""
         if isinstance(data, dict):
             data = pd.Series(data)
         data.index = pd.to_datetime(data.index, format="%Y-%m-%d", errors="coerce")
         data = pd.to_numeric(data, errors="coerce")
         data = data.dropna()
         data = data[~data.index.isna()]
-        data = data.sort_index()
-
-        if data.empty:
-            return
-
-        with Session() as session:
-            self._save_data_logic(data, session)
+        return data.sort_index()
 
     def _save_data_logic(self, data, session) -> None:
         """Core logic for saving timeseries data to a session."""
@@ -0,0 +1,146 @@
+"""Keyset (cursor) pagination and bounded row counts for listing endpoints.
+
+``OFFSET n`` makes PostgreSQL produce and discard ``n`` rows for every
+page, and an exact ``count(*)`` re-scans the whole filtered set on every
+request. Listings instead hand out an opaque cursor holding the sort key
+of the last row they returned; the next page starts *after* it::
+
+    order = [(Timeseries.code, False)]
+    stmt = select(*columns).order_by(*order_by(order))
+    if cursor:
+        stmt = stmt.where(keyset_after(order, decode_cursor(cursor, len(order))))
+    rows = await fetch_all(stmt.limit(limit))
+    next_cursor = encode_cursor([rows[-1].code]) if len(rows) == limit else None
+
+The last sort column must be unique (primary key or unique code) so that
+rows sharing the leading keys are neither skipped nor repeated.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import logging
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, ColumnElement, Executable
+
+from ix.db.conn import fetch_all, fetch_first
+
+logger = logging.getLogger(__name__)
+
+# (column, descending)
+SortKey = Tuple[ColumnElement, bool]
+
+COUNT_MODES = ("exact", "estimate", "none")
+
+
+# ── Cursors ──────────────────────────────────────────────────────────────────
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque, URL-safe cursor for the sort key *values* of the last row."""
+    raw = json.dumps(list(values), separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """Sort key values from :func:`encode_cursor`.
+
+    Raises:
+        ValueError: If *cursor* is malformed or does not hold *size* values.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+# ── Keyset predicates ────────────────────────────────────────────────────────
+
+
+def order_by(order: Sequence[SortKey]) -> list:
+    """``ORDER BY`` clauses for *order*."""
+    return [col.desc() if desc else col.asc() for col, desc in order]
+
+
+def keyset_after(order: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement:
+    """Predicate selecting the rows that sort strictly after *values*.
+
+    Expands ``(a, b) > (x, y)`` per column so that mixed ascending and
+    descending keys work, e.g. ``a < x OR (a = x AND b < y)`` for two
+    descending keys.
+    """
+    if len(order) != len(values):
+        raise ValueError("Cursor does not match the sort order")
+    clauses = []
+    for i, ((col, desc), value) in enumerate(zip(order, values)):
+        step = col < value if desc else col > value
+        ties = [c == v for (c, _), v in zip(order[:i], values[:i])]
+        clauses.append(and_(*ties, step) if ties else step)
+    return or_(*clauses)
+
+
+# ── Counts ───────────────────────────────────────────────────────────────────
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <stmt>``; bind parameters stay parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, stmt) -> None:
+        self.stmt = stmt
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.stmt, **kw)
+
+
+async def _planner_rows(stmt) -> Optional[int]:
+    """Row estimate of the planner for *stmt*, or ``None`` if unavailable."""
+    try:
+        rows = await fetch_all(_Explain(stmt), scalars=True)
+        plan = rows[0]
+        if isinstance(plan, str):  # asyncpg does not decode json
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.debug("Planner row estimate failed: %s", e)
+        return None
+
+
+async def count_rows(stmt, mode: str = "exact", cap: int = 10_000) -> Tuple[Optional[int], bool]:
+    """Count the rows *stmt* matches, ignoring its ordering and paging.
+
+    Args:
+        stmt: The listing ``select()``.
+        mode: ``"exact"`` runs ``count(*)``; ``"estimate"`` counts at most
+            *cap* + 1 rows and, past that, returns the planner's estimate
+            (never below *cap* + 1); ``"none"`` skips counting.
+        cap: Largest result set ``"estimate"`` still counts exactly.
+
+    Returns:
+        ``(count, exact)``; ``(None, False)`` for ``"none"``.
+    """
+    if mode == "none":
+        return None, False
+    base = stmt.order_by(None).limit(None).offset(None)
+    if mode == "exact":
+        return await fetch_first(select(func.count()).select_from(base.subquery())), True
+    if mode != "estimate":
+        raise ValueError(f"Unknown count mode {mode!r}")
+
+    bounded = await fetch_first(select(func.count()).select_from(base.limit(cap + 1).subquery()))
+    if bounded <= cap:
+        return bounded, True
+    estimate = await _planner_rows(base)
+    return max(estimate or 0, cap + 1), False
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import contextvars
 import logging
 import time
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple, Optional
 
 import pandas as pd
 from sqlalchemy.orm import Session as SessionType
@@ -15,6 +17,9 @@ _crawler_cache: dict[str, tuple[float, pd.Series]] = {}
 _CRAWLER_CACHE_TTL = 900  # 15 minutes
 _CRAWLER_CACHE_MAX = 64  # max entries before eviction
 
+# Sources Series() fetches from the crawler rather than reading stored data
+LIVE_SOURCES = frozenset({"Yahoo", "Fred", "Naver"})
+
 # TTL cache for Series() results: {cache_key_tuple: (timestamp, pd.Series)}
 _series_cache: dict[tuple, tuple[float, pd.Series]] = {}
 _SERIES_CACHE_TTL = 300  # 5 minutes
@@ -38,6 +43,72 @@ def clear_series_cache(code: str | None = None) -> None:
         for k in keys_to_remove:
             _series_cache.pop(k, None)
 
+
+class PreloadedSeries(NamedTuple):
+    """Metadata and stored data of one Timeseries, loaded ahead of evaluation."""
+
+    start: object
+    currency: str
+    scale: object
+    source: str
+    source_code: Optional[str]
+    data: pd.Series
+
+
+# Request-scoped {canonical code: PreloadedSeries}; Series() reads from it
+# instead of querying the DB per code. Copied into worker threads with
+# contextvars.copy_context().
+_preloaded: contextvars.ContextVar[dict[str, PreloadedSeries] | None] = contextvars.ContextVar(
+    "ix_preloaded_series", default=None
+)
+
+
+@contextmanager
+def preloaded_series(series: dict[str, PreloadedSeries]) -> Iterator[None]:
+    """Serve ``Series()`` lookups for the given codes from *series*."""
+    token = _preloaded.set(series)
+    try:
+        yield
+    finally:
+        _preloaded.reset(token)
+
+
+# Set by stored_only(): every Series() call behaves as with db_only=True
+_stored_only: contextvars.ContextVar[bool] = contextvars.ContextVar("ix_stored_only", default=False)
+
+
+@contextmanager
+def stored_only() -> Iterator[None]:
+    """Serve ``Series()`` from stored data, never from the live crawlers."""
+    token = _stored_only.set(True)
+    try:
+        yield
+    finally:
+        _stored_only.reset(token)
+
+
+def split_alias(code: str) -> tuple[str | None, str]:
+    """Split ``NAME=TICKER ASSET:FIELD`` into ``(NAME, real code)``.
+
+    Only a full Bloomberg-style right side (contains a space and ``:``)
+    counts as an alias, so futures tickers like ``ES=F:PX_LAST`` pass
+    through unchanged as ``(None, code)``.
+    """
+    if "=" in code:
+        left, right = code.split("=", 1)
+        if ":" not in left and ":" in right and " " in right:
+            return left, right
+    return None, code
+
+
+def canonical_code(code: str) -> str:
+    """DB code ``Series(code)`` resolves to (default field, upper-cased)."""
+    _, code = split_alias(code)
+    if ":" not in code:
+        code = f"{code}:PX_LAST"
+    return code.upper()
+
+
 # Re-export transforms so legacy custom chart code using
 # `from ix.db.query import ...` continues to work.
 from ix.common.data.transforms import (  # noqa: F401
@@ -125,6 +196,8 @@ def Series(
     Alias:
       If code contains '=', e.g. 'NAME=REAL_CODE', return REAL_CODE with name 'NAME'.
     """
+    db_only = db_only or _stored_only.get()
+
     # Check Series-level cache (skip when caller passes an explicit session)
     cache_key = (code, freq, ccy, scale, _skip_fx)
     if session is None:
@@ -137,22 +210,13 @@ def Series(
 
     try:
         # Alias handling: NAME=TICKER ASSETCLASS:FIELD
-        # Only trigger when right side is a full Bloomberg-style code (contains space).
-        # This avoids misdetecting futures tickers like ES=F:PX_LAST.
-        if "=" in code:
-            _left, _right = code.split("=", 1)
-            _is_alias = ":" not in _left and ":" in _right and " " in _right
-        else:
-            _is_alias = False
-        if _is_alias:
-            alias_name, real_code = code.split("=", maxsplit=1)
+        alias_name, real_code = split_alias(code)
+        if alias_name is not None:
             s = Series(code=real_code, freq=freq, ccy=ccy, scale=scale, session=session, _skip_fx=_skip_fx, strict=strict).sort_index()
             s.name = alias_name.upper()
             return s.copy()
 
-        if ":" not in code:
-            code = f"{code}:PX_LAST"
-        code = code.upper()
+        code = canonical_code(code)
 
         # Query using SQLAlchemy — extract all needed fields before session closes
         from ix.db.conn import Session
@@ -162,8 +226,6 @@ def Series(
         ts_scale = 1
         s = pd.Series(name=code, dtype=float)
 
-        _LIVE_SOURCES = {"Yahoo", "Fred", "Naver"}
-
         def _fetch_from_crawler(source: str, source_code: str) -> pd.Series:
             """Fetch data from web crawler with 15-min TTL cache."""
             # Check cache first
@@ -243,7 +305,7 @@ def Series(
             if not ts:
                 return None, pd.Series(dtype=float)
             src = str(ts.source or "")
-            if src in _LIVE_SOURCES and ts.source_code and not db_only:
+            if src in LIVE_SOURCES and ts.source_code and not db_only:
                 # Fetch from crawler, not DB
                 ts_currency = (ts.currency or "").upper()
                 try:
@@ -258,8 +320,26 @@ def Series(
                 # Fallback to DB if crawler fails
             return ts, _extract(ts)
 
+        def _lookup_preloaded():
+            """Metadata and data from the request's preloaded set, if present."""
+            nonlocal ts_start, ts_currency, ts_scale
+            pre = (_preloaded.get() or {}).get(code)
+            if pre is None or (pre.source in LIVE_SOURCES and pre.source_code and not db_only):
+                return None
+            ts_start = pre.start
+            ts_currency = (pre.currency or "").upper()
+            try:
+                ts_scale = int(pre.scale or 1)
+            except Exception:
+                ts_scale = 1
+            return pre, pre.data.copy()
+
         found = False
-        if session:
+        preloaded = _lookup_preloaded()
+        if preloaded is not None:
+            ts, s = preloaded
+            found = True
+        elif session:
             ts, s = _lookup_ts(session)
             found = ts is not None
         else:
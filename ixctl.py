@@ -12,6 +12,7 @@ Usage::
     python ixctl.py prod --check    # prod + wait for backend /health
     python ixctl.py build           # next build
     python ixctl.py stop            # kill backend + frontend + tunnel
+    python ixctl.py prod --profile-imports   # startup import-time report, no launch
 
 Design notes:
     * Stdlib-only (argparse, subprocess, urllib). No new deps.
@@ -224,6 +225,49 @@ def health_check(url: str, timeout: int = 30) -> bool:
     return False
 
 
+# ─────────────────────────────────────────────────────────────────────
+# Startup profile
+# ─────────────────────────────────────────────────────────────────────
+
+
+def _group(module: str) -> str:
+    """Report bucket: ``ix.api.routers.x`` for our code, top-level package otherwise."""
+    parts = module.split(".")
+    return ".".join(parts[:4]) if parts[0] == "ix" else parts[0]
+
+
+def profile_imports(top: int = 25) -> int:
+    """Import ``ix.api.main`` under ``-X importtime`` and print where the time goes."""
+    r = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import ix.api.main"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    rows: list[tuple[int, int, str]] = []
+    for line in r.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    if r.returncode != 0 or not rows:
+        log("  ERROR: importing ix.api.main failed")
+        print(r.stderr[-2000:])
+        return r.returncode or 1
+
+    total_us = sum(s for s, _, _ in rows)
+    groups: dict[str, int] = {}
+    for self_us, _, name in rows:
+        groups[_group(name)] = groups.get(_group(name), 0) + self_us
+
+    log(f"startup imports: {len(rows)} modules, {total_us / 1e6:.2f}s")
+    print(f"\n  {'self ms':>9}  {'share':>6}  package")
+    for name, us in sorted(groups.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"  {us / 1e3:9.1f}  {us / total_us:6.1%}  {name}")
+    print(f"\n  {'self ms':>9}  {'cum ms':>9}  module")
+    for self_us, cumulative_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {self_us / 1e3:9.1f}  {cumulative_us / 1e3:9.1f}  {name}")
+    return 0
+
+
 # ─────────────────────────────────────────────────────────────────────
 # Commands
 # ─────────────────────────────────────────────────────────────────────
@@ -267,10 +311,14 @@ def _run(mode: Mode, target: str, *, check: bool, skip_stop: bool) -> int:
 
 
 def cmd_dev(args: argparse.Namespace) -> int:
+    if args.profile_imports:
+        return profile_imports(args.profile_imports)
     return _run("dev", args.target, check=args.check, skip_stop=args.no_stop)
 
 
 def cmd_prod(args: argparse.Namespace) -> int:
+    if args.profile_imports:
+        return profile_imports(args.profile_imports)
     return _run("prod", args.target, check=args.check, skip_stop=args.no_stop)
 
 
@@ -313,6 +361,11 @@ def build_parser() -> argparse.ArgumentParser:
             "--check", action="store_true",
             help="after launch, poll /health and fail if backend is down",
         )
+        sp.add_argument(
+            "--profile-imports", type=int, nargs="?", const=25, default=0,
+            metavar="N",
+            help="print the backend's top-N startup imports by time and exit",
+        )
         sp.set_defaults(func=fn)
 
     sp = sub.add_parser("build", help="Build the frontend (next build)")
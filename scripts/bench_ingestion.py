@@ -0,0 +1,157 @@
+"""Offline ingestion benchmark: collectors and crawlers against recorded HTTP.
+
+Record the live traffic of a target once, then replay it from a local
+server (see :mod:`ix.collectors.replay`) with injected latency, errors
+and rate limits, measuring wall time, HTTP volume and DB writes.
+
+Targets are collector names (``cftc``, ``aaii``, ``naaim``, ``cboe``,
+``google_trends``, ``sec_13f``, ``finra_darkpool``) or crawler calls
+``fred:GDP,CPIAUCSL`` / ``naver:005930``.
+
+Usage::
+
+    # once, with network access
+    python scripts/bench_ingestion.py record cftc sec_13f fred:GDP --dir fixtures/http
+
+    # offline, any number of times
+    python scripts/bench_ingestion.py run cftc sec_13f fred:GDP --dir fixtures/http \\
+        --latency 0.05 --jitter 0.05 --error-rate 0.02 --rate-limit 10 --repeat 3
+
+Collectors write to the database in ``DB_URL``; point it at a scratch
+database. Crawler targets only return frames.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("SECRET_KEY", "bench")
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+
+from ix.collectors.replay import Cassette, Faults, ReplayServer, record, replay  # noqa: E402
+
+logger = logging.getLogger("bench")
+
+_WRITES = ("INSERT", "UPDATE", "DELETE", "COPY", "MERGE")
+
+
+@dataclass
+class Writes:
+    statements: int = 0
+    rows: int = 0
+
+
+class WriteCounter:
+    """Counts write statements and affected rows on every engine."""
+
+    def __init__(self) -> None:
+        self.writes = Writes()
+        self._lock = threading.Lock()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if not statement.lstrip().upper().startswith(_WRITES):
+            return
+        rows = cursor.rowcount if cursor.rowcount >= 0 else (len(parameters) if executemany else 0)
+        with self._lock:
+            self.writes.statements += 1
+            self.writes.rows += rows
+
+    def __enter__(self) -> Writes:
+        event.listen(Engine, "after_cursor_execute", self._after)
+        return self.writes
+
+    def __exit__(self, *exc) -> None:
+        event.remove(Engine, "after_cursor_execute", self._after)
+
+
+def run_target(target: str) -> str:
+    """Run one target; returns a short result description."""
+    if ":" in target:
+        source, tickers = target.split(":", 1)
+        from ix.collectors import crawler
+
+        fetch = {"fred": crawler.get_fred_data, "naver": crawler.get_naver_data}[source]
+        rows = sum(len(fetch(t)) for t in tickers.split(","))
+        return f"{rows} rows returned"
+
+    from ix.collectors.registry import get_collector
+
+    collector = get_collector(target)
+    if collector is None:
+        raise SystemExit(f"Unknown collector: {target}")
+    result = collector.collect()
+    return f"{result.get('inserted', 0)} inserted, {result.get('errors', 0)} errors"
+
+
+def _cassette_path(directory: Path, target: str) -> Path:
+    return directory / (target.replace(":", "_").replace(",", "-") + ".jsonl")
+
+
+def cmd_record(args) -> None:
+    for target in args.targets:
+        cassette = Cassette()
+        start = time.perf_counter()
+        with record(cassette):
+            outcome = run_target(target)
+        path = _cassette_path(args.dir, target)
+        cassette.save(path)
+        print(f"{target:<20} {len(cassette):5d} exchanges  {time.perf_counter() - start:7.1f}s live  {outcome}  -> {path}")
+
+
+def cmd_run(args) -> None:
+    faults = Faults(args.latency, args.jitter, args.error_rate, args.rate_limit, args.seed)
+    # FRED uses its requests-based API path whenever a key is set
+    os.environ.setdefault("FRED_API_KEY", "replay")
+    print(
+        f"latency {faults.latency * 1000:.0f}ms (+{faults.jitter * 1000:.0f}ms), "
+        f"errors {faults.error_rate:.0%}, rate limit {faults.rate_limit or '-'}/s, {args.repeat} run(s)"
+    )
+    print(f"{'target':<20} {'wall s':>8} {'req':>6} {'req/s':>7} {'miss':>5} {'5xx':>5} {'429':>5} {'stmts':>6} {'rows':>8} {'rows/s':>8}")
+    for target in args.targets:
+        cassette = Cassette.load(_cassette_path(args.dir, target))
+        walls = []
+        for _ in range(args.repeat):
+            cassette.rewind()
+            with ReplayServer(cassette, faults) as server, replay(server), WriteCounter() as writes:
+                start = time.perf_counter()
+                run_target(target)
+                wall = time.perf_counter() - start
+            walls.append(wall)
+        stats = server.stats
+        wall = statistics.median(walls)
+        print(
+            f"{target:<20} {wall:8.2f} {stats.served:6d} {stats.served / wall:7.1f} {stats.misses:5d} "
+            f"{stats.errors:5d} {stats.throttled:5d} {writes.statements:6d} {writes.rows:8d} {writes.rows / wall:8.0f}"
+        )
+        for url in stats.missed_urls[:5]:
+            print(f"    not recorded: {url}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (("record", "record live traffic"), ("run", "replay and measure")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("targets", nargs="+")
+        p.add_argument("--dir", type=Path, default=Path("fixtures/http"), help="cassette directory")
+    run = sub.choices["run"]
+    run.add_argument("--latency", type=float, default=0.0, help="seconds per response")
+    run.add_argument("--jitter", type=float, default=0.0, help="extra random seconds per response")
+    run.add_argument("--error-rate", type=float, default=0.0, help="share of 503 responses")
+    run.add_argument("--rate-limit", type=float, default=None, help="requests/s before 429s")
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--repeat", type=int, default=1, help="runs per target (median wall time)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    {"record": cmd_record, "run": cmd_run}[args.command](args)
@@ -0,0 +1,87 @@
+"""Tests for the pure ASGI middleware in ix.api.middleware."""
+
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from ix.api import middleware
+from ix.api.middleware import (
+    DBSessionCleanupMiddleware,
+    NormalizePathMiddleware,
+    RequestLoggingMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/api/research/library/view/{doc}")
+    async def view(doc: str):
+        return {"doc": doc}
+
+    @app.get("/api/stream")
+    async def stream():
+        async def body():
+            for i in range(3):
+                yield f"{i}\n".encode()
+
+        return StreamingResponse(body(), media_type="text/plain")
+
+    @app.get("/api/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    app.add_middleware(NormalizePathMiddleware)
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(DBSessionCleanupMiddleware)
+    return app
+
+
+class MiddlewareTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.session = mock.MagicMock()
+        p = mock.patch.object(middleware.conn, "Session", self.session)
+        p.start()
+        self.addCleanup(p.stop)
+        self.client = TestClient(_app(), raise_server_exceptions=False)
+
+    def test_security_headers(self) -> None:
+        headers = self.client.get("/api/ping").headers
+        self.assertEqual(headers["x-content-type-options"], "nosniff")
+        self.assertEqual(headers["x-frame-options"], "DENY")
+        self.assertEqual(headers["referrer-policy"], "strict-origin-when-cross-origin")
+        framed = self.client.get("/api/research/library/view/abc").headers
+        self.assertNotIn("x-frame-options", framed)
+
+    def test_double_slashes_are_collapsed(self) -> None:
+        with self.assertLogs(middleware.logger, "INFO") as logs:
+            response = self.client.get("/api//ping")
+        self.assertEqual(response.json(), {"ok": True})
+        self.assertRegex(logs.output[0], r"GET /api/ping 200 \d+ms")
+
+    def test_streaming_body_passes_through(self) -> None:
+        response = self.client.get("/api/stream")
+        self.assertEqual(response.text, "0\n1\n2\n")
+        self.assertEqual(response.headers["x-content-type-options"], "nosniff")
+
+    def test_errors_are_logged_and_session_removed(self) -> None:
+        with self.assertLogs(middleware.logger, "INFO") as logs:
+            response = self.client.get("/api/boom")
+        self.assertEqual(response.status_code, 500)
+        self.assertRegex(logs.output[0], r"GET /api/boom 500 \d+ms")
+        self.session.remove.assert_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
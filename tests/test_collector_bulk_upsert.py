@@ -0,0 +1,135 @@
+"""Tests for the batched collector upsert in ix.collectors.base (no DB required)."""
+
+from __future__ import annotations
+
+import json
+import sys
+import unittest
+from unittest import mock
+
+import pandas as pd
+from sqlalchemy.dialects import postgresql
+
+from ix.collectors.base import BaseCollector
+
+base = sys.modules["ix.collectors.base"]
+
+
+class _Collector(BaseCollector):
+    name = "test"
+
+    def collect(self, progress_cb=None) -> dict:
+        return {}
+
+
+class _FakeSession:
+    """Records statements; answers code lookups from *rows* ``{code: (id, parent_id)}``."""
+
+    def __init__(self, rows: dict, inserted: dict) -> None:
+        self.rows = dict(rows)
+        self.inserted = inserted
+        self.statements: list[tuple[str, dict]] = []
+        self.commits = 0
+
+    def execute(self, stmt, params=None):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        self.statements.append((sql, params if params is not None else compiled.params))
+        if sql.startswith("INSERT INTO timeseries "):
+            self.rows.update(self.inserted)
+        if sql.startswith("SELECT"):
+            codes = next(v for k, v in compiled.params.items() if k.startswith("code"))
+            return [(c, *self.rows[c]) for c in codes if c in self.rows]
+        return None
+
+    def commit(self) -> None:
+        self.commits += 1
+
+
+def _payloads(params: dict) -> dict:
+    """``{id: points}`` from the flattened ``(id, points)`` VALUES parameters."""
+    flat = [params[f"param_{i}"] for i in range(1, len(params) + 1)]
+    return {ts_id: json.loads(points) for ts_id, points in zip(flat[::2], flat[1::2])}
+
+
+def _series(values: dict) -> pd.Series:
+    return pd.Series(list(values.values()), index=pd.to_datetime(list(values)))
+
+
+class BulkUpsertTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.invalidated = mock.patch("ix.db.models.cache._cache_invalidate").start()
+        self.cleared = mock.patch("ix.db.query.clear_series_cache").start()
+        self.addCleanup(mock.patch.stopall)
+
+    def _run(self, rows, inserted, items):
+        db = _FakeSession(rows, inserted)
+        written = _Collector()._bulk_upsert_timeseries(db, items)
+        return written, db
+
+    def test_one_round_trip_per_step(self) -> None:
+        items = [
+            ("OLD", {"source": "CFTC", "name": "Old"}, _series({"2024-01-05": 1.0, "2024-01-12": 2})),
+            ("NEW", {"source": "CFTC", "name": "New", "unit": "contracts"}, _series({"2024-01-05": 3.0})),
+            ("EMPTY", {"source": "CFTC"}, pd.Series(dtype=float)),
+        ]
+        written, db = self._run({"OLD": ("id-old", None)}, {"NEW": ("id-new", None)}, items)
+
+        self.assertEqual(written, 2)
+        self.assertEqual(db.commits, 1)
+        # lookup, metadata insert, re-lookup, data rows, merge, stats
+        self.assertEqual(len(db.statements), 6)
+
+        insert_sql, insert_params = db.statements[1]
+        self.assertIn("ON CONFLICT (code) DO NOTHING", insert_sql)
+        self.assertEqual(insert_params["code_m0"], "NEW")
+        self.assertEqual(insert_params["unit_m0"], "contracts")
+        self.assertNotIn("code_m1", insert_params)
+
+        merge_sql, merge_params = db.statements[4]
+        self.assertIn("timeseries_data.data || CAST(incoming.points AS JSONB)", merge_sql)
+        self.assertIn("FROM (VALUES", merge_sql)
+        self.assertEqual(
+            _payloads(merge_params),
+            {"id-old": {"2024-01-05": 1.0, "2024-01-12": 2.0}, "id-new": {"2024-01-05": 3.0}},
+        )
+
+        _, stats_params = db.statements[5]
+        self.assertEqual(sorted(stats_params["ids"]), ["id-new", "id-old"])
+
+        self.assertEqual(sorted(c.args[0] for c in self.invalidated.call_args_list), ["id-new", "id-old"])
+        self.assertEqual(sorted(c.args[0] for c in self.cleared.call_args_list), ["NEW", "OLD"])
+
+    def test_children_feed_their_parent(self) -> None:
+        items = [
+            ("A", {}, _series({"2024-01-01": 1.0})),
+            ("B", {}, _series({"2024-01-02": 2.0})),
+        ]
+        _, db = self._run({"A": ("a", "p"), "B": ("b", "p")}, {}, items)
+        # No missing codes: no metadata insert
+        self.assertFalse(any(sql.startswith("INSERT INTO timeseries ") for sql, _ in db.statements))
+        merge_params = next(p for sql, p in db.statements if sql.startswith("UPDATE timeseries_data"))
+        self.assertEqual(_payloads(merge_params)["p"], {"2024-01-01": 1.0, "2024-01-02": 2.0})
+
+    def test_nothing_to_write(self) -> None:
+        written, db = self._run({}, {}, [("X", {}, pd.Series(dtype=float))])
+        self.assertEqual(written, 0)
+        self.assertEqual(db.statements, [])
+        self.assertEqual(db.commits, 0)
+
+    def test_single_upsert_delegates(self) -> None:
+        collector = _Collector()
+        with mock.patch.object(collector, "_bulk_upsert_timeseries") as bulk:
+            data = _series({"2024-01-01": 1.0})
+            collector._upsert_timeseries(
+                None, source="AAII", code="X", source_code="AAII:X",
+                name="X", category="Sentiment", data=data,
+            )
+        (code, metadata, series), = bulk.call_args.args[1]
+        self.assertEqual(code, "X")
+        self.assertEqual(set(metadata), set(base.UPSERT_FIELDS))
+        self.assertIs(series, data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""Tests for change detection and high-water marks of collectors (no network or DB required)."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import date
+from unittest import mock
+
+import pandas as pd
+
+from ix.collectors.aaii import AAIISentimentCollector
+from ix.collectors.base import BaseCollector
+from ix.collectors.incremental import ChangeTracker, content_hash
+
+URL = "https://www.aaii.com/files/surveys/sentiment.xls"
+
+
+class _Response:
+    def __init__(self, status: int, body: bytes = b"", headers: dict | None = None) -> None:
+        self.status_code = status
+        self.content = body
+        self.headers = headers or {}
+
+
+class _Http:
+    """Stands in for ``requests``: answers with *responses* in turn, records headers sent."""
+
+    def __init__(self, *responses: _Response) -> None:
+        self.responses = list(responses)
+        self.sent: list[dict] = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.sent.append(headers or {})
+        return self.responses.pop(0)
+
+
+class TrackerTests(unittest.TestCase):
+    def test_conditional_headers_and_304(self) -> None:
+        tracker = ChangeTracker({URL: {"etag": '"v1"', "last_modified": "Tue, 01 Oct 2024 00:00:00 GMT"}})
+        http = _Http(_Response(304))
+        self.assertIsNone(tracker.get(URL, session=http))
+        self.assertEqual(http.sent[0]["If-None-Match"], '"v1"')
+        self.assertIn("If-Modified-Since", http.sent[0])
+        self.assertTrue(tracker.nothing_changed)
+
+    def test_same_body_is_unchanged_but_new_validators_are_kept(self) -> None:
+        tracker = ChangeTracker({URL: {"sha256": content_hash(b"data")}})
+        self.assertIsNone(tracker.get(URL, session=_Http(_Response(200, b"data", {"ETag": '"v2"'}))))
+        self.assertTrue(tracker.nothing_changed)
+        self.assertEqual(tracker.commit()[URL]["etag"], '"v2"')
+
+    def test_changed_body_and_discard(self) -> None:
+        tracker = ChangeTracker({URL: {"sha256": content_hash(b"old")}, "other": {"sha256": "x"}})
+        resp = tracker.get(URL, session=_Http(_Response(200, b"new")))
+        self.assertEqual(resp.content, b"new")
+        self.assertFalse(tracker.nothing_changed)
+        self.assertEqual(tracker.commit()[URL]["sha256"], content_hash(b"new"))
+        self.assertEqual(tracker.commit()["other"], {"sha256": "x"})
+
+        # A source whose data was not written keeps its old entry
+        tracker.discard(URL)
+        self.assertEqual(tracker.commit()[URL]["sha256"], content_hash(b"old"))
+
+    def test_errors_are_not_recorded(self) -> None:
+        tracker = ChangeTracker()
+        self.assertEqual(tracker.get(URL, session=_Http(_Response(503))).status_code, 503)
+        self.assertFalse(tracker.nothing_changed)
+        self.assertEqual(tracker.commit(), {})
+
+
+class _Collector(BaseCollector):
+    name = "test"
+    revision_days = 7
+
+    def collect(self, progress_cb=None) -> dict:
+        return {}
+
+
+class _Db:
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+        self.params = None
+
+    def execute(self, stmt, params=None):
+        self.params = params
+        return self.rows
+
+
+def _series(values: dict) -> pd.Series:
+    return pd.Series(list(values.values()), index=pd.to_datetime(list(values)))
+
+
+class ChangedPointsTests(unittest.TestCase):
+    def test_only_new_or_revised_points_remain(self) -> None:
+        db = _Db(
+            [
+                ("A", date(2024, 3, 29), "2024-03-22", "1.0"),
+                ("A", date(2024, 3, 29), "2024-03-29", "2.0"),
+                ("SAME", date(2024, 3, 29), "2024-03-29", "5.0"),
+            ]
+        )
+        items = [
+            # Older history is not compared; 03-22 unchanged, 03-29 revised, 04-05 new
+            ("A", {}, _series({"2024-01-05": 9.0, "2024-03-22": 1.0, "2024-03-29": 2.5, "2024-04-05": 3.0})),
+            ("SAME", {}, _series({"2024-03-29": 5.0})),
+            ("NEW", {}, _series({"2020-01-03": 1.0, "2020-01-10": 2.0})),
+        ]
+        changed = {code: data for code, _, data in _Collector()._changed_points(db, items)}
+
+        self.assertEqual(db.params, {"codes": ["A", "SAME", "NEW"], "days": 7})
+        self.assertEqual(set(changed), {"A", "NEW"})
+        self.assertEqual(changed["A"].to_dict(), {pd.Timestamp("2024-03-29"): 2.5, pd.Timestamp("2024-04-05"): 3.0})
+        self.assertEqual(len(changed["NEW"]), 2)
+
+
+class NoOpRunTests(unittest.TestCase):
+    def test_unchanged_source_skips_parse_and_write(self) -> None:
+        collector = AAIISentimentCollector()
+        tracker = ChangeTracker({URL: {"sha256": content_hash(b"xls")}})
+        http = _Http(_Response(200, b"xls"))
+        with mock.patch.object(collector, "change_tracker", return_value=tracker), mock.patch(
+            "ix.collectors.incremental.requests", http
+        ), mock.patch.object(collector, "update_state") as update_state, mock.patch.object(
+            collector, "_upsert_changes"
+        ) as upsert, mock.patch("pandas.read_excel") as read_excel:
+            result = collector.collect()
+
+        self.assertEqual(result["inserted"], 0)
+        self.assertIn("unchanged", result["message"])
+        read_excel.assert_not_called()
+        upsert.assert_not_called()
+        self.assertIn("sources", update_state.call_args.kwargs["extra_state"])
+
+
+if __name__ == "__main__":
+    unittest.main()
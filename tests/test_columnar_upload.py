@@ -0,0 +1,123 @@
+"""Tests for the staged columnar merge in ix.core.ts.bulk_upload (no DB required)."""
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from ix.core.ts.bulk_upload import long_points, merge_columnar_to_db, read_columnar
+
+bulk = sys.modules["ix.core.ts.bulk_upload"]
+
+EXPECTED = pd.DataFrame(
+    {"A": [1.0, np.nan], "B": [2.0, 3.5]},
+    index=pd.to_datetime(["2024-01-02", "2024-01-03"]),
+)
+
+
+class ReadTests(unittest.TestCase):
+    def _check(self, body: bytes, content_type: str) -> None:
+        df = read_columnar(body, content_type)
+        pd.testing.assert_frame_equal(df, EXPECTED, check_freq=False, check_names=False)
+
+    def test_json_csv_and_arrow_bodies_agree(self) -> None:
+        payload = {
+            "dates": ["2024-01-02", "2024-01-03", "bad"],
+            "columns": {"A": [1.0, None, 9.0], "B": [2.0, 3.5, 9.0], "EMPTY": [None, None, None]},
+        }
+        self._check(json.dumps(payload).encode(), "application/json")
+        self._check(b"Date,A,B\n2024-01-02,1.0,2.0\n2024-01-03,,3.5\n", "text/csv; charset=utf-8")
+
+        dates = pa.array([pd.Timestamp("2024-01-02").date(), pd.Timestamp("2024-01-03").date()])
+        table = pa.table({"date": dates, "A": [1.0, None], "B": [2.0, 3.5]})
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        self._check(sink.getvalue(), "application/vnd.apache.arrow.stream")
+
+    def test_bad_body_is_a_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            read_columnar(b"{not json", "application/json")
+        with self.assertRaises(ValueError):
+            read_columnar(b"not arrow", "application/vnd.apache.arrow.stream")
+
+    def test_long_points_keep_finite_values_and_last_duplicate(self) -> None:
+        df = pd.DataFrame(
+            {"A": [1.0, np.inf, 4.0], "B": [np.nan, 2.0, 3.0]},
+            index=pd.DatetimeIndex(["2024-01-02 09:00", "2024-01-03 00:00", "2024-01-02 16:00"]),
+        )
+        rows = long_points(df)
+        self.assertEqual(
+            sorted(map(tuple, rows.to_numpy().tolist())),
+            [("A", "2024-01-02", 4.0), ("B", "2024-01-02", 3.0), ("B", "2024-01-03", 2.0)],
+        )
+
+
+class _FakeSession:
+    """Answers the code lookup from *found*, and each merge with the next of *merges*."""
+
+    def __init__(self, found: list[str], merges: list[list[tuple]]) -> None:
+        self.found = found
+        self.merges = list(merges)
+        self.statements: list[str] = []
+        self.commits = 0
+
+    def execute(self, stmt, params=None):
+        sql = str(stmt)
+        self.statements.append(sql.split()[0])
+        if sql.startswith("SELECT"):
+            return mock.Mock(scalars=mock.Mock(return_value=iter(self.found)))
+        if "WITH changed" in sql:
+            return self.merges.pop(0)
+        return None
+
+    def commit(self) -> None:
+        self.commits += 1
+
+
+class MergeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.invalidated = mock.patch("ix.db.models.cache._cache_invalidate").start()
+        self.cleared = mock.patch("ix.db.query.clear_series_cache").start()
+        self.staged: list[pd.DataFrame] = []
+        mock.patch.object(bulk, "_copy_rows", side_effect=lambda db, rows: self.staged.append(rows)).start()
+        mock.patch.object(bulk, "MERGE_BATCH", 2).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_batches_are_staged_and_change_counts_summed(self) -> None:
+        df = pd.DataFrame(
+            {"A": [1.0, 2.0], "B": [np.nan, 5.0], "C": [3.0, 3.0], "MISSING": [1.0, 1.0]},
+            index=pd.to_datetime(["2024-01-02", "2024-01-03"]),
+        )
+        # Three batches of two rows; C's points match what is stored
+        db = _FakeSession(["A", "B", "C"], [[("id-a", "A", 2)], [("id-b", "B", 1)], []])
+        result = merge_columnar_to_db(df, db)
+
+        self.assertEqual(result["updated"], ["A", "B", "C"])
+        self.assertEqual(result["not_found"], ["MISSING"])
+        self.assertEqual(result["points"], 5)
+        self.assertEqual(result["changed"], {"A": 2, "B": 1, "C": 0})
+        self.assertEqual([len(rows) for rows in self.staged], [2, 2, 1])
+        self.assertEqual(
+            db.statements, ["SELECT", "CREATE", "WITH", "TRUNCATE", "WITH", "TRUNCATE", "WITH", "TRUNCATE"]
+        )
+        self.assertEqual(db.commits, 1)
+        self.assertEqual({c.args[0] for c in self.invalidated.call_args_list}, {"id-a", "id-b"})
+        self.assertEqual({c.args[0] for c in self.cleared.call_args_list}, {"A", "B"})
+
+    def test_unknown_codes_stage_nothing(self) -> None:
+        db = _FakeSession([], [])
+        result = merge_columnar_to_db(pd.DataFrame({"X": [1.0]}, index=pd.to_datetime(["2024-01-02"])), db)
+        self.assertEqual((result["updated"], result["not_found"], result["changed"]), ([], ["X"], {}))
+        self.assertEqual(self.staged, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
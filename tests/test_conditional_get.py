@@ -0,0 +1,145 @@
+"""Tests for conditional GET helpers (ETag / Last-Modified / 304)."""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from fastapi.responses import Response
+from starlette.requests import Request
+
+from ix.api.conditional import http_date, make_etag, not_modified, set_validators
+from ix.api.responses import data_validators
+from ix.core.ts import resolved_references
+
+planner = sys.modules["ix.core.ts.planner"]
+
+
+def _request(method: str = "GET", **headers: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": method,
+        "headers": [(k.replace("_", "-").lower().encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+class ConditionalGetTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.updated = datetime(2026, 3, 2, 12, 30, 5)
+        self.etag = make_etag("regime", "current", "fp", self.updated)
+
+    def test_etag_is_strong_and_stable(self) -> None:
+        self.assertTrue(self.etag.startswith('"') and self.etag.endswith('"'))
+        self.assertEqual(self.etag, make_etag("regime", "current", "fp", self.updated))
+        self.assertNotEqual(
+            self.etag, make_etag("regime", "current", "fp", self.updated + timedelta(seconds=1))
+        )
+
+    def test_if_none_match(self) -> None:
+        hit = not_modified(_request(if_none_match=f'"x", W/{self.etag}'), self.etag, self.updated)
+        self.assertEqual(hit.status_code, 304)
+        self.assertEqual(hit.headers["etag"], self.etag)
+        self.assertIsNone(not_modified(_request(if_none_match='"x"'), self.etag, self.updated))
+
+    def test_if_none_match_takes_precedence(self) -> None:
+        request = _request(if_none_match='"x"', if_modified_since=http_date(self.updated))
+        self.assertIsNone(not_modified(request, self.etag, self.updated))
+
+    def test_if_modified_since(self) -> None:
+        same = _request(if_modified_since=http_date(self.updated))
+        older = _request(if_modified_since=http_date(self.updated - timedelta(minutes=1)))
+        self.assertEqual(not_modified(same, self.etag, self.updated).status_code, 304)
+        self.assertIsNone(not_modified(older, self.etag, self.updated))
+        self.assertIsNone(not_modified(_request(if_modified_since="garbage"), self.etag, self.updated))
+
+    def test_unsafe_methods_and_unversioned_never_match(self) -> None:
+        self.assertIsNone(not_modified(_request("POST", if_none_match="*"), self.etag))
+        self.assertIsNone(not_modified(_request(if_none_match="*"), None))
+        response = set_validators(Response(), None)
+        self.assertNotIn("etag", response.headers)
+
+    def test_set_validators(self) -> None:
+        response = set_validators(Response(), self.etag, self.updated)
+        self.assertEqual(response.headers["etag"], self.etag)
+        self.assertEqual(response.headers["last-modified"], "Mon, 02 Mar 2026 12:30:05 GMT")
+        self.assertIn("max-age", response.headers["cache-control"])
+
+
+class ResolvedReferencesTests(unittest.TestCase):
+    def test_literal_inputs_are_resolved(self) -> None:
+        self.assertEqual(
+            resolved_references("Rebase(Series('a')) / Series('B:PX_LAST').rolling(5).mean()"),
+            {"A:PX_LAST", "B:PX_LAST"},
+        )
+
+    def test_unknown_inputs_are_unresolved(self) -> None:
+        self.assertIsNone(resolved_references("Series(x)"))
+        self.assertIsNone(resolved_references("SomeIndicator()"))
+        self.assertIsNone(resolved_references("SPX US EQUITY:PX_LAST"))
+
+    def test_fx_conversion_is_unresolved(self) -> None:
+        self.assertIsNone(resolved_references("Series('A', ccy='USD')"))
+        self.assertIsNone(resolved_references("Series('A', 'ME', None, 'KRW')"))
+        self.assertEqual(resolved_references("Series('A', ccy=None)"), {"A:PX_LAST"})
+
+
+class LiveSourceValidatorTests(unittest.TestCase):
+    """The crawler's data can change while the stored row (and its version) does not."""
+
+    STORED = datetime(2026, 3, 2, 6, 0, 0)
+
+    def setUp(self) -> None:
+        # Stored rows never change between the two "requests" below
+        patches = [
+            mock.patch.object(
+                planner, "timeseries_versions", side_effect=lambda db, codes: {c: self.STORED for c in codes}
+            ),
+            mock.patch.object(
+                planner, "live_codes", side_effect=lambda db, codes: {c for c in codes if c.startswith("SPY")}
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_live_series_are_never_answered_304(self) -> None:
+        # The ETag a client would hold if live series were versioned by their stored row
+        with mock.patch.object(planner, "live_codes", return_value=set()):
+            held, _ = data_validators(None, _request(), ["Series('SPY')"])
+        validators = data_validators(None, _request(if_none_match=held), ["Series('SPY')"])
+        self.assertEqual(validators, (None, None))
+        self.assertIsNone(not_modified(_request(if_none_match=held), *validators))
+
+    def test_stored_series_keep_stable_validators(self) -> None:
+        etag, last_modified = data_validators(None, _request(), ["Series('CPI')"])
+        self.assertIsNotNone(etag)
+        self.assertEqual(last_modified, self.STORED)
+        self.assertEqual(data_validators(None, _request(), ["Series('CPI')"])[0], etag)
+        # A stored code of a live source is read from the DB, not the crawler
+        self.assertIsNotNone(data_validators(None, _request(), ["SPY:PX_LAST"])[0])
+
+
+class FavoritesValidatorTests(unittest.TestCase):
+    def test_unfavouriting_is_not_answered_304_by_date(self) -> None:
+        from ix.api.routers.data import timeseries as router
+
+        request = _request(if_modified_since=http_date(datetime(2030, 1, 1)))
+        panel = mock.Mock()
+        with mock.patch.object(router, "ensure_connection"), mock.patch.object(
+            router, "favorite_versions", return_value={"A": datetime(2026, 3, 2)}
+        ), mock.patch.object(router, "favorites_panel", return_value=panel), mock.patch.object(
+            router, "slice_dates", return_value=panel
+        ), mock.patch.object(router, "frame_response", return_value=Response(b"{}")), mock.patch.object(
+            planner, "timeseries_versions", side_effect=lambda db, codes: {c: datetime(2026, 3, 2) for c in codes}
+        ), mock.patch.object(planner, "live_codes", return_value=set()):
+            response = router.get_favorite_timeseries_data(request, None, None, None, None)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("etag", response.headers)
+        self.assertNotIn("last-modified", response.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
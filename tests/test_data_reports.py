@@ -0,0 +1,71 @@
+"""Tests for the stored-data report builder in ix.common.task.reports (no DB required)."""
+
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from ix.common.task.reports import build_report_frames, write_workbook
+
+CUTOFF = pd.Timestamp("2024-01-01")
+
+
+def _rows(code: str, frequency, points: dict) -> list[tuple]:
+    newest_first = sorted(points.items(), reverse=True)
+    return [(code, frequency, d, str(v), rn) for rn, (d, v) in enumerate(newest_first, start=1)]
+
+
+class BuildTests(unittest.TestCase):
+    def test_latest_and_panel(self) -> None:
+        rows = (
+            _rows("SPY:PX_LAST", "B", {"2024-01-02": 470.0, "2024-01-03": 468.5, "2024-01-05": 467.0})
+            + _rows("CPI:PX_LAST", "ME", {"2024-01-15": 3.1})
+            # Only its latest point, which predates the window
+            + _rows("OLD:PX_LAST", None, {"2019-06-30": 7.0})
+            + [("BAD:PX_LAST", None, "2024-01-04", "n/a", 1)]
+        )
+        latest, panel = build_report_frames(rows, CUTOFF, window=3)
+
+        self.assertEqual(latest.to_dict(), {"CPI:PX_LAST": 3.1, "OLD:PX_LAST": 7.0, "SPY:PX_LAST": 467.0})
+        self.assertEqual(latest.index.name, "Code")
+
+        # Monthly data lands on its month end, as Series() resamples it
+        self.assertEqual(list(panel.columns), ["CPI:PX_LAST", "SPY:PX_LAST"])
+        self.assertEqual(panel.index[-1], pd.Timestamp("2024-01-31"))
+        self.assertEqual(len(panel), 3)
+        self.assertEqual(panel.loc["2024-01-31", "CPI:PX_LAST"], 3.1)
+
+    def test_no_rows(self) -> None:
+        latest, panel = build_report_frames([], CUTOFF)
+        self.assertTrue(latest.empty)
+        self.assertTrue(panel.empty)
+
+
+class WorkbookTests(unittest.TestCase):
+    def test_sheets_round_trip(self) -> None:
+        panel = pd.DataFrame(
+            {"A": [1.0, np.nan], "B": [np.inf, 2.5]},
+            index=pd.DatetimeIndex(["2024-01-02", "2024-01-03"], name="Date"),
+        )
+        latest = pd.Series({"A": 1.0, "B": 2.5}, name="Value")
+        latest.index.name = "Code"
+
+        book = load_workbook(write_workbook({"Data": latest, "Panel": panel}))
+        self.assertEqual(book.sheetnames, ["Data", "Panel"])
+        self.assertEqual(
+            [list(r) for r in book["Data"].iter_rows(values_only=True)],
+            [["Code", "Value"], ["A", 1.0], ["B", 2.5]],
+        )
+        rows = list(book["Panel"].iter_rows(values_only=True))
+        self.assertEqual(rows[0], ("Date", "A", "B"))
+        self.assertEqual(rows[1][0].date(), pd.Timestamp("2024-01-02").date())
+        # NaN and inf are left blank
+        self.assertEqual(rows[1][1:], (1.0, None))
+        self.assertEqual(rows[2][1:], (None, 2.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
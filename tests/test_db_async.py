@@ -0,0 +1,135 @@
+"""Tests for the optional async read path in ix.db.conn (no DB required)."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import unittest
+from unittest import mock
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
+
+from ix.core.ts.search import build_search_filter_and_order
+from ix.db.conn import Connection, Settings, async_url, fetch_all, fetch_first
+from ix.db.models import Timeseries
+
+# The module itself; ``ix.db.conn`` as an attribute is the Connection instance
+conn_module = sys.modules["ix.db.conn"]
+
+
+class _FailingSession:
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        raise self.error
+
+
+def _connection_with_async(error: Exception) -> Connection:
+    connection = Connection()
+    connection.AsyncSessionLocal = lambda: _FailingSession(error)
+    return connection
+
+
+class AsyncEngineTests(unittest.TestCase):
+    @unittest.skipIf(conn_module.asyncpg is None, "asyncpg not installed")
+    def test_engine_uses_asyncpg_and_its_own_pool_size(self) -> None:
+        connection = Connection()
+        with mock.patch.multiple(
+            Settings,
+            db_url="postgresql://u:p@db:5432/ix?sslmode=require",
+            db_async=True,
+            db_async_pool_size=3,
+            db_async_max_overflow=7,
+        ):
+            self.assertTrue(connection.connect_async())
+        engine = connection.async_engine
+        self.assertEqual(engine.url.drivername, "postgresql+asyncpg")
+        self.assertEqual(dict(engine.url.query), {"ssl": "require"})
+        self.assertEqual(engine.pool.size(), 3)
+        self.assertEqual(engine.pool._max_overflow, 7)
+
+    def test_disabled_by_setting(self) -> None:
+        with mock.patch.object(Settings, "db_async", False):
+            self.assertFalse(Connection().connect_async())
+
+    def test_libpq_only_options_are_dropped(self) -> None:
+        url = async_url(
+            "postgresql://u:p@db:5432/ix?sslmode=require&channel_binding=require"
+            "&connect_timeout=5&target_session_attrs=read-write"
+        )
+        self.assertEqual(
+            dict(url.query), {"ssl": "require", "target_session_attrs": "read-write"}
+        )
+
+
+class FetchFallbackTests(unittest.TestCase):
+    stmt = select(Timeseries.code)
+
+    def _run(self, connection: Connection, coro_fn):
+        with mock.patch.object(conn_module, "conn", connection), mock.patch.object(
+            conn_module, "_fetch_sync", return_value=["from-sync"]
+        ) as sync:
+            return asyncio.run(coro_fn()), sync
+
+    def test_sync_engine_when_async_unavailable(self) -> None:
+        connection = Connection()
+        connection._async_disabled = True
+        rows, sync = self._run(connection, lambda: fetch_all(self.stmt, scalars=True))
+        self.assertEqual(rows, ["from-sync"])
+        sync.assert_called_once_with(self.stmt, True)
+
+    def test_first_async_connection_failure_falls_back_and_disables(self) -> None:
+        error = OperationalError("SELECT 1", {}, OSError("connection refused"))
+        connection = _connection_with_async(error)
+        with self.assertLogs("ix.db.conn", "WARNING"):
+            first, _ = self._run(connection, lambda: fetch_first(self.stmt))
+        self.assertEqual(first, "from-sync")
+        self.assertTrue(connection._async_disabled)
+        self.assertIsNone(connection.AsyncSessionLocal)
+
+    def test_any_first_use_error_falls_back(self) -> None:
+        error = TypeError("connect() got an unexpected keyword argument 'channel_binding'")
+        connection = _connection_with_async(error)
+        with self.assertLogs("ix.db.conn", "WARNING"):
+            rows, _ = self._run(connection, lambda: fetch_all(self.stmt))
+        self.assertEqual(rows, ["from-sync"])
+        self.assertTrue(connection._async_disabled)
+
+    def test_disabling_disposes_the_async_engine(self) -> None:
+        error = OperationalError("SELECT 1", {}, OSError("connection refused"))
+        connection = _connection_with_async(error)
+        engine = connection.async_engine = mock.Mock(dispose=mock.AsyncMock())
+        with self.assertLogs("ix.db.conn", "WARNING"):
+            self._run(connection, lambda: fetch_all(self.stmt))
+        engine.dispose.assert_awaited_once()
+        self.assertIsNone(connection.async_engine)
+
+    def test_failures_after_async_worked_propagate(self) -> None:
+        error = OperationalError("SELECT 1", {}, OSError("server closed"))
+        connection = _connection_with_async(error)
+        connection._async_verified = True
+        with self.assertRaises(OperationalError):
+            self._run(connection, lambda: fetch_all(self.stmt))
+
+
+class SelectSearchTests(unittest.TestCase):
+    def test_select_statement_gets_postgres_ranking(self) -> None:
+        stmt = build_search_filter_and_order(
+            select(Timeseries), "spx index", Timeseries, dialect_name="postgresql"
+        )
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        self.assertIn("plainto_tsquery", sql)
+        self.assertIn("ORDER BY", sql)
+
+
+if __name__ == "__main__":
+    unittest.main()
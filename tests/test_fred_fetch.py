@@ -0,0 +1,137 @@
+"""Tests for the concurrent FRED fetcher in ix.collectors.fred (no network or browser required)."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from ix.collectors.fred import chart_frame, csv_frames, fetch_fred
+from ix.collectors.ratelimit import AdaptiveLimit, RateBudget
+
+fred = sys.modules["ix.collectors.fred"]
+
+
+class _Response:
+    def __init__(self, status: int, payload=None, text: str = "", headers: dict | None = None) -> None:
+        self.status_code = status
+        self._payload = payload
+        self.text = text
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _Http:
+    """Stands in for the shared session: answers per series id, in turn."""
+
+    def __init__(self, answers: dict) -> None:
+        self.answers = {k: list(v) for k, v in answers.items()}
+        self.calls: list[tuple[str, dict]] = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None):
+        key = params.get("series_id") or params.get("id")
+        with self._lock:
+            self.calls.append((url, params))
+            return self.answers[key].pop(0)
+
+
+def _observations(*points: tuple[str, str]) -> dict:
+    return {"observations": [{"date": d, "value": v} for d, v in points]}
+
+
+class AdaptiveLimitTests(unittest.TestCase):
+    def test_halves_on_throttle_and_grows_back(self) -> None:
+        limit = AdaptiveLimit(8, calm=2, cooldown=0.0)
+        limit.throttled()
+        limit.throttled()
+        self.assertEqual(limit.limit, 2)
+        for _ in range(4):
+            limit.acquire()
+            limit.release(ok=True)
+        self.assertEqual(limit.limit, 4)
+
+    def test_caps_requests_in_flight_and_waits_out_retry_after(self) -> None:
+        limit = AdaptiveLimit(1)
+        limit.acquire()
+        entered = threading.Event()
+        waiter = threading.Thread(target=lambda: (limit.acquire(), entered.set()))
+        waiter.start()
+        self.assertFalse(entered.wait(0.05))
+        limit.release()
+        self.assertTrue(entered.wait(1))
+        waiter.join()
+        limit.release()
+
+        limit.throttled(retry_after=0.2)
+        started = time.monotonic()
+        limit.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.15)
+
+
+class FrameTests(unittest.TestCase):
+    def test_chart_and_csv_payloads(self) -> None:
+        ms = int(pd.Timestamp("2024-01-01").value // 1_000_000)
+        frame = chart_frame(json.dumps({"observations": [[[ms, 1.5], [ms + 86_400_000, None]]]}).encode())
+        self.assertEqual(frame["PX_LAST"].to_dict(), {pd.Timestamp("2024-01-01"): 1.5})
+        self.assertEqual(frame.index.name, "DATE")
+
+        text = "observation_date,GDP,UNRATE\n2019-12-01,1.0,.\n2024-01-01,2.0,3.9\n2024-02-01,.,4.0\n"
+        frames = csv_frames(text, "2020-01-01", "2024-12-31")
+        self.assertEqual(frames["GDP"]["PX_LAST"].tolist(), [2.0])
+        self.assertEqual(frames["UNRATE"]["PX_LAST"].tolist(), [3.9, 4.0])
+
+
+class FetchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        patches = [
+            mock.patch.object(fred, "_limit", AdaptiveLimit(4, cooldown=0.0)),
+            mock.patch.object(fred, "_budget", RateBudget(1000.0, burst=100)),
+            mock.patch.object(fred, "_fetch_browser", return_value={}),
+            mock.patch.dict(os.environ, {"FRED_API_KEY": "key"}),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _fetch(self, http: _Http, tickers: list[str]) -> dict:
+        with mock.patch.object(fred, "_http", return_value=http):
+            return fetch_fred(tickers, start="2024-01-01", end="2024-12-31")
+
+    def test_throttled_requests_back_off_and_failures_fall_back_to_batched_csv(self) -> None:
+        http = _Http(
+            {
+                "DGS10": [
+                    _Response(429, headers={"Retry-After": "0"}),
+                    _Response(200, _observations(("2024-01-02", "4.0"))),
+                ],
+                "EMPTY": [_Response(200, _observations(("2024-01-02", ".")))],
+                "GONE": [_Response(500)],
+                "LOST": [_Response(500)],
+                "GONE,LOST": [_Response(200, text="DATE,GONE,LOST\n2024-01-02,1.0,2.0\n")],
+            }
+        )
+        frames = self._fetch(http, ["DGS10", "EMPTY", "GONE", "LOST", "DGS10"])
+
+        self.assertEqual(sorted(frames), ["DGS10", "GONE", "LOST"])
+        self.assertEqual(frames["DGS10"]["PX_LAST"].tolist(), [4.0])
+        self.assertEqual(fred._limit.limit, 2)
+        # The two API failures share one CSV request; EMPTY answered and is not retried
+        csv_calls = [params for url, params in http.calls if url == fred.CSV_URL]
+        self.assertEqual(csv_calls, [{"id": "GONE,LOST"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests for the HTTP record / replay harness in ix.collectors.replay (no network required)."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import requests
+
+from ix.collectors.replay import Cassette, Exchange, Faults, ReplayServer, normalize_url, record, replay
+
+SUBMISSIONS = "https://data.sec.gov/submissions/CIK0001067983.json"
+
+
+def _cassette() -> Cassette:
+    return Cassette(
+        [
+            Exchange("GET", SUBMISSIONS, 200, {"Content-Type": "application/json"}, b'{"cik": 1067983}'),
+            Exchange("GET", "https://www.cftc.gov/old.zip", 302, {"Location": "/new.zip"}, b""),
+            Exchange("GET", "https://www.cftc.gov/new.zip", 200, {}, b"PK"),
+            Exchange("GET", "https://api.example.com/v1?b=2&a=1", 200, {}, b"first"),
+            Exchange("GET", "https://api.example.com/v1?b=2&a=1", 200, {}, b"second"),
+        ]
+    )
+
+
+class NormalizeTests(unittest.TestCase):
+    def test_credentials_and_moving_bounds_are_dropped(self) -> None:
+        url = "https://API.stlouisfed.org/fred?series_id=GDP&api_key=s3cret&observation_end=2024-01-01"
+        self.assertEqual(normalize_url(url), "https://api.stlouisfed.org/fred?series_id=GDP")
+
+
+class ReplayTests(unittest.TestCase):
+    def test_serves_redirects_and_sequences(self) -> None:
+        with ReplayServer(_cassette()) as server, replay(server):
+            resp = requests.get(SUBMISSIONS, headers={"User-Agent": "test"})
+            self.assertEqual(resp.json(), {"cik": 1067983})
+            self.assertEqual(resp.url, SUBMISSIONS)
+
+            moved = requests.get("https://www.cftc.gov/old.zip")
+            self.assertEqual((moved.status_code, moved.content, moved.url), (200, b"PK", "https://www.cftc.gov/new.zip"))
+
+            # Query order does not matter; repeats walk the recordings, then stick
+            bodies = [requests.get("https://api.example.com/v1", params={"a": 1, "b": 2}).text for _ in range(3)]
+            self.assertEqual(bodies, ["first", "second", "second"])
+
+            self.assertEqual(requests.get("https://www.cftc.gov/missing").status_code, 404)
+        self.assertEqual(server.stats.served, 6)
+        self.assertEqual(server.stats.missed_urls, ["https://www.cftc.gov/missing"])
+
+    def test_injected_errors_and_rate_limit(self) -> None:
+        with ReplayServer(_cassette(), Faults(error_rate=1.0)) as server, replay(server):
+            self.assertEqual(requests.get(SUBMISSIONS).status_code, 503)
+        self.assertEqual(server.stats.errors, 1)
+
+        with ReplayServer(_cassette(), Faults(rate_limit=2)) as server, replay(server):
+            codes = [requests.get(SUBMISSIONS).status_code for _ in range(4)]
+        self.assertEqual(codes, [200, 200, 429, 429])
+        self.assertEqual(server.stats.throttled, 2)
+
+
+class RecordTests(unittest.TestCase):
+    def test_recording_roundtrips_through_a_file(self) -> None:
+        recorded = Cassette()
+        # Record against a replay server standing in for the live service
+        with ReplayServer(_cassette()) as server, replay(server), record(recorded):
+            requests.get(SUBMISSIONS, params={"api_key": "s3cret"})
+        self.assertEqual(len(recorded), 1)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "sec.jsonl"
+            recorded.save(path)
+            self.assertNotIn("s3cret", path.read_text())
+            loaded = Cassette.load(path)
+
+        exchange = loaded.lookup("GET", SUBMISSIONS)
+        self.assertEqual(exchange.body, b'{"cik": 1067983}')
+        self.assertNotIn("Content-Length", exchange.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""Tests for the checkpointed job runner in ix.common.task.jobs (no DB or worker processes required)."""
+
+from __future__ import annotations
+
+import copy
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from ix.common.task.jobs import JobContext, JobSpec, claim, current, finish, reap, resumable
+
+jobs = sys.modules["ix.common.task.jobs"]
+
+NOW = datetime(2026, 3, 2, 22, 0, 0, tzinfo=timezone.utc)
+SPEC = JobSpec("sample", "tests.test_jobs:_sample_job")
+
+
+def _sample_job():
+    job = current()
+    for unit in job.pending(["a", "b", "c"]):
+        if unit == "c" and _sample_job.fail:
+            raise RuntimeError("boom")
+        job.complete(unit, unit.upper())
+    return {"seen": sorted(job.value(u) for u in "abc" if job.done(u))}
+
+
+_sample_job.fail = False
+
+
+class TransitionTests(unittest.TestCase):
+    def test_claim_respects_concurrency_limit(self) -> None:
+        state: dict = {}
+        self.assertTrue(claim(state, SPEC, "r1", "2026-03-02", NOW))
+        self.assertFalse(claim(state, SPEC, "r2", "2026-03-02", NOW))
+        wide = JobSpec("sample", SPEC.target, max_concurrency=2)
+        self.assertTrue(claim(state, wide, "r2", "2026-03-02", NOW))
+
+    def test_stale_runs_are_reaped_as_interrupted(self) -> None:
+        state: dict = {}
+        claim(state, SPEC, "r1", "2026-03-02", NOW)
+        self.assertEqual(reap(state, NOW + timedelta(seconds=jobs.STALE_AFTER - 1)), [])
+        later = NOW + timedelta(seconds=jobs.STALE_AFTER + 1)
+        # The dead run no longer blocks a new one
+        self.assertTrue(claim(state, SPEC, "r2", "2026-03-02", later))
+        self.assertEqual(state["runs"][0]["status"], "interrupted")
+
+    def test_finish_records_metrics_and_clears_checkpoint_on_success(self) -> None:
+        state = {"checkpoint": {"run_key": "2026-03-02", "units": {"a": 1}}}
+        claim(state, SPEC, "r1", "2026-03-02", NOW)
+        record = finish(state, "r1", "success", NOW + timedelta(seconds=40), units=20)
+        self.assertEqual((record["duration_s"], record["units_per_s"]), (40.0, 0.5))
+        self.assertNotIn("checkpoint", state)
+        self.assertEqual(state["active"], {})
+
+    def test_naive_stamps_are_read_as_utc(self) -> None:
+        state = {"active": {"r1": {"run_key": "k", "started_at": "2026-03-02T21:00:00",
+                                   "heartbeat_at": "2026-03-02T21:00:00"}}}
+        self.assertEqual(reap(state, NOW), ["r1"])
+        self.assertEqual(state["runs"][0]["duration_s"], 3600.0)
+
+    def test_resumable_only_after_recent_interruption(self) -> None:
+        state: dict = {}
+        claim(state, SPEC, "r1", "2026-03-02", NOW)
+        stale = NOW + timedelta(seconds=jobs.STALE_AFTER + 1)
+        self.assertEqual(resumable(state, stale), "2026-03-02")
+        self.assertIsNone(resumable(state, NOW + jobs.RESUME_WITHIN + timedelta(hours=1)))
+
+        finish(state, "r2", "failed", stale)
+        self.assertIsNone(resumable(state, stale))
+
+
+class ExecuteTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.state: dict = {}
+
+        def transact(name, update, *, outcome=None):
+            state = copy.deepcopy(self.state)
+            result = update(state)
+            self.state = state
+            return result
+
+        patches = [
+            mock.patch.object(jobs, "_transact", side_effect=transact),
+            mock.patch.dict(jobs.JOBS, {"sample": SPEC}),
+            mock.patch.object(jobs, "FLUSH_INTERVAL", 0.0),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(setattr, _sample_job, "fail", False)
+
+    def _run(self, run_id: str):
+        claim(self.state, SPEC, run_id, "2026-03-02", jobs._utcnow())
+        return jobs._execute("sample", run_id, "2026-03-02")
+
+    def test_failed_run_resumes_from_checkpoint(self) -> None:
+        _sample_job.fail = True
+        result, record = self._run("r1")
+        self.assertIsNone(result)
+        self.assertEqual((record["status"], record["units"]), ("failed", 2))
+        self.assertEqual(self.state["checkpoint"]["units"], {"a": "A", "b": "B"})
+
+        _sample_job.fail = False
+        result, record = self._run("r2")
+        self.assertEqual(result, {"seen": ["A", "B", "C"]})
+        # Only the unit left over was processed
+        self.assertEqual((record["status"], record["units"], record["resumed"]), ("success", 1, True))
+        self.assertNotIn("checkpoint", self.state)
+
+    def test_outside_a_job_nothing_is_persisted(self) -> None:
+        job = current()
+        job.complete("x")
+        self.assertTrue(job.done("x"))
+        jobs._transact.assert_not_called()
+        self.assertIsInstance(job, JobContext)
+
+
+class TransactTests(unittest.TestCase):
+    def test_state_row_is_created_without_racing(self) -> None:
+        from sqlalchemy.dialects import postgresql
+
+        db = mock.MagicMock()
+        row = db.query.return_value.filter.return_value.with_for_update.return_value.one.return_value
+        row.state = {"runs": []}
+        session = mock.MagicMock()
+        session.__enter__.return_value = db
+        with mock.patch("ix.db.conn.Session", return_value=session):
+            self.assertEqual(jobs._transact("sample", lambda state: len(state["runs"])), 0)
+
+        sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn("ON CONFLICT (collector_name) DO NOTHING", sql)
+        db.add.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Tests for deferred package re-exports and the API's startup import set."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import types
+import unittest
+from pathlib import Path
+
+from ix.common.lazy import lazy_exports
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class LazyExportsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.names = ["_lazy_pkg", "_lazy_a", "_lazy_b"]
+        a = types.ModuleType("_lazy_a")
+        a.shared, a.only_a, a._private = "a", "a", "a"
+        b = types.ModuleType("_lazy_b")
+        b.shared, b.__all__ = "b", ["shared"]
+        pkg = types.ModuleType("_lazy_pkg")
+        pkg.__getattr__, pkg.__dir__ = lazy_exports(
+            "_lazy_pkg", attrs={"mod": "_lazy_a", "attr": "_lazy_a:only_a"}, star=("_lazy_a", "_lazy_b")
+        )
+        for module in (pkg, a, b):
+            sys.modules[module.__name__] = module
+        self.pkg = pkg
+
+    def tearDown(self) -> None:
+        for name in self.names:
+            sys.modules.pop(name, None)
+
+    def test_named_and_star_exports(self) -> None:
+        self.assertIs(self.pkg.mod, sys.modules["_lazy_a"])
+        self.assertEqual(self.pkg.attr, "a")
+        self.assertEqual(self.pkg.only_a, "a")
+        # Later star modules win, as with consecutive ``import *``
+        self.assertEqual(self.pkg.shared, "b")
+        self.assertIn("shared", vars(self.pkg))  # cached after first access
+
+    def test_private_and_unknown_names_raise(self) -> None:
+        with self.assertRaises(AttributeError):
+            self.pkg._private
+        with self.assertRaises(AttributeError):
+            self.pkg.missing
+
+
+class StartupImportsTests(unittest.TestCase):
+    def test_api_startup_defers_heavy_packages(self) -> None:
+        heavy = ["ix.core.indicators", "sklearn", "scipy.signal", "scipy.stats", "xhtml2pdf", "yfinance"]
+        code = (
+            "import sys, ix.api.main; "
+            f"print('LOADED:' + ','.join(m for m in {heavy!r} if m in sys.modules))"
+        )
+        env = {"DB_URL": "postgresql://u:p@localhost:5432/x", "SECRET_KEY": "x", **os.environ}
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, timeout=120
+        )
+        self.assertEqual(out.returncode, 0, out.stderr[-2000:])
+        loaded = [line for line in out.stdout.splitlines() if line.startswith("LOADED:")]
+        self.assertEqual(loaded, ["LOADED:"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Tests for keyset pagination and bounded counts in ix.db.pagination (no DB required)."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import unittest
+from unittest import mock
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from ix.db.models import ResearchFile, Timeseries
+from ix.db.pagination import (
+    _Explain,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    order_by,
+)
+
+pagination = sys.modules["ix.db.pagination"]
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class CursorTests(unittest.TestCase):
+    def test_roundtrip(self) -> None:
+        cursor = encode_cursor(["SPX Index", "5b0c"])
+        self.assertNotIn("=", cursor)
+        self.assertEqual(decode_cursor(cursor, 2), ["SPX Index", "5b0c"])
+
+    def test_malformed_or_wrong_size_is_rejected(self) -> None:
+        for bad in ("not base64!", encode_cursor(["a"]), "e30"):  # e30 -> {}
+            with self.assertRaises(ValueError):
+                decode_cursor(bad, 2)
+
+
+class KeysetTests(unittest.TestCase):
+    def test_single_ascending_key(self) -> None:
+        order = [(Timeseries.code, False)]
+        stmt = select(Timeseries.code).where(keyset_after(order, ["M"])).order_by(*order_by(order))
+        sql = _sql(stmt)
+        self.assertIn("timeseries.code > 'M'", sql)
+        self.assertIn("ORDER BY timeseries.code ASC", sql)
+
+    def test_descending_keys_expand_with_tiebreak(self) -> None:
+        order = [(ResearchFile.filename, True), (ResearchFile.id, True)]
+        sql = _sql(select(ResearchFile.id).where(keyset_after(order, ["b.pdf", "x"])))
+        self.assertIn("research_files.filename < 'b.pdf'", sql)
+        self.assertIn("research_files.filename = 'b.pdf' AND research_files.id < 'x'", sql)
+
+    def test_explain_keeps_bind_parameters(self) -> None:
+        stmt = select(Timeseries.code).where(Timeseries.name.ilike("%a:b%"))
+        sql = str(_Explain(stmt).compile(dialect=postgresql.dialect()))
+        self.assertTrue(sql.startswith("EXPLAIN (FORMAT JSON) SELECT"))
+        self.assertIn("%(name_1)s", sql)
+
+
+class CountRowsTests(unittest.TestCase):
+    stmt = select(Timeseries.code).order_by(Timeseries.code).limit(10)
+
+    def _run(self, mode: str, counts: list, plan=None):
+        fetch_first = mock.AsyncMock(side_effect=counts)
+        fetch_all = mock.AsyncMock(return_value=[plan])
+        with mock.patch.object(pagination, "fetch_first", fetch_first), mock.patch.object(
+            pagination, "fetch_all", fetch_all
+        ):
+            return asyncio.run(count_rows(self.stmt, mode, cap=100)), fetch_first, fetch_all
+
+    def test_none_skips_the_query(self) -> None:
+        result, fetch_first, _ = self._run("none", [])
+        self.assertEqual(result, (None, False))
+        fetch_first.assert_not_called()
+
+    def test_exact_ignores_paging(self) -> None:
+        result, fetch_first, _ = self._run("exact", [42])
+        self.assertEqual(result, (42, True))
+        sql = _sql(fetch_first.call_args.args[0])
+        self.assertNotIn("ORDER BY", sql)
+        self.assertNotIn("LIMIT 10", sql)
+
+    def test_estimate_is_exact_below_cap(self) -> None:
+        result, _, fetch_all = self._run("estimate", [37])
+        self.assertEqual(result, (37, True))
+        fetch_all.assert_not_called()
+
+    def test_estimate_uses_planner_past_cap(self) -> None:
+        result, _, _ = self._run("estimate", [101], plan='[{"Plan": {"Plan Rows": 52000}}]')
+        self.assertEqual(result, (52000, False))
+
+    def test_estimate_falls_back_to_cap(self) -> None:
+        result, _, _ = self._run("estimate", [101], plan=None)
+        self.assertEqual(result, (101, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
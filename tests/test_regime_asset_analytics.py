@@ -0,0 +1,170 @@
+"""Tests for the vectorised regime asset analytics kernels.
+
+Each kernel is checked against the straightforward per-state / per-ticker
+scipy computation it replaces, on synthetic data (no DB required).
+"""
+
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from scipy.stats import spearmanr, ttest_ind
+
+from ix.core.regimes.asset_analytics import (
+    clear_panel_cache,
+    load_asset_panel,
+    rank_ic,
+    state_return_stats,
+    state_separation,
+)
+from ix.core.regimes.compute import compute_signal_ic
+from ix.db.query import PreloadedSeries, clear_series_cache
+
+
+def _panel(seed: int = 0) -> tuple[pd.DataFrame, pd.Series, list[str]]:
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2000-01-31", periods=240, freq="ME")
+    rets = pd.DataFrame(
+        rng.normal(0.005, 0.04, (len(idx), 3)), index=idx, columns=["SPY", "TLT", "GLD"]
+    )
+    rets.iloc[10:20, 1] = np.nan
+    states = ["Expansion", "Contraction", "Rare"]
+    regime = pd.Series(rng.choice(states[:2], len(idx)), index=idx)
+    regime.iloc[[30, 60]] = "Rare"
+    return rets, regime, states
+
+
+class StateReturnStatsTests(unittest.TestCase):
+    def test_matches_per_state_slices(self):
+        rets, regime, states = _panel()
+        stats = state_return_stats(rets, regime, states)
+        for state in states:
+            for col in rets.columns:
+                r = rets.loc[regime == state, col].dropna()
+                self.assertEqual(stats["count"].at[state, col], len(r))
+                self.assertAlmostEqual(stats["mean"].at[state, col], r.mean())
+                if len(r) > 1:
+                    self.assertAlmostEqual(stats["std"].at[state, col], r.std())
+                cum = (1 + r).cumprod()
+                self.assertAlmostEqual(
+                    stats["max_dd"].at[state, col], (cum / cum.cummax() - 1).min()
+                )
+
+
+class StateSeparationTests(unittest.TestCase):
+    def test_matches_welch_ttest(self):
+        rets, regime, states = _panel(1)
+        sep = state_separation(state_return_stats(rets, regime, states))
+        for col in rets.columns:
+            groups = {
+                s: rets.loc[regime == s, col].dropna().values
+                for s in states
+                if (rets.loc[regime == s, col].notna().sum()) >= 3
+            }
+            means = {s: g.mean() for s, g in groups.items()}
+            best, worst = max(means, key=means.get), min(means, key=means.get)
+            _, p = ttest_ind(groups[best], groups[worst], equal_var=False)
+            self.assertEqual(sep.at[col, "best_state"], best)
+            self.assertEqual(sep.at[col, "worst_state"], worst)
+            self.assertAlmostEqual(sep.at[col, "p_value"], p)
+            # "Rare" has only 2 observations and never qualifies
+            self.assertEqual(sep.at[col, "n_states"], 2)
+
+
+class RankICTests(unittest.TestCase):
+    def test_matches_spearmanr_per_column(self):
+        rets, _, _ = _panel(2)
+        signal = rets["SPY"].shift(1) + pd.Series(
+            np.random.default_rng(3).normal(size=len(rets)), index=rets.index
+        )
+        ic = rank_ic(signal, rets, min_obs=30)
+        for col in rets.columns:
+            merged = pd.concat([signal, rets[col]], axis=1).dropna()
+            rho, p = spearmanr(merged.iloc[:, 0], merged.iloc[:, 1])
+            self.assertEqual(ic.at[col, "n"], len(merged))
+            self.assertAlmostEqual(ic.at[col, "ic"], rho)
+            self.assertAlmostEqual(ic.at[col, "ic_pvalue"], p)
+
+    def test_short_samples_are_nan(self):
+        rets, _, _ = _panel()
+        ic = rank_ic(rets["SPY"].iloc[:10], rets, min_obs=30)
+        self.assertTrue(ic["ic"].isna().all())
+
+
+def _baseline_signal_ic(signal, prices, horizon, lag=1, warmup=120) -> dict:
+    """The per-ticker loop compute_signal_ic replaced."""
+    sig = signal.shift(lag)
+    out = {}
+    for ticker in prices.columns:
+        px = prices[ticker].dropna()
+        fwd = px.pct_change(horizon).shift(-horizon)
+        merged = pd.concat([sig.rename("signal"), fwd.rename("fwd")], axis=1).iloc[warmup:].dropna()
+        rho, p = spearmanr(merged["signal"], merged["fwd"])
+        out[ticker] = (rho, p, len(merged))
+    return out
+
+
+class SignalICTests(unittest.TestCase):
+    def test_warmup_is_per_asset_with_staggered_starts(self):
+        rng = np.random.default_rng(7)
+        sig_idx = pd.date_range("1990-01-31", periods=360, freq="ME")
+        signal = pd.Series(rng.normal(size=len(sig_idx)), index=sig_idx)
+
+        def walk(start: str, periods: int) -> pd.Series:
+            idx = pd.date_range(start, periods=periods, freq="ME")
+            return pd.Series(100 * np.exp(np.cumsum(rng.normal(0.005, 0.04, periods))), index=idx)
+
+        prices = pd.DataFrame({
+            # Starts before the signal, widening the joint index
+            "EARLY": walk("1980-01-31", 480),
+            "SPY": walk("1990-01-31", 360),
+            # Starts 15 years into the signal
+            "LATE": walk("2005-01-31", 180),
+        })
+        expected = _baseline_signal_ic(signal, prices, horizon=3)
+        result = compute_signal_ic(signal, prices, list(prices.columns), horizon_months=3)
+
+        self.assertNotEqual(expected["EARLY"][2], expected["SPY"][2])
+        for ticker, (rho, p, n) in expected.items():
+            self.assertEqual(result[ticker]["n"], n, ticker)
+            self.assertAlmostEqual(result[ticker]["ic"], rho, places=10)
+            self.assertAlmostEqual(result[ticker]["ic_pvalue"], p, places=10)
+
+
+class LoadAssetPanelTests(unittest.TestCase):
+    def setUp(self):
+        clear_panel_cache()
+        clear_series_cache()
+        self.addCleanup(clear_panel_cache)
+        self.addCleanup(clear_series_cache)
+
+    def test_stored_universe_is_read_in_one_query(self):
+        idx = pd.date_range("2024-01-01", "2024-03-31", freq="D")
+        stored = {
+            "SPY US EQUITY:PX_LAST": pd.Series(np.arange(len(idx), dtype=float), index=idx),
+            "TLT US EQUITY:PX_LAST": pd.Series(np.ones(len(idx)), index=idx),
+        }
+        rows = {code: mock.Mock(code=code, data_record=object()) for code in stored}
+
+        def preload(ts):
+            return PreloadedSeries(idx[0].date(), "USD", 1, "Bloomberg", None, stored[ts.code].copy())
+
+        session = mock.MagicMock()
+        with mock.patch("ix.db.conn.Session", return_value=session), mock.patch(
+            "ix.db.query.bulk_load_timeseries", return_value=rows
+        ) as bulk, mock.patch("ix.core.ts.planner.preload", side_effect=preload):
+            panel = load_asset_panel({"SPY": "SPY US EQUITY:PX_LAST", "TLT": "TLT US EQUITY:PX_LAST"})
+
+        bulk.assert_called_once()
+        self.assertEqual(sorted(bulk.call_args.args[1]), sorted(stored))
+        # Series() was served from the preloaded set, not one query per ticker
+        session.__enter__.return_value.query.assert_not_called()
+        self.assertEqual(list(panel.columns), ["SPY", "TLT"])
+        self.assertEqual(panel["SPY"].tolist(), [30.0, 59.0, 90.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,235 @@
+"""Tests for the incremental regime rebuild.
+
+``Regime.build_incremental`` must produce exactly what a full ``build``
+would on the updated inputs, while reusing the unchanged head of the
+previous build. ``RegimeComputer.update`` must resume from the stored
+frame and only splice date-aligned arrays. Synthetic indicators and a
+fake session only — no DB required.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from ix.core.regimes import kernel
+from ix.core.regimes.base import Regime, zscore
+from ix.core.regimes.compute import RegimeComputer
+from ix.core.regimes.registry import RegimeRegistration
+
+compute = sys.modules["ix.core.regimes.compute"]
+
+
+class _SyntheticRegime(Regime):
+    """Two-indicator, three-state regime over a mutable raw panel."""
+
+    name = "Synthetic"
+    dimensions = ["Policy"]
+    states = ["Dovish", "Neutral", "Hawkish"]
+
+    def __init__(self, raw: pd.DataFrame):
+        self.raw = raw
+
+    def _dimension_prefixes(self) -> dict[str, str]:
+        return {"Policy": "cb_"}
+
+    def _load_indicators(self, z_window: int) -> dict[str, pd.Series]:
+        return {c: zscore(self.raw[c].diff(1), z_window) for c in self.raw.columns}
+
+    def _state_probabilities(self, dim_probs):
+        p = dim_probs["Policy"]
+        dovish = ((p - 0.6) / 0.4).clip(lower=0, upper=1)
+        hawkish = ((0.4 - p) / 0.4).clip(lower=0, upper=1)
+        neutral = (1.0 - dovish - hawkish).clip(lower=0)
+        return {"P_Dovish": dovish, "P_Neutral": neutral, "P_Hawkish": hawkish}
+
+
+def _raw(periods: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("1995-01-31", periods=periods, freq="ME")
+    return pd.DataFrame(
+        rng.normal(size=(periods, 2)).cumsum(axis=0), index=idx, columns=["cb_A", "cb_B"]
+    )
+
+
+class BuildIncrementalTests(unittest.TestCase):
+    def _assert_matches_full(self, regime: Regime, previous: pd.DataFrame, **params):
+        df, since = regime.build_incremental(previous, **params)
+        expected = regime.build(**params)
+        pd.testing.assert_frame_equal(df, expected, check_exact=False, rtol=1e-10)
+        return df, since
+
+    def test_appended_month_matches_full_build(self):
+        raw = _raw(301)
+        old = raw.iloc[:-1].copy()
+        old.iloc[-2:, 1] = np.nan  # ragged edge: one indicator published late
+        for halflife in (1, 4):
+            params = dict(z_window=36, sensitivity=1.5, smooth_halflife=halflife)
+            previous = _SyntheticRegime(old).build(**params)
+            _, since = self._assert_matches_full(_SyntheticRegime(raw), previous, **params)
+            # The late indicator's back-filled months restart the rebuild
+            self.assertEqual(since, raw.index[-3])
+
+    def test_revision_restarts_at_revised_month(self):
+        raw = _raw(240, seed=1)
+        params = dict(z_window=24, sensitivity=1.0, smooth_halflife=3)
+        previous = _SyntheticRegime(raw).build(**params)
+        revised = raw.copy()
+        revised.iloc[200, 0] += 5.0
+        _, since = self._assert_matches_full(_SyntheticRegime(revised), previous, **params)
+        self.assertEqual(since, raw.index[200])
+
+    def test_unchanged_inputs_are_a_no_op(self):
+        regime = _SyntheticRegime(_raw(120, seed=2))
+        previous = regime.build()
+        df, since = regime.build_incremental(previous)
+        self.assertIsNone(since)
+        self.assertIs(df, previous)
+
+    def test_missing_previous_falls_back_to_full_build(self):
+        regime = _SyntheticRegime(_raw(120, seed=3))
+        df, since = regime.build_incremental(None)
+        pd.testing.assert_frame_equal(df, regime.build())
+        self.assertEqual(since, df.index[0])
+
+
+class SeededKernelTests(unittest.TestCase):
+    def test_ewm_continues_from_state(self):
+        values = np.random.default_rng(4).random((50, 3))
+        values[20:23, 1] = np.nan
+        full = kernel.ewm_mean(values, 3.0)
+        state = kernel.ewm_state(values[:30], 3.0)
+        np.testing.assert_allclose(
+            kernel.ewm_mean(values[30:], 3.0, init=state), full[30:], rtol=1e-12
+        )
+
+    def test_streak_continues_from_seed(self):
+        codes = np.array([0, 0, 1, 1, -1, 1, 0, 0])
+        full = kernel.streak_lengths(codes)
+        seed = (np.array(kernel.ffill_codes(codes[:5])[-1]), np.array(full[4]))
+        np.testing.assert_array_equal(kernel.streak_lengths(codes[5:], seed=seed), full[5:])
+
+
+class _Session:
+    """Serves the stored frame and timeseries arrays; records the UPDATE."""
+
+    def __init__(self, frame: bytes | None, timeseries: dict) -> None:
+        self.frame = frame
+        self.timeseries = timeseries
+        self.updates: list[dict] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def get_bind(self):
+        return mock.Mock(**{"dialect.name": "postgresql"})
+
+    def execute(self, stmt, params=None):
+        sql = str(stmt)
+        if sql.startswith("UPDATE"):
+            self.updates.append(params)
+            return None
+        if "timeseries->'dates'" in sql:
+            lengths = []
+            for i in range((len(params) - 1) // 2):
+                node = self.timeseries
+                for key in params[f"p{i}"]:
+                    node = node.get(key) if isinstance(node, dict) else None
+                lengths.append(len(node) if isinstance(node, list) else None)
+            return mock.Mock(first=mock.Mock(return_value=(self.timeseries["dates"], *lengths)))
+        return mock.Mock(scalar=mock.Mock(return_value=self.frame))
+
+    def get(self, model, fp):
+        self.row = mock.Mock()
+        return self.row
+
+    def commit(self) -> None:
+        pass
+
+
+class ComputerUpdateTests(unittest.TestCase):
+    params = {"z_window": 24, "sensitivity": 1.0, "smooth_halflife": 3}
+
+    def setUp(self) -> None:
+        raw = _raw(330, seed=5)
+        self.old = raw.iloc[:-1]
+
+        class _Live(_SyntheticRegime):
+            def __init__(self):
+                super().__init__(raw)
+
+        reg = RegimeRegistration(
+            key="synthetic",
+            display_name="Synthetic",
+            description="",
+            states=_SyntheticRegime.states,
+            dimensions=_SyntheticRegime.dimensions,
+            regime_class=_Live,
+        )
+        self.computer = RegimeComputer(reg)
+        self.previous = _SyntheticRegime(self.old).build(**self.params)
+        self.stored = json.loads(json.dumps(self.computer.serialize_timeseries(self.previous)))
+
+        mock.patch.object(RegimeComputer, "_analytics", return_value=(None, None)).start()
+        self.save = mock.patch.object(RegimeComputer, "save", return_value="saved").start()
+        mock.patch.dict(compute._frame_cache, clear=True).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def _update(self, session: _Session) -> str:
+        with mock.patch.object(compute, "Session", return_value=session):
+            return self.computer.update(self.params)
+
+    def test_resumes_from_stored_frame_without_memory_cache(self) -> None:
+        session = _Session(compute._frame_to_bytes(self.previous), self.stored)
+        with mock.patch.object(RegimeComputer, "build_frame", side_effect=AssertionError("full rebuild")):
+            self._update(session)
+
+        self.save.assert_not_called()
+        (binds,) = session.updates
+        spliced = {tuple(binds[k]) for k in binds if k.startswith("p")}
+        self.assertIn(("dates",), spliced)
+        self.assertIn(("smoothed_probabilities", "Dovish"), spliced)
+        # The new build is persisted for the next process to resume from
+        expected = self.computer._regime().build(**self.params)
+        resumed = compute._frame_from_bytes(binds["frame"])
+        pd.testing.assert_frame_equal(resumed, expected, check_exact=False, rtol=1e-10, check_freq=False)
+
+    def test_arrays_off_the_date_axis_force_a_full_rewrite(self) -> None:
+        self.stored["dominant"] = self.computer.reg.states  # a label list, not a series
+        session = _Session(compute._frame_to_bytes(self.previous), self.stored)
+        self.assertEqual(self._update(session), "saved")
+
+        self.assertEqual(session.updates, [])
+        params, payload, frame = self.save.call_args.args
+        self.assertEqual(len(payload["timeseries"]["dominant"]), len(payload["timeseries"]["dates"]))
+        self.assertEqual(frame.index[-1], _raw(330, seed=5).index[-1])
+
+    def test_unchanged_inputs_still_refresh_analytics(self) -> None:
+        previous = self.computer._regime().build(**self.params)
+        session = _Session(compute._frame_to_bytes(previous), self.stored)
+        RegimeComputer._analytics.return_value = ({"assets": 1}, {"strategy": 1})
+        self._update(session)
+
+        self.save.assert_not_called()
+        self.assertEqual(session.updates, [])  # timeseries untouched
+        self.assertEqual(session.row.asset_analytics, {"assets": 1})
+        self.assertEqual(session.row.strategy, {"strategy": 1})
+        self.assertEqual(session.row.current_state["date"][:7], str(previous.index[-1])[:7])
+
+    def test_no_stored_frame_is_a_full_rebuild(self) -> None:
+        session = _Session(None, self.stored)
+        with mock.patch.object(RegimeComputer, "compute_and_save", return_value="full") as full:
+            self.assertEqual(self._update(session), "full")
+        full.assert_called_once_with(self.params)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Tests for the post-composite regime array kernel.
+
+The kernel must reproduce the pandas semantics the regime pipeline was
+originally written against (``ewm().mean()``, NA-skipping ``idxmax``,
+forward-filled streak counting). Synthetic data only — no DB required.
+"""
+
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from ix.core.regimes import kernel
+
+
+class EwmMeanTests(unittest.TestCase):
+    def test_matches_pandas_with_gaps(self):
+        rng = np.random.default_rng(0)
+        values = rng.random((120, 3))
+        values[:7, 0] = np.nan
+        values[40:45, 1] = np.nan
+        values[:, 2] = np.nan
+        for halflife in (2, 3.5, 6):
+            expected = pd.DataFrame(values).ewm(halflife=halflife).mean().to_numpy()
+            np.testing.assert_allclose(
+                kernel.ewm_mean(values, halflife), expected, rtol=1e-10, equal_nan=True
+            )
+
+
+class DominantAndStreakTests(unittest.TestCase):
+    def test_dominant_skips_nan_rows(self):
+        smoothed = np.array([
+            [np.nan, np.nan],
+            [0.2, 0.8],
+            [np.nan, 0.4],
+            [0.5, 0.5],
+        ])
+        np.testing.assert_array_equal(kernel.dominant_codes(smoothed), [-1, 1, 1, 0])
+
+    def test_streak_matches_scalar_counter(self):
+        rng = np.random.default_rng(1)
+        codes = rng.integers(-1, 3, size=200)
+        codes[:4] = -1
+        dom = pd.Series(np.where(codes >= 0, codes, np.nan)).ffill()
+        expected, streak, prev = [], 0, None
+        for v in dom:
+            streak = 1 if v != prev else streak + 1
+            prev = v
+            expected.append(streak)
+        np.testing.assert_array_equal(kernel.streak_lengths(codes), expected)
+
+    def test_streak_is_batched_over_leading_axes(self):
+        codes = np.array([[0, 0, 1, 1, 1], [1, 1, 1, 0, 0]])
+        np.testing.assert_array_equal(
+            kernel.streak_lengths(codes), [[1, 2, 1, 2, 3], [1, 2, 3, 1, 2]]
+        )
+
+
+class SmoothStateProbabilitiesTests(unittest.TestCase):
+    def test_halflife_one_passes_through(self):
+        probs = np.random.default_rng(2).random((2, 30, 2))
+        out = kernel.smooth_state_probabilities(probs, np.array([1, 4]))
+        np.testing.assert_array_equal(out[0], probs[0])
+        np.testing.assert_allclose(out[1].sum(axis=1), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
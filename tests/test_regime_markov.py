@@ -0,0 +1,54 @@
+"""Tests for the integer-coded Markov analytics used by compositions.
+
+Each kernel is checked against the dense / pure-Python computation it
+replaces in ``compose_regimes``. Synthetic data only — no DB required.
+"""
+
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from ix.core.regimes import markov
+
+
+class ForwardDistributionTests(unittest.TestCase):
+    def test_matches_dense_laplace_matrix_power(self):
+        rng = np.random.default_rng(0)
+        n = 27
+        codes = rng.integers(0, 6, size=300)  # sparse: most states never seen
+        codes[[10, 50, 51]] = -1
+
+        seq = [c for c in codes if c >= 0]
+        dense = np.ones((n, n))
+        for a, b in zip(seq[:-1], seq[1:]):
+            dense[a, b] += 1
+        tmat = dense / dense.sum(axis=1, keepdims=True)
+
+        counts = markov.transition_counts(codes, n)
+        self.assertEqual(counts.sum(), len(seq) - 1)
+
+        p0 = rng.random(n)
+        p0 /= p0.sum()
+        projected = markov.forward_distributions(counts, p0, (1, 3, 6, 12))
+        self.assertEqual(sorted(projected), [1, 3, 6, 12])
+        for h, p_h in projected.items():
+            expected = p0 @ np.linalg.matrix_power(tmat, h)
+            np.testing.assert_allclose(p_h, expected / expected.sum(), rtol=1e-10)
+
+
+class RunLengthTests(unittest.TestCase):
+    def test_run_lengths(self):
+        states, lengths = markov.run_lengths(np.array(["a", "a", "b", "a", "a", "a"]))
+        self.assertEqual(list(states), ["a", "b", "a"])
+        self.assertEqual(list(lengths), [2, 1, 3])
+
+    def test_trailing_run(self):
+        self.assertEqual(markov.trailing_run(np.array([True, False, True, True])), 2)
+        self.assertEqual(markov.trailing_run(np.array([True, True])), 2)
+        self.assertEqual(markov.trailing_run(np.array([False])), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
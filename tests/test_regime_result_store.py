@@ -0,0 +1,174 @@
+"""Tests for the compose / ensemble result store.
+
+The persistent tier and the input-version lookup are patched out, so
+these exercise fingerprinting, the LRU front and single-flight
+computation without a DB.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+from ix.core.regimes import result_store
+from ix.db.models import result_fingerprint
+
+
+class ResultFingerprintTests(unittest.TestCase):
+    def test_key_order_is_irrelevant(self):
+        a = result_fingerprint("compose", ["b", "a"], {"z": 1}, {"a": "t1", "b": "t2"})
+        b = result_fingerprint("compose", ["a", "b"], {"z": 1}, {"b": "t2", "a": "t1"})
+        self.assertEqual(a, b)
+        self.assertTrue(a.startswith("compose:"))
+
+    def test_input_version_changes_fingerprint(self):
+        a = result_fingerprint("compose", ["a", "b"], {}, {"a": "t1", "b": "t2"})
+        b = result_fingerprint("compose", ["a", "b"], {}, {"a": "t1", "b": "t3"})
+        self.assertNotEqual(a, b)
+
+
+class GetOrComputeTests(unittest.TestCase):
+    def setUp(self):
+        self.stored: dict[str, dict] = {}
+        self.versions = {"a": "t1", "b": "t1"}
+        patches = [
+            mock.patch.object(result_store, "input_versions", lambda keys, codes=(): dict(self.versions)),
+            mock.patch.object(result_store, "_store_load", lambda fp: self.stored.get(fp)),
+            mock.patch.object(
+                result_store,
+                "_store_save",
+                lambda fp, *args: self.stored.__setitem__(fp, args[-1]),
+            ),
+            mock.patch.object(result_store, "_flush_hits", lambda pending: None),
+            mock.patch.object(result_store, "_LRU_MAX", 2),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        result_store.clear_memory()
+        for k in result_store._stats:
+            result_store._stats[k] = 0
+
+    def _get(self, cache_key: str, compute):
+        return result_store.get_or_compute("compose", cache_key, ["a", "b"], {"k": cache_key}, compute)
+
+    def test_memory_then_store_then_recompute(self):
+        compute = mock.Mock(return_value={"v": 1})
+        self.assertEqual(self._get("x", compute), {"v": 1})
+        self._get("x", compute)
+        self.assertEqual(compute.call_count, 1)
+
+        result_store.clear_memory()
+        self._get("x", compute)
+        self.assertEqual(compute.call_count, 1)
+
+        self.versions["a"] = "t2"  # input regime refreshed
+        self._get("x", compute)
+        self.assertEqual(compute.call_count, 2)
+
+        stats = result_store.store_stats()
+        self.assertEqual(
+            (stats["memory_hits"], stats["store_hits"], stats["misses"]), (1, 1, 2)
+        )
+
+    def test_lru_evicts_least_recently_used(self):
+        for key in ("x", "y"):
+            self._get(key, lambda: {"v": key})
+        self._get("x", lambda: None)  # touch x
+        self._get("z", lambda: {"v": "z"})
+        self.assertEqual(result_store.store_stats()["evictions"], 1)
+        self.stored.clear()
+        self.assertEqual(self._get("x", lambda: {"v": "miss"}), {"v": "x"})
+        self.assertEqual(self._get("y", lambda: {"v": "miss"}), {"v": "miss"})
+
+    def test_unknown_input_version_is_not_persisted(self):
+        self.versions["b"] = ""  # regime without a snapshot
+        compute = mock.Mock(return_value={"v": 1})
+        self.assertEqual(self._get("x", compute), {"v": 1})
+        self.assertEqual(self.stored, {})
+
+    def test_concurrent_misses_compute_once(self):
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.05)
+            return {"v": 1}
+
+        threads = [threading.Thread(target=self._get, args=("x", slow)) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(calls), 1)
+
+
+class InputVersionTests(unittest.TestCase):
+    def setUp(self):
+        result_store.invalidate_versions()
+        self.addCleanup(result_store.invalidate_versions)
+
+    def test_series_versions_and_date_bucket_are_inputs(self):
+        updated = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        session = mock.MagicMock()
+        session.__enter__.return_value.query.return_value.filter.return_value.all.return_value = []
+        with mock.patch.object(result_store, "Session", return_value=session), mock.patch.object(
+            result_store, "timeseries_versions", return_value={"SPY": updated}
+        ) as series, mock.patch.object(result_store, "get_regime") as get_regime:
+            get_regime.return_value.default_params = {}
+            versions = result_store.input_versions(["a"], ["SPY"])
+        self.assertEqual(series.call_args.args[1], ["SPY"])
+        self.assertEqual(versions["a"], "")
+        self.assertEqual(versions["series:SPY"], updated.isoformat())
+        self.assertEqual(versions["as_of"], datetime.now(timezone.utc).date().isoformat())
+
+
+class _LockSession:
+    """Grants the warm-up advisory lock or not; serves one stored result."""
+
+    def __init__(self, locked: bool) -> None:
+        self.locked = locked
+        self.statements: list[str] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get_bind(self):
+        return mock.Mock(**{"dialect.name": "postgresql"})
+
+    def execute(self, stmt, params=None):
+        self.statements.append(str(stmt))
+        return mock.Mock(scalar=mock.Mock(return_value=self.locked))
+
+    def query(self, *columns):
+        rows = [("ensemble", "broad", ["a", "b"])]
+        return mock.Mock(**{"order_by.return_value.limit.return_value.all.return_value": rows})
+
+
+class WarmUpTests(unittest.TestCase):
+    def _warm(self, session: _LockSession, get_ensemble: mock.Mock) -> int:
+        with mock.patch.object(result_store, "Session", return_value=session), mock.patch.object(
+            result_store, "get_ensemble", get_ensemble
+        ):
+            return result_store.warm_up()
+
+    def test_lock_holder_warms(self):
+        session, get_ensemble = _LockSession(locked=True), mock.Mock()
+        self.assertEqual(self._warm(session, get_ensemble), 1)
+        get_ensemble.assert_called_once_with("broad")
+        self.assertIn("pg_try_advisory_xact_lock", session.statements[0])
+
+    def test_other_workers_skip(self):
+        get_ensemble = mock.Mock()
+        self.assertEqual(self._warm(_LockSession(locked=False), get_ensemble), 0)
+        get_ensemble.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
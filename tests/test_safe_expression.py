@@ -1,7 +1,10 @@
 import unittest
+import unittest.mock
 
+from ix.common.security import safe_expression
 from ix.common.security.safe_expression import (
     EVALUATION_EXPRESSION_CONTEXT,
+    SERIES_EXPRESSION_CONTEXT,
     TIMESERIES_EXPRESSION_CONTEXT,
     UnsafeExpressionError,
     safe_eval_expression,
@@ -46,5 +49,30 @@ class SafeExpressionTests(unittest.TestCase):
             )
 
 
+class CompiledExpressionCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        safe_expression.clear_expression_cache()
+
+    def test_repeated_expression_compiles_once(self) -> None:
+        expr = "pd.Series([1.0, 2.0]).sum()"
+        with unittest.mock.patch.object(
+            safe_expression.ast, "parse", wraps=safe_expression.ast.parse
+        ) as parse:
+            self.assertEqual(safe_eval_expression(expr, TIMESERIES_EXPRESSION_CONTEXT), 3.0)
+            self.assertEqual(safe_eval_expression(f"  {expr}\n", TIMESERIES_EXPRESSION_CONTEXT), 3.0)
+        self.assertEqual(parse.call_count, 1)
+
+    def test_cache_is_per_context(self) -> None:
+        expr = "pd.Series([1]).sum()"
+        self.assertEqual(safe_eval_expression(expr, TIMESERIES_EXPRESSION_CONTEXT), 1)
+        with self.assertRaises(UnsafeExpressionError):
+            safe_eval_expression(expr, SERIES_EXPRESSION_CONTEXT)
+
+    def test_rejection_is_not_cached_as_success(self) -> None:
+        for _ in range(2):
+            with self.assertRaises(UnsafeExpressionError):
+                safe_eval_expression("pd.Series([1]).__class__", TIMESERIES_EXPRESSION_CONTEXT)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,113 @@
+"""Tests for the concurrent, cursor-based 13-F collector in ix.collectors.sec_13f (no network or DB required)."""
+
+from __future__ import annotations
+
+import io
+import unittest
+from unittest import mock
+
+from ix.collectors.sec_13f import (
+    Filing,
+    SEC13FCollector,
+    advance_cursor,
+    parse_info_table,
+    pick_info_table,
+)
+
+INFO_TABLE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<informationTable xmlns="http://www.sec.gov/edgar/document/thirteenf/informationtable">
+  <infoTable>
+    <nameOfIssuer>APPLE INC</nameOfIssuer>
+    <titleOfClass>COM</titleOfClass>
+    <cusip>037833100</cusip>
+    <value>174347000</value>
+    <shrsOrPrnAmt><sshPrnamt>915560382</sshPrnamt><sshPrnamtType>SH</sshPrnamtType></shrsOrPrnAmt>
+    <investmentDiscretion>SOLE</investmentDiscretion>
+  </infoTable>
+  <infoTable>
+    <nameOfIssuer>SPDR S&amp;P 500 ETF TR</nameOfIssuer>
+    <cusip>78462F103</cusip>
+    <value>1200</value>
+    <shrsOrPrnAmt><sshPrnamt>2500</sshPrnamt><sshPrnamtType>SH</sshPrnamtType></shrsOrPrnAmt>
+    <putCall>Put</putCall>
+  </infoTable>
+</informationTable>
+"""
+
+
+class _Response:
+    def __init__(self, payload: dict) -> None:
+        self.status_code = 200
+        self.payload = payload
+
+    def json(self) -> dict:
+        return self.payload
+
+
+def _submissions(*filings: tuple[str, str]) -> dict:
+    forms, accessions = zip(*filings)
+    return {
+        "filings": {
+            "recent": {
+                "form": list(forms),
+                "accessionNumber": list(accessions),
+                "filingDate": ["2024-05-15"] * len(forms),
+                "reportDate": ["2024-03-31"] * len(forms),
+            }
+        }
+    }
+
+
+class ParseTests(unittest.TestCase):
+    def test_stream_parse_reads_nested_amounts(self) -> None:
+        holdings = parse_info_table(io.BytesIO(INFO_TABLE))
+        self.assertEqual(len(holdings), 2)
+        self.assertEqual(
+            holdings[0],
+            {"name": "APPLE INC", "cusip": "037833100", "value": 174347000, "shares": 915560382, "class": "SH"},
+        )
+        self.assertEqual(holdings[1]["put_call"], "Put")
+
+    def test_pick_info_table(self) -> None:
+        self.assertEqual(pick_info_table(["primary_doc.xml", "form13fInfoTable.xml", "x.txt"]), "form13fInfoTable.xml")
+        self.assertEqual(pick_info_table(["primary_doc.xml", "46994.xml"]), "46994.xml")
+        self.assertIsNone(pick_info_table(["primary_doc.xml", "0001.txt"]))
+
+
+class CursorTests(unittest.TestCase):
+    def _filings(self, *results):
+        return [Filing("1", "F", f"a{i}", holdings=r) for i, r in enumerate(results)]
+
+    def test_all_succeed_moves_to_newest(self) -> None:
+        self.assertEqual(advance_cursor("old", self._filings([], [1])), "a0")
+
+    def test_stops_below_a_failure(self) -> None:
+        # a1 failed: the cursor only passes a2, so a1 is retried next run
+        self.assertEqual(advance_cursor("old", self._filings([1], None, [2])), "a2")
+        self.assertEqual(advance_cursor("old", self._filings([1], None)), "old")
+
+
+class NewFilingsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.collector = SEC13FCollector()
+
+    def _new(self, submissions: dict, cursor, stored=()):
+        with mock.patch.object(self.collector, "_get", return_value=_Response(submissions)), mock.patch.object(
+            self.collector, "_stored_accessions", return_value=set(stored)
+        ):
+            return self.collector._new_filings("0001067983", "BERKSHIRE", cursor)
+
+    def test_only_filings_after_cursor(self) -> None:
+        subs = _submissions(("13F-HR", "n3"), ("10-K", "k"), ("13F-HR", "n2"), ("13F-HR", "n1"))
+        self.assertEqual([f.accession for f in self._new(subs, "n1")], ["n3", "n2"])
+        self.assertEqual([f.accession for f in self._new(subs, "n3")], [])
+
+    def test_first_run_is_bounded_and_skips_stored(self) -> None:
+        subs = _submissions(*[("13F-HR", f"n{i}") for i in range(20, 0, -1)])
+        with mock.patch("ix.collectors.sec_13f.INITIAL_FILINGS", 3):
+            new = self._new(subs, None, stored={"n19"})
+        self.assertEqual([f.accession for f in new], ["n20", "n18"])
+
+
+if __name__ == "__main__":
+    unittest.main()
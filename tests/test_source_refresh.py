@@ -0,0 +1,158 @@
+"""Tests for the ticker-grouped source refresh in ix.common.task.refresh (no DB required)."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import unittest
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import date
+from unittest import mock
+
+import pandas as pd
+
+from ix.common.task.refresh import (
+    SourcePolicy,
+    Throttle,
+    TickerGroup,
+    fetch_group,
+    plan_batches,
+    plan_groups,
+    refresh_source,
+)
+
+refresh = sys.modules["ix.common.task.refresh"]
+
+FAST = SourcePolicy(workers=4, min_interval=0.0, retries=2, backoff=0.0, lookback_days=7)
+
+ROWS = [
+    ("1", "SPY", "SPY:PX_LAST", date(2024, 3, 8)),
+    ("2", "SPY_VOL", "SPY:PX_VOLUME", date(2024, 3, 1)),
+    ("3", "QQQ", "QQQ:PX_LAST", None),
+    ("4", "MANUAL", None, None),
+]
+
+
+def _frame(**cols) -> pd.DataFrame:
+    index = pd.date_range("2024-03-01", periods=3, freq="D")
+    return pd.DataFrame({k: [float(v)] * 3 for k, v in cols.items()}, index=index)
+
+
+class _FakeQuery:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def filter(self, *args):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class _FakeSession:
+    def query(self, *columns):
+        return _FakeQuery(ROWS)
+
+
+@contextmanager
+def _fake_session():
+    yield _FakeSession()
+
+
+class PlanTests(unittest.TestCase):
+    def test_groups_by_ticker_with_window(self) -> None:
+        groups, skipped = plan_groups(ROWS, FAST)
+        self.assertEqual(skipped, ["MANUAL"])
+        by_ticker = {g.ticker: g for g in groups}
+        self.assertEqual([s[2] for s in by_ticker["SPY"].series], ["PX_LAST", "PX_VOLUME"])
+        # Oldest end in the group less the look-back
+        self.assertEqual(by_ticker["SPY"].start, "2024-02-23")
+        # A never-loaded series needs full history
+        self.assertIsNone(by_ticker["QQQ"].start)
+
+    def test_full_history_policy(self) -> None:
+        groups, _ = plan_groups(ROWS[:1], SourcePolicy(lookback_days=None))
+        self.assertIsNone(groups[0].start)
+
+    def test_batches_share_a_window(self) -> None:
+        groups = [TickerGroup(t, start=s) for t, s in [("A", "x"), ("B", None), ("C", "x"), ("D", "x")]]
+        batches = plan_batches(groups, 2)
+        self.assertEqual([[g.ticker for g in b] for b in batches], [["A", "C"], ["D"], ["B"]])
+
+
+class FetchTests(unittest.TestCase):
+    def test_retries_then_succeeds(self) -> None:
+        fetcher = mock.Mock(side_effect=[OSError("reset"), _frame(PX_LAST=1)])
+        with self.assertLogs(refresh.logger, "INFO"):
+            out = fetch_group(fetcher, TickerGroup("SPY", start="2024-01-01"), FAST, Throttle(0))
+        self.assertFalse(out.empty)
+        fetcher.assert_called_with("SPY", start="2024-01-01")
+        self.assertEqual(fetcher.call_count, 2)
+
+    def test_gives_up_after_retries(self) -> None:
+        fetcher = mock.Mock(side_effect=OSError("down"))
+        with self.assertLogs(refresh.logger, "WARNING"):
+            self.assertIsNone(fetch_group(fetcher, TickerGroup("SPY"), FAST, Throttle(0)))
+        self.assertEqual(fetcher.call_count, 3)
+
+    def test_throttle_spaces_calls(self) -> None:
+        throttle = Throttle(0.05)
+        stamps = []
+
+        def call():
+            throttle.wait()
+            stamps.append(time.monotonic())
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stamps.sort()
+        self.assertGreaterEqual(stamps[-1] - stamps[0], 0.09)
+
+
+class RefreshSourceTests(unittest.TestCase):
+    def test_each_ticker_fetched_once_and_written_in_one_batch(self) -> None:
+        frames = {"SPY": _frame(PX_LAST=500, PX_VOLUME=9), "QQQ": pd.DataFrame()}
+        fetcher = mock.Mock(side_effect=lambda ticker, **kw: frames[ticker])
+        writes = []
+        progress = mock.Mock()
+        with mock.patch("ix.db.conn.Session", _fake_session), mock.patch.object(
+            refresh, "_write_batch", side_effect=lambda u: writes.append(u) or len(u)
+        ):
+            stats = refresh_source("Yahoo", fetcher, progress, policy=FAST)
+
+        self.assertEqual(sorted(c.args[0] for c in fetcher.call_args_list), ["QQQ", "SPY"])
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(sorted(code for _, code, _ in writes[0]), ["SPY", "SPY_VOL"])
+        self.assertEqual(
+            stats,
+            {"total": 4, "updated": 2, "skipped_no_ticker": 1, "skipped_empty_data": 1, "failed_tickers": 0},
+        )
+        self.assertEqual(progress.call_args.args[:2], (4, 4))
+
+    def test_batch_fetcher_requests_tickers_together(self) -> None:
+        batch_fetcher = mock.Mock(return_value={"SPY": _frame(PX_LAST=500, PX_VOLUME=9)})
+        fetcher = mock.Mock()
+        with mock.patch("ix.db.conn.Session", _fake_session), mock.patch.object(
+            refresh, "_write_batch", side_effect=len
+        ):
+            stats = refresh_source(
+                "Yahoo", fetcher, policy=replace(FAST, batch_size=10), batch_fetcher=batch_fetcher
+            )
+
+        fetcher.assert_not_called()
+        # SPY has a window, QQQ needs full history: one request each
+        self.assertEqual(
+            sorted((c.args[0], c.kwargs.get("start")) for c in batch_fetcher.call_args_list),
+            [(["QQQ"], None), (["SPY"], "2024-02-23")],
+        )
+        # QQQ left out of the result counts as empty, not failed
+        self.assertEqual((stats["updated"], stats["skipped_empty_data"], stats["failed_tickers"]), (2, 1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Tests for the timeseries column formatting and wire encodings.
+
+The vectorised column conversion must match the original per-value
+cleaning, and every negotiated encoding must round-trip the same frame.
+"""
+
+from __future__ import annotations
+
+import io
+import math
+import unittest
+from datetime import datetime
+
+import numpy as np
+import orjson
+import pandas as pd
+
+from ix.core.ts import encoding
+from ix.core.ts.formatting import _dataframe_to_column_dict, empty_frame
+
+
+def _legacy_column_dict(df: pd.DataFrame) -> dict:
+    out = {}
+    for col in df.reset_index().columns:
+        cleaned = []
+        for v in df.reset_index()[col].tolist():
+            if v is None or (isinstance(v, float) and math.isnan(v)):
+                cleaned.append(None)
+            elif isinstance(v, (pd.Timestamp, datetime)):
+                cleaned.append(v.isoformat())
+            else:
+                cleaned.append(v)
+        out[col] = cleaned
+    return out
+
+
+def _frame(rows: int = 30) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    idx = pd.date_range("2020-01-01", periods=rows, freq="D", name="Date")
+    df = pd.DataFrame(
+        {"SPX": rng.normal(size=rows), "NDX": rng.normal(size=rows)}, index=idx
+    )
+    df.iloc[::4, 0] = np.nan
+    df["Flag"] = np.arange(rows) % 2
+    df["Label"] = (["a", None] * rows)[:rows]
+    return df
+
+
+class ColumnDictTests(unittest.TestCase):
+    def test_matches_legacy_cleaning(self):
+        df = _frame()
+        self.assertEqual(dict(_dataframe_to_column_dict(df)), _legacy_column_dict(df))
+
+    def test_sub_second_timestamps_keep_precision(self):
+        idx = pd.DatetimeIndex(["2020-01-01 00:00:00", "2020-01-01 00:00:00.5"], name="Date")
+        df = pd.DataFrame({"x": [1.0, 2.0]}, index=idx)
+        self.assertEqual(dict(_dataframe_to_column_dict(df)), _legacy_column_dict(df))
+
+
+class NaTTests(unittest.TestCase):
+    def test_nat_in_index_is_null(self):
+        idx = pd.DatetimeIndex(["2020-01-01", None, "2020-01-03"], name="Date")
+        df = pd.DataFrame({"x": [1.0, 2.0, np.nan]}, index=idx)
+        expected = {"Date": ["2020-01-01T00:00:00", None, "2020-01-03T00:00:00"], "x": [1.0, 2.0, None]}
+        self.assertEqual(dict(_dataframe_to_column_dict(df)), expected)
+        self.assertEqual(orjson.loads(encoding.encode_json(df)), expected)
+        lines = [orjson.loads(line) for line in encoding.iter_ndjson(df, chunk_rows=2)]
+        self.assertEqual(lines[0]["Date"] + lines[1]["Date"], expected["Date"])
+
+
+class NegotiateFormatTests(unittest.TestCase):
+    def test_defaults_to_json(self):
+        for accept in (None, "", "*/*", "text/html", "application/json"):
+            self.assertEqual(encoding.negotiate_format(accept), encoding.JSON)
+
+    def test_quality_ordering(self):
+        accept = "application/json;q=0.5, application/x-ndjson"
+        self.assertEqual(encoding.negotiate_format(accept), encoding.NDJSON)
+        accept = "application/x-ndjson;q=0, application/json"
+        self.assertEqual(encoding.negotiate_format(accept), encoding.JSON)
+
+
+class EncodingTests(unittest.TestCase):
+    def test_json_matches_column_dict(self):
+        df = _frame()
+        self.assertEqual(orjson.loads(encoding.encode_json(df)), _legacy_column_dict(df))
+
+    def test_empty_frame_has_date_column(self):
+        self.assertEqual(orjson.loads(encoding.encode_json(empty_frame())), {"Date": []})
+        lines = list(encoding.iter_ndjson(empty_frame()))
+        self.assertEqual([orjson.loads(line) for line in lines], [{"Date": []}])
+
+    def test_ndjson_chunks_reassemble(self):
+        df = _frame(25)
+        lines = list(encoding.iter_ndjson(df, chunk_rows=10))
+        self.assertEqual(len(lines), 3)
+        merged: dict[str, list] = {}
+        for line in lines:
+            self.assertTrue(line.endswith(b"\n"))
+            for name, values in orjson.loads(line).items():
+                merged.setdefault(name, []).extend(values)
+        self.assertEqual(merged, _legacy_column_dict(df))
+
+    @unittest.skipIf(encoding.pa is None, "pyarrow not installed")
+    def test_arrow_and_parquet_round_trip(self):
+        df = _frame()
+        from_arrow = encoding.pa.ipc.open_stream(encoding.encode_arrow(df)).read_pandas()
+        from_parquet = encoding.pq.read_table(io.BytesIO(encoding.encode_parquet(df))).to_pandas()
+        expected = df.reset_index()
+        for decoded in (from_arrow, from_parquet):
+            pd.testing.assert_frame_equal(decoded, expected, check_dtype=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Tests for the materialised favourites panel in ix.core.ts.favorites (no DB required)."""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from ix.core.ts.favorites import (
+    _daily,
+    assemble_panel,
+    clear_memory,
+    decode_panel,
+    encode_panel,
+    favorites_panel,
+)
+from ix.core.ts.formatting import prepare_favorites_frame, slice_dates
+
+favorites = sys.modules["ix.core.ts.favorites"]
+
+
+def _series(code: str, start: str, periods: int, freq: str) -> pd.Series:
+    index = pd.date_range(start, periods=periods, freq=freq)
+    return pd.Series(np.arange(periods, dtype=float) + 0.5, index=index, name=code)
+
+
+SERIES = {
+    "B": _series("B", "2024-01-01", 40, "B"),
+    "A": _series("A", "2023-12-15", 3, "ME"),
+    "C": _series("C", "2024-01-10", 10, "W-FRI"),
+}
+
+
+class PanelBuildTests(unittest.TestCase):
+    def test_matches_full_rebuild(self) -> None:
+        panel = assemble_panel({code: _daily(s) for code, s in SERIES.items()})
+        expected = prepare_favorites_frame(list(SERIES.values()), None, None)
+        pd.testing.assert_frame_equal(panel, expected[sorted(expected.columns)], check_freq=False)
+
+    def test_encoding_roundtrip(self) -> None:
+        panel = assemble_panel({code: _daily(s) for code, s in SERIES.items()})
+        decoded = decode_panel(encode_panel(panel))
+        pd.testing.assert_frame_equal(decoded, panel, check_freq=False)
+        empty = decode_panel(encode_panel(assemble_panel({})))
+        self.assertTrue(empty.empty)
+        self.assertEqual(empty.index.name, "Date")
+
+    def test_slice_dates(self) -> None:
+        panel = assemble_panel({code: _daily(s) for code, s in SERIES.items()})
+        sliced = slice_dates(panel, "2024-01-05", "2024-01-31")
+        self.assertEqual(sliced.index[0], pd.Timestamp("2024-01-05"))
+        self.assertEqual(sliced.index[-1], pd.Timestamp("2024-01-31"))
+
+
+class IncrementalRebuildTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_memory()
+        self.addCleanup(clear_memory)
+        self.loaded: list[list[str]] = []
+
+        def load(db, codes):
+            self.loaded.append(list(codes))
+            return {c: _daily(SERIES[c]) for c in codes}
+
+        for name, kwargs in (
+            ("_load_columns", {"side_effect": load}),
+            ("_store_load", {"return_value": None}),
+            ("_store_save", {}),
+        ):
+            patcher = mock.patch.object(favorites, name, **kwargs)
+            setattr(self, name, patcher.start())
+            self.addCleanup(patcher.stop)
+
+    def test_only_changed_and_new_series_are_loaded(self) -> None:
+        v1, v2 = datetime(2024, 1, 1), datetime(2024, 2, 1)
+        first = favorites_panel(None, {"A": v1, "B": v1})
+        self.assertEqual(list(first.columns), ["A", "B"])
+
+        # Unchanged versions: served from memory, nothing loaded or saved
+        self.assertIs(favorites_panel(None, {"A": v1, "B": v1}), first)
+
+        # B written, C favourited, A un-favourited
+        second = favorites_panel(None, {"B": v2, "C": v1})
+        self.assertEqual(self.loaded, [["A", "B"], ["B", "C"]])
+        self.assertEqual(list(second.columns), ["B", "C"])
+        expected = prepare_favorites_frame([SERIES["B"], SERIES["C"]], None, None)
+        pd.testing.assert_frame_equal(second, expected, check_freq=False)
+        self.assertEqual(self._store_save.call_count, 2)
+
+    def test_store_hit_skips_loading(self) -> None:
+        panel = assemble_panel({"A": _daily(SERIES["A"])})
+        self._store_load.return_value = ({"A": ""}, panel)
+        self.assertIs(favorites_panel(None, {"A": None}), panel)
+        self.assertEqual(self.loaded, [])
+        self._store_save.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
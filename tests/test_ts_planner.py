@@ -0,0 +1,88 @@
+"""Tests for the /timeseries.custom evaluation planner.
+
+The bulk loader is patched with in-memory Timeseries stand-ins, so these
+check reference extraction, preloading and ordering without a DB.
+"""
+
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from ix.core.ts import planner
+from ix.db import query
+
+
+def _fake_ts(code: str, values: np.ndarray) -> SimpleNamespace:
+    dates = pd.date_range("2020-01-01", periods=len(values), freq="D")
+    data = {d.strftime("%Y-%m-%d"): float(v) for d, v in zip(dates, values)}
+    return SimpleNamespace(
+        code=code,
+        start=None,
+        currency="USD",
+        scale=1,
+        source="Bloomberg",
+        source_code=None,
+        frequency=None,
+        data_record=SimpleNamespace(data=data),
+    )
+
+
+class ReferencedSeriesTests(unittest.TestCase):
+    def test_collects_canonical_literal_codes(self):
+        refs = planner.referenced_series(
+            "Series('spy us equity') / Series(code='QQQ US EQUITY:PX_VOLUME', freq='W')"
+            " + Series('AAPL=AAPL US EQUITY:PX_LAST')"
+        )
+        self.assertEqual(
+            refs,
+            {"SPY US EQUITY:PX_LAST", "QQQ US EQUITY:PX_VOLUME", "AAPL US EQUITY:PX_LAST"},
+        )
+
+    def test_non_literal_and_invalid_reference_nothing(self):
+        self.assertEqual(planner.referenced_series("Series(name)"), set())
+        self.assertEqual(planner.referenced_series("Series('A'"), set())
+
+
+class EvaluateCodesTests(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.rows = {
+            "A:PX_LAST": _fake_ts("A:PX_LAST", rng.random(20) + 1),
+            "B:PX_LAST": _fake_ts("B:PX_LAST", rng.random(20) + 1),
+        }
+        self.loaded_with = []
+
+        def bulk_load(db, codes):
+            self.loaded_with.append(sorted(codes))
+            return {c: self.rows[c] for c in codes if c in self.rows}
+
+        p = mock.patch.object(planner, "bulk_load_timeseries", bulk_load)
+        p.start()
+        self.addCleanup(p.stop)
+        query.clear_series_cache()
+        self.addCleanup(query.clear_series_cache)
+
+    def test_shared_references_load_once_and_keep_order(self):
+        codes = ["Series('A') / Series('B')", "B:PX_LAST", "Series('A') - Series('B')"]
+        with mock.patch("ix.db.conn.Session", side_effect=AssertionError("DB hit")):
+            out = planner.evaluate_codes(None, codes, None, None)
+
+        self.assertEqual(len(self.loaded_with), 1)
+        self.assertEqual([s.name for s in out], codes)
+        a = planner.process_database_timeseries(self.rows["A:PX_LAST"], None)
+        b = planner.process_database_timeseries(self.rows["B:PX_LAST"], None)
+        np.testing.assert_allclose(out[0].to_numpy(), (a / b).to_numpy())
+        np.testing.assert_allclose(out[2].to_numpy(), (a - b).to_numpy())
+
+    def test_failed_expression_is_skipped(self):
+        out = planner.evaluate_codes(None, ["B:PX_LAST", "Series('A').__class__"], None, None)
+        self.assertEqual([s.name for s in out], ["B:PX_LAST"])
+
+
+if __name__ == "__main__":
+    unittest.main()
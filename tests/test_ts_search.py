@@ -0,0 +1,58 @@
+"""Tests for the indexed timeseries search in ix.core.ts.search (no DB required)."""
+
+from __future__ import annotations
+
+import unittest
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from ix.core.ts.search import build_search_filter_and_order
+from ix.db.models import Timeseries
+from ix.db.models.timeseries import SEARCH_VECTOR_SQL
+
+
+def _pg(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+class SearchIndexTests(unittest.TestCase):
+    def test_search_reads_stored_vector(self) -> None:
+        stmt = build_search_filter_and_order(
+            select(Timeseries.code), "spx", Timeseries, dialect_name="postgresql"
+        )
+        sql = _pg(stmt)
+        self.assertIn("timeseries.search_vector @@ plainto_tsquery", sql)
+        self.assertIn("ts_rank_cd(timeseries.search_vector", sql)
+        self.assertNotIn("to_tsvector", sql)
+        # Prefix terms match the lower(col) trigram expression indexes
+        self.assertIn("lower(timeseries.code) LIKE", sql)
+        self.assertNotIn("coalesce", sql)
+
+    def test_fallback_backend_keeps_like_ranking(self) -> None:
+        from sqlalchemy.dialects import sqlite
+
+        stmt = build_search_filter_and_order(
+            select(Timeseries.code), "spx", Timeseries, dialect_name="sqlite"
+        )
+        sql = str(stmt.compile(dialect=sqlite.dialect()))
+        self.assertNotIn("search_vector", sql)
+        self.assertIn("coalesce(timeseries.code", sql)
+
+    def test_vector_is_a_stored_generated_column(self) -> None:
+        ddl = _pg(CreateTable(Timeseries.__table__))
+        self.assertIn(f"search_vector TSVECTOR GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED", ddl)
+        index = next(i for i in Timeseries.__table__.indexes if i.name == "ix_timeseries_search_vector")
+        self.assertIn("USING gin (search_vector)", _pg(CreateIndex(index)))
+
+    def test_vector_weights(self) -> None:
+        self.assertTrue(SEARCH_VECTOR_SQL.startswith("setweight(to_tsvector('simple', coalesce(code, '')), 'A')"))
+        self.assertTrue(SEARCH_VECTOR_SQL.endswith("setweight(to_tsvector('simple', coalesce(source_code, '')), 'D')"))
+
+    def test_listings_do_not_load_the_vector(self) -> None:
+        self.assertNotIn("search_vector", _pg(select(Timeseries)))
+
+
+if __name__ == "__main__":
+    unittest.main()
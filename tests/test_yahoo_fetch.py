@@ -0,0 +1,81 @@
+"""Tests for the process-isolated Yahoo fetcher in ix.collectors.yahoo (no network required)."""
+
+from __future__ import annotations
+
+import sys
+import time
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from ix.collectors.ratelimit import RateBudget
+from ix.collectors.yahoo import _to_long, decode_frames, encode_frames, fetch_yahoo
+
+yahoo = sys.modules["ix.collectors.yahoo"]
+
+FIELDS = ["Adj Close", "Close", "Dividends", "High", "Low", "Open", "Stock Splits", "Volume"]
+
+
+def _download_frame(symbols: list[str]) -> pd.DataFrame:
+    """What ``yf.download`` returns for several symbols: ``(field, symbol)`` columns."""
+    index = pd.date_range("2024-01-01", periods=3, freq="D", name="Date")
+    columns = pd.MultiIndex.from_product([FIELDS, symbols], names=["Price", "Ticker"])
+    values = np.arange(3 * len(columns), dtype=float).reshape(3, len(columns))
+    return pd.DataFrame(values, index=index, columns=columns)
+
+
+class FrameCodecTests(unittest.TestCase):
+    def test_roundtrip_splits_per_symbol(self) -> None:
+        data = _download_frame(["SPY", "^VIX"])
+        # ^VIX has no row on the first day (different exchange calendar)
+        data.loc[data.index[0], (slice(None), "^VIX")] = np.nan
+        frames = decode_frames(encode_frames(_to_long(data, ["SPY", "^VIX"])))
+
+        self.assertEqual(sorted(frames), ["SPY", "^VIX"])
+        self.assertEqual(len(frames["SPY"]), 3)
+        self.assertEqual(len(frames["^VIX"]), 2)
+        self.assertEqual(list(frames["SPY"].columns[:6]), ["Open", "High", "Low", "Close", "Adj Close", "Volume"])
+        pd.testing.assert_series_equal(
+            frames["SPY"]["Close"], data[("Close", "SPY")].rename("Close"), check_freq=False
+        )
+
+    def test_single_symbol_and_empty_downloads(self) -> None:
+        flat = _download_frame(["SPY"]).xs("SPY", axis=1, level=1)
+        self.assertEqual(list(decode_frames(encode_frames(_to_long(flat, ["SPY"])))), ["SPY"])
+        self.assertEqual(decode_frames(encode_frames(_to_long(pd.DataFrame(), ["SPY"]))), {})
+
+
+class FetchTests(unittest.TestCase):
+    def test_batches_and_skips_failures(self) -> None:
+        def submit(batch, start, end, actions):
+            fut = Future()
+            if "BAD" in batch:
+                fut.set_exception(RuntimeError("blocked"))
+            else:
+                fut.set_result(encode_frames(_to_long(_download_frame(batch), batch)))
+            return fut
+
+        with mock.patch.object(yahoo, "BATCH_SIZE", 2), mock.patch.object(
+            yahoo, "_submit", side_effect=submit
+        ) as submitted, self.assertLogs(yahoo.logger, "WARNING"):
+            frames = fetch_yahoo(["A", "B", "A", "C", "BAD"], start="2024-01-01", end="2024-02-01")
+
+        self.assertEqual([c.args[0] for c in submitted.call_args_list], [["A", "B"], ["C", "BAD"]])
+        self.assertEqual(sorted(frames), ["A", "B"])
+
+
+class RateBudgetTests(unittest.TestCase):
+    def test_burst_then_rate(self) -> None:
+        budget = RateBudget(rate=20.0, burst=2)
+        start = time.monotonic()
+        for _ in range(4):
+            budget.acquire()
+        # Two free tokens, then two more at 20/s
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+
+if __name__ == "__main__":
+    unittest.main()